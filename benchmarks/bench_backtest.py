@@ -0,0 +1,93 @@
+"""Benchmark the parameter-sweep backtester.
+
+Builds 30 days of synthetic history for an eight-room house, then sweeps
+a 54-point grid serially and across all cores.  Run from the repository
+root:
+
+    python benchmarks/bench_backtest.py
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The integration imports Home Assistant; reuse the test stubs.
+import tests.mock_homeassistant  # noqa: F401, E402, I001
+
+from custom_components.smart_climate.backtest import (  # noqa: E402
+    ParameterSet,
+    build_frames,
+    parameter_grid,
+    run_sweep,
+)
+
+DAYS = 30
+ROOMS = 8
+START = datetime(2024, 1, 1)
+AXES = {
+    "auxiliary_threshold": [1.0, 2.0, 3.0],
+    "away_temp_offset": [2.0, 4.0, 6.0],
+    "follow_me_cooldown": [5, 10, 20],
+    "comfort_temp_weight": [0.6, 0.8],
+}
+
+
+def _history() -> tuple[dict, dict]:
+    rooms = []
+    history: dict[str, list] = {}
+    for index in range(ROOMS):
+        slug = f"room_{index}"
+        climate = f"climate.system_{index // 2}"
+        rooms.append(
+            {
+                "room_name": slug,
+                "room_slug": slug,
+                "climate_entity": climate,
+                "temp_sensors": [f"sensor.{slug}_temp"],
+                "presence_sensors": [f"binary_sensor.{slug}_motion"],
+                "vent_entities": [f"cover.{slug}_vent"],
+                "auxiliary_entities": [f"switch.{slug}_heater"],
+            }
+        )
+        temps, motion, hvac = [], [], []
+        for minute in range(0, DAYS * 24 * 60, 2):
+            now = START + timedelta(minutes=minute)
+            hour = now.hour + now.minute / 60
+            temp = 67 + 3 * math.sin((hour + index) / 24 * 2 * math.pi)
+            temps.append((now, f"{temp:.1f}", {}))
+            if minute % 30 == 0:
+                occupied = (hour + index) % 24 < 6 or 17 <= hour < 22
+                motion.append((now, "on" if occupied else "off", {}))
+                action = "heating" if temp < 67 else "idle"
+                hvac.append((now, "heat", {"temperature": 68, "hvac_action": action}))
+        history[f"sensor.{slug}_temp"] = temps
+        history[f"binary_sensor.{slug}_motion"] = motion
+        history.setdefault(climate, hvac)
+    return {"rooms": rooms}, history
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.ERROR)
+    config, history = _history()
+    started = time.perf_counter()
+    frames = build_frames(history, config, START, START + timedelta(days=DAYS))
+    print(f"{len(frames)} frames built in {time.perf_counter() - started:.2f}s")
+
+    grid = parameter_grid(ParameterSet(), AXES)
+    for workers in sorted({1, os.cpu_count() or 1}):
+        started = time.perf_counter()
+        run_sweep(frames, config, grid, workers=workers)
+        elapsed = time.perf_counter() - started
+        print(f"{len(grid)} parameter sets, {workers:>2} workers: {elapsed:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark AI response JSON extraction on multi-megabyte inputs.
+
+Compares the single-pass scanner in ``ai.analysis._extract_json`` with the
+previous regex-fence approach.  Run from the repository root:
+
+    python benchmarks/bench_extract_json.py
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The integration imports Home Assistant; reuse the test stubs.
+import tests.mock_homeassistant  # noqa: F401, E402, I001
+
+from custom_components.smart_climate.ai.analysis import _extract_json  # noqa: E402
+
+SIZES_MB = (1, 4, 16)
+REPEAT = 3
+
+
+def _regex_extract(text: str):
+    """The fence regex + json.loads used before the scanner."""
+    text = text.strip()
+    match = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", text, re.DOTALL)
+    if match:
+        text = match.group(1).strip()
+    return json.loads(text)
+
+
+def _suggestion(idx: int) -> dict:
+    return {
+        "title": f"Suggestion {idx}",
+        "description": "Lower the setpoint by two degrees overnight. " * 4,
+        "reasoning": "Room unoccupied between 23:00 and 06:00 for 7 days.",
+        "room": "bedroom",
+        "action_type": "set_temperature",
+        "action_data": {"temperature": 68},
+        "confidence": 0.8,
+        "priority": "medium",
+    }
+
+
+def _inputs(size: int) -> dict[str, str]:
+    """Build inputs of roughly ``size`` bytes."""
+    one = json.dumps(_suggestion(0))
+    count = max(1, size // len(one))
+    doc = json.dumps(
+        {"summary": "ok", "suggestions": [_suggestion(i) for i in range(count)]}
+    )
+    return {
+        "fenced, many suggestions": f"Here you go:\n```json\n{doc}\n```\nThanks!",
+        "unterminated fences": "```json\n" + "x" * (size // 2) + "``` " * (size // 8),
+        "prose then object": "lorem ipsum " * (size // 12) + '{"summary": "ok"}',
+    }
+
+
+def _time(func, text: str) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        try:
+            func(text)
+        except ValueError:
+            pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f"{'input':<28}{'size':>8}{'regex (s)':>12}{'scanner (s)':>14}")
+    for size_mb in SIZES_MB:
+        size = size_mb * 1024 * 1024
+        for name, text in _inputs(size).items():
+            regex = _time(_regex_extract, text)
+            scanner = _time(lambda t: _extract_json(t, max_chars=len(t)), text)
+            print(f"{name:<28}{size_mb:>6}MB{regex:>12.3f}{scanner:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark replaying a week of recorded coordinator inputs.
+
+Synthesises a two-room house sampled every 30 seconds for seven days,
+writes it with ``recorder.RecordingWriter`` and replays it through the
+coordinator.  Run from the repository root:
+
+    python benchmarks/bench_replay.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The integration imports Home Assistant; reuse the test stubs.
+import tests.mock_homeassistant  # noqa: F401, E402, I001
+
+from custom_components.smart_climate.recorder import (  # noqa: E402
+    RecordingWriter,
+    read_recording,
+)
+from custom_components.smart_climate.replay import async_replay  # noqa: E402
+
+INTERVAL = timedelta(seconds=30)
+DAYS = 7
+START = datetime(2024, 1, 8)
+
+CONFIG = {
+    "update_interval": 30,
+    "enable_follow_me": True,
+    "enable_zone_balancing": True,
+    "rooms": [
+        {
+            "room_name": name,
+            "room_slug": slug,
+            "climate_entity": f"climate.{slug}",
+            "temp_sensors": [f"sensor.{slug}_temp"],
+            "humidity_sensors": [f"sensor.{slug}_humidity"],
+            "presence_sensors": [f"binary_sensor.{slug}_motion"],
+            "door_window_sensors": [f"binary_sensor.{slug}_window"],
+            "vent_entities": [f"cover.{slug}_vent"],
+            "auxiliary_entities": [f"switch.{slug}_heater"],
+        }
+        for name, slug in (("Living Room", "living_room"), ("Bedroom", "bedroom"))
+    ],
+    "schedules": [
+        {
+            "schedule_name": "Night",
+            "schedule_start_time": "22:00",
+            "schedule_end_time": "06:00",
+            "schedule_target_temp": 66,
+        }
+    ],
+}
+
+
+def _state(state, **attributes):
+    return SimpleNamespace(state=state, attributes=attributes)
+
+
+def _states(now: datetime) -> dict:
+    hour = now.hour + now.minute / 60
+    states = {}
+    for index, room in enumerate(CONFIG["rooms"]):
+        slug = room["room_slug"]
+        temp = 68 + 2 * math.sin((hour + index * 3) / 24 * 2 * math.pi)
+        heating = temp < 67.5
+        occupied = (7 <= hour < 9) if index else (17 <= hour < 23)
+        states.update(
+            {
+                f"climate.{slug}": _state(
+                    "heat",
+                    temperature=68,
+                    hvac_action="heating" if heating else "idle",
+                ),
+                f"sensor.{slug}_temp": _state(f"{temp:.1f}"),
+                f"sensor.{slug}_humidity": _state("45"),
+                f"binary_sensor.{slug}_motion": _state("on" if occupied else "off"),
+                f"binary_sensor.{slug}_window": _state("off"),
+            }
+        )
+    return states
+
+
+def main() -> None:
+    # Vent safety warnings fire every cycle in this synthetic house.
+    logging.basicConfig(level=logging.ERROR)
+    cycles = int(timedelta(days=DAYS) / INTERVAL)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "inputs.jsonl.gz")
+        writer = RecordingWriter(path, CONFIG)
+        start = time.perf_counter()
+        lines: list[str] = []
+        for step in range(cycles):
+            now = START + step * INTERVAL
+            lines.extend(writer.encode_cycle(now, _states(now)))
+            if len(lines) >= 1000:
+                writer.write(lines)
+                lines = []
+        writer.write(lines)
+        recorded = time.perf_counter() - start
+        size_kb = writer.size() / 1024
+
+        result = asyncio.run(async_replay(read_recording(path)))
+
+    print(f"recorded {cycles} cycles in {recorded:.2f}s ({size_kb:,.0f} KiB)")
+    print(
+        f"replayed {result.cycles} cycles in {result.elapsed:.2f}s "
+        f"({result.cycles_per_second:,.0f} cycles/s, "
+        f"{result.cycles * INTERVAL.total_seconds() / result.elapsed:,.0f}x real time)"
+    )
+    print(
+        f"{len(result.decisions)} decision changes, "
+        f"{len(result.service_calls)} service calls, {len(result.events)} events"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark control policies on a simulated house.
+
+Runs the coordinator against the RC thermal model for a simulated month
+with each policy toggled off in turn and prints comfort, runtime and
+throughput.  Run from the repository root:
+
+    python benchmarks/bench_simulator.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The integration imports Home Assistant; reuse the test stubs.
+import tests.mock_homeassistant  # noqa: F401, E402, I001
+
+from custom_components.smart_climate.const import (  # noqa: E402
+    CONF_ENABLE_FOLLOW_ME,
+    CONF_ENABLE_ZONE_BALANCING,
+)
+from custom_components.smart_climate.simulator import (  # noqa: E402
+    async_simulate,
+    default_house,
+    np,
+)
+
+DAYS = 30
+ROOMS = 8
+INTERVAL = 60
+
+POLICIES = {
+    "all enabled": {},
+    "no zone balancing": {CONF_ENABLE_ZONE_BALANCING: False},
+    "no follow-me": {CONF_ENABLE_FOLLOW_ME: False},
+    "neither": {CONF_ENABLE_ZONE_BALANCING: False, CONF_ENABLE_FOLLOW_ME: False},
+}
+
+
+def main() -> None:
+    # Vent safety warnings can fire every cycle.
+    logging.basicConfig(level=logging.ERROR)
+    house = default_house(ROOMS)
+    print(
+        f"{DAYS} days, {ROOMS} rooms, {INTERVAL}s cycles, "
+        f"{'NumPy' if np is not None else 'pure Python'} physics"
+    )
+    print(f"{'policy':<20}{'discomfort':>12}{'HVAC h':>9}{'aux h':>8}{'cycles/s':>10}")
+    for name, config in POLICIES.items():
+        result = asyncio.run(async_simulate(house, DAYS, interval=INTERVAL, config=config))
+        aux = sum(room["aux_hours"] for room in result.rooms.values())
+        print(
+            f"{name:<20}{result.discomfort_degree_hours:>12.1f}"
+            f"{result.hvac_hours:>9.1f}{aux:>8.1f}{result.cycles_per_second:>10,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
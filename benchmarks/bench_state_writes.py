@@ -0,0 +1,80 @@
+"""Count entity state writes made and skipped on a simulated house.
+
+Runs the coordinator against the RC thermal model for a simulated day,
+hands every refresh to all sensor, binary sensor and climate entities and
+reports how many state writes were actually needed.  Run from the
+repository root:
+
+    python benchmarks/bench_state_writes.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The integration imports Home Assistant; reuse the test stubs.
+import tests.mock_homeassistant  # noqa: F401, E402, I001
+
+from custom_components.smart_climate import (  # noqa: E402
+    binary_sensor,
+    climate,
+    sensor,
+)
+from custom_components.smart_climate.const import DOMAIN  # noqa: E402
+from custom_components.smart_climate.simulator import (  # noqa: E402
+    HouseSimulator,
+    default_house,
+)
+
+DAYS = 1
+ROOMS = 40
+INTERVAL = 60
+
+
+async def _run() -> None:
+    simulator = HouseSimulator(default_house(ROOMS), interval=INTERVAL)
+    coordinator = simulator.coordinator
+    coordinator.data = await coordinator._async_update_data()
+
+    entities = []
+    hass = SimpleNamespace(data={DOMAIN: {coordinator.entry.entry_id: coordinator}})
+    for platform in (sensor, binary_sensor, climate):
+        await platform.async_setup_entry(hass, coordinator.entry, entities.extend)
+
+    handling = 0.0
+
+    def update_listeners() -> None:
+        nonlocal handling
+        started = time.perf_counter()
+        for entity in entities:
+            entity._handle_coordinator_update()
+        handling += time.perf_counter() - started
+
+    coordinator.async_update_listeners = update_listeners
+    result = await simulator.async_run(DAYS)
+    cycles = result.cycles
+
+    stats = coordinator.state_write_stats
+    total = stats.written + stats.skipped
+    print(f"{DAYS} day(s), {ROOMS} rooms, {len(entities)} entities, {cycles} refreshes")
+    print(f"{'state writes before':<24}{total:>10,}  ({total / cycles:,.0f}/refresh)")
+    print(f"{'state writes now':<24}{stats.written:>10,}  ({stats.written / cycles:,.0f}/refresh)")
+    print(f"{'skipped as unchanged':<24}{stats.skipped / total:>10.1%}")
+    print(f"{'entity update time':<24}{handling / cycles * 1000:>10.2f} ms/refresh")
+
+
+def main() -> None:
+    # Vent safety warnings can fire every cycle.
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ from homeassistant.helpers import device_registry as dr
 from .const import DOMAIN
 from .coordinator import SmartClimateCoordinator
 from .services import async_setup_services, async_unload_services
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +41,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS_LIST)
     await async_setup_services(hass, coordinator)
+    async_register_websocket_commands(hass)
 
     # Remove devices/entities for rooms that were deleted from config
     _cleanup_stale_devices(hass, entry, coordinator)
@@ -50,6 +52,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Schedule daily AI analysis
     coordinator.schedule_daily_analysis()
 
+    # Timers for schedule transitions and pre-conditioning starts
+    coordinator.schedule_room_transitions()
+
+    # Presence from sensor events rather than polled samples
+    coordinator.start_presence_tracking()
+
+    # Close vents and stop auxiliary devices as soon as a window opens
+    coordinator.start_window_tracking()
+
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     _LOGGER.info("Smart Climate integration setup complete for %s", entry.title)
@@ -140,6 +151,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     coordinator: SmartClimateCoordinator = hass.data[DOMAIN][entry.entry_id]
     coordinator.cancel_scheduled_tasks()
+    # End card subscriptions; a reload gives them a new coordinator.
+    coordinator.feed.async_close()
+    await coordinator.analysis_jobs.async_shutdown()
     await coordinator.async_save_state()
 
     unload_ok = await hass.config_entries.async_unload_platforms(
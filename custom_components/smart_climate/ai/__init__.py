@@ -9,30 +9,49 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from ..coordinator import SmartClimateCoordinator
+    from .jobs import ProgressCallback
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_run_analysis(hass: HomeAssistant, coordinator: SmartClimateCoordinator) -> None:
+async def async_run_analysis(
+    hass: HomeAssistant,
+    coordinator: SmartClimateCoordinator,
+    progress: ProgressCallback | None = None,
+) -> None:
     """Run the full AI analysis pipeline.
 
     Steps:
-        1. Determine the configured AI provider.
-        2. Build system and user prompts from current coordinator data.
-        3. Send prompts to the AI provider and receive a response.
-        4. Parse the AI response into structured suggestions.
-        5. Store suggestions and summary in the coordinator's house state.
+        1. Determine the configured AI provider (or failover chain).
+        2. Run the local rules pre-pass (unless the provider is the rules
+           engine itself or the pre-pass is disabled).
+        3. Build system and user prompts from current coordinator data,
+           leaving out what the pre-pass already reported.
+        4. Send prompts to the AI provider and receive a response.
+        5. Parse the AI response into structured suggestions and merge
+           them after the pre-pass suggestions, capped at MAX_SUGGESTIONS.
+        6. Store suggestions and summary in the coordinator's house state.
+
+    If the provider fails, the pre-pass suggestions are still stored with
+    a local summary before the error propagates.
+
+    ``progress``, if given, is called with the name of each stage as it
+    starts ("rules", "prompt", "warm_up", "provider", "parse", "store").
     """
     from ..const import (
+        AI_PROVIDER_LOCAL,
         AI_PROVIDER_NONE,
-        CONF_AI_API_KEY,
-        CONF_AI_BASE_URL,
-        CONF_AI_MODEL,
+        CONF_AI_LOCAL_PREPASS,
         CONF_AI_PROVIDER,
+        DEFAULT_AI_LOCAL_PREPASS,
     )
-    from .analysis import parse_ai_response
+    from .analysis import MAX_SUGGESTIONS, parse_ai_response
     from .prompts import build_system_prompt, build_user_prompt
-    from .provider import create_ai_provider
+    from .rules import (
+        evaluate_rules,
+        findings_to_response,
+        findings_to_suggestions,
+    )
     from .suggestions import store_suggestions
 
     config = coordinator.config_entry.data
@@ -44,28 +63,58 @@ async def async_run_analysis(hass: HomeAssistant, coordinator: SmartClimateCoord
 
     _LOGGER.info("Starting AI analysis pipeline with provider '%s'", provider_type)
 
-    provider = create_ai_provider(
-        provider_type,
-        {
-            "api_key": config.get(CONF_AI_API_KEY, ""),
-            "model": config.get(CONF_AI_MODEL, ""),
-            "base_url": config.get(CONF_AI_BASE_URL, ""),
-        },
-    )
+    def stage(name: str) -> None:
+        if progress is not None:
+            progress(name)
+
+    provider = coordinator.get_ai_provider()
+    now = coordinator.clock.now()
 
+    stage("rules")
+    findings = []
+    if provider_type != AI_PROVIDER_LOCAL and config.get(
+        CONF_AI_LOCAL_PREPASS, DEFAULT_AI_LOCAL_PREPASS
+    ):
+        findings = evaluate_rules(coordinator.data, now)
+        _LOGGER.debug("Local rules pre-pass found %d issues", len(findings))
+
+    stage("prompt")
     system_prompt = build_system_prompt()
-    user_prompt = build_user_prompt(coordinator.data)
+    user_prompt = build_user_prompt(coordinator.data, findings=findings, now=now)
+
+    # Preload local models outside the analysis request's timeout; a
+    # no-op for hosted providers or if the scheduled warm-up already ran.
+    stage("warm_up")
+    await coordinator.async_warm_up_ai()
 
+    stage("provider")
     try:
         response = await provider.analyze(system_prompt, user_prompt)
     except Exception:
         _LOGGER.exception("AI provider failed to generate a response")
+        if findings:
+            stage("store")
+            await store_suggestions(
+                coordinator,
+                findings_to_suggestions(findings, now)[:MAX_SUGGESTIONS],
+                findings_to_response(findings)["summary"],
+            )
         raise
 
-    suggestions, summary = parse_ai_response(response)
+    stage("parse")
+    suggestions, summary = parse_ai_response(response, now)
+
+    if findings:
+        # A fallback to the local provider would repeat the pre-pass.
+        local = findings_to_suggestions(findings, now)
+        seen = {(s.room, s.title) for s in local}
+        suggestions = (
+            local + [s for s in suggestions if (s.room, s.title) not in seen]
+        )[:MAX_SUGGESTIONS]
 
     _LOGGER.info(
         "AI analysis complete: %d suggestions generated", len(suggestions)
     )
 
+    stage("store")
     await store_suggestions(coordinator, suggestions, summary)
@@ -31,17 +31,34 @@ ALLOWED_PRIORITIES = frozenset({"low", "medium", "high", "critical"})
 # HVAC modes that are considered safe to set via set_mode suggestions.
 SAFE_HVAC_MODES = frozenset({"heat", "cool", "auto", "off", "fan_only", "heat_cool", "dry"})
 
+# Upper bound on suggestions kept from a single analysis.
+MAX_SUGGESTIONS = 10
+
+# Responses larger than this are rejected before any parsing.
+MAX_RESPONSE_CHARS = 1_000_000
+
+# Opening braces tried before giving up on a response with stray "{" in prose.
+MAX_JSON_CANDIDATES = 8
+
 # Temperature sanity bounds (Fahrenheit).
 MIN_SAFE_TEMP = 55.0
 MAX_SAFE_TEMP = 85.0
 
 
-def parse_ai_response(response_text: str) -> tuple[list[Suggestion], str]:
+def parse_ai_response(
+    response_text: str, now: datetime | None = None
+) -> tuple[list[Suggestion], str]:
     """Parse raw AI response text into structured suggestions.
 
+    Providers return schema-constrained JSON; ``_extract_json`` still
+    tolerates fences and prose.  Schema mismatches are logged and the
+    lenient per-field sanitizers below still salvage what they can.
+
     Args:
         response_text: The raw text returned by the AI provider.  May be
             plain JSON or wrapped in markdown code fences.
+        now: Creation time for the suggestions (defaults to the wall
+            clock).
 
     Returns:
         A tuple of ``(suggestions_list, summary_text)``.  On parse failure
@@ -58,6 +75,16 @@ def parse_ai_response(response_text: str) -> tuple[list[Suggestion], str]:
         _LOGGER.warning("AI response root is not a JSON object")
         return [], "AI analysis returned an unexpected format."
 
+    from .schema import validate_analysis
+
+    errors = validate_analysis(data)
+    if errors:
+        _LOGGER.warning(
+            "AI response does not match the analysis schema (%d issues): %s",
+            len(errors),
+            "; ".join(errors[:5]),
+        )
+
     summary = _extract_summary(data)
     raw_suggestions = data.get("suggestions", [])
 
@@ -68,7 +95,7 @@ def parse_ai_response(response_text: str) -> tuple[list[Suggestion], str]:
     suggestions: list[Suggestion] = []
     for idx, raw in enumerate(raw_suggestions):
         try:
-            suggestion = _parse_single_suggestion(raw)
+            suggestion = _parse_single_suggestion(raw, now)
             if suggestion is not None:
                 suggestions.append(suggestion)
         except Exception:
@@ -76,8 +103,7 @@ def parse_ai_response(response_text: str) -> tuple[list[Suggestion], str]:
                 "Skipping invalid suggestion at index %d", idx, exc_info=True
             )
 
-    # Enforce a maximum of 10 suggestions
-    suggestions = suggestions[:10]
+    suggestions = suggestions[:MAX_SUGGESTIONS]
 
     _LOGGER.debug(
         "Parsed %d valid suggestions from AI response", len(suggestions)
@@ -90,23 +116,163 @@ def parse_ai_response(response_text: str) -> tuple[list[Suggestion], str]:
 # ---------------------------------------------------------------------------
 
 
-def _extract_json(text: str) -> Any:
-    """Extract a JSON object from raw text.
+def _extract_json(text: str, max_chars: int = MAX_RESPONSE_CHARS) -> Any:
+    """Extract the first complete top-level JSON object from raw text.
 
     Handles responses that are:
     - Plain JSON
     - Wrapped in ```json ... ``` markdown fences
-    - Wrapped in ``` ... ``` without a language tag
+    - Surrounded by prose before or after the object
+
+    Fenced content is tried first, then the whole text.  Each is scanned
+    from one opening brace at a time (see ``_scan_json_object``), moving
+    to the next brace when a candidate does not decode or never closes,
+    for at most MAX_JSON_CANDIDATES candidates, so the work stays linear
+    in the response size.  Only the object's span -- with the
+    ``suggestions`` array already truncated to MAX_SUGGESTIONS items --
+    is handed to ``json.loads``.
+
+    Raises:
+        ValueError: if the text exceeds ``max_chars`` or contains no
+            decodable JSON object.
     """
-    text = text.strip()
+    if len(text) > max_chars:
+        raise ValueError(
+            f"AI response is {len(text)} characters; limit is {max_chars}"
+        )
+
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        # Top-level array: let the caller reject it as the wrong shape.
+        return json.loads(stripped)
+
+    fenced = _fenced_block(text)
+    for source in (text,) if fenced is None else (fenced, text):
+        found = _first_json_object(source)
+        if found is not None:
+            return found
+
+    raise ValueError("No JSON object found in AI response")
+
 
-    # Try to extract from markdown code blocks first
-    pattern = r"```(?:json)?\s*\n?(.*?)\n?\s*```"
-    match = re.search(pattern, text, re.DOTALL)
-    if match:
-        text = match.group(1).strip()
+def _fenced_block(text: str) -> str | None:
+    """Return the content of the first ``` fence, or None if there is none."""
+    opening = text.find("```")
+    if opening < 0:
+        return None
+    body = opening + 3
+    if text.startswith("json", body):
+        body += 4
+    closing = text.find("```", body)
+    if closing < 0:
+        return None
+    return text[body:closing]
+
+
+def _first_json_object(text: str) -> Any:
+    """Return the first decodable top-level object in ``text``, or None."""
+    pos = 0
+    for _ in range(MAX_JSON_CANDIDATES):
+        candidate = _scan_json_object(text, pos)
+        if candidate is None:
+            return None
+        obj_start, fragment, balanced = candidate
+        if balanced:
+            try:
+                return json.loads(fragment)
+            except json.JSONDecodeError:
+                pass
+        elif text.find("}", obj_start) < 0:
+            # Nothing after this brace ever closes, so no later one can.
+            return None
+        # Prose such as "set {temp}" or "{68-70." -- try the next brace.
+        pos = obj_start + 1
+    return None
+
+
+# Outside a string only brackets and quotes matter; inside one only the
+# closing quote and escapes do.  Jumping between them with ``search``
+# keeps the scan linear and never backtracks.
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
 
-    return json.loads(text)
+
+def _scan_json_object(text: str, pos: int) -> tuple[int, str, bool] | None:
+    """Find the first balanced ``{...}`` at or after ``pos``.
+
+    Returns ``(start, fragment, balanced)`` where ``fragment`` is the
+    object text with any ``suggestions`` items beyond MAX_SUGGESTIONS cut
+    out; ``balanced`` is False when the text ends before the braces do.
+    Returns None when there is no opening brace.
+    """
+    start = text.find("{", pos)
+    if start < 0:
+        return None
+
+    depth = 0
+    last_key: str | None = None
+    last_key_end = -1
+    suggestions_depth = 0  # depth of the suggestions array, 0 = not inside
+    item_count = 0
+    cut_from = -1  # index after the last kept suggestion
+    cut_to = -1  # index of the suggestions array's closing bracket
+
+    i = start
+    length = len(text)
+    while i < length:
+        match = _STRUCTURAL.search(text, i)
+        if match is None:
+            break
+        i = match.start()
+        char = text[i]
+
+        if char == '"':
+            j = i + 1
+            while True:
+                special = _STRING_SPECIAL.search(text, j)
+                if special is None:
+                    return start, text[start:], False
+                if text[special.start()] == "\\":
+                    j = special.start() + 2
+                    continue
+                j = special.start()
+                break
+            if depth == 1:
+                last_key = text[i + 1 : j]
+                last_key_end = j + 1
+            i = j + 1
+            continue
+
+        if char in "{[":
+            if (
+                char == "["
+                and depth == 1
+                and last_key == "suggestions"
+                and text[last_key_end:i].strip() == ":"
+            ):
+                suggestions_depth = depth + 1
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                if cut_from >= 0:
+                    fragment = text[start:cut_from] + text[cut_to : i + 1]
+                else:
+                    fragment = text[start : i + 1]
+                return start, fragment, True
+            if suggestions_depth:
+                if depth == suggestions_depth and char == "}":
+                    item_count += 1
+                    if item_count == MAX_SUGGESTIONS:
+                        cut_from = i + 1
+                elif depth == suggestions_depth - 1:
+                    # Closing bracket of the suggestions array itself.
+                    if cut_from >= 0:
+                        cut_to = i
+                    suggestions_depth = 0
+        i += 1
+
+    return start, text[start:], False
 
 
 def _extract_summary(data: dict) -> str:
@@ -117,7 +283,9 @@ def _extract_summary(data: dict) -> str:
     return summary.strip() or "No summary provided."
 
 
-def _parse_single_suggestion(raw: Any) -> Suggestion | None:
+def _parse_single_suggestion(
+    raw: Any, now: datetime | None = None
+) -> Suggestion | None:
     """Parse and validate a single suggestion dict into a Suggestion model.
 
     Returns None if the suggestion fails validation (unknown action type,
@@ -170,7 +338,7 @@ def _parse_single_suggestion(raw: Any) -> Suggestion | None:
     description = str(raw.get("description", "")).strip()
     reasoning = str(raw.get("reasoning", "")).strip()
 
-    now = datetime.now()
+    now = now or datetime.now()
 
     return Suggestion(
         id=str(uuid.uuid4()),
@@ -8,7 +8,17 @@ import logging
 
 import aiohttp
 
-from .provider import AIConnectionError, AIProviderBase, AIResponseError
+from .provider import (
+    RATE_LIMIT_STATUSES,
+    AIConnectionError,
+    AIProviderBase,
+    AIRateLimitError,
+    AIResponseError,
+    parse_retry_after,
+    read_limited_text,
+)
+from .schema import ANALYSIS_SCHEMA, ANALYSIS_SCHEMA_NAME
+from .telemetry import AICallRecord, build_trace_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,13 +26,21 @@ DEFAULT_API_URL = "https://api.anthropic.com"
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
 ANTHROPIC_VERSION = "2023-06-01"
 REQUEST_TIMEOUT = 120  # seconds
-MAX_RETRIES = 3
-RETRY_BACKOFF_SECONDS = [2, 4, 8]
+
+# The analysis schema is exposed as a single tool the model is forced to
+# call, so its arguments arrive as already-decoded JSON.
+ANALYSIS_TOOL = {
+    "name": ANALYSIS_SCHEMA_NAME,
+    "description": "Record the climate analysis summary and suggestions.",
+    "input_schema": ANALYSIS_SCHEMA,
+}
 
 
 class AnthropicProvider(AIProviderBase):
     """AI provider that talks to the Anthropic Messages API."""
 
+    provider_name = "Anthropic"
+
     def __init__(self, config: dict) -> None:
         super().__init__(config)
         self._api_key: str = config.get("api_key", "")
@@ -36,8 +54,11 @@ class AnthropicProvider(AIProviderBase):
     async def analyze(self, system_prompt: str, user_prompt: str) -> str:
         """Send prompts to the Anthropic messages endpoint.
 
-        Retries up to MAX_RETRIES times with exponential back-off on
-        transient failures (5xx, timeouts, connection errors).
+        Tool use is forced on ANALYSIS_TOOL so the reply follows the
+        analysis schema.
+
+        Transient failures are retried by the shared policy in
+        AIProviderBase._request_with_retry.
         """
         url = f"{self._base_url}/v1/messages"
         headers = {
@@ -52,31 +73,12 @@ class AnthropicProvider(AIProviderBase):
             "messages": [
                 {"role": "user", "content": user_prompt},
             ],
+            "tools": [ANALYSIS_TOOL],
+            "tool_choice": {"type": "tool", "name": ANALYSIS_SCHEMA_NAME},
         }
 
-        last_error: Exception | None = None
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                return await self._make_request(url, headers, payload)
-            except AIConnectionError as err:
-                last_error = err
-                if attempt < MAX_RETRIES - 1:
-                    wait = RETRY_BACKOFF_SECONDS[attempt]
-                    _LOGGER.warning(
-                        "Anthropic request failed (attempt %d/%d), retrying in %ds: %s",
-                        attempt + 1,
-                        MAX_RETRIES,
-                        wait,
-                        err,
-                    )
-                    await asyncio.sleep(wait)
-            except AIResponseError:
-                # Non-retryable response error -- propagate immediately
-                raise
-
-        raise AIConnectionError(
-            f"Anthropic request failed after {MAX_RETRIES} attempts: {last_error}"
+        return await self._request_with_retry(
+            lambda call: self._make_request(url, headers, payload, call)
         )
 
     async def test_connection(self) -> bool:
@@ -116,20 +118,30 @@ class AnthropicProvider(AIProviderBase):
     # ------------------------------------------------------------------
 
     async def _make_request(
-        self, url: str, headers: dict, payload: dict
+        self, url: str, headers: dict, payload: dict, call: AICallRecord
     ) -> str:
         """Execute a single HTTP POST and return the assistant text content."""
         timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
 
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session, session.post(
-                url, headers=headers, json=payload
+            async with aiohttp.ClientSession(
+                timeout=timeout, trace_configs=[build_trace_config()]
+            ) as session, session.post(
+                url, headers=headers, json=payload, trace_request_ctx=call
             ) as resp:
-                body = await resp.text()
+                body = await read_limited_text(resp)
+                call.response_bytes = len(body.encode())
+
+                if resp.status in RATE_LIMIT_STATUSES:
+                    raise AIRateLimitError(
+                        f"Anthropic rate limited ({resp.status}): {body[:500]}",
+                        retry_after=parse_retry_after(resp.headers),
+                    )
 
                 if resp.status >= 500:
                     raise AIConnectionError(
-                        f"Anthropic server error {resp.status}: {body[:500]}"
+                        f"Anthropic server error {resp.status}: {body[:500]}",
+                        retry_after=parse_retry_after(resp.headers),
                     )
 
                 if resp.status != 200:
@@ -145,12 +157,16 @@ class AnthropicProvider(AIProviderBase):
                     ) from err
 
                 try:
-                    content = data["content"][0]["text"]
+                    content = _extract_content(data["content"])
                 except (KeyError, IndexError, TypeError) as err:
                     raise AIResponseError(
                         f"Unexpected Anthropic response structure: {err}"
                     ) from err
 
+                usage = data.get("usage") or {}
+                call.prompt_tokens = usage.get("input_tokens")
+                call.completion_tokens = usage.get("output_tokens")
+
                 return content
 
         except aiohttp.ClientError as err:
@@ -161,3 +177,14 @@ class AnthropicProvider(AIProviderBase):
             raise AIConnectionError(
                 f"Anthropic request timed out after {REQUEST_TIMEOUT}s"
             ) from err
+
+
+def _extract_content(blocks: list[dict]) -> str:
+    """Return the forced tool call's input as JSON, else the first text block."""
+    for block in blocks:
+        if block.get("type") == "tool_use" and block.get("name") == ANALYSIS_SCHEMA_NAME:
+            return json.dumps(block["input"])
+    for block in blocks:
+        if block.get("type", "text") == "text":
+            return block["text"]
+    raise KeyError("no tool_use or text block")
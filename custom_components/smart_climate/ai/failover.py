@@ -0,0 +1,323 @@
+"""Ordered AI provider chain with hedged requests and circuit breakers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Any
+
+from .provider import AIConnectionError, AIProviderBase, AIProviderError, AIResponseError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hedging: launch the next provider once the running one is slower than
+# this percentile of its own recent successful latencies.
+DEFAULT_HEDGE_PERCENTILE = 95
+# Samples required before the percentile is trusted.
+HEDGE_MIN_SAMPLES = 5
+# Hedge delay used until enough latency samples have been collected.
+DEFAULT_HEDGE_DELAY = 45.0  # seconds
+# Number of recent latencies kept per provider.
+LATENCY_WINDOW = 50
+
+# Circuit breaker: open after this many consecutive failures ...
+BREAKER_FAILURE_THRESHOLD = 3
+# ... and allow a single trial request again after this many seconds.
+BREAKER_RESET_SECONDS = 600
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+
+
+class CircuitBreaker:
+    """Per-provider circuit breaker.
+
+    Closed: requests flow normally.  Open: the provider is skipped until
+    ``reset_seconds`` have passed.  Half-open: one trial request is let
+    through; success closes the breaker, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = BREAKER_RESET_SECONDS,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Return the current breaker state."""
+        if self._opened_at is None:
+            return BREAKER_CLOSED
+        if time.monotonic() - self._opened_at >= self._reset_seconds:
+            return BREAKER_HALF_OPEN
+        return BREAKER_OPEN
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Return the number of failures since the last success."""
+        return self._consecutive_failures
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent to this provider now."""
+        state = self.state
+        if state == BREAKER_CLOSED:
+            return True
+        if state == BREAKER_HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure and open the breaker once the threshold is hit."""
+        self._consecutive_failures += 1
+        self._trial_in_flight = False
+        if (
+            self._opened_at is not None
+            or self._consecutive_failures >= self._failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Release a half-open trial slot without recording an outcome."""
+        self._trial_in_flight = False
+
+
+# ---------------------------------------------------------------------------
+# Latency tracking
+# ---------------------------------------------------------------------------
+
+
+class LatencyTracker:
+    """Bounded window of recent successful request latencies."""
+
+    def __init__(self, size: int = LATENCY_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample in seconds."""
+        self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the nearest-rank percentile, or None without samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+        return ordered[rank]
+
+
+# ---------------------------------------------------------------------------
+# Failover provider
+# ---------------------------------------------------------------------------
+
+
+class FailoverProvider(AIProviderBase):
+    """Provider that fans a request out over an ordered chain of providers.
+
+    The first healthy provider is asked first.  If it fails, the next one
+    is tried.  If it is merely slow -- slower than ``hedge_percentile`` of
+    its recent latencies -- a hedged request is sent to the next provider
+    as well, the first valid response wins and the loser is cancelled.
+    Providers whose circuit breaker is open are skipped.
+    """
+
+    def __init__(
+        self,
+        providers: list[tuple[str, AIProviderBase]],
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+    ) -> None:
+        super().__init__({})
+        self._providers = providers
+        self._hedge_percentile = hedge_percentile
+        self._breakers: dict[str, CircuitBreaker] = {
+            name: CircuitBreaker() for name, _ in providers
+        }
+        self._latencies: dict[str, LatencyTracker] = {
+            name: LatencyTracker() for name, _ in providers
+        }
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    async def analyze(self, system_prompt: str, user_prompt: str) -> str:
+        """Return the first valid response from the provider chain."""
+        queue = [
+            (name, provider)
+            for name, provider in self._providers
+            if self._breakers[name].allow_request()
+        ]
+        if not queue:
+            raise AIConnectionError(
+                "All AI providers are unavailable (circuit breakers open)"
+            )
+
+        pending: dict[asyncio.Task[str], str] = {}
+        errors: list[str] = []
+        last_launch = 0.0
+        last_name = ""
+
+        def _launch() -> None:
+            nonlocal last_launch, last_name
+            name, provider = queue.pop(0)
+            task = asyncio.ensure_future(
+                self._call_provider(name, provider, system_prompt, user_prompt)
+            )
+            pending[task] = name
+            last_launch = time.monotonic()
+            last_name = name
+
+        _launch()
+        try:
+            while pending:
+                timeout = None
+                if queue:
+                    deadline = last_launch + self._hedge_delay(last_name)
+                    timeout = max(0.0, deadline - time.monotonic())
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    _LOGGER.info(
+                        "AI provider '%s' exceeded its p%d latency; "
+                        "sending hedged request to '%s'",
+                        last_name,
+                        self._hedge_percentile,
+                        queue[0][0],
+                    )
+                    _launch()
+                    continue
+
+                for task in done:
+                    name = pending.pop(task)
+                    try:
+                        return task.result()
+                    except AIProviderError as err:
+                        errors.append(f"{name}: {err}")
+                        _LOGGER.warning("AI provider '%s' failed: %s", name, err)
+
+                if queue and not pending:
+                    _launch()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            # Providers that were never launched give back their trial slot.
+            for name, _ in queue:
+                self._breakers[name].release()
+
+        raise AIConnectionError("All AI providers failed: " + "; ".join(errors))
+
+    async def test_connection(self) -> bool:
+        """Return True if at least one provider in the chain is reachable."""
+        for _name, provider in self._providers:
+            if await provider.test_connection():
+                return True
+        return False
+
+    async def warm_up(self, keep_alive_minutes: float) -> bool:
+        """Warm every provider in the chain; True if any was warmed."""
+        results = await asyncio.gather(
+            *(
+                provider.warm_up(keep_alive_minutes)
+                for _name, provider in self._providers
+            ),
+            return_exceptions=True,
+        )
+        return any(result is True for result in results)
+
+    def health(self) -> dict[str, dict[str, Any]]:
+        """Return breaker state and latency percentiles per provider."""
+        result: dict[str, dict[str, Any]] = {}
+        for name, _ in self._providers:
+            tracker = self._latencies[name]
+            breaker = self._breakers[name]
+            p50 = tracker.percentile(50)
+            p95 = tracker.percentile(self._hedge_percentile)
+            result[name] = {
+                "circuit": breaker.state,
+                "consecutive_failures": breaker.consecutive_failures,
+                "latency_samples": len(tracker),
+                "latency_p50": round(p50, 2) if p50 is not None else None,
+                "latency_hedge": round(p95, 2) if p95 is not None else None,
+            }
+        return result
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _hedge_delay(self, name: str) -> float:
+        """Return how long to wait on ``name`` before hedging."""
+        tracker = self._latencies[name]
+        if len(tracker) < HEDGE_MIN_SAMPLES:
+            return DEFAULT_HEDGE_DELAY
+        return tracker.percentile(self._hedge_percentile) or DEFAULT_HEDGE_DELAY
+
+    async def _call_provider(
+        self,
+        name: str,
+        provider: AIProviderBase,
+        system_prompt: str,
+        user_prompt: str,
+    ) -> str:
+        """Run one provider, validate the result and update its health."""
+        breaker = self._breakers[name]
+        start = time.monotonic()
+        try:
+            response = await provider.analyze(system_prompt, user_prompt)
+            _validate_response(response)
+        except asyncio.CancelledError:
+            # Lost a hedge race -- neither a success nor a failure.
+            breaker.release()
+            raise
+        except AIProviderError:
+            breaker.record_failure()
+            raise
+        except Exception as err:
+            breaker.record_failure()
+            raise AIConnectionError(f"Unexpected provider error: {err}") from err
+
+        breaker.record_success()
+        self._latencies[name].record(time.monotonic() - start)
+        return response
+
+
+def _validate_response(response: str) -> None:
+    """Raise AIResponseError unless ``response`` holds a JSON object."""
+    from .analysis import _extract_json
+
+    if not isinstance(response, str) or not response.strip():
+        raise AIResponseError("Provider returned an empty response")
+    try:
+        data = _extract_json(response)
+    except ValueError as err:
+        raise AIResponseError(f"Provider returned unparseable JSON: {err}") from err
+    if not isinstance(data, dict):
+        raise AIResponseError("Provider response is not a JSON object")
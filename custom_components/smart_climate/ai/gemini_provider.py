@@ -8,20 +8,32 @@ import logging
 
 import aiohttp
 
-from .provider import AIConnectionError, AIProviderBase, AIResponseError
+from .provider import (
+    RATE_LIMIT_STATUSES,
+    AIConnectionError,
+    AIProviderBase,
+    AIRateLimitError,
+    AIResponseError,
+    parse_retry_after,
+    read_limited_text,
+)
+from .schema import ANALYSIS_SCHEMA, to_gemini_schema
+from .telemetry import AICallRecord, build_trace_config
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com"
 DEFAULT_MODEL = "gemini-2.0-flash"
 REQUEST_TIMEOUT = 120  # seconds
-MAX_RETRIES = 3
-RETRY_BACKOFF_SECONDS = [2, 4, 8]
+
+RESPONSE_SCHEMA = to_gemini_schema(ANALYSIS_SCHEMA)
 
 
 class GeminiProvider(AIProviderBase):
     """AI provider that talks to the Google Gemini (Generative Language) API."""
 
+    provider_name = "Gemini"
+
     def __init__(self, config: dict) -> None:
         super().__init__(config)
         self._api_key: str = config.get("api_key", "")
@@ -35,8 +47,10 @@ class GeminiProvider(AIProviderBase):
     async def analyze(self, system_prompt: str, user_prompt: str) -> str:
         """Send prompts to the Gemini generateContent endpoint.
 
-        Retries up to MAX_RETRIES times with exponential back-off on
-        transient failures (5xx, timeouts, connection errors).
+        The analysis schema is enforced through ``responseSchema``.
+
+        Transient failures are retried by the shared policy in
+        AIProviderBase._request_with_retry.
         """
         url = (
             f"{self._base_url}/v1beta/models/{self._model}:generateContent"
@@ -53,33 +67,13 @@ class GeminiProvider(AIProviderBase):
             ],
             "generationConfig": {
                 "responseMimeType": "application/json",
+                "responseSchema": RESPONSE_SCHEMA,
                 "temperature": 0.3,
             },
         }
 
-        last_error: Exception | None = None
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                return await self._make_request(url, headers, payload)
-            except AIConnectionError as err:
-                last_error = err
-                if attempt < MAX_RETRIES - 1:
-                    wait = RETRY_BACKOFF_SECONDS[attempt]
-                    _LOGGER.warning(
-                        "Gemini request failed (attempt %d/%d), retrying in %ds: %s",
-                        attempt + 1,
-                        MAX_RETRIES,
-                        wait,
-                        err,
-                    )
-                    await asyncio.sleep(wait)
-            except AIResponseError:
-                # Non-retryable response error -- propagate immediately
-                raise
-
-        raise AIConnectionError(
-            f"Gemini request failed after {MAX_RETRIES} attempts: {last_error}"
+        return await self._request_with_retry(
+            lambda call: self._make_request(url, headers, payload, call)
         )
 
     async def test_connection(self) -> bool:
@@ -105,20 +99,30 @@ class GeminiProvider(AIProviderBase):
     # ------------------------------------------------------------------
 
     async def _make_request(
-        self, url: str, headers: dict, payload: dict
+        self, url: str, headers: dict, payload: dict, call: AICallRecord
     ) -> str:
         """Execute a single HTTP POST and return the generated text content."""
         timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
 
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session, session.post(
-                url, headers=headers, json=payload
+            async with aiohttp.ClientSession(
+                timeout=timeout, trace_configs=[build_trace_config()]
+            ) as session, session.post(
+                url, headers=headers, json=payload, trace_request_ctx=call
             ) as resp:
-                body = await resp.text()
+                body = await read_limited_text(resp)
+                call.response_bytes = len(body.encode())
+
+                if resp.status in RATE_LIMIT_STATUSES:
+                    raise AIRateLimitError(
+                        f"Gemini rate limited ({resp.status}): {body[:500]}",
+                        retry_after=parse_retry_after(resp.headers),
+                    )
 
                 if resp.status >= 500:
                     raise AIConnectionError(
-                        f"Gemini server error {resp.status}: {body[:500]}"
+                        f"Gemini server error {resp.status}: {body[:500]}",
+                        retry_after=parse_retry_after(resp.headers),
                     )
 
                 if resp.status != 200:
@@ -140,6 +144,10 @@ class GeminiProvider(AIProviderBase):
                         f"Unexpected Gemini response structure: {err}"
                     ) from err
 
+                usage = data.get("usageMetadata") or {}
+                call.prompt_tokens = usage.get("promptTokenCount")
+                call.completion_tokens = usage.get("candidatesTokenCount")
+
                 return content
 
         except aiohttp.ClientError as err:
@@ -19,6 +19,8 @@ class GrokProvider(OpenAIProvider):
     the default base URL and model while inheriting all request logic.
     """
 
+    provider_name = "Grok"
+
     def __init__(self, config: dict) -> None:
         # Apply Grok-specific defaults before passing to the parent
         grok_config = dict(config)
@@ -0,0 +1,219 @@
+"""Single-flight job manager for AI analysis runs.
+
+Triggers (button, service, daily timer) call ``request`` and return at
+once with a job id.  At most one analysis runs at a time and at most one
+follow-up waits behind it; further triggers while a follow-up is queued
+are collapsed into that follow-up.  Every state change and pipeline stage
+is fired as an ``EVENT_ANALYSIS_PROGRESS`` bus event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from ..const import EVENT_ANALYSIS_PROGRESS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+# Finished jobs kept for diagnostics.
+JOB_HISTORY_SIZE = 10
+
+ProgressCallback = Callable[[str], None]
+JobRunner = Callable[["AnalysisJob", ProgressCallback], Awaitable[None]]
+
+
+@dataclass
+class AnalysisJob:
+    """One requested analysis run."""
+
+    job_id: str
+    trigger: str
+    state: str = JOB_QUEUED
+    stage: str | None = None
+    # Number of triggers collapsed into this job, including its own.
+    requests: int = 1
+    created_at: datetime = field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+
+    @property
+    def done(self) -> bool:
+        """Return True once the job has finished in any way."""
+        return self.state in (JOB_COMPLETED, JOB_FAILED, JOB_CANCELLED)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for events and diagnostics."""
+        return {
+            "job_id": self.job_id,
+            "trigger": self.trigger,
+            "state": self.state,
+            "stage": self.stage,
+            "requests": self.requests,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+        }
+
+
+class AnalysisJobManager:
+    """Run analysis jobs one at a time with a single queued follow-up."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        runner: JobRunner,
+        history_size: int = JOB_HISTORY_SIZE,
+    ) -> None:
+        self._hass = hass
+        self._runner = runner
+        self._current: AnalysisJob | None = None
+        self._pending: AnalysisJob | None = None
+        self._task: asyncio.Task | None = None
+        self._history: deque[AnalysisJob] = deque(maxlen=history_size)
+        self._closing = False
+
+    @property
+    def current(self) -> AnalysisJob | None:
+        """Return the running job, if any."""
+        return self._current
+
+    @property
+    def pending(self) -> AnalysisJob | None:
+        """Return the queued follow-up job, if any."""
+        return self._pending
+
+    @property
+    def busy(self) -> bool:
+        """Return True while a job is running or queued."""
+        return self._current is not None or self._pending is not None
+
+    def request(self, trigger: str = "manual", cancel_running: bool = False) -> str:
+        """Request an analysis run and return its job id without waiting.
+
+        With nothing running the job starts immediately.  Otherwise the
+        request joins the queued follow-up (creating it if needed), and
+        with ``cancel_running`` the stale in-flight run is cancelled so
+        the follow-up starts straight away.
+        """
+        if self._current is None:
+            job = self._new_job(trigger)
+            self._start(job)
+            return job.job_id
+
+        if self._pending is None:
+            self._pending = self._new_job(trigger)
+            self._fire(self._pending)
+        else:
+            self._pending.requests += 1
+            _LOGGER.debug(
+                "Analysis trigger '%s' collapsed into queued job %s",
+                trigger,
+                self._pending.job_id,
+            )
+
+        if cancel_running and self._task is not None and not self._task.done():
+            _LOGGER.info("Cancelling stale analysis job %s", self._current.job_id)
+            self._task.cancel()
+        return self._pending.job_id
+
+    def get(self, job_id: str) -> AnalysisJob | None:
+        """Look up a running, queued or recently finished job."""
+        for job in (self._current, self._pending, *self._history):
+            if job is not None and job.job_id == job_id:
+                return job
+        return None
+
+    async def async_join(self) -> None:
+        """Wait until no job is running or queued."""
+        while self._task is not None:
+            await asyncio.wait({self._task})
+
+    async def async_shutdown(self) -> None:
+        """Drop the queued job and cancel the running one."""
+        self._closing = True
+        if self._pending is not None:
+            self._finish(self._pending, JOB_CANCELLED)
+            self._pending = None
+        task = self._task
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.wait({task})
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the manager state for diagnostics."""
+        return {
+            "current": self._current.to_dict() if self._current else None,
+            "pending": self._pending.to_dict() if self._pending else None,
+            "history": [job.to_dict() for job in self._history],
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _new_job(trigger: str) -> AnalysisJob:
+        return AnalysisJob(job_id=uuid.uuid4().hex[:12], trigger=trigger)
+
+    def _start(self, job: AnalysisJob) -> None:
+        self._current = job
+        job.state = JOB_RUNNING
+        job.started_at = datetime.now(tz=timezone.utc)
+        self._fire(job)
+        self._task = self._hass.async_create_background_task(
+            self._run(job), f"smart_climate_analysis_{job.job_id}"
+        )
+        self._task.add_done_callback(lambda _task: self._on_done(job))
+
+    async def _run(self, job: AnalysisJob) -> None:
+        def progress(stage: str) -> None:
+            job.stage = stage
+            self._fire(job)
+
+        try:
+            await self._runner(job, progress)
+        except asyncio.CancelledError:
+            self._finish(job, JOB_CANCELLED)
+            raise
+        except Exception as err:
+            job.error = str(err)
+            self._finish(job, JOB_FAILED)
+        else:
+            self._finish(job, JOB_COMPLETED)
+
+    def _on_done(self, job: AnalysisJob) -> None:
+        # A task cancelled before its first step never enters _run.
+        if not job.done:
+            self._finish(job, JOB_CANCELLED)
+        self._current = None
+        self._task = None
+        if self._pending is not None and not self._closing:
+            follow_up, self._pending = self._pending, None
+            self._start(follow_up)
+
+    def _finish(self, job: AnalysisJob, state: str) -> None:
+        job.state = state
+        job.finished_at = datetime.now(tz=timezone.utc)
+        self._history.append(job)
+        self._fire(job)
+
+    def _fire(self, job: AnalysisJob) -> None:
+        self._hass.bus.async_fire(EVENT_ANALYSIS_PROGRESS, job.to_dict())
@@ -5,27 +5,45 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 
 import aiohttp
 
-from .provider import AIConnectionError, AIProviderBase, AIResponseError
+from .provider import (
+    RATE_LIMIT_STATUSES,
+    AIConnectionError,
+    AIProviderBase,
+    AIRateLimitError,
+    AIResponseError,
+    parse_retry_after,
+    read_limited_text,
+)
+from .schema import ANALYSIS_SCHEMA
+from .telemetry import AICallRecord, build_trace_config
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "http://localhost:11434"
 DEFAULT_MODEL = "llama3.1"
 REQUEST_TIMEOUT = 120  # seconds
-MAX_RETRIES = 3
-RETRY_BACKOFF_SECONDS = [2, 4, 8]
+# Loading a large model on CPU can take minutes; the preload gets its own,
+# longer budget so the analysis request itself never pays for it.
+WARMUP_TIMEOUT = 300  # seconds
+# Ollama reports model load time; anything above this means a cold start.
+COLD_LOAD_THRESHOLD = 1.0  # seconds
 
 
 class OllamaProvider(AIProviderBase):
     """AI provider that talks to a local Ollama instance."""
 
+    provider_name = "Ollama"
+
     def __init__(self, config: dict) -> None:
         super().__init__(config)
         self._model: str = config.get("model", "") or DEFAULT_MODEL
         self._base_url: str = (config.get("base_url", "") or DEFAULT_BASE_URL).rstrip("/")
+        # Monotonic time until which the last preload keeps the model loaded.
+        self._warm_until = 0.0
 
     # ------------------------------------------------------------------
     # Public interface
@@ -34,8 +52,11 @@ class OllamaProvider(AIProviderBase):
     async def analyze(self, system_prompt: str, user_prompt: str) -> str:
         """Send prompts to the Ollama chat endpoint.
 
-        Retries up to MAX_RETRIES times with exponential back-off on
-        transient failures (connection errors, timeouts).
+        The analysis schema is passed as ``format`` so the model's output
+        is constrained to it.
+
+        Transient failures are retried by the shared policy in
+        AIProviderBase._request_with_retry.
         """
         url = f"{self._base_url}/api/chat"
         payload = {
@@ -45,33 +66,52 @@ class OllamaProvider(AIProviderBase):
                 {"role": "user", "content": user_prompt},
             ],
             "stream": False,
-            "format": "json",
+            "format": ANALYSIS_SCHEMA,
         }
 
-        last_error: Exception | None = None
+        return await self._request_with_retry(
+            lambda call: self._make_request(url, payload, call)
+        )
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                return await self._make_request(url, payload)
-            except AIConnectionError as err:
-                last_error = err
-                if attempt < MAX_RETRIES - 1:
-                    wait = RETRY_BACKOFF_SECONDS[attempt]
+    async def warm_up(self, keep_alive_minutes: float) -> bool:
+        """Preload the model and keep it resident for ``keep_alive_minutes``.
+
+        Sends an empty-prompt generate request, which makes Ollama load
+        the model without generating.  Skipped while a previous preload
+        is still within its keep-alive window.
+        """
+        if time.monotonic() < self._warm_until:
+            return True
+
+        url = f"{self._base_url}/api/generate"
+        payload = {"model": self._model, "keep_alive": f"{int(keep_alive_minutes)}m"}
+        timeout = aiohttp.ClientTimeout(total=WARMUP_TIMEOUT)
+        start = time.monotonic()
+
+        try:
+            async with aiohttp.ClientSession(timeout=timeout) as session, session.post(
+                url, json=payload
+            ) as resp:
+                await resp.read()
+                if resp.status != 200:
                     _LOGGER.warning(
-                        "Ollama request failed (attempt %d/%d), retrying in %ds: %s",
-                        attempt + 1,
-                        MAX_RETRIES,
-                        wait,
-                        err,
+                        "Ollama warm-up for %s returned status %d",
+                        self._model,
+                        resp.status,
                     )
-                    await asyncio.sleep(wait)
-            except AIResponseError:
-                # Non-retryable response error -- propagate immediately
-                raise
+                    return False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.warning("Ollama warm-up for %s failed: %s", self._model, err)
+            return False
 
-        raise AIConnectionError(
-            f"Ollama request failed after {MAX_RETRIES} attempts: {last_error}"
+        self._warm_until = start + keep_alive_minutes * 60
+        _LOGGER.debug(
+            "Ollama model %s warmed in %.1fs (keep_alive %dm)",
+            self._model,
+            time.monotonic() - start,
+            keep_alive_minutes,
         )
+        return True
 
     async def test_connection(self) -> bool:
         """Test connectivity by requesting the list of available models."""
@@ -95,20 +135,32 @@ class OllamaProvider(AIProviderBase):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _make_request(self, url: str, payload: dict) -> str:
+    async def _make_request(
+        self, url: str, payload: dict, call: AICallRecord
+    ) -> str:
         """Execute a single HTTP POST and return the assistant message content."""
         timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
         headers = {"Content-Type": "application/json"}
 
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session, session.post(
-                url, headers=headers, json=payload
+            async with aiohttp.ClientSession(
+                timeout=timeout, trace_configs=[build_trace_config()]
+            ) as session, session.post(
+                url, headers=headers, json=payload, trace_request_ctx=call
             ) as resp:
-                body = await resp.text()
+                body = await read_limited_text(resp)
+                call.response_bytes = len(body.encode())
+
+                if resp.status in RATE_LIMIT_STATUSES:
+                    raise AIRateLimitError(
+                        f"Ollama rate limited ({resp.status}): {body[:500]}",
+                        retry_after=parse_retry_after(resp.headers),
+                    )
 
                 if resp.status >= 500:
                     raise AIConnectionError(
-                        f"Ollama server error {resp.status}: {body[:500]}"
+                        f"Ollama server error {resp.status}: {body[:500]}",
+                        retry_after=parse_retry_after(resp.headers),
                     )
 
                 if resp.status != 200:
@@ -130,6 +182,12 @@ class OllamaProvider(AIProviderBase):
                         f"Unexpected Ollama response structure: {err}"
                     ) from err
 
+                call.prompt_tokens = data.get("prompt_eval_count")
+                call.completion_tokens = data.get("eval_count")
+                load_ns = data.get("load_duration")
+                if isinstance(load_ns, (int, float)):
+                    call.model_warm = load_ns / 1e9 < COLD_LOAD_THRESHOLD
+
                 return content
 
         except aiohttp.ClientError as err:
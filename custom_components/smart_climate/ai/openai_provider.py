@@ -8,20 +8,39 @@ import logging
 
 import aiohttp
 
-from .provider import AIConnectionError, AIProviderBase, AIResponseError
+from .provider import (
+    RATE_LIMIT_STATUSES,
+    AIConnectionError,
+    AIProviderBase,
+    AIRateLimitError,
+    AIResponseError,
+    parse_retry_after,
+    read_limited_text,
+)
+from .schema import ANALYSIS_SCHEMA, ANALYSIS_SCHEMA_NAME, to_strict_schema
+from .telemetry import AICallRecord, build_trace_config
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "https://api.openai.com"
 DEFAULT_MODEL = "gpt-4o-mini"
 REQUEST_TIMEOUT = 120  # seconds
-MAX_RETRIES = 3
-RETRY_BACKOFF_SECONDS = [2, 4, 8]
+
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": ANALYSIS_SCHEMA_NAME,
+        "strict": True,
+        "schema": to_strict_schema(ANALYSIS_SCHEMA),
+    },
+}
 
 
 class OpenAIProvider(AIProviderBase):
     """AI provider that talks to OpenAI (or any OpenAI-compatible API)."""
 
+    provider_name = "OpenAI"
+
     def __init__(self, config: dict) -> None:
         super().__init__(config)
         self._api_key: str = config.get("api_key", "")
@@ -35,8 +54,11 @@ class OpenAIProvider(AIProviderBase):
     async def analyze(self, system_prompt: str, user_prompt: str) -> str:
         """Send prompts to the OpenAI chat completions endpoint.
 
-        Retries up to MAX_RETRIES times with exponential back-off on
-        transient failures (5xx, timeouts, connection errors).
+        The analysis schema is enforced with ``response_format``
+        ``json_schema`` in strict mode.
+
+        Transient failures are retried by the shared policy in
+        AIProviderBase._request_with_retry.
         """
         url = f"{self._base_url}/v1/chat/completions"
         headers = {
@@ -50,32 +72,11 @@ class OpenAIProvider(AIProviderBase):
                 {"role": "user", "content": user_prompt},
             ],
             "temperature": 0.3,
-            "response_format": {"type": "json_object"},
+            "response_format": RESPONSE_FORMAT,
         }
 
-        last_error: Exception | None = None
-
-        for attempt in range(MAX_RETRIES):
-            try:
-                return await self._make_request(url, headers, payload)
-            except AIConnectionError as err:
-                last_error = err
-                if attempt < MAX_RETRIES - 1:
-                    wait = RETRY_BACKOFF_SECONDS[attempt]
-                    _LOGGER.warning(
-                        "OpenAI request failed (attempt %d/%d), retrying in %ds: %s",
-                        attempt + 1,
-                        MAX_RETRIES,
-                        wait,
-                        err,
-                    )
-                    await asyncio.sleep(wait)
-            except AIResponseError:
-                # Non-retryable response error -- propagate immediately
-                raise
-
-        raise AIConnectionError(
-            f"OpenAI request failed after {MAX_RETRIES} attempts: {last_error}"
+        return await self._request_with_retry(
+            lambda call: self._make_request(url, headers, payload, call)
         )
 
     async def test_connection(self) -> bool:
@@ -105,20 +106,30 @@ class OpenAIProvider(AIProviderBase):
     # ------------------------------------------------------------------
 
     async def _make_request(
-        self, url: str, headers: dict, payload: dict
+        self, url: str, headers: dict, payload: dict, call: AICallRecord
     ) -> str:
         """Execute a single HTTP POST and return the assistant message content."""
         timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
 
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session, session.post(
-                url, headers=headers, json=payload
+            async with aiohttp.ClientSession(
+                timeout=timeout, trace_configs=[build_trace_config()]
+            ) as session, session.post(
+                url, headers=headers, json=payload, trace_request_ctx=call
             ) as resp:
-                body = await resp.text()
+                body = await read_limited_text(resp)
+                call.response_bytes = len(body.encode())
+
+                if resp.status in RATE_LIMIT_STATUSES:
+                    raise AIRateLimitError(
+                        f"OpenAI rate limited ({resp.status}): {body[:500]}",
+                        retry_after=parse_retry_after(resp.headers),
+                    )
 
                 if resp.status >= 500:
                     raise AIConnectionError(
-                        f"OpenAI server error {resp.status}: {body[:500]}"
+                        f"OpenAI server error {resp.status}: {body[:500]}",
+                        retry_after=parse_retry_after(resp.headers),
                     )
 
                 if resp.status != 200:
@@ -140,6 +151,10 @@ class OpenAIProvider(AIProviderBase):
                         f"Unexpected OpenAI response structure: {err}"
                     ) from err
 
+                usage = data.get("usage") or {}
+                call.prompt_tokens = usage.get("prompt_tokens")
+                call.completion_tokens = usage.get("completion_tokens")
+
                 return content
 
         except aiohttp.ClientError as err:
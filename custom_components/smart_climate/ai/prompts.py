@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .rules import RuleFinding
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -112,7 +115,11 @@ You MUST respond with valid JSON matching this exact schema:
 """
 
 
-def build_user_prompt(coordinator_data: dict[str, Any]) -> str:
+def build_user_prompt(
+    coordinator_data: dict[str, Any],
+    findings: list[RuleFinding] | None = None,
+    now: datetime | None = None,
+) -> str:
     """Build the user prompt from current coordinator data.
 
     Serializes room states, house state, schedules, and weather into a
@@ -123,6 +130,11 @@ def build_user_prompt(coordinator_data: dict[str, Any]) -> str:
         coordinator_data: The dict returned by the coordinator's
             ``_async_update_data`` method, containing ``rooms`` and ``house``
             keys.
+        findings: Issues already found by the local rules pre-pass.  The
+            room facts they cover are left out and the LLM is told not to
+            repeat them.
+        now: Time shown as "current" in the prompt (defaults to the
+            wall clock).
 
     Returns:
         A formatted string prompt ready to send to the AI provider.
@@ -133,7 +145,7 @@ def build_user_prompt(coordinator_data: dict[str, Any]) -> str:
     rooms_data = coordinator_data.get("rooms", {})
     house_state = coordinator_data.get("house")
 
-    now = datetime.now()
+    now = now or datetime.now()
 
     sections: list[str] = []
 
@@ -152,8 +164,14 @@ def build_user_prompt(coordinator_data: dict[str, Any]) -> str:
     if hvac_section:
         sections.append(hvac_section)
 
+    # -- Facts already handled by the local rules pre-pass
+    handled: dict[str, set[str]] = {}
+    for finding in findings or []:
+        if finding.room is not None:
+            handled.setdefault(finding.room, set()).update(finding.facts)
+
     # -- Room details
-    room_section = _build_rooms_section(rooms_data)
+    room_section = _build_rooms_section(rooms_data, handled=handled)
     sections.append(room_section)
 
     prompt = "\n\n".join(sections)
@@ -163,10 +181,15 @@ def build_user_prompt(coordinator_data: dict[str, Any]) -> str:
         _LOGGER.debug(
             "User prompt too long (%d chars); summarizing rooms", len(prompt)
         )
-        room_section = _build_rooms_section(rooms_data, summarize=True)
+        room_section = _build_rooms_section(
+            rooms_data, summarize=True, handled=handled
+        )
         sections[-1] = room_section
         prompt = "\n\n".join(sections)
 
+    if findings:
+        sections.append(_build_findings_section(findings))
+
     sections.append(
         "## Instructions\n"
         "Analyze the data above and provide your suggestions as JSON."
@@ -232,8 +255,23 @@ def _build_house_section(house_state: Any) -> str:
     return "\n".join(lines)
 
 
+def _build_findings_section(findings: list[RuleFinding]) -> str:
+    """List issues the local rules already reported."""
+    lines = [
+        "## Already Reported",
+        "These issues were detected by local rules and are already shown to "
+        "the user. Do NOT suggest them again:",
+    ]
+    for finding in findings:
+        room = finding.room or "house-wide"
+        lines.append(f"- {finding.suggestion['title']} ({room})")
+    return "\n".join(lines)
+
+
 def _build_rooms_section(
-    rooms_data: dict[str, Any], summarize: bool = False
+    rooms_data: dict[str, Any],
+    summarize: bool = False,
+    handled: dict[str, set[str]] | None = None,
 ) -> str:
     """Serialize all room states into a prompt section.
 
@@ -241,7 +279,10 @@ def _build_rooms_section(
         rooms_data: Mapping of room slug to RoomState instances.
         summarize: If True, only include key metrics per room to reduce
             prompt length.
+        handled: Room slug to fact keys (see ``ai.rules``) to omit because
+            a local rule already reported on them.
     """
+    handled = handled or {}
     if not rooms_data:
         return "## Rooms\nNo room data available."
 
@@ -257,16 +298,19 @@ def _build_rooms_section(
         if temp is None and target is None:
             continue
 
+        skip = handled.get(slug, set())
         if summarize:
-            lines.append(_summarize_room(slug, name, room))
+            lines.append(_summarize_room(slug, name, room, skip))
         else:
-            lines.append(_detail_room(slug, name, room))
+            lines.append(_detail_room(slug, name, room, skip))
 
     return "\n".join(lines)
 
 
-def _detail_room(slug: str, name: str, room: Any) -> str:
-    """Build a detailed block for a single room."""
+def _detail_room(
+    slug: str, name: str, room: Any, skip: set[str] | frozenset[str] = frozenset()
+) -> str:
+    """Build a detailed block for a single room, omitting ``skip`` facts."""
     config = getattr(room, "config", None)
     climate_entity = getattr(config, "climate_entity", None) if config else None
 
@@ -301,11 +345,11 @@ def _detail_room(slug: str, name: str, room: Any) -> str:
         parts.append(f"  - Efficiency score: {efficiency}/100")
 
     occupied = getattr(room, "occupied", None)
-    if occupied is not None:
+    if occupied is not None and "occupied" not in skip:
         parts.append(f"  - Occupied: {'yes' if occupied else 'no'}")
 
     window_open = getattr(room, "window_open", None)
-    if window_open is not None:
+    if window_open is not None and "window_open" not in skip:
         parts.append(f"  - Window/door open: {'yes' if window_open else 'no'}")
 
     action = getattr(room, "hvac_action", None)
@@ -317,7 +361,7 @@ def _detail_room(slug: str, name: str, room: Any) -> str:
         parts.append(f"  - HVAC runtime today: {runtime:.0f} min")
 
     cycles = getattr(room, "hvac_cycles_today", None)
-    if cycles is not None and cycles > 0:
+    if cycles is not None and cycles > 0 and "hvac_cycles" not in skip:
         parts.append(f"  - HVAC cycles today: {cycles}")
 
     trend = getattr(room, "temp_trend", None)
@@ -349,7 +393,9 @@ def _detail_room(slug: str, name: str, room: Any) -> str:
     return "\n".join(parts)
 
 
-def _summarize_room(slug: str, name: str, room: Any) -> str:
+def _summarize_room(
+    slug: str, name: str, room: Any, skip: set[str] | frozenset[str] = frozenset()
+) -> str:
     """Build a compact one-line summary for a room (used when truncating)."""
     temp = getattr(room, "temperature", "?")
     target = getattr(room, "current_target", "?")
@@ -357,9 +403,10 @@ def _summarize_room(slug: str, name: str, room: Any) -> str:
     occupied = "Y" if getattr(room, "occupied", False) else "N"
     action = getattr(room, "hvac_action", "?")
 
+    occupied_part = "" if "occupied" in skip else f", occupied={occupied}"
     return (
         f"  - {name} ({slug}): sensor_temp={temp}, hvac_target={target}, "
-        f"comfort={comfort}, occupied={occupied}, hvac={action}"
+        f"comfort={comfort}{occupied_part}, hvac={action}"
     )
 
 
@@ -2,11 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import re
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .telemetry import AICallRecord, AITelemetry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Retry policy shared by every provider.  Delays follow "decorrelated
+# jitter": each wait is drawn from [base, 3 * previous wait], capped.
+RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+RETRY_MAX_ATTEMPTS = 5
+# Total wall-clock budget for one analyze() call including all waits.
+RETRY_TIME_BUDGET = 180.0  # seconds
+
+# HTTP statuses that signal throttling / overload rather than a bad request.
+RATE_LIMIT_STATUSES = frozenset({429, 529})
+
+# Token bucket shared by all instances talking to the same endpoint, so
+# manual and scheduled runs queue behind each other instead of colliding.
+TOKEN_BUCKET_CAPACITY = 2
+TOKEN_BUCKET_RATE = 0.2  # tokens per second
+
+# Upper bound on an HTTP response body read from a provider.  The raw
+# body wraps the model text in the provider's envelope, so this sits
+# above analysis.MAX_RESPONSE_CHARS.
+MAX_RESPONSE_BYTES = 2_000_000
+READ_CHUNK_BYTES = 65_536
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+
 
 # ---------------------------------------------------------------------------
 # Exceptions
@@ -16,15 +51,168 @@ _LOGGER = logging.getLogger(__name__)
 class AIProviderError(Exception):
     """Base exception for AI provider errors."""
 
+    def __init__(self, *args: Any, retry_after: float | None = None) -> None:
+        super().__init__(*args)
+        self.retry_after = retry_after
+
 
 class AIConnectionError(AIProviderError):
     """Raised when the provider cannot be reached."""
 
 
+class AIRateLimitError(AIConnectionError):
+    """Raised when the provider throttles the request (HTTP 429/529)."""
+
+
 class AIResponseError(AIProviderError):
     """Raised when the provider returns an unexpected response."""
 
 
+# ---------------------------------------------------------------------------
+# Rate limiting helpers
+# ---------------------------------------------------------------------------
+
+
+class TokenBucket:
+    """Async token bucket that can also be paused by a Retry-After hint."""
+
+    def __init__(self, capacity: float, rate: float) -> None:
+        self._capacity = capacity
+        self._rate = rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def block_for(self, seconds: float) -> None:
+        """Hold back every caller for at least ``seconds``."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self._rate
+                await asyncio.sleep(wait)
+
+
+_TOKEN_BUCKETS: dict[str, TokenBucket] = {}
+
+
+def get_token_bucket(key: str) -> TokenBucket:
+    """Return the shared token bucket for a provider endpoint."""
+    bucket = _TOKEN_BUCKETS.get(key)
+    if bucket is None:
+        bucket = TokenBucket(TOKEN_BUCKET_CAPACITY, TOKEN_BUCKET_RATE)
+        _TOKEN_BUCKETS[key] = bucket
+    return bucket
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Return the server-requested wait in seconds, if any.
+
+    Understands ``Retry-After`` (seconds or HTTP date), ``retry-after-ms``,
+    OpenAI-style ``x-ratelimit-reset-*`` durations (``"6m0s"``, ``"20ms"``)
+    and Anthropic-style ``anthropic-ratelimit-*-reset`` timestamps.
+    """
+    if not headers:
+        return None
+    lowered = {str(k).lower(): str(v) for k, v in headers.items()}
+
+    raw = lowered.get("retry-after-ms")
+    if raw is not None:
+        try:
+            return max(0.0, float(raw) / 1000.0)
+        except ValueError:
+            pass
+
+    raw = lowered.get("retry-after")
+    if raw is not None:
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(raw)
+            except (TypeError, ValueError):
+                when = None
+            if when is not None:
+                if when.tzinfo is None:
+                    when = when.replace(tzinfo=timezone.utc)
+                return max(0.0, (when - datetime.now(tz=timezone.utc)).total_seconds())
+
+    waits: list[float] = []
+    for key in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+        value = _parse_duration(lowered.get(key))
+        if value is not None:
+            waits.append(value)
+    for key in (
+        "anthropic-ratelimit-requests-reset",
+        "anthropic-ratelimit-tokens-reset",
+        "anthropic-ratelimit-input-tokens-reset",
+        "anthropic-ratelimit-output-tokens-reset",
+    ):
+        raw = lowered.get(key)
+        if raw is None:
+            continue
+        try:
+            when = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        waits.append(max(0.0, (when - datetime.now(tz=timezone.utc)).total_seconds()))
+
+    return max(waits) if waits else None
+
+
+def _parse_duration(raw: str | None) -> float | None:
+    """Parse Go-style durations such as ``"1m30s"`` or ``"250ms"``."""
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(raw)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(value) * scale[unit] for value, unit in parts)
+
+
+async def read_limited_text(resp: Any, limit: int = MAX_RESPONSE_BYTES) -> str:
+    """Read an aiohttp response body, refusing anything over ``limit`` bytes.
+
+    ``content.read(n)`` only returns what is already buffered, so the body
+    is read chunk by chunk until EOF.
+    """
+    chunks: list[bytes] = []
+    total = 0
+    async for chunk in resp.content.iter_chunked(READ_CHUNK_BYTES):
+        total += len(chunk)
+        if total > limit:
+            raise AIResponseError(f"Response body exceeds {limit} bytes")
+        chunks.append(chunk)
+    return b"".join(chunks).decode(resp.charset or "utf-8", errors="replace")
+
+
+def next_backoff(previous: float) -> float:
+    """Return the next decorrelated-jitter delay after ``previous``."""
+    upper = max(RETRY_BASE_DELAY, previous * 3)
+    return min(RETRY_MAX_DELAY, random.uniform(RETRY_BASE_DELAY, upper))
+
+
 # ---------------------------------------------------------------------------
 # Abstract base
 # ---------------------------------------------------------------------------
@@ -33,6 +221,12 @@ class AIResponseError(AIProviderError):
 class AIProviderBase(ABC):
     """Base class that every AI provider must implement."""
 
+    # Human-readable name used in log and error messages.
+    provider_name = "AI provider"
+
+    # Sink for per-call metrics; set by create_ai_provider_chain.
+    telemetry: AITelemetry | None = None
+
     def __init__(self, config: dict) -> None:
         self._config = config
 
@@ -44,6 +238,93 @@ class AIProviderBase(ABC):
     async def test_connection(self) -> bool:
         """Return True if the provider is reachable and credentials are valid."""
 
+    async def warm_up(self, keep_alive_minutes: float) -> bool:
+        """Load the model ahead of an analysis run.
+
+        Hosted providers have nothing to warm, so the default does
+        nothing and returns False.  Local providers override this to
+        preload the model and keep it resident for ``keep_alive_minutes``.
+        """
+        return False
+
+    def _rate_limit_key(self) -> str:
+        """Return the key identifying this provider's shared token bucket."""
+        return f"{type(self).__name__}:{getattr(self, '_base_url', '')}"
+
+    async def _request_with_retry(
+        self, send: Callable[[AICallRecord], Awaitable[str]]
+    ) -> str:
+        """Run ``send`` under the shared retry policy.
+
+        Connection errors, 5xx and throttling (429/529) are retried with
+        decorrelated-jitter backoff.  A server-provided Retry-After wins
+        over the computed delay and also pauses the shared token bucket.
+        Retries stop after RETRY_MAX_ATTEMPTS or once the next wait would
+        overrun RETRY_TIME_BUDGET.  Response errors are never retried.
+
+        ``send`` receives the AICallRecord for this call and fills in
+        timings, token usage and response size; the finished record is
+        passed to ``self.telemetry`` when one is attached.  A call that is
+        cancelled, such as the losing request of a hedge, is neither a
+        success nor a failure and is not recorded.
+        """
+        from .telemetry import AICallRecord
+
+        call = AICallRecord(
+            provider=self.provider_name, model=getattr(self, "_model", None)
+        )
+        bucket = get_token_bucket(self._rate_limit_key())
+        start = time.monotonic()
+        delay = RETRY_BASE_DELAY
+        attempt = 0
+        cancelled = False
+
+        try:
+            while True:
+                attempt += 1
+                call.retries = attempt - 1
+                await bucket.acquire()
+                try:
+                    response = await send(call)
+                except AIConnectionError as err:
+                    delay = next_backoff(delay)
+                    if err.retry_after is not None:
+                        delay = max(delay, err.retry_after)
+                        bucket.block_for(err.retry_after)
+
+                    elapsed = time.monotonic() - start
+                    if (
+                        attempt >= RETRY_MAX_ATTEMPTS
+                        or elapsed + delay > RETRY_TIME_BUDGET
+                    ):
+                        raise type(err)(
+                            f"{self.provider_name} request failed after "
+                            f"{attempt} attempts: {err}",
+                            retry_after=err.retry_after,
+                        ) from err
+
+                    _LOGGER.warning(
+                        "%s request failed (attempt %d), retrying in %.1fs: %s",
+                        self.provider_name,
+                        attempt,
+                        delay,
+                        err,
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    call.success = True
+                    return response
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except Exception as err:
+            call.error = str(err)[:200]
+            raise
+        finally:
+            call.latency = time.monotonic() - start
+            if self.telemetry is not None and not cancelled:
+                self.telemetry.record(call)
+
 
 # ---------------------------------------------------------------------------
 # No-op provider (used when AI is disabled)
@@ -81,10 +362,16 @@ def create_ai_provider(provider_type: str, config: dict) -> AIProviderBase:
         AI_PROVIDER_ANTHROPIC,
         AI_PROVIDER_GEMINI,
         AI_PROVIDER_GROK,
+        AI_PROVIDER_LOCAL,
         AI_PROVIDER_OLLAMA,
         AI_PROVIDER_OPENAI,
     )
 
+    if provider_type == AI_PROVIDER_LOCAL:
+        from .rules import LocalRulesProvider
+
+        return LocalRulesProvider(config)
+
     if provider_type == AI_PROVIDER_OPENAI:
         from .openai_provider import OpenAIProvider
 
@@ -115,3 +402,82 @@ def create_ai_provider(provider_type: str, config: dict) -> AIProviderBase:
         provider_type,
     )
     return NoOpProvider(config)
+
+
+def create_ai_provider_chain(
+    config: Mapping[str, Any],
+    telemetry: AITelemetry | None = None,
+    data_source: Callable[[], Any] | None = None,
+    now_source: Callable[[], datetime] | None = None,
+) -> AIProviderBase:
+    """Build the configured provider, wrapped in a failover chain if needed.
+
+    Args:
+        config: Config entry data containing the ``ai_*`` settings.
+        telemetry: Optional sink every provider in the chain reports to.
+        data_source: Returns current coordinator data; used by the local
+            rules provider, which reads data rather than prompts.
+        now_source: Returns the coordinator's current time for the local
+            rules provider.
+
+    Returns:
+        The primary provider on its own when no fallback is configured,
+        otherwise a FailoverProvider trying the primary first.
+    """
+    from ..const import (
+        AI_PROVIDER_NONE,
+        CONF_AI_API_KEY,
+        CONF_AI_BASE_URL,
+        CONF_AI_FALLBACK_API_KEY,
+        CONF_AI_FALLBACK_BASE_URL,
+        CONF_AI_FALLBACK_MODEL,
+        CONF_AI_FALLBACK_PROVIDER,
+        CONF_AI_HEDGE_PERCENTILE,
+        CONF_AI_MODEL,
+        CONF_AI_PROVIDER,
+        DEFAULT_AI_HEDGE_PERCENTILE,
+    )
+
+    chain: list[tuple[str, AIProviderBase]] = []
+    for type_key, key_key, model_key, url_key in (
+        (CONF_AI_PROVIDER, CONF_AI_API_KEY, CONF_AI_MODEL, CONF_AI_BASE_URL),
+        (
+            CONF_AI_FALLBACK_PROVIDER,
+            CONF_AI_FALLBACK_API_KEY,
+            CONF_AI_FALLBACK_MODEL,
+            CONF_AI_FALLBACK_BASE_URL,
+        ),
+    ):
+        provider_type = config.get(type_key, AI_PROVIDER_NONE) or AI_PROVIDER_NONE
+        if provider_type == AI_PROVIDER_NONE:
+            continue
+        name = provider_type
+        if any(existing == name for existing, _ in chain):
+            name = f"{provider_type}_{len(chain) + 1}"
+        provider = create_ai_provider(
+            provider_type,
+            {
+                "api_key": config.get(key_key, ""),
+                "model": config.get(model_key, ""),
+                "base_url": config.get(url_key, ""),
+            },
+        )
+        provider.telemetry = telemetry
+        if hasattr(provider, "data_source"):
+            provider.data_source = data_source
+            provider.now_source = now_source
+        chain.append((name, provider))
+
+    if not chain:
+        return NoOpProvider({})
+    if len(chain) == 1:
+        return chain[0][1]
+
+    from .failover import FailoverProvider
+
+    return FailoverProvider(
+        chain,
+        hedge_percentile=config.get(
+            CONF_AI_HEDGE_PERCENTILE, DEFAULT_AI_HEDGE_PERCENTILE
+        ),
+    )
@@ -0,0 +1,307 @@
+"""Deterministic local rules engine for climate analysis.
+
+The rules look at the same coordinator data the LLM sees and emit
+suggestions in the analysis-schema shape, so their output flows through
+``parse_ai_response`` like any provider's.  They run in milliseconds
+without a network, either as the ``local`` provider or as a pre-pass
+whose findings are left out of the LLM prompt.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from ..models import HVACAction, Suggestion
+from .provider import AIProviderBase
+
+_LOGGER = logging.getLogger(__name__)
+
+# Short cycling: at least this many cycles today ...
+SHORT_CYCLE_MIN_CYCLES = 6
+# ... averaging fewer minutes of runtime per cycle than this.
+SHORT_CYCLE_MAX_MINUTES_PER_CYCLE = 10.0
+
+# A room counts as unoccupied once presence has been clear this long.
+UNOCCUPIED_GRACE = timedelta(minutes=30)
+
+# Degrees beyond the setpoint before a room on a shared system is said to
+# need heating or cooling.
+SHARED_CONFLICT_MARGIN = 1.5
+
+# Vent position suggested for rooms that should not be conditioned.
+CLOSED_VENT_POSITION = 0
+SETBACK_VENT_POSITION = 25
+
+_ACTIVE_ACTIONS = frozenset({HVACAction.HEATING, HVACAction.COOLING})
+
+# Prompt facts a finding covers; see prompts.build_user_prompt.
+FACT_WINDOW_OPEN = "window_open"
+FACT_HVAC_CYCLES = "hvac_cycles"
+FACT_OCCUPANCY = "occupied"
+
+
+@dataclass
+class RuleFinding:
+    """One issue detected by a local rule."""
+
+    rule: str
+    room: str | None
+    suggestion: dict[str, Any]
+    facts: tuple[str, ...] = field(default_factory=tuple)
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+
+def _rule_window_open(slug: str, room: Any) -> RuleFinding | None:
+    """HVAC actively conditioning a room with a window or door open."""
+    if not room.window_open or room.hvac_action not in _ACTIVE_ACTIONS:
+        return None
+    name = room.config.name
+    verb = "heating" if room.hvac_action == HVACAction.HEATING else "cooling"
+    if room.config.vent_entities:
+        action_type = "vent_adjustment"
+        action_data: dict[str, Any] = {"vent_position": CLOSED_VENT_POSITION}
+        description = f"Close the vents in {name} until the window is shut."
+    else:
+        action_type = "general"
+        description = f"Close the window in {name} or pause {verb} while it is open."
+        action_data = {"advice": description}
+    return RuleFinding(
+        rule="window_open_hvac",
+        room=slug,
+        facts=(FACT_WINDOW_OPEN,),
+        suggestion={
+            "title": f"Window open while {verb} {name}",
+            "description": description,
+            "reasoning": f"A window/door sensor in {name} reports open while "
+            f"the HVAC is {verb}.",
+            "room": slug,
+            "action_type": action_type,
+            "action_data": action_data,
+            "confidence": 0.95,
+            "priority": "high",
+        },
+    )
+
+
+def _rule_short_cycling(slug: str, room: Any) -> RuleFinding | None:
+    """Many short HVAC cycles today."""
+    cycles = room.hvac_cycles_today
+    if cycles < SHORT_CYCLE_MIN_CYCLES:
+        return None
+    per_cycle = room.hvac_runtime_today / cycles
+    if per_cycle >= SHORT_CYCLE_MAX_MINUTES_PER_CYCLE:
+        return None
+    name = room.config.name
+    advice = (
+        f"Widen the thermostat deadband or check the sensor placement for "
+        f"{room.config.climate_entity}; it is short cycling."
+    )
+    return RuleFinding(
+        rule="short_cycling",
+        room=slug,
+        facts=(FACT_HVAC_CYCLES,),
+        suggestion={
+            "title": f"Short cycling in {name}",
+            "description": advice,
+            "reasoning": f"{cycles} cycles today averaging {per_cycle:.1f} min "
+            f"each (threshold {SHORT_CYCLE_MAX_MINUTES_PER_CYCLE:.0f} min).",
+            "room": slug,
+            "action_type": "general",
+            "action_data": {"advice": advice},
+            "confidence": 0.8,
+            "priority": "medium",
+        },
+    )
+
+
+def _rule_unoccupied_conditioned(
+    slug: str, room: Any, now: datetime
+) -> RuleFinding | None:
+    """HVAC conditioning a room that has been empty for a while."""
+    if (
+        not room.config.presence_sensors
+        or room.occupied
+        or room.follow_me_active
+        or room.hvac_action not in _ACTIVE_ACTIONS
+    ):
+        return None
+    last_seen = room.last_presence_time
+    if last_seen is not None and now - last_seen < UNOCCUPIED_GRACE:
+        return None
+    name = room.config.name
+    verb = "heated" if room.hvac_action == HVACAction.HEATING else "cooled"
+    if room.config.vent_entities:
+        action_type = "vent_adjustment"
+        action_data: dict[str, Any] = {"vent_position": SETBACK_VENT_POSITION}
+        description = f"Partially close the vents in {name} while it is empty."
+    else:
+        action_type = "general"
+        description = f"Set back {name} while it is unoccupied."
+        action_data = {"advice": description}
+    since = (
+        f"since {last_seen.strftime('%H:%M')}" if last_seen else "all day"
+    )
+    return RuleFinding(
+        rule="unoccupied_conditioned",
+        room=slug,
+        facts=(FACT_OCCUPANCY,),
+        suggestion={
+            "title": f"{name} {verb} while empty",
+            "description": description,
+            "reasoning": f"No presence detected in {name} {since}, yet it is "
+            f"being actively {verb}.",
+            "room": slug,
+            "action_type": action_type,
+            "action_data": action_data,
+            "confidence": 0.7,
+            "priority": "medium",
+        },
+    )
+
+
+def _rule_shared_conflicts(rooms: dict[str, Any]) -> list[RuleFinding]:
+    """Rooms on one climate entity wanting opposite things."""
+    groups: dict[str, list[tuple[str, Any]]] = {}
+    for slug, room in rooms.items():
+        groups.setdefault(room.config.climate_entity, []).append((slug, room))
+
+    findings: list[RuleFinding] = []
+    for entity, members in groups.items():
+        if len(members) < 2:
+            continue
+        too_cold: list[str] = []
+        too_warm: list[str] = []
+        for slug, room in members:
+            if room.temperature is None or room.current_target is None:
+                continue
+            delta = room.temperature - room.current_target
+            if delta <= -SHARED_CONFLICT_MARGIN:
+                too_cold.append(slug)
+            elif delta >= SHARED_CONFLICT_MARGIN:
+                too_warm.append(slug)
+        if not too_cold or not too_warm:
+            continue
+        advice = (
+            f"Use vents or auxiliary devices to balance {', '.join(too_cold)} "
+            f"(below target) against {', '.join(too_warm)} (above target); "
+            f"changing the setpoint on {entity} cannot satisfy both."
+        )
+        findings.append(
+            RuleFinding(
+                rule="shared_setpoint_conflict",
+                room=None,
+                suggestion={
+                    "title": f"Conflicting needs on {entity}",
+                    "description": advice,
+                    "reasoning": f"Rooms sharing {entity} are more than "
+                    f"{SHARED_CONFLICT_MARGIN} degrees off target in opposite "
+                    "directions.",
+                    "room": None,
+                    "action_type": "general",
+                    "action_data": {"advice": advice},
+                    "confidence": 0.75,
+                    "priority": "medium",
+                },
+            )
+        )
+    return findings
+
+
+def evaluate_rules(
+    coordinator_data: dict[str, Any] | None, now: datetime | None = None
+) -> list[RuleFinding]:
+    """Run every local rule over coordinator data."""
+    if not coordinator_data:
+        return []
+    rooms: dict[str, Any] = coordinator_data.get("rooms", {})
+    now = now or datetime.now()
+
+    findings: list[RuleFinding] = []
+    for slug, room in rooms.items():
+        for finding in (
+            _rule_window_open(slug, room),
+            _rule_short_cycling(slug, room),
+            _rule_unoccupied_conditioned(slug, room, now),
+        ):
+            if finding is not None:
+                findings.append(finding)
+    findings.extend(_rule_shared_conflicts(rooms))
+    return findings
+
+
+def findings_to_response(findings: list[RuleFinding]) -> dict[str, Any]:
+    """Build an analysis-schema document from rule findings."""
+    if findings:
+        summary = (
+            f"Local rules found {len(findings)} issue"
+            f"{'s' if len(findings) != 1 else ''}: "
+            + "; ".join(f.suggestion["title"] for f in findings)
+            + "."
+        )
+    else:
+        summary = "Local rules found no issues."
+    return {
+        "summary": summary,
+        "suggestions": [f.suggestion for f in findings],
+    }
+
+
+def findings_to_suggestions(
+    findings: list[RuleFinding], now: datetime | None = None
+) -> list[Suggestion]:
+    """Convert findings to Suggestions through the normal sanitizers."""
+    from .analysis import _parse_single_suggestion
+
+    suggestions: list[Suggestion] = []
+    for finding in findings:
+        suggestion = _parse_single_suggestion(finding.suggestion, now)
+        if suggestion is not None:
+            suggestions.append(suggestion)
+    return suggestions
+
+
+# ---------------------------------------------------------------------------
+# Provider
+# ---------------------------------------------------------------------------
+
+
+class LocalRulesProvider(AIProviderBase):
+    """Provider that answers from the local rules instead of an LLM.
+
+    The prompts are ignored; the rules read coordinator data through
+    ``data_source`` and the coordinator's time through ``now_source``,
+    which create_ai_provider_chain wires up.
+    """
+
+    provider_name = "Local rules"
+
+    def __init__(
+        self,
+        config: dict,
+        data_source: Callable[[], dict[str, Any] | None] | None = None,
+        now_source: Callable[[], datetime] | None = None,
+    ) -> None:
+        super().__init__(config)
+        self.data_source = data_source
+        self.now_source = now_source
+
+    async def analyze(self, system_prompt: str, user_prompt: str) -> str:
+        """Return the rules' findings as an analysis JSON document."""
+        data = self.data_source() if self.data_source is not None else None
+        now = self.now_source() if self.now_source is not None else None
+        findings = evaluate_rules(data, now)
+        _LOGGER.debug("Local rules produced %d findings", len(findings))
+        return json.dumps(findings_to_response(findings))
+
+    async def test_connection(self) -> bool:
+        """Always succeeds -- there is nothing to connect to."""
+        return True
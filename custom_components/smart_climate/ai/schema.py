@@ -0,0 +1,240 @@
+"""JSON schema for AI analysis responses and a small precompiled validator.
+
+The same schema is sent to every provider's native structured-output
+feature and used to validate what comes back.  Only the subset of JSON
+Schema the schema itself uses is supported, so no third-party validator
+is required.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+from typing import Any
+
+from .analysis import ALLOWED_ACTION_TYPES, ALLOWED_PRIORITIES, MAX_SUGGESTIONS
+
+# Name used for the OpenAI json_schema and the Anthropic forced tool.
+ANALYSIS_SCHEMA_NAME = "climate_analysis"
+
+ANALYSIS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "suggestions": {
+            "type": "array",
+            "maxItems": MAX_SUGGESTIONS,
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "description": {"type": "string"},
+                    "reasoning": {"type": "string"},
+                    "room": {"type": ["string", "null"]},
+                    "action_type": {
+                        "type": "string",
+                        "enum": sorted(ALLOWED_ACTION_TYPES),
+                    },
+                    "action_data": {
+                        "type": "object",
+                        "properties": {
+                            "temperature": {"type": ["number", "null"]},
+                            "mode": {"type": ["string", "null"]},
+                            "vent_position": {
+                                "type": ["integer", "null"],
+                                "minimum": 0,
+                                "maximum": 100,
+                            },
+                            "description": {"type": ["string", "null"]},
+                            "advice": {"type": ["string", "null"]},
+                        },
+                        "required": [],
+                        "additionalProperties": False,
+                    },
+                    "confidence": {
+                        "type": "number",
+                        "minimum": 0,
+                        "maximum": 1,
+                    },
+                    "priority": {
+                        "type": "string",
+                        "enum": sorted(ALLOWED_PRIORITIES),
+                    },
+                },
+                "required": [
+                    "title",
+                    "description",
+                    "reasoning",
+                    "room",
+                    "action_type",
+                    "action_data",
+                    "confidence",
+                    "priority",
+                ],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["summary", "suggestions"],
+    "additionalProperties": False,
+}
+
+
+# ---------------------------------------------------------------------------
+# Provider dialects
+# ---------------------------------------------------------------------------
+
+
+def to_strict_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Return ``schema`` in OpenAI strict form.
+
+    Strict mode requires every property to be listed in ``required``;
+    optional fields stay optional by being nullable.
+    """
+    result = copy.deepcopy(schema)
+
+    def _walk(node: dict[str, Any]) -> None:
+        if "properties" in node:
+            node["required"] = list(node["properties"])
+            node["additionalProperties"] = False
+            for child in node["properties"].values():
+                _walk(child)
+        if isinstance(node.get("items"), dict):
+            _walk(node["items"])
+
+    _walk(result)
+    return result
+
+
+def to_gemini_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Return ``schema`` in the OpenAPI subset Gemini's responseSchema accepts.
+
+    Nullable type unions become ``nullable: true`` and
+    ``additionalProperties`` is dropped.
+    """
+    result: dict[str, Any] = {}
+    for key, value in schema.items():
+        if key == "additionalProperties":
+            continue
+        if key == "type" and isinstance(value, list):
+            types = [t for t in value if t != "null"]
+            result["type"] = types[0]
+            if len(types) != len(value):
+                result["nullable"] = True
+        elif key == "properties":
+            result[key] = {name: to_gemini_schema(sub) for name, sub in value.items()}
+        elif key == "items":
+            result[key] = to_gemini_schema(value)
+        elif key == "required" and not value:
+            continue
+        else:
+            result[key] = value
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+Validator = Callable[[Any, str], list[str]]
+
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+def compile_schema(schema: dict[str, Any]) -> Validator:
+    """Compile ``schema`` into a validator returning a list of error strings.
+
+    The schema is walked once here; validating a document afterwards only
+    runs the prebuilt checks.
+    """
+    checks: list[Validator] = []
+
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        type_checks = [_TYPE_CHECKS[name] for name in names]
+        expected = "|".join(names)
+
+        def _check_type(value: Any, path: str) -> list[str]:
+            if any(check(value) for check in type_checks):
+                return []
+            return [f"{path}: expected {expected}, got {type(value).__name__}"]
+
+        checks.append(_check_type)
+
+    if "enum" in schema:
+        allowed = frozenset(schema["enum"])
+
+        def _check_enum(value: Any, path: str) -> list[str]:
+            if value is None or value in allowed:
+                return []
+            return [f"{path}: {value!r} is not one of {sorted(allowed)}"]
+
+        checks.append(_check_enum)
+
+    if "minimum" in schema or "maximum" in schema:
+        low = schema.get("minimum")
+        high = schema.get("maximum")
+
+        def _check_range(value: Any, path: str) -> list[str]:
+            if not _TYPE_CHECKS["number"](value):
+                return []
+            if (low is not None and value < low) or (high is not None and value > high):
+                return [f"{path}: {value} outside [{low}, {high}]"]
+            return []
+
+        checks.append(_check_range)
+
+    if "properties" in schema:
+        props = {name: compile_schema(sub) for name, sub in schema["properties"].items()}
+        required = tuple(schema.get("required", ()))
+        closed = schema.get("additionalProperties") is False
+
+        def _check_object(value: Any, path: str) -> list[str]:
+            if not isinstance(value, dict):
+                return []
+            errors = [f"{path}.{name}: missing" for name in required if name not in value]
+            for name, item in value.items():
+                sub = props.get(name)
+                if sub is not None:
+                    errors.extend(sub(item, f"{path}.{name}"))
+                elif closed:
+                    errors.append(f"{path}.{name}: unexpected property")
+            return errors
+
+        checks.append(_check_object)
+
+    if "items" in schema or "maxItems" in schema:
+        item_check = compile_schema(schema["items"]) if "items" in schema else None
+        max_items = schema.get("maxItems")
+
+        def _check_array(value: Any, path: str) -> list[str]:
+            if not isinstance(value, list):
+                return []
+            errors: list[str] = []
+            if max_items is not None and len(value) > max_items:
+                errors.append(f"{path}: more than {max_items} items")
+            if item_check is not None:
+                for idx, item in enumerate(value):
+                    errors.extend(item_check(item, f"{path}[{idx}]"))
+            return errors
+
+        checks.append(_check_array)
+
+    def _validate(value: Any, path: str = "$") -> list[str]:
+        errors: list[str] = []
+        for check in checks:
+            errors.extend(check(value, path))
+        return errors
+
+    return _validate
+
+
+validate_analysis: Validator = compile_schema(ANALYSIS_SCHEMA)
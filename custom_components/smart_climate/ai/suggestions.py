@@ -2,24 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from ..const import (
     AUTO_APPLY_CONFIDENCE_THRESHOLD,
+    BULK_APPROVAL_CONCURRENCY,
     CONF_AI_AUTO_APPLY,
     DEFAULT_AI_AUTO_APPLY,
     DOMAIN,
     EVENT_NEW_SUGGESTIONS,
     EVENT_SUGGESTION_APPLIED,
     EVENT_SUGGESTION_REJECTED,
+    EVENT_SUGGESTIONS_BULK_APPROVED,
     SUGGESTION_APPLIED,
     SUGGESTION_EXPIRED,
     SUGGESTION_PENDING,
     SUGGESTION_REJECTED,
 )
-from ..models import HouseState, Suggestion
+from ..models import HouseState, Suggestion, SuggestionPriority, SuggestionStore
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -63,17 +67,15 @@ async def store_suggestions(
         return
 
     # Expire any old suggestions first
-    expire_old_suggestions(house)
+    expire_old_suggestions(house, coordinator.clock.now())
 
     # Clear previous pending suggestions — the new analysis replaces them
-    house.suggestions = [
-        s for s in house.suggestions if s.status != SUGGESTION_PENDING
-    ]
+    house.suggestions.remove_pending()
 
     # Store new suggestions and summary
     house.suggestions.extend(suggestions)
     house.ai_daily_summary = summary
-    house.last_analysis_time = datetime.now(tz=timezone.utc)
+    house.last_analysis_time = coordinator.clock.utcnow()
 
     # Fire event so the frontend / automations can react
     hass.bus.async_fire(
@@ -97,6 +99,9 @@ async def store_suggestions(
     if auto_apply:
         await _auto_apply_suggestions(hass, coordinator, suggestions)
 
+    # Re-arm the expiry timer for the new batch
+    coordinator.schedule_suggestion_expiry()
+
     # Request a coordinator refresh so entities pick up new data
     await coordinator.async_request_refresh()
 
@@ -118,7 +123,8 @@ async def approve_suggestion(
     Returns:
         True if the suggestion was found, approved, and executed.
     """
-    suggestion = _find_suggestion(coordinator, suggestion_id)
+    store = _get_store(coordinator)
+    suggestion = store.get(suggestion_id) if store is not None else None
     if suggestion is None:
         _LOGGER.warning("Suggestion '%s' not found", suggestion_id)
         return False
@@ -131,8 +137,8 @@ async def approve_suggestion(
         )
         return False
 
-    if suggestion.is_expired():
-        suggestion.status = SUGGESTION_EXPIRED
+    if suggestion.is_expired(coordinator.clock.now()):
+        store.set_status(suggestion, SUGGESTION_EXPIRED)
         _LOGGER.info("Suggestion '%s' has expired", suggestion_id)
         return False
 
@@ -140,8 +146,8 @@ async def approve_suggestion(
     success = await execute_suggestion(coordinator.hass, suggestion)
 
     if success:
-        suggestion.status = SUGGESTION_APPLIED
-        suggestion.applied_at = datetime.now()
+        store.set_status(suggestion, SUGGESTION_APPLIED)
+        suggestion.applied_at = coordinator.clock.now()
 
         coordinator.hass.bus.async_fire(
             EVENT_SUGGESTION_APPLIED,
@@ -174,7 +180,8 @@ async def reject_suggestion(
     Returns:
         True if the suggestion was found and rejected.
     """
-    suggestion = _find_suggestion(coordinator, suggestion_id)
+    store = _get_store(coordinator)
+    suggestion = store.get(suggestion_id) if store is not None else None
     if suggestion is None:
         _LOGGER.warning("Suggestion '%s' not found", suggestion_id)
         return False
@@ -187,7 +194,7 @@ async def reject_suggestion(
         )
         return False
 
-    suggestion.status = SUGGESTION_REJECTED
+    store.set_status(suggestion, SUGGESTION_REJECTED)
     suggestion.rejected_reason = reason or "Rejected by user"
 
     coordinator.hass.bus.async_fire(
@@ -203,6 +210,241 @@ async def reject_suggestion(
     return True
 
 
+# ---------------------------------------------------------------------------
+# Bulk approval
+# ---------------------------------------------------------------------------
+
+# Per-suggestion outcomes reported by approve_suggestions.
+OUTCOME_APPLIED = "applied"
+OUTCOME_FAILED = "failed"
+OUTCOME_SUPERSEDED = "superseded"
+OUTCOME_EXPIRED = "expired"
+OUTCOME_NOT_PENDING = "not_pending"
+OUTCOME_NOT_FOUND = "not_found"
+
+_PRIORITY_RANK = {
+    SuggestionPriority.LOW: 0,
+    SuggestionPriority.MEDIUM: 1,
+    SuggestionPriority.HIGH: 2,
+    SuggestionPriority.CRITICAL: 3,
+}
+
+# action_data field -> service data field for SAFE_SERVICE_MAP actions.
+_ACTION_FIELDS: dict[str, tuple[str, str]] = {
+    "set_temperature": ("temperature", "temperature"),
+    "set_mode": ("mode", "hvac_mode"),
+}
+
+# Within one entity, change the mode before the setpoint.
+_SERVICE_ORDER = {"set_hvac_mode": 0}
+
+
+@dataclass
+class _Command:
+    """One service call planned on behalf of a suggestion."""
+
+    domain: str
+    service: str
+    entity_id: str
+    data: dict[str, Any]
+    suggestion_id: str
+
+
+@dataclass
+class _Plan:
+    """Planned commands for one suggestion (empty for informational ones)."""
+
+    suggestion: Suggestion
+    commands: list[_Command] = field(default_factory=list)
+    error: str | None = None
+
+
+async def approve_suggestions(
+    coordinator: SmartClimateCoordinator, suggestion_ids: list[str]
+) -> dict[str, str]:
+    """Approve and execute several pending suggestions at once.
+
+    Each suggestion is turned into service calls keyed by target entity
+    and attribute.  When two suggestions change the same attribute of the
+    same entity (e.g. two rooms sharing a thermostat), only the
+    higher-priority, then higher-confidence, one is sent; the other is
+    rejected as superseded once that command succeeds.  A suggestion any
+    of whose attributes failed to change, including through the winning
+    command of another, is reported as failed and stays pending so it can
+    be approved again.  Commands for one entity run in order, and
+    different entities are commanded concurrently, at most
+    BULK_APPROVAL_CONCURRENCY at a time.
+
+    Each applied suggestion fires EVENT_SUGGESTION_APPLIED, as with
+    approve_suggestion, and a single EVENT_SUGGESTIONS_BULK_APPROVED
+    event then reports every outcome.
+
+    Returns:
+        Mapping of suggestion id to one of the OUTCOME_* values.
+    """
+    hass = coordinator.hass
+    store = _get_store(coordinator)
+    outcomes: dict[str, str] = {}
+    plans: list[_Plan] = []
+    now = coordinator.clock.now()
+
+    for suggestion_id in dict.fromkeys(suggestion_ids):
+        suggestion = store.get(suggestion_id) if store is not None else None
+        if suggestion is None:
+            outcomes[suggestion_id] = OUTCOME_NOT_FOUND
+        elif suggestion.status != SUGGESTION_PENDING:
+            outcomes[suggestion_id] = OUTCOME_NOT_PENDING
+        elif suggestion.is_expired(now):
+            store.set_status(suggestion, SUGGESTION_EXPIRED)
+            outcomes[suggestion_id] = OUTCOME_EXPIRED
+        else:
+            plans.append(_plan_suggestion(hass, suggestion))
+
+    # Coalesce: one final value per (entity, service).
+    winners: dict[tuple[str, str], tuple[tuple[int, float], _Command]] = {}
+    for plan in plans:
+        rank = (
+            _PRIORITY_RANK.get(plan.suggestion.priority, 1),
+            plan.suggestion.confidence,
+        )
+        for command in plan.commands:
+            key = (command.entity_id, command.service)
+            current = winners.get(key)
+            if current is None or rank >= current[0]:
+                winners[key] = (rank, command)
+
+    by_entity: dict[str, list[_Command]] = {}
+    for _rank, command in winners.values():
+        by_entity.setdefault(command.entity_id, []).append(command)
+
+    failed_commands: set[int] = set()
+    semaphore = asyncio.Semaphore(BULK_APPROVAL_CONCURRENCY)
+
+    async def run_entity(commands: list[_Command]) -> None:
+        async with semaphore:
+            for command in sorted(
+                commands, key=lambda c: _SERVICE_ORDER.get(c.service, 1)
+            ):
+                try:
+                    await hass.services.async_call(
+                        command.domain,
+                        command.service,
+                        {"entity_id": command.entity_id, **command.data},
+                        blocking=True,
+                    )
+                except Exception:
+                    _LOGGER.exception(
+                        "Failed to call %s.%s for %s",
+                        command.domain,
+                        command.service,
+                        command.entity_id,
+                    )
+                    failed_commands.add(id(command))
+
+    await asyncio.gather(*(run_entity(cmds) for cmds in by_entity.values()))
+
+    sent = {id(command) for _rank, command in winners.values()}
+    now = coordinator.clock.now()
+    for plan in plans:
+        suggestion = plan.suggestion
+        mine = [c for c in plan.commands if id(c) in sent]
+        # The commands actually sent for this suggestion's attributes.
+        covering = [winners[(c.entity_id, c.service)][1] for c in plan.commands]
+        if plan.error is not None or any(id(c) in failed_commands for c in covering):
+            outcomes[suggestion.id] = OUTCOME_FAILED
+        elif plan.commands and not mine:
+            winner = next(
+                winners[(c.entity_id, c.service)][1].suggestion_id
+                for c in plan.commands
+            )
+            store.set_status(suggestion, SUGGESTION_REJECTED)
+            suggestion.rejected_reason = f"Superseded by suggestion {winner}"
+            outcomes[suggestion.id] = OUTCOME_SUPERSEDED
+        else:
+            store.set_status(suggestion, SUGGESTION_APPLIED)
+            suggestion.applied_at = now
+            outcomes[suggestion.id] = OUTCOME_APPLIED
+            hass.bus.async_fire(
+                EVENT_SUGGESTION_APPLIED,
+                {
+                    "suggestion_id": suggestion.id,
+                    "title": suggestion.title,
+                    "action_type": suggestion.action_type,
+                    "room": suggestion.room,
+                },
+            )
+
+    counts: dict[str, int] = {}
+    for outcome in outcomes.values():
+        counts[outcome] = counts.get(outcome, 0) + 1
+
+    hass.bus.async_fire(
+        EVENT_SUGGESTIONS_BULK_APPROVED,
+        {
+            "outcomes": outcomes,
+            "counts": counts,
+            "service_calls": len(winners),
+        },
+    )
+    _LOGGER.info(
+        "Bulk approved %d suggestions with %d service calls: %s",
+        len(outcomes),
+        len(winners),
+        counts,
+    )
+    return outcomes
+
+
+def _plan_suggestion(hass: HomeAssistant, suggestion: Suggestion) -> _Plan:
+    """Translate a suggestion into service calls without executing them."""
+    plan = _Plan(suggestion)
+    action_type = suggestion.action_type
+    action_data = suggestion.action_data
+
+    if action_type in SAFE_SERVICE_MAP:
+        domain, service = SAFE_SERVICE_MAP[action_type]
+        source, target = _ACTION_FIELDS[action_type]
+        value = action_data.get(source)
+        entity_id = _get_climate_entity_for_room(hass, suggestion.room)
+        if value is None or value == "":
+            plan.error = f"{action_type} action missing '{source}' field"
+        elif entity_id is None:
+            plan.error = f"cannot resolve climate entity for room '{suggestion.room}'"
+        else:
+            plan.commands.append(
+                _Command(domain, service, entity_id, {target: value}, suggestion.id)
+            )
+    elif action_type == "vent_adjustment":
+        position = action_data.get("vent_position")
+        if position is None or suggestion.room is None:
+            plan.error = "vent_adjustment needs a room and vent_position"
+        else:
+            for entity_id in _get_vent_entities_for_room(hass, suggestion.room):
+                domain = entity_id.split(".")[0]
+                if domain == "cover":
+                    plan.commands.append(
+                        _Command(
+                            "cover",
+                            "set_cover_position",
+                            entity_id,
+                            {"position": position},
+                            suggestion.id,
+                        )
+                    )
+                elif domain == "number":
+                    plan.commands.append(
+                        _Command(
+                            "number", "set_value", entity_id, {"value": position}, suggestion.id
+                        )
+                    )
+    elif action_type not in ("schedule_change", "general"):
+        plan.error = f"unknown action_type '{action_type}'"
+
+    if plan.error is not None:
+        _LOGGER.warning("Cannot apply suggestion '%s': %s", suggestion.id, plan.error)
+    return plan
+
+
 async def execute_suggestion(
     hass: HomeAssistant, suggestion: Suggestion
 ) -> bool:
@@ -254,22 +496,21 @@ async def execute_suggestion(
 # ---------------------------------------------------------------------------
 
 
-def expire_old_suggestions(house_state: HouseState) -> None:
+def expire_old_suggestions(
+    house_state: HouseState, now: datetime | None = None
+) -> list[Suggestion]:
     """Mark expired suggestions in the house state.
 
     Any suggestion that is still pending and past its ``expires_at``
-    timestamp will be moved to the ``expired`` status.
+    timestamp (relative to ``now``, default the wall clock) will be moved
+    to the ``expired`` status.  Only the due entries of the store's
+    expiry heap are visited.
     """
-    now = datetime.now()
-    expired_count = 0
+    expired = house_state.suggestions.expire_due(now or datetime.now())
 
-    for suggestion in house_state.suggestions:
-        if suggestion.status == SUGGESTION_PENDING and now > suggestion.expires_at:
-            suggestion.status = SUGGESTION_EXPIRED
-            expired_count += 1
-
-    if expired_count:
-        _LOGGER.debug("Expired %d old suggestions", expired_count)
+    if expired:
+        _LOGGER.debug("Expired %d old suggestions", len(expired))
+    return expired
 
 
 # ---------------------------------------------------------------------------
@@ -277,10 +518,8 @@ def expire_old_suggestions(house_state: HouseState) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _find_suggestion(
-    coordinator: SmartClimateCoordinator, suggestion_id: str
-) -> Suggestion | None:
-    """Look up a suggestion by ID from the coordinator's house state."""
+def _get_store(coordinator: SmartClimateCoordinator) -> SuggestionStore | None:
+    """Return the suggestion store from the coordinator's house state."""
     if not coordinator.data:
         return None
 
@@ -288,11 +527,7 @@ def _find_suggestion(
     if house is None:
         return None
 
-    for suggestion in house.suggestions:
-        if suggestion.id == suggestion_id:
-            return suggestion
-
-    return None
+    return house.suggestions
 
 
 async def _auto_apply_suggestions(
@@ -301,18 +536,21 @@ async def _auto_apply_suggestions(
     suggestions: list[Suggestion],
 ) -> None:
     """Auto-apply suggestions that meet the confidence threshold."""
-    for suggestion in suggestions:
-        if (
-            suggestion.status == SUGGESTION_PENDING
-            and suggestion.confidence >= AUTO_APPLY_CONFIDENCE_THRESHOLD
-            and suggestion.action_type in SAFE_SERVICE_MAP
-        ):
-            _LOGGER.info(
-                "Auto-applying suggestion '%s' (confidence=%.2f)",
-                suggestion.title,
-                suggestion.confidence,
-            )
-            await approve_suggestion(coordinator, suggestion.id)
+    eligible = [
+        suggestion
+        for suggestion in suggestions
+        if suggestion.status == SUGGESTION_PENDING
+        and suggestion.confidence >= AUTO_APPLY_CONFIDENCE_THRESHOLD
+        and suggestion.action_type in SAFE_SERVICE_MAP
+    ]
+    for suggestion in eligible:
+        _LOGGER.info(
+            "Auto-applying suggestion '%s' (confidence=%.2f)",
+            suggestion.title,
+            suggestion.confidence,
+        )
+    if eligible:
+        await approve_suggestions(coordinator, [s.id for s in eligible])
 
 
 def _get_climate_entity_for_room(
@@ -344,6 +582,18 @@ def _get_climate_entity_for_room(
     return None
 
 
+def _get_vent_entities_for_room(hass: HomeAssistant, room_slug: str) -> list[str]:
+    """Resolve a room slug to its configured vent entity IDs."""
+    for entry_data in (hass.data.get(DOMAIN) or {}).values():
+        if not hasattr(entry_data, "data") or not entry_data.data:
+            continue
+        room_state = entry_data.data.get("rooms", {}).get(room_slug)
+        if room_state is not None:
+            config = getattr(room_state, "config", None)
+            return list(getattr(config, "vent_entities", []) or [])
+    return []
+
+
 async def _execute_set_temperature(
     hass: HomeAssistant, room_slug: str | None, action_data: dict
 ) -> bool:
@@ -439,23 +689,10 @@ async def _execute_vent_adjustment(
         _LOGGER.warning("vent_adjustment requires a room slug")
         return False
 
-    # Find vent entities from the coordinator data
-    domain_data = hass.data.get(DOMAIN)
-    if not domain_data:
+    if not hass.data.get(DOMAIN):
         return False
 
-    vent_entities: list[str] = []
-    for entry_data in domain_data.values():
-        if not hasattr(entry_data, "data") or not entry_data.data:
-            continue
-        rooms = entry_data.data.get("rooms", {})
-        for slug, room_state in rooms.items():
-            if slug == room_slug:
-                config = getattr(room_state, "config", None)
-                if config is not None:
-                    vent_entities = getattr(config, "vent_entities", [])
-                break
-
+    vent_entities = _get_vent_entities_for_room(hass, room_slug)
     if not vent_entities:
         _LOGGER.info(
             "No vent entities configured for room '%s'; vent_adjustment is informational",
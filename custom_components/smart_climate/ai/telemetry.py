@@ -0,0 +1,258 @@
+"""Per-call telemetry for AI provider requests."""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+# Number of recent calls kept in memory and persisted.
+TELEMETRY_HISTORY_SIZE = 100
+
+
+@dataclass
+class AICallRecord:
+    """Metrics for one ``analyze`` call, including all of its retries.
+
+    Timings are in seconds.  ``connect_time`` and ``time_to_first_byte``
+    describe the final attempt; ``latency`` spans the whole call.
+    """
+
+    provider: str = ""
+    model: str | None = None
+    timestamp: datetime = field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    success: bool = False
+    error: str | None = None
+    latency: float = 0.0
+    connect_time: float | None = None
+    time_to_first_byte: float | None = None
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    retries: int = 0
+    response_bytes: int = 0
+    # Whether the model was already loaded; None for hosted providers.
+    model_warm: bool | None = None
+
+    @property
+    def total_tokens(self) -> int:
+        """Return prompt plus completion tokens (missing counts as 0)."""
+        return (self.prompt_tokens or 0) + (self.completion_tokens or 0)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a plain dict for storage and diagnostics."""
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "timestamp": self.timestamp.isoformat(),
+            "success": self.success,
+            "error": self.error,
+            "latency": round(self.latency, 3),
+            "connect_time": _round(self.connect_time),
+            "time_to_first_byte": _round(self.time_to_first_byte),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "retries": self.retries,
+            "response_bytes": self.response_bytes,
+            "model_warm": self.model_warm,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AICallRecord:
+        """Deserialize from a plain dict."""
+        timestamp = datetime.now(tz=timezone.utc)
+        if data.get("timestamp"):
+            with contextlib.suppress(ValueError, TypeError):
+                timestamp = datetime.fromisoformat(data["timestamp"])
+        return cls(
+            provider=data.get("provider", ""),
+            model=data.get("model"),
+            timestamp=timestamp,
+            success=bool(data.get("success", False)),
+            error=data.get("error"),
+            latency=float(data.get("latency") or 0.0),
+            connect_time=data.get("connect_time"),
+            time_to_first_byte=data.get("time_to_first_byte"),
+            prompt_tokens=data.get("prompt_tokens"),
+            completion_tokens=data.get("completion_tokens"),
+            retries=int(data.get("retries") or 0),
+            response_bytes=int(data.get("response_bytes") or 0),
+            model_warm=data.get("model_warm"),
+        )
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 3) if value is not None else None
+
+
+class AITelemetry:
+    """Bounded history of AI calls plus lifetime counters."""
+
+    def __init__(self, size: int = TELEMETRY_HISTORY_SIZE) -> None:
+        self._calls: deque[AICallRecord] = deque(maxlen=size)
+        self.total_calls = 0
+        self.total_failures = 0
+        self.total_retries = 0
+        self.total_prompt_tokens = 0
+        self.total_completion_tokens = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    @property
+    def last_call(self) -> AICallRecord | None:
+        """Return the most recent call, if any."""
+        return self._calls[-1] if self._calls else None
+
+    @property
+    def total_tokens(self) -> int:
+        """Return lifetime prompt plus completion tokens."""
+        return self.total_prompt_tokens + self.total_completion_tokens
+
+    def record(self, call: AICallRecord) -> None:
+        """Add a finished call to the history and counters."""
+        self._calls.append(call)
+        self.total_calls += 1
+        self.total_retries += call.retries
+        if not call.success:
+            self.total_failures += 1
+        self.total_prompt_tokens += call.prompt_tokens or 0
+        self.total_completion_tokens += call.completion_tokens or 0
+
+    def summary(self) -> dict[str, Any]:
+        """Return aggregate statistics over the retained history."""
+        ok = [c for c in self._calls if c.success]
+        latencies = sorted(c.latency for c in ok)
+        p95 = None
+        if latencies:
+            p95 = latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)]
+        per_provider: dict[str, int] = {}
+        for call in self._calls:
+            per_provider[call.provider] = per_provider.get(call.provider, 0) + 1
+        return {
+            "total_calls": self.total_calls,
+            "total_failures": self.total_failures,
+            "total_retries": self.total_retries,
+            "total_prompt_tokens": self.total_prompt_tokens,
+            "total_completion_tokens": self.total_completion_tokens,
+            "recent_calls": len(self._calls),
+            "recent_calls_by_provider": per_provider,
+            "recent_cold_starts": sum(
+                1 for c in self._calls if c.model_warm is False
+            ),
+            "avg_latency": (
+                round(sum(latencies) / len(latencies), 3) if latencies else None
+            ),
+            "p95_latency": _round(p95),
+            "avg_completion_tokens": (
+                round(
+                    sum(c.completion_tokens or 0 for c in ok) / len(ok), 1
+                )
+                if ok
+                else None
+            ),
+        }
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the retained history, oldest first."""
+        return [call.to_dict() for call in self._calls]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize history and counters for storage."""
+        return {
+            "calls": self.as_list(),
+            "totals": {
+                "calls": self.total_calls,
+                "failures": self.total_failures,
+                "retries": self.total_retries,
+                "prompt_tokens": self.total_prompt_tokens,
+                "completion_tokens": self.total_completion_tokens,
+            },
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Load history and counters saved by ``to_dict``."""
+        self._calls.clear()
+        for item in data.get("calls", []):
+            with contextlib.suppress(Exception):
+                self._calls.append(AICallRecord.from_dict(item))
+        totals = data.get("totals", {})
+        self.total_calls = int(totals.get("calls", len(self._calls)))
+        self.total_failures = int(totals.get("failures", 0))
+        self.total_retries = int(totals.get("retries", 0))
+        self.total_prompt_tokens = int(totals.get("prompt_tokens", 0))
+        self.total_completion_tokens = int(totals.get("completion_tokens", 0))
+
+
+# ---------------------------------------------------------------------------
+# aiohttp tracing
+# ---------------------------------------------------------------------------
+
+
+async def _on_request_start(
+    _session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    _params: Any,
+) -> None:
+    ctx.request_start = time.monotonic()
+
+
+async def _on_connection_create_start(
+    _session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    _params: Any,
+) -> None:
+    ctx.connect_start = time.monotonic()
+
+
+async def _on_connection_create_end(
+    _session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    _params: Any,
+) -> None:
+    call = ctx.trace_request_ctx
+    start = getattr(ctx, "connect_start", None)
+    if isinstance(call, AICallRecord) and start is not None:
+        call.connect_time = time.monotonic() - start
+
+
+async def _on_connection_reuseconn(
+    _session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    _params: Any,
+) -> None:
+    call = ctx.trace_request_ctx
+    if isinstance(call, AICallRecord):
+        call.connect_time = 0.0
+
+
+async def _on_request_end(
+    _session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    _params: Any,
+) -> None:
+    # Fired once the response status line and headers have arrived.
+    call = ctx.trace_request_ctx
+    start = getattr(ctx, "request_start", None)
+    if isinstance(call, AICallRecord) and start is not None:
+        call.time_to_first_byte = time.monotonic() - start
+
+
+def build_trace_config() -> aiohttp.TraceConfig:
+    """Return a TraceConfig that fills in timings on an AICallRecord.
+
+    Pass the record as ``trace_request_ctx`` on the request.
+    """
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(_on_request_start)
+    trace.on_connection_create_start.append(_on_connection_create_start)
+    trace.on_connection_create_end.append(_on_connection_create_end)
+    trace.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace.on_request_end.append(_on_request_end)
+    return trace
@@ -0,0 +1,632 @@
+"""Parameter-sweep backtester over recorded history.
+
+Loads a window of history for the configured entities once and resamples
+it into fixed-step frames.  The source is either Home Assistant's
+recorder database (SQLite) or an input recording from ``recorder.py``.
+Every parameter set in a grid is then evaluated against the same frames
+through the pure helpers: follow-me target selection, comfort and
+efficiency scoring, auxiliary engagement and vent positions.  Parameter
+sets are spread across a process pool; each worker receives the frames
+once, when it starts.
+
+History is fixed, so a backtest shows what the helpers would have
+decided, not how the house would have responded (see ``simulator.py``
+for that)::
+
+    python -m custom_components.smart_climate.backtest --config-dir /config \\
+        --days 14 --grid auxiliary_threshold=1,2,3 --grid away_temp_offset=2,4,6
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields, replace
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+from .const import (
+    CONF_AUXILIARY_MAX_RUNTIME,
+    CONF_OUTDOOR_TEMP_SENSOR,
+    CONF_ROOMS,
+    CONF_WEATHER_ENTITY,
+    DEFAULT_AUXILIARY_DELAY_MINUTES,
+    DEFAULT_AUXILIARY_MAX_RUNTIME,
+    DEFAULT_AUXILIARY_THRESHOLD,
+    DEFAULT_AWAY_TEMP_OFFSET,
+    DEFAULT_COMFORT_HUMIDITY_WEIGHT,
+    DEFAULT_COMFORT_TEMP_WEIGHT,
+    DEFAULT_FOLLOW_ME_COOLDOWN,
+    DOMAIN,
+)
+from .coordinator import TEMP_HISTORY_SIZE
+from .helpers.auxiliary import should_disengage_auxiliary, should_engage_auxiliary
+from .helpers.comfort import calculate_comfort_score
+from .helpers.efficiency import calculate_efficiency_score
+from .helpers.presence import calculate_follow_me_targets, determine_follow_me_target
+from .helpers.vents import calculate_vent_positions
+from .models import (
+    AuxiliaryDeviceState,
+    AuxiliaryDeviceType,
+    HVACAction,
+    RoomConfig,
+    RoomState,
+)
+from .recorder import read_recording
+
+DEFAULT_STEP_SECONDS = 300
+
+# entity_id -> [(time, state, attributes), ...] in time order
+History = dict[str, list[tuple[datetime, str, dict[str, Any]]]]
+
+_ACTIVE_ACTIONS = ("heating", "cooling")
+_ACTIONS = frozenset(action.value for action in HVACAction)
+
+
+class RoomSample(NamedTuple):
+    """One room's inputs at one frame, with parameter-independent history."""
+
+    temperature: float | None
+    humidity: float | None
+    occupied: bool
+    window_open: bool
+    current_target: float | None
+    hvac_action: str
+    hvac_since: datetime | None
+    temp_trend: float
+    runtime_today: float
+    cycles_today: int
+
+
+class Frame(NamedTuple):
+    """All rooms' inputs at one instant."""
+
+    time: datetime
+    outdoor: float | None
+    rooms: tuple[RoomSample, ...]
+
+
+@dataclass(frozen=True)
+class ParameterSet:
+    """Tunable options; field names match the config entry keys."""
+
+    auxiliary_threshold: float = DEFAULT_AUXILIARY_THRESHOLD
+    auxiliary_delay_minutes: float = DEFAULT_AUXILIARY_DELAY_MINUTES
+    away_temp_offset: float = DEFAULT_AWAY_TEMP_OFFSET
+    follow_me_cooldown: float = DEFAULT_FOLLOW_ME_COOLDOWN
+    comfort_temp_weight: float = DEFAULT_COMFORT_TEMP_WEIGHT
+    comfort_humidity_weight: float = DEFAULT_COMFORT_HUMIDITY_WEIGHT
+
+    @classmethod
+    def from_config(cls, data: Mapping[str, Any]) -> ParameterSet:
+        """Take the configured values as the baseline."""
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+@dataclass
+class BacktestResult:
+    """Outcome of one parameter set."""
+
+    params: ParameterSet
+    # Mean comfort score against the effective target, all / occupied frames.
+    comfort: float = 0.0
+    occupied_comfort: float = 0.0
+    efficiency: float = 0.0
+    # Degree-hours the effective target sat away from the thermostat's.
+    setback_degree_hours: float = 0.0
+    aux_hours: float = 0.0
+    aux_starts: int = 0
+    follow_me_switches: int = 0
+    mean_vent_position: float = 100.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        data = asdict(self)
+        data["params"] = asdict(self.params)
+        return data
+
+
+def parameter_grid(
+    base: ParameterSet, axes: Mapping[str, Sequence[float]]
+) -> list[ParameterSet]:
+    """Return every combination of ``axes`` applied to ``base``."""
+    names = list(axes)
+    known = {f.name for f in fields(ParameterSet)}
+    unknown = set(names) - known
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+    return [
+        replace(base, **dict(zip(names, values)))
+        for values in itertools.product(*(axes[name] for name in names))
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Loading history
+# ---------------------------------------------------------------------------
+
+
+def tracked_entities(config: Mapping[str, Any]) -> list[str]:
+    """Return the entities a backtest needs, as the coordinator tracks them."""
+    entities: set[str] = set()
+    for room in config.get(CONF_ROOMS, []):
+        cfg = RoomConfig.from_dict(room)
+        entities.add(cfg.climate_entity)
+        entities.update(cfg.temp_sensors)
+        entities.update(cfg.humidity_sensors)
+        entities.update(cfg.presence_sensors)
+        entities.update(cfg.door_window_sensors)
+    for key in (CONF_OUTDOOR_TEMP_SENSOR, CONF_WEATHER_ENTITY):
+        if config.get(key):
+            entities.add(config[key])
+    return sorted(entities)
+
+
+def load_config_entry(config_dir: str, entry_id: str | None = None) -> dict[str, Any]:
+    """Read a Smart Climate config entry's data from ``.storage``."""
+    path = os.path.join(config_dir, ".storage", "core.config_entries")
+    with open(path, encoding="utf-8") as handle:
+        entries = json.load(handle)["data"]["entries"]
+    for entry in entries:
+        if entry.get("domain") == DOMAIN and entry_id in (None, entry.get("entry_id")):
+            return dict(entry.get("data", {}))
+    raise ValueError(f"No {DOMAIN} config entry found in {path}")
+
+
+def load_recorder_history(
+    db_path: str, entity_ids: Iterable[str], start: datetime, end: datetime
+) -> History:
+    """Fetch state history from a recorder SQLite database in one pass.
+
+    Includes each entity's last state before ``start`` so the window
+    opens with known values.  Times are returned as naive local time.
+    """
+    entity_ids = list(entity_ids)
+    history: History = {entity_id: [] for entity_id in entity_ids}
+    if not entity_ids:
+        return history
+    marks = ",".join("?" * len(entity_ids))
+    select = (
+        "SELECT m.entity_id, s.state, s.last_updated_ts, a.shared_attrs "
+        "FROM states s JOIN states_meta m ON s.metadata_id = m.metadata_id "
+        "LEFT JOIN state_attributes a ON s.attributes_id = a.attributes_id "
+    )
+    queries = (
+        (
+            select
+            + "WHERE s.state_id IN (SELECT MAX(s2.state_id) FROM states s2 "
+            "JOIN states_meta m2 ON s2.metadata_id = m2.metadata_id "
+            f"WHERE m2.entity_id IN ({marks}) AND s2.last_updated_ts < ? "
+            "GROUP BY s2.metadata_id)",
+            (*entity_ids, start.timestamp()),
+        ),
+        (
+            select
+            + f"WHERE m.entity_id IN ({marks}) "
+            "AND s.last_updated_ts >= ? AND s.last_updated_ts < ? "
+            "ORDER BY s.last_updated_ts",
+            (*entity_ids, start.timestamp(), end.timestamp()),
+        ),
+    )
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        for query, args in queries:
+            for entity_id, state, timestamp, attrs in connection.execute(query, args):
+                attributes: dict[str, Any] = {}
+                if attrs:
+                    with contextlib.suppress(ValueError):
+                        attributes = json.loads(attrs)
+                history[entity_id].append(
+                    (datetime.fromtimestamp(timestamp), state, attributes)
+                )
+    finally:
+        connection.close()
+    return history
+
+
+def history_from_recording(path: str) -> tuple[dict[str, Any], History]:
+    """Convert an input recording into history plus its config."""
+    config: dict[str, Any] = {}
+    history: History = {}
+    for cycle in read_recording(path):
+        config = config or cycle.config
+        for entity_id, encoded in cycle.changes.items():
+            state, attributes = encoded if encoded is not None else ("unavailable", {})
+            history.setdefault(entity_id, []).append((cycle.time, state, attributes))
+    return config, history
+
+
+# ---------------------------------------------------------------------------
+# Resampling into frames
+# ---------------------------------------------------------------------------
+
+
+def _number(value: Any) -> float | None:
+    if value is None or value in ("unavailable", "unknown", ""):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _reading(
+    current: Mapping[str, tuple[str, dict]], entity_id: str, attribute: str
+) -> float | None:
+    """Read a sensor value the way the coordinator does."""
+    item = current.get(entity_id)
+    if item is None:
+        return None
+    state, attributes = item
+    if entity_id.startswith("climate."):
+        value = attributes.get(f"current_{attribute}")
+        if value is None and attribute != "temperature":
+            value = attributes.get(attribute)
+        return _number(value)
+    return _number(state)
+
+
+def _mean(values: Iterable[float | None]) -> float | None:
+    present = [v for v in values if v is not None]
+    return round(sum(present) / len(present), 2) if present else None
+
+
+def _climate_target(attributes: Mapping[str, Any]) -> float | None:
+    target = _number(attributes.get("temperature"))
+    if target is not None:
+        return target
+    high = _number(attributes.get("target_temp_high"))
+    low = _number(attributes.get("target_temp_low"))
+    if high is not None and low is not None:
+        return (high + low) / 2.0
+    return high if high is not None else low
+
+
+def build_frames(
+    history: History,
+    config: Mapping[str, Any],
+    start: datetime,
+    end: datetime,
+    step: timedelta = timedelta(seconds=DEFAULT_STEP_SECONDS),
+) -> list[Frame]:
+    """Resample history onto a fixed grid of frames.
+
+    HVAC runtime, cycle counts, the time of the last HVAC action change
+    and the temperature trend do not depend on parameters, so they are
+    computed here once rather than per parameter set.
+    """
+    rooms = [RoomConfig.from_dict(room) for room in config.get(CONF_ROOMS, [])]
+    outdoor_sensor = config.get(CONF_OUTDOOR_TEMP_SENSOR)
+    weather = config.get(CONF_WEATHER_ENTITY)
+    pending = {
+        entity_id: iter(sorted(events, key=lambda item: item[0]))
+        for entity_id, events in history.items()
+    }
+    upcoming = {entity_id: next(events, None) for entity_id, events in pending.items()}
+    current: dict[str, tuple[str, dict]] = {}
+
+    actions = ["idle"] * len(rooms)
+    since: list[datetime | None] = [None] * len(rooms)
+    runtime = [0.0] * len(rooms)
+    cycles = [0] * len(rooms)
+    temps: list[list[tuple[datetime, float]]] = [[] for _ in rooms]
+    day = None
+    previous: datetime | None = None
+
+    frames: list[Frame] = []
+    now = start
+    while now < end:
+        for entity_id, item in upcoming.items():
+            while item is not None and item[0] <= now:
+                current[entity_id] = (item[1], item[2])
+                item = next(pending[entity_id], None)
+            upcoming[entity_id] = item
+
+        if now.date() != day:
+            day = now.date()
+            runtime = [0.0] * len(rooms)
+            cycles = [0] * len(rooms)
+
+        outdoor = _reading(current, outdoor_sensor, "temperature") if outdoor_sensor else None
+        if outdoor is None and weather and weather in current:
+            outdoor = _number(current[weather][1].get("temperature"))
+
+        samples = []
+        for index, cfg in enumerate(rooms):
+            climate = current.get(cfg.climate_entity)
+            target = _climate_target(climate[1]) if climate else None
+            action = climate[1].get("hvac_action", "idle") if climate else actions[index]
+            if action not in _ACTIONS:
+                action = "idle"
+
+            if previous is not None and actions[index] in _ACTIVE_ACTIONS:
+                runtime[index] += (now - previous).total_seconds() / 60.0
+            if action != actions[index]:
+                if action in _ACTIVE_ACTIONS and actions[index] not in _ACTIVE_ACTIONS:
+                    cycles[index] += 1
+                since[index] = now
+                actions[index] = action
+
+            temperature = _mean(_reading(current, e, "temperature") for e in cfg.temp_sensors)
+            trend = 0.0
+            if temperature is not None:
+                temps[index] = [*temps[index], (now, temperature)][-TEMP_HISTORY_SIZE:]
+                first_time, first_temp = temps[index][0]
+                hours = (now - first_time).total_seconds() / 3600.0
+                if hours > 0:
+                    trend = round((temperature - first_temp) / hours, 2)
+
+            samples.append(
+                RoomSample(
+                    temperature=temperature,
+                    humidity=_mean(
+                        _reading(current, e, "humidity") for e in cfg.humidity_sensors
+                    ),
+                    occupied=any(
+                        current.get(e, ("off",))[0] == "on" for e in cfg.presence_sensors
+                    ),
+                    window_open=any(
+                        current.get(e, ("off",))[0] == "on" for e in cfg.door_window_sensors
+                    ),
+                    current_target=target,
+                    hvac_action=action,
+                    hvac_since=since[index],
+                    temp_trend=trend,
+                    runtime_today=round(runtime[index], 2),
+                    cycles_today=cycles[index],
+                )
+            )
+        frames.append(Frame(now, outdoor, tuple(samples)))
+        previous = now
+        now += step
+    return frames
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+
+def evaluate_parameters(
+    frames: Sequence[Frame],
+    rooms: Sequence[RoomConfig],
+    params: ParameterSet,
+    max_runtime: int = DEFAULT_AUXILIARY_MAX_RUNTIME,
+) -> BacktestResult:
+    """Replay frames through the helpers with one parameter set.
+
+    The effective target is the follow-me target where there is one,
+    otherwise the thermostat's; comfort and efficiency are scored
+    against it.  Auxiliary engagement is counted, not simulated.
+    """
+    states = {cfg.slug: RoomState(config=cfg) for cfg in rooms}
+    aux = {
+        cfg.slug: AuxiliaryDeviceState(
+            entity_id=cfg.auxiliary_entities[0],
+            device_type=AuxiliaryDeviceType.SWITCH,
+            max_runtime=max_runtime,
+        )
+        for cfg in rooms
+        if cfg.auxiliary_entities
+    }
+    result = BacktestResult(params=params)
+    comfort_total = occupied_total = efficiency_total = vent_total = 0.0
+    scored = occupied_scored = vents_scored = 0
+    follow_me: str | None = None
+
+    for index, frame in enumerate(frames):
+        now = frame.time
+        following = frames[index + 1].time if index + 1 < len(frames) else None
+        hours = (following - now).total_seconds() / 3600.0 if following else 0.0
+
+        for room, sample in zip(states.values(), frame.rooms):
+            room.temperature = sample.temperature
+            room.humidity = sample.humidity
+            if sample.occupied and not room.occupied:
+                room.presence_since = now
+            elif not sample.occupied:
+                room.presence_since = None
+            room.occupied = sample.occupied
+            room.window_open = sample.window_open
+            room.current_target = sample.current_target
+            room.hvac_action = HVACAction(sample.hvac_action)
+            room.hvac_state_change_time = sample.hvac_since
+            room.temp_trend = sample.temp_trend
+            if sample.occupied:
+                room.last_presence_time = now
+
+        target = determine_follow_me_target(
+            states, follow_me, cooldown_minutes=params.follow_me_cooldown, now=now
+        )
+        if target != follow_me and follow_me is not None:
+            result.follow_me_switches += 1
+        follow_me = target
+        smart = calculate_follow_me_targets(
+            states, target, away_temp_offset=params.away_temp_offset
+        )
+
+        for vents in calculate_vent_positions(states).values():
+            for _entity_id, position in vents:
+                vent_total += position
+                vents_scored += 1
+
+        for (slug, room), sample in zip(states.items(), frame.rooms):
+            effective = smart.get(slug)
+            if effective is None:
+                effective = room.current_target
+            if room.temperature is None or effective is None:
+                continue
+
+            comfort = calculate_comfort_score(
+                room.temperature,
+                effective,
+                room.humidity,
+                temp_weight=params.comfort_temp_weight,
+                humidity_weight=params.comfort_humidity_weight,
+            )
+            comfort_total += comfort
+            scored += 1
+            if room.occupied:
+                occupied_total += comfort
+                occupied_scored += 1
+            efficiency_total += calculate_efficiency_score(
+                hvac_runtime_minutes=sample.runtime_today,
+                hvac_cycles=sample.cycles_today,
+                temp_deviation=abs(room.temperature - effective),
+                outdoor_temp=frame.outdoor,
+                target_temp=effective,
+                window_open=room.window_open,
+            )
+            if room.current_target is not None:
+                result.setback_degree_hours += abs(room.current_target - effective) * hours
+
+            device = aux.get(slug)
+            if device is None:
+                continue
+            if device.is_on:
+                device.runtime_minutes = (now - device.started_at).total_seconds() / 60.0
+                if should_disengage_auxiliary(room, effective, device):
+                    device.is_on = False
+            elif should_engage_auxiliary(
+                room,
+                effective,
+                threshold=params.auxiliary_threshold,
+                delay_minutes=params.auxiliary_delay_minutes,
+                now=now,
+            ):
+                device.is_on = True
+                device.started_at = now
+                result.aux_starts += 1
+            if device.is_on:
+                result.aux_hours += hours
+
+    result.comfort = round(comfort_total / scored, 2) if scored else 0.0
+    result.occupied_comfort = (
+        round(occupied_total / occupied_scored, 2) if occupied_scored else 0.0
+    )
+    result.efficiency = round(efficiency_total / scored, 2) if scored else 0.0
+    result.setback_degree_hours = round(result.setback_degree_hours, 2)
+    result.aux_hours = round(result.aux_hours, 2)
+    if vents_scored:
+        result.mean_vent_position = round(vent_total / vents_scored, 1)
+    return result
+
+
+_WORKER_INPUTS: tuple[Sequence[Frame], Sequence[RoomConfig], int] | None = None
+
+
+def _init_worker(frames: Sequence[Frame], rooms: Sequence[RoomConfig], max_runtime: int) -> None:
+    global _WORKER_INPUTS
+    _WORKER_INPUTS = (frames, rooms, max_runtime)
+
+
+def _evaluate_in_worker(params: ParameterSet) -> BacktestResult:
+    frames, rooms, max_runtime = _WORKER_INPUTS
+    return evaluate_parameters(frames, rooms, params, max_runtime)
+
+
+def run_sweep(
+    frames: Sequence[Frame],
+    config: Mapping[str, Any],
+    grid: Sequence[ParameterSet],
+    workers: int | None = None,
+) -> list[BacktestResult]:
+    """Evaluate every parameter set, in parallel across ``workers`` processes.
+
+    ``workers`` defaults to the CPU count; 1 evaluates in this process.
+    Results are returned in grid order.
+    """
+    rooms = [RoomConfig.from_dict(room) for room in config.get(CONF_ROOMS, [])]
+    max_runtime = config.get(CONF_AUXILIARY_MAX_RUNTIME, DEFAULT_AUXILIARY_MAX_RUNTIME)
+    workers = min(workers or os.cpu_count() or 1, len(grid))
+    if workers <= 1:
+        return [evaluate_parameters(frames, rooms, params, max_runtime) for params in grid]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(frames, rooms, max_runtime),
+    ) as pool:
+        chunksize = max(1, len(grid) // (workers * 4))
+        return list(pool.map(_evaluate_in_worker, grid, chunksize=chunksize))
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def _parse_axis(text: str) -> tuple[str, list[float]]:
+    name, _, values = text.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError(f"Expected NAME=V1,V2,...; got {text!r}")
+    return name.strip(), [float(value) for value in values.split(",")]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--config-dir", help="Home Assistant config directory")
+    source.add_argument("--recording", help="Input recording (*.jsonl.gz)")
+    parser.add_argument("--db", help="Recorder database (default: home-assistant_v2.db)")
+    parser.add_argument("--entry-id", help="Config entry to use if there are several")
+    parser.add_argument("--days", type=float, default=7.0, help="History window (config dir)")
+    parser.add_argument("--step", type=int, default=DEFAULT_STEP_SECONDS, help="Seconds")
+    parser.add_argument("--grid", type=_parse_axis, action="append", default=[])
+    parser.add_argument("--workers", type=int, help="Processes (default: all cores)")
+    parser.add_argument("--output", help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.recording:
+        config, history = history_from_recording(args.recording)
+        times = [t for events in history.values() for t, _s, _a in events]
+        if not times:
+            print("Recording is empty")
+            return 1
+        start, end = min(times), max(times) + timedelta(seconds=1)
+    else:
+        config = load_config_entry(args.config_dir, args.entry_id)
+        end = datetime.now()
+        start = end - timedelta(days=args.days)
+        db_path = args.db or os.path.join(args.config_dir, "home-assistant_v2.db")
+        history = load_recorder_history(db_path, tracked_entities(config), start, end)
+    frames = build_frames(history, config, start, end, timedelta(seconds=args.step))
+    loaded = time.perf_counter() - started
+
+    grid = parameter_grid(ParameterSet.from_config(config), dict(args.grid))
+    started = time.perf_counter()
+    results = run_sweep(frames, config, grid, workers=args.workers)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{len(frames)} frames loaded in {loaded:.2f}s; "
+        f"{len(grid)} parameter sets in {elapsed:.2f}s"
+    )
+    axes = [name for name, _values in args.grid]
+    header = "".join(f"{name:>24}" for name in axes)
+    print(f"{header}{'occ. comfort':>14}{'efficiency':>12}{'setback °h':>12}{'aux h':>8}")
+    ranked = sorted(results, key=lambda r: (-r.occupied_comfort, -r.efficiency, r.aux_hours))
+    for result in ranked:
+        values = "".join(f"{getattr(result.params, name):>24g}" for name in axes)
+        print(
+            f"{values}{result.occupied_comfort:>14.1f}{result.efficiency:>12.1f}"
+            f"{result.setback_degree_hours:>12.1f}{result.aux_hours:>8.1f}"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump([result.to_dict() for result in results], handle, indent=1, default=str)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
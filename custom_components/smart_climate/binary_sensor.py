@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -100,6 +100,21 @@ class SmartClimateOccupancySensor(SmartClimateEntity, BinarySensorEntity):
             return None
         return room_state.occupied
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return presence confidence and when presence was last seen."""
+        room_state = self.coordinator.data.get("rooms", {}).get(self._room_slug)
+        if room_state is None:
+            return {}
+        return {
+            "confidence": room_state.presence_confidence,
+            "last_presence": (
+                room_state.last_presence_time.isoformat()
+                if room_state.last_presence_time
+                else None
+            ),
+        }
+
 
 class SmartClimateWindowSensor(SmartClimateEntity, BinarySensorEntity):
     """Window open state for a room."""
@@ -221,7 +236,7 @@ class SmartClimateAuxiliaryActiveSensor(SmartClimateEntity, BinarySensorEntity):
             remaining = DEFAULT_AUXILIARY_MAX_RUNTIME - room_state.auxiliary_runtime_minutes
             if remaining > 0:
                 attrs["auto_shutoff_at"] = (
-                    datetime.now() + timedelta(minutes=remaining)
+                    self.coordinator.clock.now() + timedelta(minutes=remaining)
                 ).isoformat()
 
         return attrs
@@ -261,6 +276,4 @@ class SmartClimateSuggestionsPendingSensor(SmartClimateEntity, BinarySensorEntit
         house_state = self.coordinator.data.get("house")
         if house_state is None:
             return False
-        return any(
-            s.status == SUGGESTION_PENDING for s in house_state.suggestions
-        )
+        return house_state.suggestions.count(SUGGESTION_PENDING) > 0
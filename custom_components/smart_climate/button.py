@@ -51,4 +51,4 @@ class SmartClimateTriggerAnalysisButton(SmartClimateEntity, ButtonEntity):
     async def async_press(self) -> None:
         """Handle the button press."""
         _LOGGER.info("AI analysis triggered via button press")
-        await self.coordinator.async_trigger_analysis()
+        await self.coordinator.async_trigger_analysis(trigger="button")
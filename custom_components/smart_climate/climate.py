@@ -2,11 +2,16 @@
 
 Creates virtual zone climate entities that proxy real climate entities.
 One per room. Entity: climate.sc_{room_slug}
+
+Each entity follows its real climate entity's state changes, parses the
+state once per change into a snapshot and writes its own state at once,
+so it never lags the real thermostat and property reads are lookups.
 """
 
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -17,8 +22,9 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import DOMAIN, ENTITY_PREFIX
 from .entity import SmartClimateEntity
@@ -32,6 +38,75 @@ _HVAC_MODE_MAP: dict[str, HVACMode] = {m.value: m for m in HVACMode}
 _HVAC_ACTION_MAP: dict[str, HVACAction] = {a.value: a for a in HVACAction}
 
 
+def _to_float(value: Any) -> float | None:
+    """Return ``value`` as a float, or None if missing or not numeric."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass(frozen=True)
+class _RealClimateState:
+    """Parsed state of the underlying real climate entity."""
+
+    hvac_mode: HVACMode | None = None
+    hvac_modes: tuple[HVACMode, ...] = ()
+    hvac_action: HVACAction | None = None
+    current_temperature: float | None = None
+    target_temperature: float | None = None
+    target_temperature_high: float | None = None
+    target_temperature_low: float | None = None
+    target_temperature_step: float | None = None
+    min_temp: float | None = None
+    max_temp: float | None = None
+    temperature_unit: str | None = None
+    fan_mode: str | None = None
+    fan_modes: list[str] | None = None
+    preset_mode: str | None = None
+    preset_modes: list[str] | None = None
+    swing_mode: str | None = None
+    swing_modes: list[str] | None = None
+    supported_features: int = 0
+
+    @classmethod
+    def from_state(cls, state: State | None) -> _RealClimateState:
+        """Parse a real climate entity's State; None gives an empty snapshot."""
+        if state is None:
+            return cls()
+        attrs = state.attributes
+        try:
+            features = int(attrs.get("supported_features", 0))
+        except (ValueError, TypeError):
+            features = 0
+        return cls(
+            hvac_mode=_HVAC_MODE_MAP.get(state.state),
+            hvac_modes=tuple(
+                _HVAC_MODE_MAP[mode]
+                for mode in attrs.get("hvac_modes", [])
+                if mode in _HVAC_MODE_MAP
+            ),
+            hvac_action=_HVAC_ACTION_MAP.get(attrs.get("hvac_action")),
+            current_temperature=_to_float(attrs.get("current_temperature")),
+            target_temperature=_to_float(attrs.get("temperature")),
+            target_temperature_high=_to_float(attrs.get("target_temp_high")),
+            target_temperature_low=_to_float(attrs.get("target_temp_low")),
+            target_temperature_step=_to_float(attrs.get("target_temp_step")),
+            min_temp=_to_float(attrs.get("min_temp")),
+            max_temp=_to_float(attrs.get("max_temp")),
+            temperature_unit=attrs.get("unit_of_measurement"),
+            fan_mode=attrs.get("fan_mode"),
+            fan_modes=attrs.get("fan_modes"),
+            preset_mode=attrs.get("preset_mode"),
+            preset_modes=attrs.get("preset_modes"),
+            swing_mode=attrs.get("swing_mode"),
+            swing_modes=attrs.get("swing_modes"),
+            supported_features=features,
+        )
+
+
 # ---------------------------------------------------------------------------
 # Platform setup
 # ---------------------------------------------------------------------------
@@ -86,6 +161,25 @@ class SmartClimateVirtualClimate(SmartClimateEntity, ClimateEntity):
         )
         room_config = coordinator.data["rooms"][room_slug].config
         self._underlying_entity: str = room_config.climate_entity
+        self._real = _RealClimateState()
+
+    async def async_added_to_hass(self) -> None:
+        """Start mirroring the underlying real climate entity."""
+        await super().async_added_to_hass()
+        self._real = _RealClimateState.from_state(
+            self.hass.states.get(self._underlying_entity)
+        )
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [self._underlying_entity], self._handle_real_state_change
+            )
+        )
+
+    @callback
+    def _handle_real_state_change(self, event: Event) -> None:
+        """Re-parse the real entity's state and publish it immediately."""
+        self._real = _RealClimateState.from_state(event.data.get("new_state"))
+        self.async_write_ha_state_if_changed()
 
     # ------------------------------------------------------------------
     # Entity ID override
@@ -102,20 +196,9 @@ class SmartClimateVirtualClimate(SmartClimateEntity, ClimateEntity):
         self._attr_entity_id = value
 
     # ------------------------------------------------------------------
-    # Helpers to read real entity state
+    # Helpers
     # ------------------------------------------------------------------
 
-    def _get_real_state(self):
-        """Return the State object for the underlying real climate entity."""
-        return self.hass.states.get(self._underlying_entity)
-
-    def _get_real_attr(self, key: str, default=None):
-        """Return an attribute from the underlying real climate entity."""
-        real_state = self._get_real_state()
-        if real_state is None:
-            return default
-        return real_state.attributes.get(key, default)
-
     def _get_room_state(self):
         """Return the RoomState from coordinator data for this room."""
         return self.coordinator.data.get("rooms", {}).get(self._room_slug)
@@ -127,152 +210,98 @@ class SmartClimateVirtualClimate(SmartClimateEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return current HVAC mode from the real entity."""
-        real_state = self._get_real_state()
-        if real_state is None:
-            return None
-        return _HVAC_MODE_MAP.get(real_state.state)
+        return self._real.hvac_mode
 
     @property
     def hvac_modes(self) -> list[HVACMode]:
         """Return the list of available HVAC modes from the real entity."""
-        raw_modes = self._get_real_attr("hvac_modes", [])
-        modes = []
-        for mode in raw_modes:
-            mapped = _HVAC_MODE_MAP.get(mode)
-            if mapped is not None:
-                modes.append(mapped)
-        return modes or [HVACMode.OFF]
+        return list(self._real.hvac_modes) or [HVACMode.OFF]
 
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return current HVAC action from the real entity."""
-        raw_action = self._get_real_attr("hvac_action")
-        if raw_action is None:
-            return None
-        return _HVAC_ACTION_MAP.get(raw_action)
+        return self._real.hvac_action
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature from the real entity."""
-        value = self._get_real_attr("current_temperature")
-        if value is not None:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self._real.current_temperature
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature from the real entity."""
-        value = self._get_real_attr("temperature")
-        if value is not None:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self._real.target_temperature
 
     @property
     def target_temperature_high(self) -> float | None:
         """Return the upper bound target temperature from the real entity."""
-        value = self._get_real_attr("target_temp_high")
-        if value is not None:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self._real.target_temperature_high
 
     @property
     def target_temperature_low(self) -> float | None:
         """Return the lower bound target temperature from the real entity."""
-        value = self._get_real_attr("target_temp_low")
-        if value is not None:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self._real.target_temperature_low
 
     @property
     def target_temperature_step(self) -> float | None:
         """Return the temperature step from the real entity."""
-        value = self._get_real_attr("target_temp_step")
-        if value is not None:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-        return None
+        return self._real.target_temperature_step
 
     @property
     def min_temp(self) -> float:
         """Return the minimum temperature from the real entity."""
-        value = self._get_real_attr("min_temp")
-        if value is not None:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                pass
+        if self._real.min_temp is not None:
+            return self._real.min_temp
         return super().min_temp
 
     @property
     def max_temp(self) -> float:
         """Return the maximum temperature from the real entity."""
-        value = self._get_real_attr("max_temp")
-        if value is not None:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                pass
+        if self._real.max_temp is not None:
+            return self._real.max_temp
         return super().max_temp
 
     @property
     def temperature_unit(self) -> str:
         """Return the temperature unit from the real entity."""
-        unit = self._get_real_attr("unit_of_measurement")
-        if unit is not None:
-            return unit
-        return UnitOfTemperature.FAHRENHEIT
+        return self._real.temperature_unit or UnitOfTemperature.FAHRENHEIT
 
     @property
     def fan_mode(self) -> str | None:
         """Return the current fan mode from the real entity."""
-        return self._get_real_attr("fan_mode")
+        return self._real.fan_mode
 
     @property
     def fan_modes(self) -> list[str] | None:
         """Return the list of available fan modes from the real entity."""
-        return self._get_real_attr("fan_modes")
+        return self._real.fan_modes
 
     @property
     def preset_mode(self) -> str | None:
         """Return the current preset mode from the real entity."""
-        return self._get_real_attr("preset_mode")
+        return self._real.preset_mode
 
     @property
     def preset_modes(self) -> list[str] | None:
         """Return the list of available preset modes from the real entity."""
-        return self._get_real_attr("preset_modes")
+        return self._real.preset_modes
 
     @property
     def swing_mode(self) -> str | None:
         """Return the current swing mode from the real entity."""
-        return self._get_real_attr("swing_mode")
+        return self._real.swing_mode
 
     @property
     def swing_modes(self) -> list[str] | None:
         """Return the list of available swing modes from the real entity."""
-        return self._get_real_attr("swing_modes")
+        return self._real.swing_modes
 
     @property
     def supported_features(self) -> ClimateEntityFeature:
         """Return supported features from the real entity."""
-        raw = self._get_real_attr("supported_features", 0)
         try:
-            return ClimateEntityFeature(int(raw))
-        except (ValueError, TypeError):
+            return ClimateEntityFeature(self._real.supported_features)
+        except ValueError:
             return ClimateEntityFeature(0)
 
     # ------------------------------------------------------------------
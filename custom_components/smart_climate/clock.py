@@ -0,0 +1,60 @@
+"""Time source shared by the coordinator and its helpers.
+
+Everything that decides based on "now" (follow-me cooldowns, auxiliary
+delays, schedules, suggestion expiry, daily counters) asks the
+coordinator's clock instead of calling ``datetime.now()`` itself, so one
+update cycle sees a single consistent instant and simulations can swap
+in a ``VirtualClock`` to run days of history in milliseconds.
+
+Local decisions use naive local wall time (``now``), matching the
+timestamps already kept in room state and suggestions; persisted
+bookkeeping uses ``utcnow``, the same instant in UTC.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+
+class Clock:
+    """Wall-clock time."""
+
+    def now(self) -> datetime:
+        """Return the current naive local time."""
+        return datetime.now()
+
+    def utcnow(self) -> datetime:
+        """Return the current time as an aware UTC datetime."""
+        return datetime.now(tz=timezone.utc)
+
+
+class VirtualClock(Clock):
+    """Clock that only moves when told to.
+
+    ``start`` is a naive local time; it defaults to the wall clock at
+    construction.
+    """
+
+    def __init__(self, start: datetime | None = None) -> None:
+        self._now = start if start is not None else datetime.now()
+
+    def now(self) -> datetime:
+        """Return the virtual local time."""
+        return self._now
+
+    def utcnow(self) -> datetime:
+        """Return the virtual time in UTC."""
+        return self._now.astimezone(timezone.utc)
+
+    def set(self, when: datetime) -> None:
+        """Jump to ``when``; the clock never runs backwards."""
+        if when < self._now:
+            raise ValueError(f"Cannot move clock back from {self._now} to {when}")
+        self._now = when
+
+    def advance(self, delta: timedelta | float) -> datetime:
+        """Move forward by a timedelta or a number of seconds."""
+        if not isinstance(delta, timedelta):
+            delta = timedelta(seconds=delta)
+        self.set(self._now + delta)
+        return self._now
@@ -29,18 +29,29 @@ from .const import (
     CONF_AI_API_KEY,
     CONF_AI_AUTO_APPLY,
     CONF_AI_BASE_URL,
+    CONF_AI_FALLBACK_API_KEY,
+    CONF_AI_FALLBACK_BASE_URL,
+    CONF_AI_FALLBACK_MODEL,
+    CONF_AI_FALLBACK_PROVIDER,
+    CONF_AI_HEDGE_PERCENTILE,
+    CONF_AI_LOCAL_PREPASS,
     CONF_AI_MODEL,
     CONF_AI_PROVIDER,
+    CONF_AI_WARMUP_MINUTES,
     CONF_AUXILIARY_ENTITIES,
     CONF_CLIMATE_ENTITY,
     CONF_DOOR_WINDOW_SENSORS,
     CONF_ENABLE_FOLLOW_ME,
+    CONF_ENABLE_PRECONDITIONING,
     CONF_ENABLE_ZONE_BALANCING,
     CONF_HUMIDITY_SENSORS,
     CONF_INTEGRATION_NAME,
     CONF_OPERATION_MODE,
     CONF_OUTDOOR_TEMP_SENSOR,
+    CONF_PRESENCE_DECAY,
+    CONF_PRESENCE_HOLD_OFF,
     CONF_PRESENCE_SENSORS,
+    CONF_RECORD_INPUTS,
     CONF_ROOM_NAME,
     CONF_ROOM_PRIORITY,
     CONF_ROOM_SLUG,
@@ -57,6 +68,8 @@ from .const import (
     CONF_SCHEDULE_TARGET_TEMP,
     CONF_SCHEDULE_USE_AUXILIARY,
     CONF_SCHEDULES,
+    CONF_SUGGESTION_HISTORY_DAYS,
+    CONF_SUGGESTION_HISTORY_LIMIT,
     CONF_TARGET_TEMP_OFFSET,
     CONF_TEMP_SENSORS,
     CONF_TEMP_UNIT,
@@ -65,11 +78,20 @@ from .const import (
     CONF_WEATHER_ENTITY,
     DEFAULT_AI_ANALYSIS_TIME,
     DEFAULT_AI_AUTO_APPLY,
+    DEFAULT_AI_HEDGE_PERCENTILE,
+    DEFAULT_AI_LOCAL_PREPASS,
+    DEFAULT_AI_WARMUP_MINUTES,
     DEFAULT_ENABLE_FOLLOW_ME,
+    DEFAULT_ENABLE_PRECONDITIONING,
     DEFAULT_ENABLE_ZONE_BALANCING,
     DEFAULT_NAME,
     DEFAULT_OPERATION_MODE,
+    DEFAULT_PRESENCE_DECAY,
+    DEFAULT_PRESENCE_HOLD_OFF,
+    DEFAULT_RECORD_INPUTS,
     DEFAULT_ROOM_PRIORITY,
+    DEFAULT_SUGGESTION_HISTORY_DAYS,
+    DEFAULT_SUGGESTION_HISTORY_LIMIT,
     DEFAULT_TARGET_TEMP_OFFSET,
     DEFAULT_TEMP_UNIT,
     DEFAULT_UPDATE_INTERVAL,
@@ -264,6 +286,10 @@ class SmartClimateConfigFlow(ConfigFlow, domain=DOMAIN):
                         CONF_ENABLE_ZONE_BALANCING,
                         default=DEFAULT_ENABLE_ZONE_BALANCING,
                     ): bool,
+                    vol.Required(
+                        CONF_ENABLE_PRECONDITIONING,
+                        default=DEFAULT_ENABLE_PRECONDITIONING,
+                    ): bool,
                     vol.Required(
                         CONF_OPERATION_MODE, default=DEFAULT_OPERATION_MODE
                     ): selector.SelectSelector(
@@ -728,6 +754,18 @@ class SmartClimateConfigFlow(ConfigFlow, domain=DOMAIN):
             self._data[CONF_AI_AUTO_APPLY] = user_input.get(
                 CONF_AI_AUTO_APPLY, DEFAULT_AI_AUTO_APPLY
             )
+            self._data[CONF_AI_FALLBACK_PROVIDER] = user_input.get(
+                CONF_AI_FALLBACK_PROVIDER, AI_PROVIDER_NONE
+            )
+            self._data[CONF_AI_FALLBACK_API_KEY] = user_input.get(
+                CONF_AI_FALLBACK_API_KEY, ""
+            )
+            self._data[CONF_AI_FALLBACK_MODEL] = user_input.get(
+                CONF_AI_FALLBACK_MODEL, ""
+            )
+            self._data[CONF_AI_FALLBACK_BASE_URL] = user_input.get(
+                CONF_AI_FALLBACK_BASE_URL, ""
+            )
 
             # Test connection if provider is not none
             if provider != AI_PROVIDER_NONE:
@@ -782,6 +820,22 @@ class SmartClimateConfigFlow(ConfigFlow, domain=DOMAIN):
                     vol.Optional(
                         CONF_AI_AUTO_APPLY, default=DEFAULT_AI_AUTO_APPLY
                     ): bool,
+                    vol.Optional(
+                        CONF_AI_FALLBACK_PROVIDER, default=AI_PROVIDER_NONE
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                selector.SelectOptionDict(
+                                    value=p, label=p.title() if p != "none" else "None (No fallback)"
+                                )
+                                for p in AI_PROVIDERS
+                            ],
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                    vol.Optional(CONF_AI_FALLBACK_API_KEY): str,
+                    vol.Optional(CONF_AI_FALLBACK_MODEL): str,
+                    vol.Optional(CONF_AI_FALLBACK_BASE_URL): str,
                 }
             ),
             errors=errors,
@@ -887,6 +941,26 @@ class SmartClimateOptionsFlow(OptionsFlow):
                             CONF_ENABLE_FOLLOW_ME, DEFAULT_ENABLE_FOLLOW_ME
                         ),
                     ): bool,
+                    vol.Required(
+                        CONF_PRESENCE_HOLD_OFF,
+                        default=self._data.get(
+                            CONF_PRESENCE_HOLD_OFF, DEFAULT_PRESENCE_HOLD_OFF
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0, max=30, step=1, unit_of_measurement="min"
+                        )
+                    ),
+                    vol.Required(
+                        CONF_PRESENCE_DECAY,
+                        default=self._data.get(
+                            CONF_PRESENCE_DECAY, DEFAULT_PRESENCE_DECAY
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0, max=120, step=1, unit_of_measurement="min"
+                        )
+                    ),
                     vol.Required(
                         CONF_ENABLE_ZONE_BALANCING,
                         default=self._data.get(
@@ -894,6 +968,13 @@ class SmartClimateOptionsFlow(OptionsFlow):
                             DEFAULT_ENABLE_ZONE_BALANCING,
                         ),
                     ): bool,
+                    vol.Required(
+                        CONF_ENABLE_PRECONDITIONING,
+                        default=self._data.get(
+                            CONF_ENABLE_PRECONDITIONING,
+                            DEFAULT_ENABLE_PRECONDITIONING,
+                        ),
+                    ): bool,
                     vol.Required(
                         CONF_OPERATION_MODE,
                         default=self._data.get(
@@ -918,6 +999,12 @@ class SmartClimateOptionsFlow(OptionsFlow):
                             mode=selector.SelectSelectorMode.DROPDOWN,
                         )
                     ),
+                    vol.Optional(
+                        CONF_RECORD_INPUTS,
+                        default=self._data.get(
+                            CONF_RECORD_INPUTS, DEFAULT_RECORD_INPUTS
+                        ),
+                    ): bool,
                 }
             ),
         )
@@ -1369,6 +1456,83 @@ class SmartClimateOptionsFlow(OptionsFlow):
                             CONF_AI_AUTO_APPLY, DEFAULT_AI_AUTO_APPLY
                         ),
                     ): bool,
+                    vol.Optional(
+                        CONF_AI_LOCAL_PREPASS,
+                        default=self._data.get(
+                            CONF_AI_LOCAL_PREPASS, DEFAULT_AI_LOCAL_PREPASS
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_AI_FALLBACK_PROVIDER,
+                        default=self._data.get(
+                            CONF_AI_FALLBACK_PROVIDER, AI_PROVIDER_NONE
+                        ),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                selector.SelectOptionDict(
+                                    value=p,
+                                    label=p.title()
+                                    if p != "none"
+                                    else "None (No fallback)",
+                                )
+                                for p in AI_PROVIDERS
+                            ],
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_AI_FALLBACK_API_KEY,
+                        default=self._data.get(CONF_AI_FALLBACK_API_KEY, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_AI_FALLBACK_MODEL,
+                        default=self._data.get(CONF_AI_FALLBACK_MODEL, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_AI_FALLBACK_BASE_URL,
+                        default=self._data.get(CONF_AI_FALLBACK_BASE_URL, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_AI_HEDGE_PERCENTILE,
+                        default=self._data.get(
+                            CONF_AI_HEDGE_PERCENTILE, DEFAULT_AI_HEDGE_PERCENTILE
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=50, max=99, step=1, unit_of_measurement="%"
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_AI_WARMUP_MINUTES,
+                        default=self._data.get(
+                            CONF_AI_WARMUP_MINUTES, DEFAULT_AI_WARMUP_MINUTES
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0, max=30, step=1, unit_of_measurement="min"
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SUGGESTION_HISTORY_LIMIT,
+                        default=self._data.get(
+                            CONF_SUGGESTION_HISTORY_LIMIT,
+                            DEFAULT_SUGGESTION_HISTORY_LIMIT,
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=0, max=500, step=10)
+                    ),
+                    vol.Optional(
+                        CONF_SUGGESTION_HISTORY_DAYS,
+                        default=self._data.get(
+                            CONF_SUGGESTION_HISTORY_DAYS,
+                            DEFAULT_SUGGESTION_HISTORY_DAYS,
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1, max=365, step=1, unit_of_measurement="d"
+                        )
+                    ),
                 }
             ),
         )
@@ -11,6 +11,7 @@ CONF_TEMP_UNIT = "temp_unit"
 CONF_UPDATE_INTERVAL = "update_interval"
 CONF_ENABLE_FOLLOW_ME = "enable_follow_me"
 CONF_ENABLE_ZONE_BALANCING = "enable_zone_balancing"
+CONF_ENABLE_PRECONDITIONING = "enable_preconditioning"
 
 # Config keys - Weather
 CONF_WEATHER_ENTITY = "weather_entity"
@@ -52,6 +53,13 @@ CONF_AI_MODEL = "ai_model"
 CONF_AI_BASE_URL = "ai_base_url"
 CONF_AI_ANALYSIS_TIME = "ai_analysis_time"
 CONF_AI_AUTO_APPLY = "ai_auto_apply"
+CONF_AI_FALLBACK_PROVIDER = "ai_fallback_provider"
+CONF_AI_FALLBACK_API_KEY = "ai_fallback_api_key"
+CONF_AI_FALLBACK_MODEL = "ai_fallback_model"
+CONF_AI_FALLBACK_BASE_URL = "ai_fallback_base_url"
+CONF_AI_HEDGE_PERCENTILE = "ai_hedge_percentile"
+CONF_AI_LOCAL_PREPASS = "ai_local_prepass"
+CONF_AI_WARMUP_MINUTES = "ai_warmup_minutes"
 
 # Config keys - Operation Mode
 CONF_OPERATION_MODE = "operation_mode"
@@ -79,6 +87,8 @@ CONF_WINDOW_OPEN_BEHAVIOR = "window_open_behavior"
 CONF_AUXILIARY_THRESHOLD = "auxiliary_threshold"
 CONF_AUXILIARY_DELAY_MINUTES = "auxiliary_delay_minutes"
 CONF_AUXILIARY_MAX_RUNTIME = "auxiliary_max_runtime"
+CONF_PRESENCE_HOLD_OFF = "presence_hold_off"
+CONF_PRESENCE_DECAY = "presence_decay"
 
 # Defaults
 DEFAULT_NAME = "Smart Climate"
@@ -86,10 +96,16 @@ DEFAULT_TEMP_UNIT = "F"
 DEFAULT_UPDATE_INTERVAL = 60
 DEFAULT_ENABLE_FOLLOW_ME = True
 DEFAULT_ENABLE_ZONE_BALANCING = True
+DEFAULT_ENABLE_PRECONDITIONING = True
 DEFAULT_ROOM_PRIORITY = 5
 DEFAULT_TARGET_TEMP_OFFSET = 0.0
 DEFAULT_AI_ANALYSIS_TIME = "06:00"
 DEFAULT_AI_AUTO_APPLY = False
+DEFAULT_AI_HEDGE_PERCENTILE = 95
+DEFAULT_AI_LOCAL_PREPASS = True
+DEFAULT_AI_WARMUP_MINUTES = 5
+# Extra minutes a preloaded model is kept resident past the analysis time.
+AI_WARMUP_KEEP_ALIVE_MARGIN = 10
 DEFAULT_COMFORT_TEMP_WEIGHT = 0.7
 DEFAULT_COMFORT_HUMIDITY_WEIGHT = 0.3
 DEFAULT_EFFICIENCY_THRESHOLD = 70
@@ -99,6 +115,10 @@ DEFAULT_WINDOW_OPEN_BEHAVIOR = "eco"
 DEFAULT_AUXILIARY_THRESHOLD = 2.0
 DEFAULT_AUXILIARY_DELAY_MINUTES = 15
 DEFAULT_AUXILIARY_MAX_RUNTIME = 120
+# Minutes a room stays occupied after its last presence sensor turns off
+DEFAULT_PRESENCE_HOLD_OFF = 2
+# Minutes over which presence confidence then falls to zero
+DEFAULT_PRESENCE_DECAY = 15
 
 # AI Provider types
 AI_PROVIDER_NONE = "none"
@@ -107,9 +127,11 @@ AI_PROVIDER_ANTHROPIC = "anthropic"
 AI_PROVIDER_OLLAMA = "ollama"
 AI_PROVIDER_GEMINI = "gemini"
 AI_PROVIDER_GROK = "grok"
+AI_PROVIDER_LOCAL = "local"
 
 AI_PROVIDERS = [
     AI_PROVIDER_NONE,
+    AI_PROVIDER_LOCAL,
     AI_PROVIDER_OPENAI,
     AI_PROVIDER_ANTHROPIC,
     AI_PROVIDER_OLLAMA,
@@ -125,9 +147,11 @@ COMFORT_POOR = 30
 
 # Events
 EVENT_ANALYSIS_COMPLETE = f"{DOMAIN}_analysis_complete"
+EVENT_ANALYSIS_PROGRESS = f"{DOMAIN}_analysis_progress"
 EVENT_NEW_SUGGESTIONS = f"{DOMAIN}_new_suggestions"
 EVENT_SUGGESTION_APPLIED = f"{DOMAIN}_suggestion_applied"
 EVENT_SUGGESTION_REJECTED = f"{DOMAIN}_suggestion_rejected"
+EVENT_SUGGESTIONS_BULK_APPROVED = f"{DOMAIN}_suggestions_bulk_approved"
 EVENT_COMFORT_ALERT = f"{DOMAIN}_comfort_alert"
 EVENT_EFFICIENCY_ALERT = f"{DOMAIN}_efficiency_alert"
 EVENT_FOLLOW_ME_CHANGED = f"{DOMAIN}_follow_me_changed"
@@ -168,9 +192,56 @@ SUGGESTION_APPROVED = "approved"
 SUGGESTION_REJECTED = "rejected"
 SUGGESTION_APPLIED = "applied"
 SUGGESTION_EXPIRED = "expired"
+SUGGESTION_STATUSES = [
+    SUGGESTION_PENDING,
+    SUGGESTION_APPROVED,
+    SUGGESTION_REJECTED,
+    SUGGESTION_APPLIED,
+    SUGGESTION_EXPIRED,
+]
+
+# Websocket commands (see websocket_api.py)
+WS_TYPE_SUGGESTIONS = f"{DOMAIN}/suggestions"
+# Suggestions returned per page
+WS_SUGGESTIONS_DEFAULT_LIMIT = 20
+WS_SUGGESTIONS_MAX_LIMIT = 100
+WS_TYPE_SUBSCRIBE = f"{DOMAIN}/subscribe"
+# Recent feed deltas kept so a reconnecting card can catch up without
+# a full snapshot
+WS_FEED_HISTORY = 30
+
+# Input recording for offline replay (see recorder.py)
+CONF_RECORD_INPUTS = "record_inputs"
+DEFAULT_RECORD_INPUTS = False
+
+# Online thermal response learning (see helpers/thermal.py)
+# Minutes of readings folded into one least-squares observation
+THERMAL_SAMPLE_MINUTES = 10
+# Per-observation forgetting factor (~1000 observations, about a week)
+THERMAL_FORGETTING_FACTOR = 0.999
+# Observations needed (per direction) before predictions are trusted
+THERMAL_MIN_SAMPLES = 6
+# Engage auxiliary devices right away when HVAC alone is predicted to
+# need longer than this to reach target
+AUXILIARY_RECOVERY_MINUTES = 60
+
+# Schedule lookahead and pre-conditioning
+# Days searched for a room's next schedule transition
+SCHEDULE_LOOKAHEAD_DAYS = 8
+# Longest head start given to a schedule, even if the target looks unreachable
+PRECONDITION_MAX_MINUTES = 180
 
 # Suggestion expiry
 SUGGESTION_EXPIRY_HOURS = 24
 
+# Retention for applied / rejected / expired suggestions, applied on save
+CONF_SUGGESTION_HISTORY_LIMIT = "suggestion_history_limit"
+CONF_SUGGESTION_HISTORY_DAYS = "suggestion_history_days"
+DEFAULT_SUGGESTION_HISTORY_LIMIT = 50
+DEFAULT_SUGGESTION_HISTORY_DAYS = 30
+
 # Auto-apply confidence threshold
 AUTO_APPLY_CONFIDENCE_THRESHOLD = 0.8
+
+# Entities commanded at once when approving suggestions in bulk
+BULK_APPROVAL_CONCURRENCY = 4
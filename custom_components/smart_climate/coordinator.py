@@ -4,20 +4,26 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Any
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+    async_track_time_change,
+)
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
     AI_PROVIDER_NONE,
+    AI_WARMUP_KEEP_ALIVE_MARGIN,
     COMFORT_POOR,
     CONF_AI_ANALYSIS_TIME,
     CONF_AI_PROVIDER,
+    CONF_AI_WARMUP_MINUTES,
     CONF_AUXILIARY_DELAY_MINUTES,
     CONF_AUXILIARY_MAX_RUNTIME,
     CONF_AUXILIARY_THRESHOLD,
@@ -25,15 +31,22 @@ from .const import (
     CONF_COMFORT_HUMIDITY_WEIGHT,
     CONF_COMFORT_TEMP_WEIGHT,
     CONF_ENABLE_FOLLOW_ME,
+    CONF_ENABLE_PRECONDITIONING,
     CONF_ENABLE_ZONE_BALANCING,
     CONF_FOLLOW_ME_COOLDOWN,
     CONF_OPERATION_MODE,
     CONF_OUTDOOR_TEMP_SENSOR,
+    CONF_PRESENCE_DECAY,
+    CONF_PRESENCE_HOLD_OFF,
+    CONF_RECORD_INPUTS,
     CONF_ROOMS,
     CONF_SCHEDULES,
+    CONF_SUGGESTION_HISTORY_DAYS,
+    CONF_SUGGESTION_HISTORY_LIMIT,
     CONF_UPDATE_INTERVAL,
     CONF_WEATHER_ENTITY,
     DEFAULT_AI_ANALYSIS_TIME,
+    DEFAULT_AI_WARMUP_MINUTES,
     DEFAULT_AUXILIARY_DELAY_MINUTES,
     DEFAULT_AUXILIARY_MAX_RUNTIME,
     DEFAULT_AUXILIARY_THRESHOLD,
@@ -41,9 +54,15 @@ from .const import (
     DEFAULT_COMFORT_HUMIDITY_WEIGHT,
     DEFAULT_COMFORT_TEMP_WEIGHT,
     DEFAULT_ENABLE_FOLLOW_ME,
+    DEFAULT_ENABLE_PRECONDITIONING,
     DEFAULT_ENABLE_ZONE_BALANCING,
     DEFAULT_FOLLOW_ME_COOLDOWN,
     DEFAULT_OPERATION_MODE,
+    DEFAULT_PRESENCE_DECAY,
+    DEFAULT_PRESENCE_HOLD_OFF,
+    DEFAULT_RECORD_INPUTS,
+    DEFAULT_SUGGESTION_HISTORY_DAYS,
+    DEFAULT_SUGGESTION_HISTORY_LIMIT,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     EVENT_AUXILIARY_ACTIVATED,
@@ -55,8 +74,12 @@ from .const import (
     EVENT_WINDOW_OPEN_ADJUSTED,
     OPERATION_MODE_ACTIVE,
     OPERATION_MODE_DISABLED,
-    SUGGESTION_PENDING,
+    PRECONDITION_MAX_MINUTES,
 )
+from .ai.jobs import AnalysisJob, AnalysisJobManager, ProgressCallback
+from .ai.telemetry import AITelemetry
+from .clock import Clock
+from .feed import SnapshotFeed
 from .helpers.auxiliary import (
     async_disengage_auxiliary,
     async_engage_auxiliary,
@@ -69,8 +92,18 @@ from .helpers.efficiency import (
     calculate_efficiency_score,
     calculate_heating_degree_days,
 )
-from .helpers.presence import calculate_follow_me_targets, determine_follow_me_target
-from .helpers.scheduling import get_house_active_schedule, get_winning_schedule
+from .helpers.presence import (
+    FollowMeIndex,
+    RoomPresence,
+    calculate_follow_me_targets,
+)
+from .helpers.scheduling import (
+    SchedulePlan,
+    get_house_active_schedule,
+    get_winning_schedule,
+    next_schedule_transition,
+)
+from .helpers.thermal import ThermalEstimator
 from .helpers.vents import async_apply_vent_positions, calculate_vent_positions
 from .models import (
     AuxiliaryDeviceState,
@@ -80,8 +113,13 @@ from .models import (
     RoomConfig,
     RoomState,
     Schedule,
+    StateWriteStats,
     Suggestion,
 )
+from .recorder import InputRecorder
+
+if TYPE_CHECKING:
+    from .ai.provider import AIProviderBase
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -109,6 +147,8 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Initialize the coordinator."""
         self.entry = entry
         self._scheduled_tasks: list[CALLBACK_TYPE] = []
+        # Single timer for the earliest pending suggestion expiry.
+        self._expiry_unsub: CALLBACK_TYPE | None = None
 
         # Parse room configs
         self.room_configs: dict[str, RoomConfig] = {}
@@ -121,6 +161,12 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         for sched_data in entry.data.get(CONF_SCHEDULES, []):
             self.schedules.append(Schedule.from_dict(sched_data))
 
+        # Per-room schedule plans, recomputed only at transitions, and one
+        # timer per room for its next transition or pre-conditioning start.
+        self._schedule_plans: dict[str, SchedulePlan] = {}
+        self._schedule_unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._schedule_timers_enabled = False
+
         # Auxiliary device tracking: room_slug -> entity_id -> AuxiliaryDeviceState
         self._auxiliary_states: dict[str, dict[str, AuxiliaryDeviceState]] = {}
         for slug, cfg in self.room_configs.items():
@@ -150,6 +196,11 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         for slug, cfg in self.room_configs.items():
             self._room_states[slug] = RoomState(config=cfg)
 
+        # Learned thermal response per room, persisted with the state
+        self._thermal: dict[str, ThermalEstimator] = {
+            slug: ThermalEstimator() for slug in self.room_configs
+        }
+
         # House-level state
         self._house_state = HouseState()
 
@@ -162,6 +213,72 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Previous follow-me target (for change detection / events)
         self._prev_follow_me_target: str | None = None
 
+        # Follow-me candidates, updated on presence transitions only, and
+        # cached per-room targets recomputed only for rooms whose inputs
+        # (occupancy, thermostat target or action, primary) changed.
+        self._follow_me_index = FollowMeIndex(list(self.room_configs))
+        self._follow_me_targets: dict[str, float | None] = {}
+        self._follow_me_dirty: set[str] = set(self.room_configs)
+
+        # Timestamped presence per room.  Once event tracking starts,
+        # sensor state changes are recorded as they happen and polls
+        # only evaluate hold-off; until then polls sample the sensors.
+        hold_off = timedelta(
+            minutes=entry.data.get(CONF_PRESENCE_HOLD_OFF, DEFAULT_PRESENCE_HOLD_OFF)
+        )
+        decay = timedelta(
+            minutes=entry.data.get(CONF_PRESENCE_DECAY, DEFAULT_PRESENCE_DECAY)
+        )
+        self._presence: dict[str, RoomPresence] = {}
+        self._presence_rooms: dict[str, list[str]] = {}
+        for slug, cfg in self.room_configs.items():
+            self._presence[slug] = RoomPresence(cfg.presence_sensors, hold_off, decay)
+            for entity_id in cfg.presence_sensors:
+                self._presence_rooms.setdefault(entity_id, []).append(slug)
+        self._presence_unsub: CALLBACK_TYPE | None = None
+        self._hold_off_unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._hold_off_timers_enabled = False
+
+        # Door/window sensor -> rooms, for the window-open fast path
+        self._window_rooms: dict[str, list[str]] = {}
+        for slug, cfg in self.room_configs.items():
+            for entity_id in cfg.door_window_sensors:
+                self._window_rooms.setdefault(entity_id, []).append(slug)
+        self._window_unsub: CALLBACK_TYPE | None = None
+
+        # AI provider (or failover chain), built lazily and kept for the
+        # lifetime of the entry so circuit breakers and latency history
+        # survive between analysis runs.
+        self._ai_provider: AIProviderBase | None = None
+
+        # Per-call AI latency / token metrics, persisted with the state.
+        self.ai_telemetry = AITelemetry()
+
+        # Entity state writes made vs skipped because nothing changed.
+        self.state_write_stats = StateWriteStats()
+
+        # Snapshot-and-delta feed for the card's websocket subscription.
+        self.feed = SnapshotFeed(self)
+
+        # Single-flight runner for analysis triggers.
+        self.analysis_jobs = AnalysisJobManager(hass, self._async_run_analysis_job)
+
+        # Single source of "now" for the coordinator and every helper it
+        # calls; simulations and replays swap in a VirtualClock.
+        self.clock: Clock = Clock()
+
+        # Optional recording of every cycle's inputs for offline replay.
+        self._tracked_entities = self.tracked_entities()
+        self.recorder: InputRecorder | None = None
+        if entry.data.get(CONF_RECORD_INPUTS, DEFAULT_RECORD_INPUTS):
+            from .diagnostics import _redact_data
+
+            self.recorder = InputRecorder(
+                hass,
+                hass.config.path(".storage", f"{DOMAIN}_{entry.entry_id}_inputs.jsonl.gz"),
+                _redact_data(dict(entry.data)),
+            )
+
         # Operation mode: "active" (full control), "training" (observe only),
         # "disabled" (paused). Can be changed at runtime via the select entity.
         self.operation_mode: str = entry.data.get(
@@ -183,7 +300,12 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Poll all tracked entities and recompute state."""
-        now = datetime.now()
+        now = self.clock.now()
+
+        if self.recorder is not None:
+            self.recorder.record_cycle(
+                now, {eid: self.hass.states.get(eid) for eid in self._tracked_entities}
+            )
 
         # If disabled, skip all processing
         if self.operation_mode == OPERATION_MODE_DISABLED:
@@ -238,6 +360,15 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             except Exception:
                 _LOGGER.exception("Error running auxiliary device logic")
 
+        # ---- suggestion expiry ---------------------------------------
+        # The expiry timer runs on wall-clock time; catching due
+        # suggestions here keeps a virtual clock consistent too.
+        next_expiry = self._house_state.suggestions.next_expiry()
+        if next_expiry is not None and next_expiry < now:
+            from .ai.suggestions import expire_old_suggestions
+
+            expire_old_suggestions(self._house_state, now)
+
         # ---- house-level aggregation ---------------------------------
         try:
             self._update_house_state(rooms, now)
@@ -282,22 +413,14 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             room.humidity = None
 
         # -- Presence --------------------------------------------------
-        room.occupied = any(
-            self._get_binary_state(eid) for eid in cfg.presence_sensors
-        )
-        if room.occupied:
-            room.last_presence_time = now
+        if self._presence_unsub is None:
+            presence = self._presence[slug]
+            for entity_id in cfg.presence_sensors:
+                presence.record(entity_id, self._get_binary_state(entity_id), now)
+        self._refresh_occupancy(slug, room, now)
 
         # -- Door/window sensors (any open -> window_open) -------------
-        prev_window_open = room.window_open
-        room.window_open = any(
-            self._get_binary_state(eid) for eid in cfg.door_window_sensors
-        )
-        if room.window_open and not prev_window_open:
-            self.hass.bus.async_fire(
-                EVENT_WINDOW_OPEN_ADJUSTED,
-                {"room": slug, "room_name": cfg.name, "open": True},
-            )
+        self._refresh_window(slug, room)
 
         # -- Climate entity --------------------------------------------
         climate_state = self.hass.states.get(cfg.climate_entity)
@@ -316,7 +439,10 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     target = low
             if target is not None:
                 with contextlib.suppress(ValueError, TypeError):
-                    room.current_target = float(target)
+                    target = float(target)
+                    if target != room.current_target:
+                        self._follow_me_dirty.add(slug)
+                    room.current_target = target
 
             raw_action = climate_state.attributes.get("hvac_action", "idle")
             try:
@@ -326,6 +452,8 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             # Track HVAC runtime and cycles
             self._track_hvac_runtime(room, new_action, now)
+            if new_action != room.hvac_action:
+                self._follow_me_dirty.add(slug)
             room.hvac_action = new_action
 
         # -- Temperature trend (degrees per hour) ----------------------
@@ -365,8 +493,18 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 },
             )
 
-        # -- Efficiency score ------------------------------------------
+        # -- Thermal response learning ---------------------------------
         outdoor_temp = self._get_outdoor_temperature()
+        thermal = self._thermal[slug]
+        if thermal.observe(
+            now, room.temperature, outdoor_temp, room.hvac_action, room.window_open
+        ):
+            self._apply_thermal_estimate(room, thermal)
+        room.time_to_target = thermal.time_to_target(
+            room.temperature, room.current_target, outdoor_temp
+        )
+
+        # -- Efficiency score ------------------------------------------
         temp_deviation = (
             abs(room.temperature - room.current_target)
             if room.temperature is not None and room.current_target is not None
@@ -381,6 +519,187 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             window_open=room.window_open,
         )
 
+    def _refresh_occupancy(self, slug: str, room: RoomState, now: datetime) -> bool:
+        """Update a room's occupancy from its presence record.
+
+        Returns True if occupancy flipped, after updating the follow-me
+        index with the exact time presence began.
+        """
+        presence = self._presence[slug]
+        prev_occupied = room.occupied
+        room.occupied = presence.is_occupied(now)
+        room.presence_confidence = round(presence.confidence(now), 2)
+        last_seen = presence.last_seen(now)
+        if last_seen is not None:
+            room.last_presence_time = last_seen
+        room.presence_since = presence.last_on if room.occupied else None
+        if room.occupied == prev_occupied:
+            return False
+
+        self._follow_me_index.update(
+            slug,
+            room.occupied and bool(room.config.presence_sensors),
+            room.presence_since,
+            room.config.priority,
+        )
+        self._follow_me_dirty.add(slug)
+        return True
+
+    def _refresh_window(self, slug: str, room: RoomState) -> bool:
+        """Update a room's window_open flag; return True if it changed."""
+        prev_window_open = room.window_open
+        room.window_open = any(
+            self._get_binary_state(eid) for eid in room.config.door_window_sensors
+        )
+        if room.window_open and not prev_window_open:
+            self.hass.bus.async_fire(
+                EVENT_WINDOW_OPEN_ADJUSTED,
+                {"room": slug, "room_name": room.config.name, "open": True},
+            )
+        return room.window_open != prev_window_open
+
+    # ------------------------------------------------------------------
+    # Window-open fast path
+    # ------------------------------------------------------------------
+
+    def start_window_tracking(self) -> None:
+        """React to door/window sensors as they change, not at the next poll."""
+        if self._window_unsub is not None or not self._window_rooms:
+            return
+        self._window_unsub = async_track_state_change_event(
+            self.hass, list(self._window_rooms), self._handle_window_event
+        )
+
+    @callback
+    def _handle_window_event(self, event: Event) -> None:
+        """Update the sensor's rooms and react for those rooms only."""
+        self._record_event(event)
+        changed = False
+        for slug in self._window_rooms.get(event.data.get("entity_id"), ()):
+            if not self._refresh_window(slug, self._room_states[slug]):
+                continue
+            changed = True
+            if self.operation_mode == OPERATION_MODE_ACTIVE:
+                self.hass.async_create_task(
+                    self._async_react_to_window(slug, self.clock.now())
+                )
+        if changed:
+            self.async_update_listeners()
+
+    def _record_event(self, event: Event) -> None:
+        """Record an event-driven input so replays apply it when it happened."""
+        if self.recorder is not None:
+            self.recorder.record_event(
+                self.clock.now(),
+                event.data.get("entity_id"),
+                event.data.get("new_state"),
+            )
+
+    async def _async_react_to_window(self, slug: str, now: datetime) -> None:
+        """Apply one room's vent and auxiliary reaction to a door/window."""
+        rooms = self._room_states
+        if self.entry.data.get(
+            CONF_ENABLE_ZONE_BALANCING, DEFAULT_ENABLE_ZONE_BALANCING
+        ):
+            # Positions are computed house-wide so the static-pressure
+            # limit still holds, but only this room's vents are moved.
+            positions = calculate_vent_positions(rooms)
+            if slug in positions:
+                await async_apply_vent_positions(self.hass, {slug: positions[slug]})
+        try:
+            await self._run_auxiliary_logic({slug: rooms[slug]}, now)
+        except Exception:
+            _LOGGER.exception("Error running auxiliary device logic")
+        self.async_update_listeners()
+
+    # ------------------------------------------------------------------
+    # Event-driven presence
+    # ------------------------------------------------------------------
+
+    def start_presence_tracking(self, listen: bool = True) -> None:
+        """Record presence sensor changes as they happen.
+
+        With ``listen`` False the caller feeds the state change events to
+        ``_handle_presence_event`` itself, as replays do, and hold-off
+        expiries are picked up by the next cycle instead of a timer.
+        """
+        if self._presence_unsub is not None or not self._presence_rooms:
+            return
+        now = self.clock.now()
+        for entity_id, slugs in self._presence_rooms.items():
+            state = self.hass.states.get(entity_id)
+            is_on = state is not None and state.state == "on"
+            for slug in slugs:
+                self._presence[slug].record(entity_id, is_on, self._event_time(state, now))
+        self._hold_off_timers_enabled = listen
+        if listen:
+            self._presence_unsub = async_track_state_change_event(
+                self.hass, list(self._presence_rooms), self._handle_presence_event
+            )
+        else:
+            self._presence_unsub = lambda: None
+
+    def _event_time(self, state: State | None, now: datetime) -> datetime:
+        """Return when ``state`` changed, as naive local time, capped at now."""
+        changed = getattr(state, "last_changed", None)
+        if not isinstance(changed, datetime):
+            return now
+        if changed.tzinfo is not None:
+            changed = changed.astimezone().replace(tzinfo=None)
+        return min(changed, now)
+
+    @callback
+    def _handle_presence_event(self, event: Event) -> None:
+        """Record one presence sensor change and react if occupancy flipped."""
+        self._record_event(event)
+        entity_id = event.data.get("entity_id")
+        new_state = event.data.get("new_state")
+        is_on = new_state is not None and new_state.state == "on"
+        now = self.clock.now()
+        when = self._event_time(new_state, now)
+
+        changed = False
+        for slug in self._presence_rooms.get(entity_id, ()):
+            if self._presence[slug].record(entity_id, is_on, when):
+                changed |= self._refresh_occupancy(slug, self._room_states[slug], now)
+                self._arm_hold_off_timer(slug, now)
+        if changed:
+            self._react_to_presence(now)
+
+    def _arm_hold_off_timer(self, slug: str, now: datetime) -> None:
+        """Fire when the room's hold-off runs out, replacing any earlier timer."""
+        unsub = self._hold_off_unsubs.pop(slug, None)
+        if unsub is not None:
+            unsub()
+        ends = self._presence[slug].hold_off_ends()
+        if ends is None or not self._hold_off_timers_enabled:
+            return
+
+        @callback
+        def _expire(_now: datetime) -> None:
+            self._hold_off_unsubs.pop(slug, None)
+            now = self.clock.now()
+            if self._refresh_occupancy(slug, self._room_states[slug], now):
+                self._react_to_presence(now)
+
+        delay = max(0.0, (ends - now).total_seconds())
+        self._hold_off_unsubs[slug] = async_call_later(self.hass, delay, _expire)
+
+    def _react_to_presence(self, now: datetime) -> None:
+        """Re-run follow-me now instead of waiting for the next poll."""
+        rooms = self._room_states
+        if self.operation_mode == OPERATION_MODE_ACTIVE and self.entry.data.get(
+            CONF_ENABLE_FOLLOW_ME, DEFAULT_ENABLE_FOLLOW_ME
+        ):
+            try:
+                self._run_follow_me(rooms, now)
+            except Exception:
+                _LOGGER.exception("Error running follow-me logic")
+            # Schedules take precedence over the follow-me targets.
+            for slug, plan in self._schedule_plans.items():
+                self._apply_schedule_plan(rooms[slug], plan, now)
+        self.async_update_listeners()
+
     # ------------------------------------------------------------------
     # HVAC runtime / cycle tracking
     # ------------------------------------------------------------------
@@ -392,24 +711,40 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         active_actions = {HVACAction.HEATING, HVACAction.COOLING}
         old_action = room.hvac_action
 
-        if old_action != new_action:
-            # Accumulate runtime for the period that just ended
-            if old_action in active_actions and room.hvac_state_change_time is not None:
-                elapsed = (now - room.hvac_state_change_time).total_seconds() / 60.0
-                room.hvac_runtime_today += max(0.0, elapsed)
+        # Runtime accumulates from a per-cycle checkpoint so that
+        # hvac_state_change_time keeps marking when the action started.
+        checkpoint = room.hvac_runtime_checkpoint or room.hvac_state_change_time
+        if old_action in active_actions and checkpoint is not None:
+            elapsed = (now - checkpoint).total_seconds() / 60.0
+            room.hvac_runtime_today += max(0.0, elapsed)
+        room.hvac_runtime_checkpoint = now
 
+        if old_action != new_action:
             # Detect a new cycle (transition from non-active to active)
             if new_action in active_actions and old_action not in active_actions:
                 room.hvac_cycles_today += 1
 
             room.last_hvac_state = new_action.value
             room.hvac_state_change_time = now
-        else:
-            # Same action continues — accumulate runtime if active
-            if new_action in active_actions and room.hvac_state_change_time is not None:
-                elapsed = (now - room.hvac_state_change_time).total_seconds() / 60.0
-                room.hvac_runtime_today += max(0.0, elapsed)
-                room.hvac_state_change_time = now
+
+    @staticmethod
+    def _apply_thermal_estimate(room: RoomState, thermal: ThermalEstimator) -> None:
+        """Publish the learned coefficients that are trustworthy yet."""
+        room.heating_rate = (
+            round(thermal.heating_rate, 2)
+            if thermal.is_confident(HVACAction.HEATING)
+            else None
+        )
+        room.cooling_rate = (
+            round(thermal.cooling_rate, 2)
+            if thermal.is_confident(HVACAction.COOLING)
+            else None
+        )
+        room.loss_coefficient = (
+            round(thermal.loss_coefficient, 4)
+            if room.heating_rate is not None or room.cooling_rate is not None
+            else None
+        )
 
     # ------------------------------------------------------------------
     # Temperature trend calculation
@@ -450,10 +785,11 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             CONF_AWAY_TEMP_OFFSET, DEFAULT_AWAY_TEMP_OFFSET
         )
 
-        new_target = determine_follow_me_target(
+        new_target = self._follow_me_index.select(
             rooms,
             current_target=self._house_state.follow_me_target,
             cooldown_minutes=cooldown,
+            now=now,
         )
 
         if new_target != self._prev_follow_me_target:
@@ -465,15 +801,27 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 },
             )
             self._prev_follow_me_target = new_target
-
+        previous = self._house_state.follow_me_target
+        if new_target != previous:
+            self._follow_me_dirty.update(
+                slug for slug in (previous, new_target) if slug in rooms
+            )
         self._house_state.follow_me_target = new_target
 
-        # Calculate per-room follow-me targets
-        fm_targets = calculate_follow_me_targets(
-            rooms, primary_room=new_target, away_temp_offset=away_offset
-        )
+        # Recalculate follow-me targets only for rooms whose inputs changed
+        if self._follow_me_dirty:
+            dirty = {
+                slug: rooms[slug] for slug in self._follow_me_dirty if slug in rooms
+            }
+            self._follow_me_targets.update(
+                calculate_follow_me_targets(
+                    dirty, primary_room=new_target, away_temp_offset=away_offset
+                )
+            )
+            self._follow_me_dirty.clear()
 
-        for slug, smart_target in fm_targets.items():
+        # Schedules may have overridden last cycle's values; reapply.
+        for slug, smart_target in self._follow_me_targets.items():
             room = rooms[slug]
             room.smart_target = smart_target
             room.follow_me_active = slug == new_target
@@ -485,44 +833,117 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def _run_schedules(
         self, rooms: dict[str, RoomState], now: datetime
     ) -> None:
-        """Evaluate schedules for each room and update active_schedule."""
-        for slug, room in rooms.items():
-            winning = get_winning_schedule(self.schedules, slug, now)
-            prev_schedule = room.active_schedule
-            new_schedule_name = winning.name if winning else None
-
-            if new_schedule_name != prev_schedule:
-                if new_schedule_name is not None:
-                    self.hass.bus.async_fire(
-                        EVENT_SCHEDULE_ACTIVATED,
-                        {
-                            "room": slug,
-                            "room_name": room.config.name,
-                            "schedule": new_schedule_name,
-                        },
-                    )
-                elif prev_schedule is not None:
-                    self.hass.bus.async_fire(
-                        EVENT_SCHEDULE_DEACTIVATED,
-                        {
-                            "room": slug,
-                            "room_name": room.config.name,
-                            "schedule": prev_schedule,
-                        },
-                    )
-
-            room.active_schedule = new_schedule_name
+        """Apply each room's planned schedule, re-planning only when due.
 
-            # Apply schedule target if present and no user override
-            if winning and not room.user_override_active:
-                room.smart_target = winning.target_temperature + room.config.target_temp_offset
-                room.last_adjustment_reason = f"Schedule: {winning.name}"
+        Timers normally advance the plans at the exact transition; the
+        check here keeps them right when timers aren't running (replays,
+        simulations) or one fires late.
+        """
+        for slug, room in rooms.items():
+            plan = self._schedule_plans.get(slug)
+            if plan is None or (plan.next_at is not None and now >= plan.next_at):
+                plan = self._plan_room_schedule(slug, room, now)
+            self._apply_schedule_plan(room, plan, now)
 
         # House-level active schedule
         self._house_state.active_schedule = get_house_active_schedule(
             self.schedules, now
         )
 
+    def _plan_room_schedule(
+        self, slug: str, room: RoomState, now: datetime
+    ) -> SchedulePlan:
+        """Find the winning and next schedule for a room and arm its timer."""
+        winning = get_winning_schedule(self.schedules, slug, now)
+        prev_schedule = room.active_schedule
+        new_schedule_name = winning.name if winning else None
+
+        if new_schedule_name != prev_schedule:
+            if new_schedule_name is not None:
+                self.hass.bus.async_fire(
+                    EVENT_SCHEDULE_ACTIVATED,
+                    {
+                        "room": slug,
+                        "room_name": room.config.name,
+                        "schedule": new_schedule_name,
+                    },
+                )
+            elif prev_schedule is not None:
+                self.hass.bus.async_fire(
+                    EVENT_SCHEDULE_DEACTIVATED,
+                    {
+                        "room": slug,
+                        "room_name": room.config.name,
+                        "schedule": prev_schedule,
+                    },
+                )
+        room.active_schedule = new_schedule_name
+
+        plan = SchedulePlan(active=winning)
+        transition = next_schedule_transition(self.schedules, slug, now)
+        if transition is not None:
+            plan.next_at, plan.next_schedule = transition
+            plan.precondition_at = self._precondition_start(slug, room, plan)
+
+        room.next_schedule = plan.next_schedule.name if plan.next_schedule else None
+        room.next_schedule_time = plan.next_at
+        room.precondition_start = plan.precondition_at
+        self._schedule_plans[slug] = plan
+        self._arm_schedule_timer(slug, now)
+        return plan
+
+    def _precondition_start(
+        self, slug: str, room: RoomState, plan: SchedulePlan
+    ) -> datetime | None:
+        """Return when to start conditioning so the next schedule starts on target.
+
+        The room is assumed to sit at its current schedule (or thermostat)
+        target until then; the learned thermal model gives the time to
+        move to the new target.  Unreachable targets get the maximum head
+        start, and nothing is planned until the model is confident.
+        """
+        if plan.next_schedule is None or plan.next_at is None:
+            return None
+        if not self.entry.data.get(
+            CONF_ENABLE_PRECONDITIONING, DEFAULT_ENABLE_PRECONDITIONING
+        ):
+            return None
+
+        offset = room.config.target_temp_offset
+        target = plan.next_schedule.target_temperature + offset
+        held = (
+            plan.active.target_temperature + offset
+            if plan.active is not None
+            else room.current_target
+        )
+        if held is None:
+            held = room.temperature
+        minutes = self._thermal[slug].time_to_target(
+            held, target, self._get_outdoor_temperature()
+        )
+        if not minutes:
+            return None
+        return plan.next_at - timedelta(minutes=min(minutes, PRECONDITION_MAX_MINUTES))
+
+    @staticmethod
+    def _apply_schedule_plan(
+        room: RoomState, plan: SchedulePlan, now: datetime
+    ) -> None:
+        """Set the room's smart target from its plan unless overridden."""
+        room.preconditioning = plan.is_preconditioning(now)
+        if room.user_override_active:
+            return
+        if room.preconditioning:
+            room.smart_target = (
+                plan.next_schedule.target_temperature + room.config.target_temp_offset
+            )
+            room.last_adjustment_reason = f"Pre-conditioning: {plan.next_schedule.name}"
+        elif plan.active is not None:
+            room.smart_target = (
+                plan.active.target_temperature + room.config.target_temp_offset
+            )
+            room.last_adjustment_reason = f"Schedule: {plan.active.name}"
+
     # ------------------------------------------------------------------
     # Zone balancing / vents
     # ------------------------------------------------------------------
@@ -549,6 +970,7 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         delay = self.entry.data.get(
             CONF_AUXILIARY_DELAY_MINUTES, DEFAULT_AUXILIARY_DELAY_MINUTES
         )
+        outdoor_temp = self._get_outdoor_temperature()
 
         for slug, room in rooms.items():
             aux_states = self._auxiliary_states.get(slug, {})
@@ -558,6 +980,13 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             target_temp = room.smart_target if room.smart_target is not None else room.current_target
             if target_temp is None:
                 continue
+            time_to_target = (
+                room.time_to_target
+                if target_temp == room.current_target
+                else self._thermal[slug].time_to_target(
+                    room.temperature, target_temp, outdoor_temp
+                )
+            )
 
             for entity_id, aux_state in aux_states.items():
                 # Update runtime if device is on
@@ -572,6 +1001,7 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         await async_disengage_auxiliary(self.hass, entity_id)
                         aux_state.is_on = False
                         aux_state.started_at = None
+                        aux_state.heating = None
                         room.auxiliary_active = False
                         if entity_id in room.auxiliary_devices_on:
                             room.auxiliary_devices_on.remove(entity_id)
@@ -592,7 +1022,12 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 else:
                     # Check if we should engage
                     if should_engage_auxiliary(
-                        room, target_temp, threshold=threshold, delay_minutes=delay
+                        room,
+                        target_temp,
+                        threshold=threshold,
+                        delay_minutes=delay,
+                        now=now,
+                        time_to_target=time_to_target,
                     ):
                         temp_deviation = (
                             room.temperature - target_temp
@@ -604,6 +1039,7 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         )
                         aux_state.is_on = True
                         aux_state.started_at = now
+                        aux_state.heating = temp_deviation < 0
                         aux_state.runtime_minutes = 0.0
                         room.auxiliary_active = True
                         if entity_id not in room.auxiliary_devices_on:
@@ -681,7 +1117,7 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
 
         saved_date = data.get("saved_date")
-        today = datetime.now(tz=timezone.utc).strftime("%Y-%m-%d")
+        today = self.clock.utcnow().strftime("%Y-%m-%d")
         is_same_day = saved_date == today
 
         # Restore per-room runtime data (only if same day)
@@ -710,13 +1146,30 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     last_analysis
                 )
 
+        telemetry_data = data.get("ai_telemetry")
+        if telemetry_data:
+            self.ai_telemetry.restore(telemetry_data)
+
+        # Restore learned thermal response (persists across days)
+        for slug, thermal_data in data.get("thermal", {}).items():
+            if slug not in self._thermal:
+                continue
+            try:
+                thermal = ThermalEstimator.from_dict(thermal_data)
+            except (ValueError, TypeError, AttributeError):
+                _LOGGER.warning("Discarding malformed thermal model for '%s'", slug)
+                continue
+            self._thermal[slug] = thermal
+            self._apply_thermal_estimate(self._room_states[slug], thermal)
+
         # Restore suggestions — drop any that reference deleted rooms
         valid_rooms = set(self.room_configs.keys())
         for s_data in house_data.get("suggestions", []):
             with contextlib.suppress(Exception):
                 s = Suggestion.from_dict(s_data)
                 if s.room is None or s.room in valid_rooms:
-                    self._house_state.suggestions.append(s)
+                    self._house_state.suggestions.add(s)
+        self.schedule_suggestion_expiry()
 
         _LOGGER.info(
             "Restored persisted state (saved_date=%s, same_day=%s, suggestions=%d)",
@@ -726,9 +1179,32 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
 
     async def async_save_state(self) -> None:
-        """Persist current state to storage."""
+        """Persist current state to storage.
+
+        Suggestion history is compacted to the configured retention first,
+        and any buffered input recording is flushed.
+        """
+        if self.recorder is not None:
+            await self.recorder.async_flush()
+
+        dropped = self._house_state.suggestions.compact(
+            int(
+                self.entry.data.get(
+                    CONF_SUGGESTION_HISTORY_LIMIT, DEFAULT_SUGGESTION_HISTORY_LIMIT
+                )
+            ),
+            timedelta(
+                days=self.entry.data.get(
+                    CONF_SUGGESTION_HISTORY_DAYS, DEFAULT_SUGGESTION_HISTORY_DAYS
+                )
+            ),
+            now=self.clock.now(),
+        )
+        if dropped:
+            _LOGGER.debug("Dropped %d suggestions past retention", dropped)
+
         data: dict[str, Any] = {
-            "saved_date": datetime.now(tz=timezone.utc).strftime("%Y-%m-%d"),
+            "saved_date": self.clock.utcnow().strftime("%Y-%m-%d"),
             "rooms": {},
             "house": {
                 "ai_daily_summary": self._house_state.ai_daily_summary,
@@ -741,6 +1217,10 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     s.to_dict() for s in self._house_state.suggestions
                 ],
             },
+            "ai_telemetry": self.ai_telemetry.to_dict(),
+            "thermal": {
+                slug: thermal.to_dict() for slug, thermal in self._thermal.items()
+            },
         }
         for slug, room in self._room_states.items():
             data["rooms"][slug] = {
@@ -749,12 +1229,12 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             }
 
         await self._store.async_save(data)
-        self._last_save_time = datetime.now(tz=timezone.utc)
+        self._last_save_time = self.clock.utcnow()
 
     def _maybe_save_state(self, now: datetime) -> None:
         """Schedule a save if enough time has elapsed since last save."""
         if self._last_save_time is None or (
-            datetime.now(tz=timezone.utc) - self._last_save_time > SAVE_INTERVAL
+            self.clock.utcnow() - self._last_save_time > SAVE_INTERVAL
         ):
             self.hass.async_create_task(self.async_save_state())
 
@@ -762,6 +1242,20 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     # Helper: read entity states
     # ------------------------------------------------------------------
 
+    def tracked_entities(self) -> list[str]:
+        """Return every entity id the update cycle reads, sorted."""
+        entities: set[str] = set()
+        for cfg in self.room_configs.values():
+            entities.add(cfg.climate_entity)
+            entities.update(cfg.temp_sensors)
+            entities.update(cfg.humidity_sensors)
+            entities.update(cfg.presence_sensors)
+            entities.update(cfg.door_window_sensors)
+        for key in (CONF_OUTDOOR_TEMP_SENSOR, CONF_WEATHER_ENTITY):
+            if self.entry.data.get(key):
+                entities.add(self.entry.data[key])
+        return sorted(entities)
+
     def _get_numeric_state(self, entity_id: str) -> float | None:
         """Return a float value for a sensor entity, or None if unavailable."""
         state = self.hass.states.get(entity_id)
@@ -876,9 +1370,141 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "Scheduled daily AI analysis at %02d:%02d", hour, minute
         )
 
+        lead = int(self.entry.data.get(CONF_AI_WARMUP_MINUTES, DEFAULT_AI_WARMUP_MINUTES))
+        if lead > 0:
+            warm_at = (hour * 60 + minute - lead) % (24 * 60)
+            unsub = async_track_time_change(
+                self.hass,
+                self._handle_ai_warm_up,
+                hour=warm_at // 60,
+                minute=warm_at % 60,
+                second=0,
+            )
+            self._scheduled_tasks.append(unsub)
+            _LOGGER.debug(
+                "Scheduled AI model warm-up at %02d:%02d", warm_at // 60, warm_at % 60
+            )
+
     async def _handle_daily_analysis(self, _now: datetime) -> None:
         """Callback fired by async_track_time_change for daily analysis."""
-        await self.async_trigger_analysis()
+        await self.async_trigger_analysis(trigger="schedule")
+
+    async def _handle_ai_warm_up(self, _now: datetime) -> None:
+        """Callback fired ahead of the daily analysis to preload the model."""
+        await self.async_warm_up_ai()
+
+    async def async_warm_up_ai(self) -> bool:
+        """Preload the AI model so the next analysis starts warm.
+
+        Keeps the model resident for the warm-up lead time plus
+        AI_WARMUP_KEEP_ALIVE_MARGIN minutes.  Returns False when warm-up
+        is disabled, the provider has nothing to warm, or the preload
+        failed; failures never block the analysis itself.
+        """
+        lead = int(self.entry.data.get(CONF_AI_WARMUP_MINUTES, DEFAULT_AI_WARMUP_MINUTES))
+        if lead <= 0:
+            return False
+        if self.entry.data.get(CONF_AI_PROVIDER, AI_PROVIDER_NONE) == AI_PROVIDER_NONE:
+            return False
+        try:
+            return await self.get_ai_provider().warm_up(
+                lead + AI_WARMUP_KEEP_ALIVE_MARGIN
+            )
+        except Exception:
+            _LOGGER.warning("AI model warm-up failed", exc_info=True)
+            return False
+
+    # ------------------------------------------------------------------
+    # Suggestion expiry timer
+    # ------------------------------------------------------------------
+
+    def schedule_suggestion_expiry(self) -> None:
+        """Arm one timer for the earliest pending suggestion expiry.
+
+        Replaces any previous timer; nothing is armed when no suggestion
+        is pending.
+        """
+        if self._expiry_unsub is not None:
+            self._expiry_unsub()
+            self._expiry_unsub = None
+
+        next_expiry = self._house_state.suggestions.next_expiry()
+        if next_expiry is None:
+            return
+        delay = max(0.0, (next_expiry - self.clock.now()).total_seconds())
+        # expire_due() is strict, so fire just after the deadline.
+        self._expiry_unsub = async_call_later(
+            self.hass, delay + 1, self._handle_suggestion_expiry
+        )
+
+    def schedule_room_transitions(self) -> None:
+        """Start arming per-room timers for schedule transitions."""
+        self._schedule_timers_enabled = True
+        now = self.clock.now()
+        for slug in self._schedule_plans:
+            self._arm_schedule_timer(slug, now)
+
+    def replan_schedules(self) -> None:
+        """Drop the cached schedule plans and timers and plan afresh.
+
+        Plans are only recomputed at their next transition, so anything
+        that changes the schedules themselves must call this.  Outside
+        active mode the next active cycle plans from scratch.
+        """
+        for unsub in self._schedule_unsubs.values():
+            unsub()
+        self._schedule_unsubs.clear()
+        self._schedule_plans.clear()
+        if self.operation_mode != OPERATION_MODE_ACTIVE:
+            return
+        self._run_schedules(self._room_states, self.clock.now())
+        self.async_update_listeners()
+
+    def _arm_schedule_timer(self, slug: str, now: datetime) -> None:
+        """Arm one timer for the room's next transition or pre-conditioning."""
+        unsub = self._schedule_unsubs.pop(slug, None)
+        if unsub is not None:
+            unsub()
+        if not self._schedule_timers_enabled:
+            return
+
+        when = self._schedule_plans[slug].next_event(now)
+        if when is None:
+            return
+
+        @callback
+        def _fire(_now: datetime) -> None:
+            self._handle_schedule_timer(slug)
+
+        delay = max(0.0, (when - now).total_seconds())
+        self._schedule_unsubs[slug] = async_call_later(self.hass, delay, _fire)
+
+    def _handle_schedule_timer(self, slug: str) -> None:
+        """Advance a room's plan at its scheduled instant."""
+        self._schedule_unsubs.pop(slug, None)
+        room = self._room_states.get(slug)
+        if room is None or self.operation_mode != OPERATION_MODE_ACTIVE:
+            # The next cycle in active mode re-plans.
+            return
+
+        now = self.clock.now()
+        plan = self._schedule_plans.get(slug)
+        if plan is None or (plan.next_at is not None and now >= plan.next_at):
+            plan = self._plan_room_schedule(slug, room, now)
+        else:
+            self._arm_schedule_timer(slug, now)
+        self._apply_schedule_plan(room, plan, now)
+        self.async_update_listeners()
+
+    @callback
+    def _handle_suggestion_expiry(self, _now: datetime) -> None:
+        """Expire due suggestions and re-arm for the next one."""
+        from .ai.suggestions import expire_old_suggestions
+
+        self._expiry_unsub = None
+        if expire_old_suggestions(self._house_state, self.clock.now()):
+            self.async_update_listeners()
+        self.schedule_suggestion_expiry()
 
     # ------------------------------------------------------------------
     # Cancel scheduled tasks (called on unload)
@@ -889,24 +1515,70 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         for unsub in self._scheduled_tasks:
             unsub()
         self._scheduled_tasks.clear()
+        if self._expiry_unsub is not None:
+            self._expiry_unsub()
+            self._expiry_unsub = None
+        self._schedule_timers_enabled = False
+        for unsub in self._schedule_unsubs.values():
+            unsub()
+        self._schedule_unsubs.clear()
+        if self._presence_unsub is not None:
+            self._presence_unsub()
+            self._presence_unsub = None
+        self._hold_off_timers_enabled = False
+        for unsub in self._hold_off_unsubs.values():
+            unsub()
+        self._hold_off_unsubs.clear()
+        if self._window_unsub is not None:
+            self._window_unsub()
+            self._window_unsub = None
         _LOGGER.debug("Cancelled all scheduled Smart Climate tasks")
 
     # ------------------------------------------------------------------
     # AI analysis trigger
     # ------------------------------------------------------------------
 
-    async def async_trigger_analysis(self) -> None:
-        """Invoke the AI analysis pipeline.
+    def get_ai_provider(self) -> AIProviderBase:
+        """Return the configured AI provider, building it on first use."""
+        if self._ai_provider is None:
+            from .ai.provider import create_ai_provider_chain
 
-        This is called on the daily schedule and can also be invoked manually
-        through the ``trigger_analysis`` service.
+            self._ai_provider = create_ai_provider_chain(
+                self.entry.data,
+                telemetry=self.ai_telemetry,
+                data_source=lambda: self.data,
+                now_source=lambda: self.clock.now(),
+            )
+        return self._ai_provider
+
+    async def async_trigger_analysis(
+        self, trigger: str = "manual", cancel_running: bool = False
+    ) -> str | None:
+        """Request an AI analysis run and return its job id.
+
+        Returns as soon as the job is started or queued; see
+        AnalysisJobManager for how concurrent triggers are collapsed.
+        Called on the daily schedule, by the trigger button and through
+        the ``trigger_analysis`` service.  Returns None when AI is off.
         """
         provider = self.entry.data.get(CONF_AI_PROVIDER, AI_PROVIDER_NONE)
         if provider == AI_PROVIDER_NONE:
             _LOGGER.debug("AI provider is 'none'; skipping analysis")
-            return
+            return None
 
-        _LOGGER.info("Triggering AI analysis with provider '%s'", provider)
+        return self.analysis_jobs.request(trigger, cancel_running=cancel_running)
+
+    async def _async_run_analysis_job(
+        self, job: AnalysisJob, progress: ProgressCallback
+    ) -> None:
+        """Run one analysis job; errors propagate to the job manager."""
+        provider = self.entry.data.get(CONF_AI_PROVIDER, AI_PROVIDER_NONE)
+        _LOGGER.info(
+            "Running AI analysis job %s (%s) with provider '%s'",
+            job.job_id,
+            job.trigger,
+            provider,
+        )
 
         try:
             from .ai import async_run_analysis
@@ -915,30 +1587,32 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
 
         try:
-            await async_run_analysis(hass=self.hass, coordinator=self)
-
-            self._house_state.last_analysis_time = datetime.now(tz=timezone.utc)
-
-            self.hass.bus.async_fire(
-                f"{DOMAIN}_analysis_complete",
-                {
-                    "provider": provider,
-                    "suggestion_count": len(
-                        [s for s in self._house_state.suggestions if s.status == SUGGESTION_PENDING]
-                    ),
-                },
-            )
-
-            self._send_notification(
-                "Smart Climate AI Analysis",
-                self._format_analysis_notification(provider),
-            )
+            await async_run_analysis(hass=self.hass, coordinator=self, progress=progress)
         except Exception as err:
             _LOGGER.exception("AI analysis failed")
             self._send_notification(
                 "Smart Climate AI Analysis Failed",
                 f"Analysis with provider **{provider}** failed:\n\n`{err}`",
             )
+            raise
+
+        self._house_state.last_analysis_time = self.clock.utcnow()
+
+        self.hass.bus.async_fire(
+            f"{DOMAIN}_analysis_complete",
+            {
+                "provider": provider,
+                "job_id": job.job_id,
+                "suggestion_count": len(
+                    self._house_state.suggestions.pending()
+                ),
+            },
+        )
+
+        self._send_notification(
+            "Smart Climate AI Analysis",
+            self._format_analysis_notification(provider),
+        )
 
     def _send_notification(self, title: str, message: str) -> None:
         """Create a persistent notification via the service bus."""
@@ -966,9 +1640,8 @@ class SmartClimateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         valid_rooms = set(self.room_configs.keys())
         pending = [
-            s for s in house.suggestions
-            if s.status == SUGGESTION_PENDING
-            and (s.room is None or s.room in valid_rooms)
+            s for s in house.suggestions.pending()
+            if s.room is None or s.room in valid_rooms
         ]
         if pending:
             lines.append(f"## Suggestions ({len(pending)} pending)")
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import math
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_AI_API_KEY, DOMAIN
+from .const import (
+    AI_PROVIDER_NONE,
+    CONF_AI_API_KEY,
+    CONF_AI_FALLBACK_API_KEY,
+    CONF_AI_PROVIDER,
+    DOMAIN,
+)
 
-REDACT_KEYS = {CONF_AI_API_KEY, "api_key"}
+REDACT_KEYS = {CONF_AI_API_KEY, CONF_AI_FALLBACK_API_KEY, "api_key"}
 
 
 def _redact_data(data: dict) -> dict:
@@ -64,6 +71,16 @@ async def async_get_config_entry_diagnostics(
             "active_schedule": room_state.active_schedule,
             "auxiliary_active": room_state.auxiliary_active,
             "temp_trend": room_state.temp_trend,
+            "heating_rate": room_state.heating_rate,
+            "cooling_rate": room_state.cooling_rate,
+            "loss_coefficient": room_state.loss_coefficient,
+            # Unreachable targets are inf, which JSON cannot carry
+            "time_to_target": (
+                str(room_state.time_to_target)
+                if room_state.time_to_target is not None
+                and math.isinf(room_state.time_to_target)
+                else room_state.time_to_target
+            ),
         }
 
     house = data.get("house")
@@ -86,10 +103,26 @@ async def async_get_config_entry_diagnostics(
             "suggestion_count": len(house.suggestions),
         }
 
+    ai_diag: dict[str, Any] = {}
+    if entry.data.get(CONF_AI_PROVIDER, AI_PROVIDER_NONE) != AI_PROVIDER_NONE:
+        from .ai.failover import FailoverProvider
+
+        provider = coordinator.get_ai_provider()
+        if isinstance(provider, FailoverProvider):
+            ai_diag["provider_health"] = provider.health()
+    ai_diag["telemetry"] = coordinator.ai_telemetry.summary()
+    ai_diag["recent_calls"] = coordinator.ai_telemetry.as_list()
+    ai_diag["jobs"] = coordinator.analysis_jobs.as_dict()
+
     return {
         "config_entry": _redact_data(dict(entry.data)),
         "rooms": rooms_diag,
         "house": house_diag,
+        "ai": ai_diag,
+        "state_writes": {
+            "written": coordinator.state_write_stats.written,
+            "skipped": coordinator.state_write_stats.skipped,
+        },
         "coordinator_last_update": (
             coordinator.last_update_success_time.isoformat()
             if coordinator.last_update_success_time
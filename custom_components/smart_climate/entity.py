@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import copy
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -29,6 +31,8 @@ class SmartClimateEntity(CoordinatorEntity["SmartClimateCoordinator"], Entity):
         super().__init__(coordinator)
         self._room_slug = room_slug
         self._entity_key = entity_key
+        # What the last state write published, to skip unchanged writes
+        self._last_written: tuple[Any, ...] | None = None
 
         if room_slug:
             self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{room_slug}_{entity_key}"
@@ -39,6 +43,35 @@ class SmartClimateEntity(CoordinatorEntity["SmartClimateCoordinator"], Entity):
             )
             self._attr_name = name
 
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return everything a state write would publish."""
+        return (
+            self.available,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self.async_write_ha_state_if_changed()
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> bool:
+        """Write state unless it matches the last write; return True if written."""
+        fingerprint = self._state_fingerprint()
+        stats = self.coordinator.state_write_stats
+        if fingerprint == self._last_written:
+            stats.skipped += 1
+            return False
+        # Attributes may share lists with the room state; keep a copy so
+        # later in-place changes are still seen as changes.
+        self._last_written = copy.deepcopy(fingerprint)
+        stats.written += 1
+        self.async_write_ha_state()
+        return True
+
     @property
     def device_info(self):
         """Return device info."""
@@ -0,0 +1,276 @@
+"""Snapshot-and-delta feed of the coordinator state for the Lovelace card.
+
+The card used to rebuild its view from dozens of entity states.  The feed
+condenses the coordinator data into one compact snapshot and, after each
+coordinator update, publishes only the fields that changed, numbered with
+a version so a client that missed some can catch up or ask for a resync.
+"""
+
+from __future__ import annotations
+
+import math
+import uuid
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import SUGGESTION_PENDING, WS_FEED_HISTORY
+from .models import HouseState, RoomState, Schedule
+
+if TYPE_CHECKING:
+    from .coordinator import SmartClimateCoordinator
+
+# Snapshot sections keyed by room slug, climate entity or schedule slug;
+# "house" is a single record.
+KEYED_SECTIONS = ("rooms", "systems", "schedules")
+
+FeedListener = Callable[[int, dict[str, Any]], None]
+
+
+def _round(value: float | None, digits: int = 1) -> float | None:
+    """Round a value for the feed, mapping None and infinities to None."""
+    if value is None or math.isinf(value):
+        return None
+    return round(value, digits)
+
+
+def _iso(value: datetime | None) -> str | None:
+    """Return an ISO timestamp or None."""
+    return value.isoformat() if value is not None else None
+
+
+def room_snapshot(room: RoomState) -> dict[str, Any]:
+    """Return the card-facing fields of a room."""
+    return {
+        "name": room.config.name,
+        "system": room.config.climate_entity,
+        "temperature": _round(room.temperature),
+        "humidity": _round(room.humidity),
+        "temp_trend": _round(room.temp_trend, 2),
+        "target": _round(room.current_target),
+        "smart_target": _round(room.smart_target),
+        "comfort_score": _round(room.comfort_score),
+        "efficiency_score": _round(room.efficiency_score),
+        "hvac_action": str(room.hvac_action),
+        "hvac_runtime_today": _round(room.hvac_runtime_today),
+        "occupied": room.occupied,
+        "presence_confidence": _round(room.presence_confidence, 2),
+        "window_open": room.window_open,
+        "follow_me_active": room.follow_me_active,
+        "user_override_active": room.user_override_active,
+        "active_schedule": room.active_schedule,
+        "next_schedule": room.next_schedule,
+        "next_schedule_time": _iso(room.next_schedule_time),
+        "preconditioning": room.preconditioning,
+        "time_to_target": _round(room.time_to_target, 0),
+        "auxiliary_active": room.auxiliary_active,
+        "auxiliary_devices_on": list(room.auxiliary_devices_on),
+    }
+
+
+def systems_snapshot(rooms: dict[str, RoomState]) -> dict[str, dict[str, Any]]:
+    """Group rooms by the climate entity (HVAC system) that serves them."""
+    systems: dict[str, dict[str, Any]] = {}
+    for slug, room in rooms.items():
+        system = systems.setdefault(
+            room.config.climate_entity,
+            {"rooms": [], "hvac_action": str(room.hvac_action), "target": None},
+        )
+        system["rooms"].append(slug)
+        if system["target"] is None:
+            system["target"] = _round(room.current_target)
+    return systems
+
+
+def house_snapshot(house: HouseState, operation_mode: str) -> dict[str, Any]:
+    """Return the card-facing fields of the whole house."""
+    return {
+        "operation_mode": operation_mode,
+        "comfort_score": _round(house.comfort_score),
+        "efficiency_score": _round(house.efficiency_score),
+        "total_hvac_runtime": _round(house.total_hvac_runtime),
+        "follow_me_target": house.follow_me_target,
+        "active_schedule": house.active_schedule,
+        "outdoor_temperature": _round(house.outdoor_temperature),
+        "outdoor_humidity": _round(house.outdoor_humidity),
+        "last_analysis_time": _iso(house.last_analysis_time),
+        "pending_suggestions": house.suggestions.count(SUGGESTION_PENDING),
+    }
+
+
+def schedule_snapshot(schedule: Schedule, active: bool) -> dict[str, Any]:
+    """Return a schedule's definition and whether it is running."""
+    return {
+        "name": schedule.name,
+        "rooms": list(schedule.rooms),
+        "days": list(schedule.days),
+        "start_time": schedule.start_time,
+        "end_time": schedule.end_time,
+        "target_temperature": schedule.target_temperature,
+        "hvac_mode": schedule.hvac_mode,
+        "enabled": schedule.enabled,
+        "active": active,
+    }
+
+
+def build_snapshot(coordinator: SmartClimateCoordinator) -> dict[str, Any]:
+    """Return the full feed snapshot of the coordinator's current data."""
+    data = coordinator.data or {}
+    rooms: dict[str, RoomState] = data.get("rooms", {})
+    house: HouseState = data.get("house") or HouseState()
+    running = {room.active_schedule for room in rooms.values()}
+    running.add(house.active_schedule)
+    return {
+        "rooms": {slug: room_snapshot(room) for slug, room in rooms.items()},
+        "systems": systems_snapshot(rooms),
+        "house": house_snapshot(house, coordinator.operation_mode),
+        "schedules": {
+            schedule.slug: schedule_snapshot(schedule, schedule.name in running)
+            for schedule in coordinator.schedules
+        },
+    }
+
+
+def _diff_record(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of ``new`` that differ from ``old``."""
+    return {key: value for key, value in new.items() if old.get(key) != value}
+
+
+def diff_snapshot(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Return what changed between two snapshots.
+
+    Keyed sections map each changed key to its changed fields, a new key
+    to its full record and a removed key to None; "house" maps to its
+    changed fields.  Unchanged sections are left out, so an empty result
+    means nothing changed.
+    """
+    delta: dict[str, Any] = {}
+    for section in KEYED_SECTIONS:
+        before, after = old.get(section, {}), new.get(section, {})
+        changes: dict[str, Any] = {
+            key: None for key in before.keys() - after.keys()
+        }
+        for key, record in after.items():
+            if key not in before:
+                changes[key] = record
+            elif fields := _diff_record(before[key], record):
+                changes[key] = fields
+        if changes:
+            delta[section] = changes
+    if house := _diff_record(old.get("house", {}), new.get("house", {})):
+        delta["house"] = house
+    return delta
+
+
+class SnapshotFeed:
+    """Versioned feed of coordinator snapshots for websocket subscribers.
+
+    Each coordinator update that changes the snapshot bumps ``version`` and
+    is sent to subscribers as a delta.  The last few deltas are kept so a
+    client reconnecting with the version it last applied can be replayed
+    forward; ``feed_id`` changes on restart so stale versions resync.
+    """
+
+    def __init__(
+        self, coordinator: SmartClimateCoordinator, history: int = WS_FEED_HISTORY
+    ) -> None:
+        """Initialize the feed."""
+        self._coordinator = coordinator
+        self.feed_id = uuid.uuid4().hex
+        self.version = 0
+        self._snapshot: dict[str, Any] | None = None
+        self._deltas: deque[tuple[int, dict[str, Any]]] = deque(maxlen=history)
+        # Each subscriber's delta listener and its callback for close
+        self._listeners: list[tuple[FeedListener, Callable[[], None] | None]] = []
+        self._remove_coordinator_listener: CALLBACK_TYPE | None = None
+
+    @property
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current snapshot."""
+        if self._snapshot is None:
+            self._snapshot = build_snapshot(self._coordinator)
+        return self._snapshot
+
+    def refresh(self) -> dict[str, Any] | None:
+        """Rebuild the snapshot and return the delta, or None if unchanged."""
+        if self._snapshot is None:
+            self._snapshot = build_snapshot(self._coordinator)
+            return None
+        snapshot = build_snapshot(self._coordinator)
+        delta = diff_snapshot(self._snapshot, snapshot)
+        if not delta:
+            return None
+        self._snapshot = snapshot
+        self.version += 1
+        self._deltas.append((self.version, delta))
+        return delta
+
+    def deltas_since(self, version: int) -> list[tuple[int, dict[str, Any]]] | None:
+        """Return the deltas after ``version``, or None if no longer held."""
+        if version == self.version:
+            return []
+        oldest = self._deltas[0][0] if self._deltas else self.version + 1
+        if not oldest - 1 <= version < self.version:
+            return None
+        return [(v, delta) for v, delta in self._deltas if v > version]
+
+    @callback
+    def async_subscribe(
+        self,
+        listener: FeedListener,
+        on_close: Callable[[], None] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Send each future delta to ``listener``; return an unsubscribe.
+
+        The feed listens to the coordinator only while it has subscribers,
+        so it is brought up to date here before the new listener is added.
+        ``on_close`` is called if the feed closes first (see async_close).
+        """
+        self._publish()
+        if self._remove_coordinator_listener is None:
+            self._remove_coordinator_listener = self._coordinator.async_add_listener(
+                self._publish
+            )
+        subscriber = (listener, on_close)
+        self._listeners.append(subscriber)
+
+        @callback
+        def unsubscribe() -> None:
+            if subscriber not in self._listeners:
+                return
+            self._listeners.remove(subscriber)
+            if not self._listeners:
+                self._stop_listening()
+
+        return unsubscribe
+
+    @callback
+    def async_close(self) -> None:
+        """End every subscription; called when the config entry unloads.
+
+        A reload replaces the coordinator and its feed, so subscribers are
+        told to subscribe again rather than wait on a feed that is gone.
+        """
+        subscribers, self._listeners = self._listeners, []
+        self._stop_listening()
+        for _listener, on_close in subscribers:
+            if on_close is not None:
+                on_close()
+
+    def _stop_listening(self) -> None:
+        """Stop listening to the coordinator."""
+        if self._remove_coordinator_listener is not None:
+            self._remove_coordinator_listener()
+            self._remove_coordinator_listener = None
+
+    @callback
+    def _publish(self) -> None:
+        """Refresh the snapshot and send any delta to the subscribers."""
+        delta = self.refresh()
+        if delta is None:
+            return
+        for listener, _on_close in list(self._listeners):
+            listener(self.version, delta)
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from homeassistant.core import HomeAssistant
 
 from ..const import (
+    AUXILIARY_RECOVERY_MINUTES,
     DEFAULT_AUXILIARY_DELAY_MINUTES,
     DEFAULT_AUXILIARY_THRESHOLD,
 )
@@ -26,6 +27,9 @@ def should_engage_auxiliary(
     target_temp: float,
     threshold: float = DEFAULT_AUXILIARY_THRESHOLD,
     delay_minutes: int = DEFAULT_AUXILIARY_DELAY_MINUTES,
+    now: datetime | None = None,
+    time_to_target: float | None = None,
+    recovery_minutes: float = AUXILIARY_RECOVERY_MINUTES,
 ) -> bool:
     """Determine if auxiliary devices should be engaged for a room.
 
@@ -33,8 +37,14 @@ def should_engage_auxiliary(
     1. Room is > threshold degrees from target
     2. HVAC has been running for > delay_minutes
     3. Temperature trend shows HVAC is losing or not gaining
+
+    Nothing is engaged while a door or window in the room is open.
+    When the learned thermal model gives a ``time_to_target`` (minutes of
+    HVAC alone), conditions 2 and 3 are replaced by the prediction: engage
+    as soon as HVAC is running and would need more than
+    ``recovery_minutes`` to get there.
     """
-    if room.temperature is None:
+    if room.temperature is None or room.window_open:
         return False
 
     temp_deviation = abs(room.temperature - target_temp)
@@ -43,16 +53,26 @@ def should_engage_auxiliary(
     if temp_deviation <= threshold:
         return False
 
-    # Condition 2: HVAC has been running long enough
-    if room.hvac_state_change_time is None:
+    is_hvac_active = room.hvac_action.value in ("heating", "cooling")
+    if not is_hvac_active:
         return False
 
-    hvac_running_time = datetime.now() - room.hvac_state_change_time
-    is_hvac_active = room.hvac_action.value in ("heating", "cooling")
+    # A shared system heating for other rooms doesn't mean this one,
+    # already above target, needs more heat (or the reverse for cooling).
+    if room.hvac_action.value == "heating" and room.temperature > target_temp:
+        return False
+    if room.hvac_action.value == "cooling" and room.temperature < target_temp:
+        return False
 
-    if not is_hvac_active:
+    if time_to_target is not None:
+        return time_to_target > recovery_minutes
+
+    # Condition 2: HVAC has been running long enough
+    if room.hvac_state_change_time is None:
         return False
 
+    hvac_running_time = (now or datetime.now()) - room.hvac_state_change_time
+
     if hvac_running_time < timedelta(minutes=delay_minutes):
         return False
 
@@ -76,10 +96,12 @@ def should_disengage_auxiliary(
     """Determine if auxiliary devices should be disengaged.
 
     Disengage when:
-    - Room is within DISENGAGE_THRESHOLD of target
+    - Room is within DISENGAGE_THRESHOLD of target, or past it in the
+      direction the device was engaged for (e.g. the target dropped)
     - Max runtime exceeded (safety)
+    - A door or window in the room is open
     """
-    if room.temperature is None:
+    if room.temperature is None or room.window_open:
         return True
 
     # Safety: max runtime exceeded
@@ -96,6 +118,12 @@ def should_disengage_auxiliary(
     if temp_deviation <= DISENGAGE_THRESHOLD:
         return True
 
+    # Overshot: heating a room that is already warm enough, or vice versa
+    if aux_state.heating is True and room.temperature > target_temp:
+        return True
+    if aux_state.heating is False and room.temperature < target_temp:
+        return True
+
     return False
 
 
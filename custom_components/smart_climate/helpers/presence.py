@@ -2,26 +2,105 @@
 
 from __future__ import annotations
 
+import heapq
 from datetime import datetime, timedelta
 
 from ..const import DEFAULT_AWAY_TEMP_OFFSET, DEFAULT_FOLLOW_ME_COOLDOWN
 from ..models import RoomState
 
 
+class RoomPresence:
+    """Presence for one room from timestamped sensor transitions.
+
+    Each sensor keeps only whether it is on; the room keeps the number of
+    sensors on, when presence last began and when the last sensor went
+    off.  The room stays occupied for ``hold_off`` after that, so motion
+    sensors that pulse for a few seconds between polls still count, and
+    ``confidence`` then falls linearly to zero over ``decay``.
+    """
+
+    __slots__ = ("_on", "_on_count", "hold_off", "decay", "last_on", "last_off")
+
+    def __init__(
+        self,
+        sensors: list[str],
+        hold_off: timedelta = timedelta(),
+        decay: timedelta = timedelta(),
+    ) -> None:
+        """Initialize with every sensor off."""
+        self._on: dict[str, bool] = dict.fromkeys(sensors, False)
+        self._on_count = 0
+        self.hold_off = hold_off
+        self.decay = decay
+        self.last_on: datetime | None = None
+        self.last_off: datetime | None = None
+
+    def record(self, entity_id: str, is_on: bool, when: datetime) -> bool:
+        """Record a sensor's state at ``when``; return True on an edge."""
+        previous = self._on.get(entity_id)
+        if previous is None or previous == is_on:
+            return False
+        self._on[entity_id] = is_on
+        if is_on:
+            self._on_count += 1
+            if self._on_count == 1:
+                self.last_on = when
+        else:
+            self._on_count -= 1
+            if self._on_count == 0:
+                self.last_off = when
+        return True
+
+    @property
+    def sensing(self) -> bool:
+        """Return True while any sensor reports presence."""
+        return self._on_count > 0
+
+    def is_occupied(self, now: datetime) -> bool:
+        """Return True if a sensor is on or the hold-off hasn't run out."""
+        if self._on_count:
+            return True
+        return self.last_off is not None and now - self.last_off < self.hold_off
+
+    def last_seen(self, now: datetime) -> datetime | None:
+        """Return when presence was last observed (``now`` while sensing)."""
+        return now if self._on_count else self.last_off
+
+    def hold_off_ends(self) -> datetime | None:
+        """Return when a running hold-off expires, or None."""
+        if self._on_count or self.last_off is None or not self.hold_off:
+            return None
+        return self.last_off + self.hold_off
+
+    def confidence(self, now: datetime) -> float:
+        """Return 1.0 while occupied, decaying to 0.0 over ``decay`` after."""
+        if self.is_occupied(now):
+            return 1.0
+        if self.last_off is None or not self.decay:
+            return 0.0
+        elapsed = now - self.last_off - self.hold_off
+        return max(0.0, 1.0 - elapsed / self.decay)
+
+
 def determine_follow_me_target(
     rooms: dict[str, RoomState],
     current_target: str | None = None,
     cooldown_minutes: int = DEFAULT_FOLLOW_ME_COOLDOWN,
+    now: datetime | None = None,
 ) -> str | None:
     """Determine which room should be the follow-me target.
 
     Rules:
     1. Room must have presence sensors and be occupied
-    2. Most recently active room wins (by last_presence_time)
+    2. Most recently entered room wins (by presence_since, falling back
+       to last_presence_time for states that don't track it)
     3. If tied, higher priority room wins
     4. Cooldown prevents thrashing between rooms
+
+    last_presence_time is refreshed every cycle while a room is occupied,
+    so ordering by it alone would leave every occupied room tied.
     """
-    now = datetime.now()
+    now = now or datetime.now()
     occupied_rooms: list[tuple[str, RoomState]] = []
 
     for slug, state in rooms.items():
@@ -31,18 +110,28 @@ def determine_follow_me_target(
     if not occupied_rooms:
         return None
 
-    # Sort by last presence time (most recent first), then by priority (highest first)
+    # Sort by presence start (most recent first), then by priority (highest first)
     occupied_rooms.sort(
         key=lambda x: (
-            x[1].last_presence_time or datetime.min,
+            x[1].presence_since or x[1].last_presence_time or datetime.min,
             x[1].config.priority,
         ),
         reverse=True,
     )
 
-    best_candidate = occupied_rooms[0][0]
+    return _apply_cooldown(
+        rooms, occupied_rooms[0][0], current_target, cooldown_minutes, now
+    )
+
 
-    # Apply cooldown: don't switch if we recently changed
+def _apply_cooldown(
+    rooms: dict[str, RoomState],
+    best_candidate: str,
+    current_target: str | None,
+    cooldown_minutes: int,
+    now: datetime,
+) -> str:
+    """Keep the current target over ``best_candidate`` during the cooldown."""
     if current_target and current_target != best_candidate:
         current_room = rooms.get(current_target)
         if current_room and current_room.occupied:
@@ -54,6 +143,81 @@ def determine_follow_me_target(
     return best_candidate
 
 
+class FollowMeIndex:
+    """Occupied rooms ordered for follow-me, maintained incrementally.
+
+    Rooms enter the index when presence begins, keyed on that time (the
+    room's ``presence_since``) and their priority, and leave it when
+    presence ends, so the best candidate is read off the top of a
+    max-heap instead of sorting every room each cycle.  Superseded heap
+    entries are dropped lazily.  Ordering and ties (to the room
+    configured first) match ``determine_follow_me_target``.
+    """
+
+    def __init__(self, room_order: list[str]) -> None:
+        """Initialize an empty index for rooms in configuration order."""
+        self._order = {slug: index for index, slug in enumerate(room_order)}
+        self._heap: list[tuple[float, int, int, str]] = []
+        self._entries: dict[str, tuple[float, int, int, str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of occupied rooms."""
+        return len(self._entries)
+
+    def __contains__(self, slug: object) -> bool:
+        """Return True if ``slug`` is an occupied candidate."""
+        return slug in self._entries
+
+    def update(
+        self,
+        slug: str,
+        occupied: bool,
+        since: datetime | None,
+        priority: int,
+    ) -> None:
+        """Record a presence transition for a room."""
+        if not occupied:
+            self._entries.pop(slug, None)
+            return
+        entry = (
+            -since.timestamp() if since is not None else float("inf"),
+            -priority,
+            self._order.get(slug, len(self._order)),
+            slug,
+        )
+        self._entries[slug] = entry
+        heapq.heappush(self._heap, entry)
+        # Rebuild rather than let stale entries pile up indefinitely.
+        if len(self._heap) > 4 * len(self._order) + 16:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def best(self) -> str | None:
+        """Return the best candidate room, or None if nobody is home."""
+        heap = self._heap
+        while heap:
+            entry = heap[0]
+            if self._entries.get(entry[3]) == entry:
+                return entry[3]
+            heapq.heappop(heap)
+        return None
+
+    def select(
+        self,
+        rooms: dict[str, RoomState],
+        current_target: str | None = None,
+        cooldown_minutes: int = DEFAULT_FOLLOW_ME_COOLDOWN,
+        now: datetime | None = None,
+    ) -> str | None:
+        """Return the follow-me target with the same cooldown rule."""
+        best = self.best()
+        if best is None:
+            return None
+        return _apply_cooldown(
+            rooms, best, current_target, cooldown_minutes, now or datetime.now()
+        )
+
+
 def calculate_follow_me_targets(
     rooms: dict[str, RoomState],
     primary_room: str | None,
@@ -2,12 +2,38 @@
 
 from __future__ import annotations
 
-from datetime import datetime, time
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
 
-from ..const import CONF_SCHEDULE_ALL_ROOMS
+from ..const import CONF_SCHEDULE_ALL_ROOMS, SCHEDULE_LOOKAHEAD_DAYS
 from ..models import Schedule
 
 
+@dataclass
+class SchedulePlan:
+    """A room's winning schedule and its next planned change."""
+
+    active: Schedule | None = None
+    next_at: datetime | None = None
+    next_schedule: Schedule | None = None
+    # When to start moving towards next_schedule's target; None if not needed
+    precondition_at: datetime | None = None
+
+    def is_preconditioning(self, now: datetime) -> bool:
+        """Return True while the early setpoint should be applied."""
+        return (
+            self.precondition_at is not None
+            and self.next_at is not None
+            and self.precondition_at <= now < self.next_at
+        )
+
+    def next_event(self, now: datetime) -> datetime | None:
+        """Return the next instant the plan needs attention."""
+        if self.precondition_at is not None and self.precondition_at > now:
+            return self.precondition_at
+        return self.next_at
+
+
 def parse_time(time_str: str) -> time:
     """Parse HH:MM string to time object."""
     parts = time_str.split(":")
@@ -18,9 +44,15 @@ def is_schedule_active_now(
     schedule: Schedule,
     now: datetime | None = None,
 ) -> bool:
-    """Check if a schedule is currently active."""
+    """Check if a schedule is currently active.
+
+    A schedule manually activated with the activate_schedule service is
+    active regardless of its days and time window.
+    """
     if not schedule.enabled:
         return False
+    if getattr(schedule, "_manual_override", False):
+        return True
 
     if now is None:
         now = datetime.now()
@@ -122,3 +154,43 @@ def get_todays_schedules(
         for s in schedules
         if s.enabled and now.weekday() in s.days
     ]
+
+
+def next_schedule_transition(
+    schedules: list[Schedule],
+    room_slug: str,
+    now: datetime,
+    days: int = SCHEDULE_LOOKAHEAD_DAYS,
+) -> tuple[datetime, Schedule | None] | None:
+    """Return when the winning schedule for a room next changes, and to what.
+
+    The winner can only change at a schedule start, just after a schedule
+    end (end times are inclusive) or at midnight, when the day-of-week
+    filter moves on, so only those instants within ``days`` are checked.
+    Returns None if nothing changes in that window.
+    """
+    relevant = [
+        s
+        for s in schedules
+        if s.enabled and (CONF_SCHEDULE_ALL_ROOMS in s.rooms or room_slug in s.rooms)
+    ]
+    if not relevant:
+        return None
+
+    boundaries: set[datetime] = set()
+    for offset in range(days + 1):
+        day = now.date() + timedelta(days=offset)
+        boundaries.add(datetime.combine(day, time()))
+        for schedule in relevant:
+            boundaries.add(datetime.combine(day, parse_time(schedule.start_time)))
+            boundaries.add(
+                datetime.combine(day, parse_time(schedule.end_time))
+                + timedelta(seconds=1)
+            )
+
+    current = get_winning_schedule(relevant, room_slug, now)
+    for boundary in sorted(b for b in boundaries if b > now):
+        winner = get_winning_schedule(relevant, room_slug, boundary)
+        if winner is not current:
+            return boundary, winner
+    return None
@@ -0,0 +1,276 @@
+"""Online thermal response learning for Smart Climate rooms.
+
+Each room is modelled as a single first-order system::
+
+    dT/dt = k * (T_out - T) + h * heat_duty - c * cool_duty + b
+
+where ``k`` is the passive loss coefficient (1/h), ``h`` and ``c`` are the
+heating and cooling rates at full duty (degrees/h), ``b`` lumps internal
+gains and sun (degrees/h), and the duties are the fraction of time the
+HVAC spent heating or cooling.  The four parameters are fitted with
+recursive least squares: every cycle only accumulates running sums, and
+every ``THERMAL_SAMPLE_MINUTES`` one observation updates the estimate with
+a fixed 4x4 amount of work, however long the room has been learning.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime
+from typing import Any
+
+from ..const import (
+    THERMAL_FORGETTING_FACTOR,
+    THERMAL_MIN_SAMPLES,
+    THERMAL_SAMPLE_MINUTES,
+)
+from ..models import HVACAction
+
+# Parameter order in the estimate vector
+_LOSS, _HEAT, _COOL, _BIAS = range(4)
+_SIZE = 4
+
+# Initial covariance: a weak prior so the first samples dominate.
+INITIAL_COVARIANCE = 100.0
+# Forgetting is suspended while the covariance trace is above this, so
+# directions that are never excited (no cooling all winter) don't blow up.
+MAX_COVARIANCE_TRACE = 4 * INITIAL_COVARIANCE
+# Minimum duty fraction for a sample to count as exercising heat or cool.
+EXCITATION_DUTY = 0.5
+# Rates below this are treated as zero when solving for time-to-target.
+_EPSILON = 1e-6
+
+
+class ThermalEstimator:
+    """Recursive least-squares estimate of one room's thermal response."""
+
+    def __init__(self) -> None:
+        """Initialize with no knowledge of the room."""
+        self.theta: list[float] = [0.0] * _SIZE
+        self.covariance: list[list[float]] = [
+            [INITIAL_COVARIANCE if i == j else 0.0 for j in range(_SIZE)]
+            for i in range(_SIZE)
+        ]
+        self.samples = 0
+        self.heating_samples = 0
+        self.cooling_samples = 0
+        self._reset_window()
+
+    # ------------------------------------------------------------------
+    # Learned parameters
+    # ------------------------------------------------------------------
+
+    @property
+    def loss_coefficient(self) -> float:
+        """Return the passive loss coefficient towards outdoor (1/h)."""
+        return self.theta[_LOSS]
+
+    @property
+    def heating_rate(self) -> float:
+        """Return the heating rate at full duty (degrees/h)."""
+        return self.theta[_HEAT]
+
+    @property
+    def cooling_rate(self) -> float:
+        """Return the cooling rate at full duty (degrees/h, positive)."""
+        return self.theta[_COOL]
+
+    @property
+    def internal_gain(self) -> float:
+        """Return the drift not explained by outdoor or HVAC (degrees/h)."""
+        return self.theta[_BIAS]
+
+    def is_confident(self, action: HVACAction) -> bool:
+        """Return True if predictions for ``action`` are trustworthy."""
+        if self.samples < 2 * THERMAL_MIN_SAMPLES or self.loss_coefficient < 0:
+            return False
+        if action == HVACAction.HEATING:
+            return self.heating_samples >= THERMAL_MIN_SAMPLES and self.heating_rate > 0
+        if action == HVACAction.COOLING:
+            return self.cooling_samples >= THERMAL_MIN_SAMPLES and self.cooling_rate > 0
+        return False
+
+    # ------------------------------------------------------------------
+    # Observation
+    # ------------------------------------------------------------------
+
+    def _reset_window(self) -> None:
+        self._window_temp = 0.0
+        self._last_time: datetime | None = None
+        self._last_temp = 0.0
+        self._last_outdoor = 0.0
+        self._last_action = HVACAction.IDLE
+        self._hours = 0.0
+        self._delta_sum = 0.0
+        self._heat_hours = 0.0
+        self._cool_hours = 0.0
+
+    def observe(
+        self,
+        now: datetime,
+        temperature: float | None,
+        outdoor: float | None,
+        action: HVACAction,
+        window_open: bool = False,
+    ) -> bool:
+        """Accumulate one cycle; return True when an RLS update was made.
+
+        Readings with an open window or unknown temperatures break the
+        current window instead of polluting the estimate.
+        """
+        if temperature is None or outdoor is None or window_open:
+            self._reset_window()
+            return False
+
+        if self._last_time is None or now <= self._last_time:
+            if self._last_time is None:
+                self._window_temp = temperature
+            self._last_time = now
+            self._last_temp = temperature
+            self._last_outdoor = outdoor
+            self._last_action = action
+            return False
+
+        # Integrate the previous interval using the state at its start.
+        hours = (now - self._last_time).total_seconds() / 3600.0
+        self._hours += hours
+        self._delta_sum += hours * (
+            (self._last_outdoor + outdoor) / 2.0 - (self._last_temp + temperature) / 2.0
+        )
+        if self._last_action == HVACAction.HEATING:
+            self._heat_hours += hours
+        elif self._last_action == HVACAction.COOLING:
+            self._cool_hours += hours
+        self._last_time = now
+        self._last_temp = temperature
+        self._last_outdoor = outdoor
+        self._last_action = action
+
+        if self._hours * 60.0 < THERMAL_SAMPLE_MINUTES:
+            return False
+
+        span = self._hours
+        regressors = [
+            self._delta_sum / span,
+            self._heat_hours / span,
+            -self._cool_hours / span,
+            1.0,
+        ]
+        slope = (temperature - self._window_temp) / span
+        self._update(regressors, slope)
+
+        self.samples += 1
+        if regressors[_HEAT] >= EXCITATION_DUTY:
+            self.heating_samples += 1
+        if -regressors[_COOL] >= EXCITATION_DUTY:
+            self.cooling_samples += 1
+
+        # The next window starts where this one ended.
+        self._window_temp = temperature
+        self._hours = self._delta_sum = self._heat_hours = self._cool_hours = 0.0
+        return True
+
+    def _update(self, x: list[float], y: float) -> None:
+        """Apply one recursive least-squares step with forgetting."""
+        p = self.covariance
+        px = [sum(p[i][j] * x[j] for j in range(_SIZE)) for i in range(_SIZE)]
+        trace = sum(p[i][i] for i in range(_SIZE))
+        forgetting = THERMAL_FORGETTING_FACTOR if trace < MAX_COVARIANCE_TRACE else 1.0
+        denominator = forgetting + sum(x[i] * px[i] for i in range(_SIZE))
+        gain = [value / denominator for value in px]
+        error = y - sum(self.theta[i] * x[i] for i in range(_SIZE))
+
+        for i in range(_SIZE):
+            self.theta[i] += gain[i] * error
+        for i in range(_SIZE):
+            for j in range(_SIZE):
+                p[i][j] = (p[i][j] - gain[i] * px[j]) / forgetting
+
+    # ------------------------------------------------------------------
+    # Prediction
+    # ------------------------------------------------------------------
+
+    def time_to_target(
+        self,
+        temperature: float | None,
+        target: float | None,
+        outdoor: float | None,
+    ) -> float | None:
+        """Return predicted minutes of full HVAC to reach ``target``.
+
+        Heating is assumed when the room is below target and cooling when
+        above.  Returns ``math.inf`` if the learned model says the target
+        is out of reach, and None when there is not enough data yet.
+        """
+        if temperature is None or target is None or outdoor is None:
+            return None
+        if abs(target - temperature) < 0.05:
+            return 0.0
+
+        if target > temperature:
+            action, drive = HVACAction.HEATING, self.heating_rate
+        else:
+            action, drive = HVACAction.COOLING, -self.cooling_rate
+        if not self.is_confident(action):
+            return None
+
+        loss = self.loss_coefficient
+        drive += self.internal_gain
+        if loss < _EPSILON:
+            slope = drive
+            if slope * (target - temperature) <= 0:
+                return math.inf
+            return (target - temperature) / slope * 60.0
+
+        # Exponential approach to the equilibrium the HVAC can hold.
+        equilibrium = outdoor + drive / loss
+        remaining = (target - equilibrium) / (temperature - equilibrium)
+        if remaining <= 0 or remaining >= 1:
+            return math.inf
+        return -math.log(remaining) / loss * 60.0
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the learned estimate for storage.
+
+        The partial observation window is not kept; it restarts on load.
+        """
+        return {
+            "theta": list(self.theta),
+            "covariance": [list(row) for row in self.covariance],
+            "samples": self.samples,
+            "heating_samples": self.heating_samples,
+            "cooling_samples": self.cooling_samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ThermalEstimator:
+        """Restore an estimate saved by ``to_dict``."""
+        estimator = cls()
+        theta = [float(v) for v in data.get("theta", [])]
+        covariance = [[float(v) for v in row] for row in data.get("covariance", [])]
+        if len(theta) != _SIZE or len(covariance) != _SIZE or any(
+            len(row) != _SIZE for row in covariance
+        ):
+            raise ValueError("Malformed thermal estimate")
+        estimator.theta = theta
+        estimator.covariance = covariance
+        estimator.samples = int(data.get("samples", 0))
+        estimator.heating_samples = int(data.get("heating_samples", 0))
+        estimator.cooling_samples = int(data.get("cooling_samples", 0))
+        return estimator
+
+    def as_attributes(self) -> dict[str, Any]:
+        """Return the learned coefficients for entity attributes."""
+        return {
+            "heating_rate": round(self.heating_rate, 2),
+            "cooling_rate": round(self.cooling_rate, 2),
+            "loss_coefficient": round(self.loss_coefficient, 4),
+            "internal_gain": round(self.internal_gain, 2),
+            "samples": self.samples,
+            "heating_samples": self.heating_samples,
+            "cooling_samples": self.cooling_samples,
+        }
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import heapq
 import re
 import sys
 import uuid
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
@@ -22,6 +24,7 @@ from .const import (
     DEFAULT_AUXILIARY_THRESHOLD,
     DEFAULT_ROOM_PRIORITY,
     DEFAULT_TARGET_TEMP_OFFSET,
+    SUGGESTION_EXPIRED,
     SUGGESTION_PENDING,
 )
 
@@ -173,6 +176,7 @@ class RoomState:
     temperature: float | None = None
     humidity: float | None = None
     occupied: bool = False
+    presence_confidence: float = 0.0  # 1.0 occupied, decaying after
     window_open: bool = False
     comfort_score: float = 0.0
     efficiency_score: float = 0.0
@@ -185,14 +189,25 @@ class RoomState:
     follow_me_active: bool = False
     last_adjustment_reason: str = ""
     active_schedule: str | None = None
+    next_schedule: str | None = None  # None also when the schedule just ends
+    next_schedule_time: datetime | None = None
+    precondition_start: datetime | None = None
+    preconditioning: bool = False
     auxiliary_active: bool = False
     auxiliary_devices_on: list[str] = field(default_factory=list)
     auxiliary_reason: str = ""
     auxiliary_runtime_minutes: float = 0.0
     temp_trend: float = 0.0  # degrees per hour
+    # Learned thermal response (see helpers/thermal.py); None until trusted
+    heating_rate: float | None = None  # degrees per hour at full duty
+    cooling_rate: float | None = None  # degrees per hour at full duty
+    loss_coefficient: float | None = None  # per hour, towards outdoor
+    time_to_target: float | None = None  # minutes of HVAC to reach target
     last_presence_time: datetime | None = None
+    presence_since: datetime | None = None  # when current occupancy began
     last_hvac_state: str | None = None
     hvac_state_change_time: datetime | None = None
+    hvac_runtime_checkpoint: datetime | None = None
     temp_history: list[tuple[datetime, float]] = field(default_factory=list)
 
 
@@ -217,9 +232,9 @@ class Suggestion:
     applied_at: datetime | None = None
     rejected_reason: str | None = None
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: datetime | None = None) -> bool:
         """Check if the suggestion has expired."""
-        return datetime.now() > self.expires_at
+        return (now or datetime.now()) > self.expires_at
 
     def to_dict(self) -> dict:
         """Serialize for API/events."""
@@ -285,6 +300,169 @@ class Suggestion:
         )
 
 
+class SuggestionStore:
+    """Suggestions indexed by id, status and room.
+
+    Pending suggestions are also kept in a min-heap keyed on
+    ``expires_at`` so the next expiry is found without a scan.  Heap
+    entries are invalidated lazily: an entry whose suggestion is gone, no
+    longer pending or has a different expiry is skipped when reached.
+
+    Change a stored suggestion's status through ``set_status`` so the
+    indexes stay consistent.
+    """
+
+    def __init__(self, suggestions: Iterable[Suggestion] = ()) -> None:
+        self._by_id: dict[str, Suggestion] = {}
+        # Inner dicts keep insertion order, so per-status / per-room
+        # listings come out oldest first like the old flat list.
+        self._by_status: dict[str, dict[str, Suggestion]] = {}
+        self._by_room: dict[str | None, dict[str, Suggestion]] = {}
+        self._expiry: list[tuple[datetime, str]] = []
+        for suggestion in suggestions:
+            self.add(suggestion)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Suggestion]:
+        return iter(list(self._by_id.values()))
+
+    def __contains__(self, suggestion_id: object) -> bool:
+        return suggestion_id in self._by_id
+
+    def get(self, suggestion_id: str) -> Suggestion | None:
+        """Return the suggestion with this id, if stored."""
+        return self._by_id.get(suggestion_id)
+
+    def add(self, suggestion: Suggestion) -> None:
+        """Store a suggestion, replacing any with the same id."""
+        if suggestion.id in self._by_id:
+            self.remove(suggestion.id)
+        self._by_id[suggestion.id] = suggestion
+        self._by_status.setdefault(suggestion.status, {})[suggestion.id] = suggestion
+        self._by_room.setdefault(suggestion.room, {})[suggestion.id] = suggestion
+        if suggestion.status == SUGGESTION_PENDING:
+            heapq.heappush(self._expiry, (suggestion.expires_at, suggestion.id))
+
+    def extend(self, suggestions: Iterable[Suggestion]) -> None:
+        """Store several suggestions."""
+        for suggestion in suggestions:
+            self.add(suggestion)
+
+    def remove(self, suggestion_id: str) -> Suggestion | None:
+        """Drop a suggestion and return it."""
+        suggestion = self._by_id.pop(suggestion_id, None)
+        if suggestion is None:
+            return None
+        self._unindex(self._by_status, suggestion.status, suggestion_id)
+        self._unindex(self._by_room, suggestion.room, suggestion_id)
+        return suggestion
+
+    def set_status(self, suggestion: Suggestion, status: str) -> None:
+        """Change a stored suggestion's status and re-index it."""
+        if suggestion.status == status:
+            return
+        if suggestion.id in self._by_id:
+            self._unindex(self._by_status, suggestion.status, suggestion.id)
+            self._by_status.setdefault(status, {})[suggestion.id] = suggestion
+            if status == SUGGESTION_PENDING:
+                heapq.heappush(self._expiry, (suggestion.expires_at, suggestion.id))
+        suggestion.status = status
+
+    def with_status(self, status: str) -> list[Suggestion]:
+        """Return suggestions with the given status, oldest first."""
+        return list(self._by_status.get(status, {}).values())
+
+    def pending(self) -> list[Suggestion]:
+        """Return pending suggestions, oldest first."""
+        return self.with_status(SUGGESTION_PENDING)
+
+    def for_room(self, room: str | None) -> list[Suggestion]:
+        """Return suggestions for a room slug (None for house-wide)."""
+        return list(self._by_room.get(room, {}).values())
+
+    def count(self, status: str | None = None) -> int:
+        """Return the number of suggestions, optionally for one status."""
+        if status is None:
+            return len(self._by_id)
+        return len(self._by_status.get(status, {}))
+
+    def remove_pending(self) -> int:
+        """Drop every pending suggestion and return how many there were."""
+        pending = self.pending()
+        for suggestion in pending:
+            self.remove(suggestion.id)
+        return len(pending)
+
+    def next_expiry(self) -> datetime | None:
+        """Return the earliest expiry among pending suggestions."""
+        while self._expiry:
+            expires_at, suggestion_id = self._expiry[0]
+            if self._is_live(expires_at, suggestion_id):
+                return expires_at
+            heapq.heappop(self._expiry)
+        return None
+
+    def expire_due(self, now: datetime) -> list[Suggestion]:
+        """Mark pending suggestions past ``expires_at`` as expired."""
+        expired: list[Suggestion] = []
+        while self._expiry and self._expiry[0][0] < now:
+            expires_at, suggestion_id = heapq.heappop(self._expiry)
+            if self._is_live(expires_at, suggestion_id):
+                suggestion = self._by_id[suggestion_id]
+                self.set_status(suggestion, SUGGESTION_EXPIRED)
+                expired.append(suggestion)
+        return expired
+
+    def compact(
+        self,
+        history_limit: int,
+        history_max_age: timedelta,
+        now: datetime | None = None,
+    ) -> int:
+        """Apply retention to non-pending history and rebuild the heap.
+
+        Keeps at most ``history_limit`` applied / rejected / expired
+        suggestions, none created more than ``history_max_age`` ago.
+        Pending suggestions are never dropped.  Returns how many were
+        removed.
+        """
+        now = now or datetime.now()
+        cutoff = now - history_max_age
+        history = sorted(
+            (s for s in self._by_id.values() if s.status != SUGGESTION_PENDING),
+            key=lambda s: s.created_at,
+            reverse=True,
+        )
+        drop = [
+            s for idx, s in enumerate(history)
+            if idx >= history_limit or s.created_at < cutoff
+        ]
+        for suggestion in drop:
+            self.remove(suggestion.id)
+
+        self._expiry = [(s.expires_at, s.id) for s in self.pending()]
+        heapq.heapify(self._expiry)
+        return len(drop)
+
+    def _is_live(self, expires_at: datetime, suggestion_id: str) -> bool:
+        suggestion = self._by_id.get(suggestion_id)
+        return (
+            suggestion is not None
+            and suggestion.status == SUGGESTION_PENDING
+            and suggestion.expires_at == expires_at
+        )
+
+    @staticmethod
+    def _unindex(index: dict, key: str | None, suggestion_id: str) -> None:
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(suggestion_id, None)
+            if not bucket:
+                del index[key]
+
+
 @dataclass
 class HouseState:
     """Whole-house aggregated state."""
@@ -300,7 +478,15 @@ class HouseState:
     outdoor_humidity: float | None = None
     last_analysis_time: datetime | None = None
     ai_daily_summary: str = ""
-    suggestions: list[Suggestion] = field(default_factory=list)
+    suggestions: SuggestionStore = field(default_factory=SuggestionStore)
+
+
+@dataclass
+class StateWriteStats:
+    """Entity state writes made and skipped as unchanged."""
+
+    written: int = 0
+    skipped: int = 0
 
 
 @dataclass
@@ -312,6 +498,8 @@ class AuxiliaryDeviceState:
     is_on: bool = False
     started_at: datetime | None = None
     runtime_minutes: float = 0.0
+    # True when engaged to heat, False to cool, None if unknown
+    heating: bool | None = None
     max_runtime: int = DEFAULT_AUXILIARY_MAX_RUNTIME
     threshold: float = DEFAULT_AUXILIARY_THRESHOLD
     delay_minutes: int = DEFAULT_AUXILIARY_DELAY_MINUTES
@@ -0,0 +1,297 @@
+"""Append-only recorder of coordinator inputs for offline replay.
+
+Every update cycle the coordinator hands the recorder the states of the
+entities it reads.  Only entities whose state or attributes changed since
+the previous cycle are written, as one JSON line per cycle, to a gzip
+file next to the integration's storage.  Presence and door/window
+changes the coordinator reacts to between cycles are written as event
+lines at the time they arrived, so a replay applies them then rather
+than at the next cycle.  Every session (and every file
+after rotation) starts with a header line carrying the redacted config
+entry data, followed by a full keyframe, so a recording can be replayed
+without Home Assistant and survives restarts and truncated tails.
+
+Line format::
+
+    {"header": 1, "start": "<iso time>", "config": {...}}
+    {"t": <seconds since start>, "s": {"<entity_id>": ["<state>", {attrs}] | null}}
+    {"t": <seconds since start>, "e": {"<entity_id>": ["<state>", {attrs}] | null}}
+
+See ``replay.py`` for the harness that feeds a recording back through
+the coordinator.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import zlib
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Version 2 added event lines.
+RECORDING_VERSION = 2
+
+# Buffered cycles written per gzip member.
+RECORDER_FLUSH_CYCLES = 30
+
+# Size at which the recording is rotated to "<path>.1".
+RECORDER_MAX_BYTES = 50 * 1024 * 1024
+
+EntityState = list[Any]  # [state, attributes]
+
+
+def _encode_state(state: Any) -> EntityState | None:
+    if state is None:
+        return None
+    return [state.state, dict(state.attributes)]
+
+
+@dataclass
+class RecordedEvent:
+    """One event-driven input read back from a recording."""
+
+    time: datetime
+    entity_id: str
+    # [state, attributes], or None if the entity was removed.
+    state: EntityState | None
+
+
+@dataclass
+class RecordedCycle:
+    """One coordinator cycle read back from a recording."""
+
+    time: datetime
+    # entity_id -> [state, attributes], or None once the entity is gone.
+    changes: dict[str, EntityState | None]
+    config: dict[str, Any] = field(default_factory=dict)
+    # True for the first cycle of a session (a full keyframe).
+    keyframe: bool = False
+    # Events that arrived since the previous cycle, in order.
+    events: list[RecordedEvent] = field(default_factory=list)
+    # Recording format version; events are only recorded from version 2.
+    version: int = RECORDING_VERSION
+
+
+class RecordingWriter:
+    """Delta-encode cycles and append them to a gzip recording.
+
+    Blocking; Home Assistant code should go through InputRecorder, which
+    runs the writes in the executor.
+    """
+
+    def __init__(self, path: str, config: Mapping[str, Any]) -> None:
+        self.path = path
+        self._config = dict(config)
+        self._start: datetime | None = None
+        self._last: dict[str, EntityState | None] = {}
+
+    def encode_cycle(
+        self, now: datetime, states: Mapping[str, Any]
+    ) -> list[str]:
+        """Return the lines for one cycle, including a header if needed.
+
+        ``states`` maps entity ids to State-like objects (``.state`` and
+        ``.attributes``) or None.
+        """
+        lines: list[str] = []
+        if self._start is None:
+            self._start = now
+            self._last = {}
+            lines.append(
+                json.dumps(
+                    {
+                        "header": RECORDING_VERSION,
+                        "start": now.isoformat(),
+                        "config": self._config,
+                    },
+                    default=str,
+                )
+            )
+
+        changes: dict[str, EntityState | None] = {}
+        for entity_id, state in states.items():
+            encoded = _encode_state(state)
+            if entity_id not in self._last or self._last[entity_id] != encoded:
+                changes[entity_id] = encoded
+                self._last[entity_id] = encoded
+
+        offset = round((now - self._start).total_seconds(), 3)
+        lines.append(
+            json.dumps({"t": offset, "s": changes}, separators=(",", ":"), default=str)
+        )
+        return lines
+
+    def encode_event(
+        self, now: datetime, entity_id: str, state: Any
+    ) -> list[str]:
+        """Return the line for one event-driven input.
+
+        Nothing is written before the session's first cycle, whose
+        keyframe carries the state instead.
+        """
+        if self._start is None:
+            return []
+        encoded = _encode_state(state)
+        self._last[entity_id] = encoded
+        offset = round((now - self._start).total_seconds(), 3)
+        return [
+            json.dumps(
+                {"t": offset, "e": {entity_id: encoded}},
+                separators=(",", ":"),
+                default=str,
+            )
+        ]
+
+    def restart(self) -> None:
+        """Start a new session: the next cycle gets a header and keyframe."""
+        self._start = None
+
+    def write(self, lines: list[str]) -> int:
+        """Append lines as one gzip member and return the file size."""
+        if not lines:
+            return self.size()
+        with gzip.open(self.path, "at", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+        return self.size()
+
+    def rotate(self) -> None:
+        """Move the current recording to ``<path>.1``.
+
+        Call ``restart`` before encoding the next cycle so the new file
+        begins with a header and keyframe.
+        """
+        if os.path.exists(self.path):
+            os.replace(self.path, f"{self.path}.1")
+
+    def size(self) -> int:
+        """Return the recording size in bytes (0 if missing)."""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+
+class InputRecorder:
+    """Buffer coordinator cycles and write them from the executor."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        config: Mapping[str, Any],
+        flush_cycles: int = RECORDER_FLUSH_CYCLES,
+        max_bytes: int = RECORDER_MAX_BYTES,
+    ) -> None:
+        self._hass = hass
+        self._writer = RecordingWriter(path, config)
+        self._flush_cycles = flush_cycles
+        self._max_bytes = max_bytes
+        self._buffer: list[str] = []
+        self._size = 0
+        # Buffer index where the next file starts, once rotation is due.
+        self._rotate_at: int | None = None
+        self.cycles = 0
+
+    @property
+    def path(self) -> str:
+        """Return the recording path."""
+        return self._writer.path
+
+    def record_cycle(self, now: datetime, states: Mapping[str, Any]) -> None:
+        """Record one cycle's inputs; flushes every ``flush_cycles``."""
+        if self._size >= self._max_bytes and self._rotate_at is None:
+            # Lines already buffered still belong to the old file; the
+            # next file starts with a fresh header and keyframe.
+            self._rotate_at = len(self._buffer)
+            self._writer.restart()
+        self._buffer.extend(self._writer.encode_cycle(now, states))
+        self.cycles += 1
+        if self.cycles % self._flush_cycles == 0:
+            self._hass.async_create_task(self.async_flush())
+
+    def record_event(self, now: datetime, entity_id: str, state: Any) -> None:
+        """Record a state change the coordinator reacted to between cycles."""
+        self._buffer.extend(self._writer.encode_event(now, entity_id, state))
+
+    async def async_flush(self) -> None:
+        """Write buffered cycles to disk."""
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        rotate_at, self._rotate_at = self._rotate_at, None
+        try:
+            self._size = await self._hass.async_add_executor_job(
+                self._write, lines, rotate_at
+            )
+        except OSError as err:
+            _LOGGER.warning("Could not write input recording %s: %s", self.path, err)
+
+    def _write(self, lines: list[str], rotate_at: int | None) -> int:
+        if rotate_at is not None:
+            self._writer.write(lines[:rotate_at])
+            self._writer.rotate()
+            lines = lines[rotate_at:]
+        return self._writer.write(lines)
+
+
+def read_recording(path: str) -> Iterator[RecordedCycle]:
+    """Yield the cycles of a recording in order.
+
+    Event lines are attached to the cycle that follows them; events after
+    the last cycle are dropped.  A truncated final gzip member (e.g. after
+    a crash) ends the iteration instead of raising.
+    """
+    start: datetime | None = None
+    config: dict[str, Any] = {}
+    keyframe = False
+    version = RECORDING_VERSION
+    events: list[RecordedEvent] = []
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    _LOGGER.warning("Skipping corrupt line in %s", path)
+                    continue
+                if "header" in record:
+                    start = datetime.fromisoformat(record["start"])
+                    config = record.get("config", {})
+                    version = record["header"]
+                    keyframe = True
+                    events = []
+                    continue
+                if start is None:
+                    continue
+                time = start + timedelta(seconds=record.get("t", 0))
+                if "e" in record:
+                    events.extend(
+                        RecordedEvent(time, entity_id, state)
+                        for entity_id, state in record["e"].items()
+                    )
+                    continue
+                yield RecordedCycle(
+                    time=time,
+                    changes=record.get("s", {}),
+                    config=config,
+                    keyframe=keyframe,
+                    events=events,
+                    version=version,
+                )
+                keyframe = False
+                events = []
+    except (EOFError, zlib.error, gzip.BadGzipFile) as err:
+        _LOGGER.warning("Recording %s ends early: %s", path, err)
@@ -0,0 +1,324 @@
+"""Offline replay of recorded coordinator inputs.
+
+Feeds a recording made by ``recorder.InputRecorder`` back through a real
+``SmartClimateCoordinator`` as fast as possible.  Home Assistant is
+replaced by a small in-memory stand-in: the state machine is rebuilt
+from the recorded deltas, service calls and bus events are captured
+instead of executed, and the coordinator's clock is pinned to each
+recorded cycle time with a ``VirtualClock``.  Presence and door/window
+events recorded between cycles are handed to the coordinator at their
+recorded times, as they were live; only presence hold-off expiries are
+still noticed at the next cycle rather than by a timer.  Recordings
+made before events were recorded replay presence at cycle resolution.
+
+The result lists every decision change (per-room targets, HVAC action,
+follow-me, schedules, auxiliary devices) and every service call, so two
+runs can be diffed to check that a change to the control logic behaves
+the same on real history.  From the repository root::
+
+    python -m custom_components.smart_climate.replay recording.jsonl.gz \\
+        --output result.json --baseline previous.json
+
+The coordinator must be importable, i.e. Home Assistant (or the test
+stubs) has to be installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+from .clock import VirtualClock
+from .const import CONF_RECORD_INPUTS, OPERATION_MODE_ACTIVE, OPERATION_MODES
+from .recorder import RecordedCycle, RecordedEvent, read_recording
+
+ROOM_DECISION_FIELDS = (
+    "smart_target",
+    "current_target",
+    "hvac_action",
+    "follow_me_active",
+    "active_schedule",
+    "auxiliary_active",
+)
+HOUSE_DECISION_FIELDS = ("follow_me_target", "active_schedule")
+
+
+@dataclass
+class _ReplayState:
+    entity_id: str
+    state: str
+    attributes: dict[str, Any]
+
+
+class _ReplayStates:
+    """Minimal state machine rebuilt from recorded deltas."""
+
+    def __init__(self) -> None:
+        self._states: dict[str, _ReplayState] = {}
+
+    def get(self, entity_id: str) -> _ReplayState | None:
+        return self._states.get(entity_id)
+
+    def apply(self, changes: dict[str, Any]) -> None:
+        for entity_id, encoded in changes.items():
+            if encoded is None:
+                self._states.pop(entity_id, None)
+            else:
+                self._states[entity_id] = _ReplayState(
+                    entity_id, encoded[0], encoded[1] or {}
+                )
+
+
+class _ReplayServices:
+    """Capture service calls instead of executing them."""
+
+    def __init__(self, result: ReplayResult) -> None:
+        self._result = result
+        self.now: datetime | None = None
+
+    async def async_call(
+        self, domain: str, service: str, data: dict | None = None, **kwargs: Any
+    ) -> None:
+        self._result.service_calls.append(
+            {
+                "time": self.now.isoformat() if self.now else None,
+                "service": f"{domain}.{service}",
+                "data": dict(data or {}),
+            }
+        )
+
+
+class _ReplayBus:
+    """Capture bus events."""
+
+    def __init__(self, result: ReplayResult) -> None:
+        self._result = result
+        self.now: datetime | None = None
+
+    def async_fire(self, event_type: str, event_data: dict | None = None) -> None:
+        self._result.events.append(
+            {
+                "time": self.now.isoformat() if self.now else None,
+                "event": event_type,
+                "data": dict(event_data or {}),
+            }
+        )
+
+
+class _ReplayHass:
+    """The parts of HomeAssistant the coordinator touches during a cycle."""
+
+    def __init__(self, result: ReplayResult) -> None:
+        self.states = _ReplayStates()
+        self.services = _ReplayServices(result)
+        self.bus = _ReplayBus(result)
+        self.data: dict[str, Any] = {}
+        self.config = SimpleNamespace(path=lambda *parts: "/".join(parts))
+        self._tasks: list[asyncio.Task] = []
+
+    def async_create_task(self, coro: Any, *args: Any, **kwargs: Any) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.append(task)
+        return task
+
+    async_create_background_task = async_create_task
+
+    async def async_add_executor_job(self, func: Any, *args: Any) -> Any:
+        return func(*args)
+
+    async def async_drain(self) -> None:
+        """Wait for tasks started during the last cycle."""
+        while self._tasks:
+            tasks, self._tasks = self._tasks, []
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _NullStore:
+    """Keep replays from touching the live integration's storage."""
+
+    async def async_load(self) -> None:
+        return None
+
+    async def async_save(self, data: Any) -> None:
+        return None
+
+
+@dataclass
+class ReplayResult:
+    """Decisions and service calls produced by a replay."""
+
+    cycles: int = 0
+    elapsed: float = 0.0
+    decisions: list[dict[str, Any]] = field(default_factory=list)
+    service_calls: list[dict[str, Any]] = field(default_factory=list)
+    events: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def cycles_per_second(self) -> float:
+        """Return replay throughput."""
+        return self.cycles / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output and diffing."""
+        return {
+            "cycles": self.cycles,
+            "elapsed": round(self.elapsed, 3),
+            "decisions": self.decisions,
+            "service_calls": self.service_calls,
+            "events": self.events,
+        }
+
+
+def _snapshot(data: dict[str, Any]) -> dict[str, Any]:
+    rooms = {
+        slug: {name: getattr(room, name) for name in ROOM_DECISION_FIELDS}
+        for slug, room in data["rooms"].items()
+    }
+    house = {name: getattr(data["house"], name) for name in HOUSE_DECISION_FIELDS}
+    return {"rooms": rooms, "house": house}
+
+
+async def _async_replay_event(
+    hass: _ReplayHass, coordinator: Any, event: RecordedEvent
+) -> None:
+    """Apply one recorded state change and hand it to the coordinator."""
+    hass.states.apply({event.entity_id: event.state})
+    hass.services.now = hass.bus.now = event.time
+    coordinator.clock.set(max(event.time, coordinator.clock.now()))
+    ha_event = SimpleNamespace(
+        data={
+            "entity_id": event.entity_id,
+            "new_state": hass.states.get(event.entity_id),
+        }
+    )
+    if event.entity_id in coordinator._presence_rooms:
+        coordinator._handle_presence_event(ha_event)
+    if event.entity_id in coordinator._window_rooms:
+        coordinator._handle_window_event(ha_event)
+    await hass.async_drain()
+
+
+async def async_replay(
+    cycles: Iterable[RecordedCycle],
+    config: dict[str, Any] | None = None,
+    operation_mode: str = OPERATION_MODE_ACTIVE,
+) -> ReplayResult:
+    """Replay recorded cycles through a fresh coordinator.
+
+    ``config`` overrides the config entry data stored in the recording,
+    e.g. to try different thresholds on the same history.  The runtime
+    operation mode is not part of the recording, so replays run in
+    active mode unless told otherwise.
+    """
+    from .coordinator import SmartClimateCoordinator
+
+    result = ReplayResult()
+    hass = _ReplayHass(result)
+    coordinator: SmartClimateCoordinator | None = None
+    previous: dict[str, Any] | None = None
+
+    def record_decisions(when: datetime, data: dict[str, Any]) -> None:
+        nonlocal previous
+        snapshot = _snapshot(data)
+        if snapshot != previous:
+            result.decisions.append({"time": when.isoformat(), **snapshot})
+            previous = snapshot
+
+    started = time.perf_counter()
+    for cycle in cycles:
+        if coordinator is not None:
+            for event in cycle.events:
+                await _async_replay_event(hass, coordinator, event)
+                state = {
+                    "rooms": coordinator._room_states,
+                    "house": coordinator._house_state,
+                }
+                record_decisions(event.time, state)
+
+        hass.states.apply(cycle.changes)
+        if coordinator is None:
+            data = dict(config if config is not None else cycle.config)
+            data[CONF_RECORD_INPUTS] = False
+            entry = SimpleNamespace(
+                entry_id="replay", data=data, options={}, title="Replay"
+            )
+            coordinator = SmartClimateCoordinator(hass, entry)
+            coordinator.clock = clock = VirtualClock(cycle.time)
+            coordinator._store = _NullStore()
+            coordinator.operation_mode = operation_mode
+            if cycle.version >= 2:
+                # Presence then comes from the recorded events, as it did live.
+                coordinator.start_presence_tracking(listen=False)
+
+        hass.services.now = hass.bus.now = cycle.time
+        clock.set(max(cycle.time, clock.now()))
+        data = await coordinator._async_update_data()
+        await hass.async_drain()
+        result.cycles += 1
+        record_decisions(cycle.time, data)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def diff_results(
+    baseline: dict[str, Any], candidate: dict[str, Any]
+) -> list[str]:
+    """Describe where two serialized replay results diverge."""
+    differences: list[str] = []
+    for key in ("decisions", "service_calls"):
+        old, new = baseline.get(key, []), candidate.get(key, [])
+        for index, (a, b) in enumerate(zip(old, new)):
+            if a != b:
+                differences.append(
+                    f"{key}[{index}] differs at {b.get('time')}: {a} != {b}"
+                )
+                break
+        if len(old) != len(new):
+            differences.append(f"{key}: {len(old)} in baseline, {len(new)} now")
+    return differences
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point; returns 1 if the baseline differs."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", help="Path to a *.jsonl.gz input recording")
+    parser.add_argument("--output", help="Write the replay result as JSON")
+    parser.add_argument("--baseline", help="Compare against a previous result")
+    parser.add_argument(
+        "--mode", choices=OPERATION_MODES, default=OPERATION_MODE_ACTIVE
+    )
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(
+        async_replay(read_recording(args.recording), operation_mode=args.mode)
+    )
+    serialized = json.loads(json.dumps(result.to_dict(), default=str))
+    print(
+        f"{result.cycles} cycles in {result.elapsed:.2f}s "
+        f"({result.cycles_per_second:,.0f} cycles/s), "
+        f"{len(result.decisions)} decision changes, "
+        f"{len(result.service_calls)} service calls"
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(serialized, handle, indent=1)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            differences = diff_results(json.load(handle), serialized)
+        for line in differences:
+            print(line)
+        return 1 if differences else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -21,6 +22,7 @@ from .const import (
     DOMAIN,
     ENTITY_PREFIX,
     SUGGESTION_PENDING,
+    SUGGESTION_STATUSES,
 )
 from .entity import SmartClimateEntity
 
@@ -81,6 +83,7 @@ async def async_setup_entry(
                 SmartClimateRuntimeSensor(coordinator, room_slug),
                 SmartClimateCyclesSensor(coordinator, room_slug),
                 SmartClimateActiveScheduleSensor(coordinator, room_slug),
+                SmartClimateTimeToTargetSensor(coordinator, room_slug),
             ]
         )
 
@@ -94,6 +97,8 @@ async def async_setup_entry(
             SmartClimateCDDSensor(coordinator),
             SmartClimateLastAnalysisSensor(coordinator),
             SmartClimateSuggestionCountSensor(coordinator),
+            SmartClimateAILatencySensor(coordinator),
+            SmartClimateAITokensSensor(coordinator),
             SmartClimateDailySummarySensor(coordinator),
             SmartClimateActiveHouseScheduleSensor(coordinator),
         ]
@@ -386,6 +391,82 @@ class SmartClimateActiveScheduleSensor(SmartClimateEntity, SensorEntity):
             return "none"
         return room_state.active_schedule or "none"
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the next planned schedule change."""
+        room_state = self.coordinator.data.get("rooms", {}).get(self._room_slug)
+        if room_state is None:
+            return {}
+        return {
+            "next_schedule": room_state.next_schedule,
+            "next_change": (
+                room_state.next_schedule_time.isoformat()
+                if room_state.next_schedule_time
+                else None
+            ),
+            "precondition_start": (
+                room_state.precondition_start.isoformat()
+                if room_state.precondition_start
+                else None
+            ),
+            "preconditioning": room_state.preconditioning,
+        }
+
+
+class SmartClimateTimeToTargetSensor(SmartClimateEntity, SensorEntity):
+    """Predicted minutes of HVAC for a room to reach its target."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_icon = "mdi:timer-sand"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, room_slug: str) -> None:
+        """Initialize the time-to-target sensor."""
+        super().__init__(
+            coordinator,
+            entity_key="time_to_target",
+            name="Time to Target",
+            room_slug=room_slug,
+        )
+
+    @property
+    def entity_id(self) -> str:
+        """Return the entity_id."""
+        return f"sensor.{ENTITY_PREFIX}_{self._room_slug}_time_to_target"
+
+    @entity_id.setter
+    def entity_id(self, value: str) -> None:
+        """Allow HA to set entity_id."""
+        self._attr_entity_id = value
+
+    @property
+    def native_value(self) -> float | None:
+        """Return predicted minutes, or None if unknown or unreachable."""
+        room_state = self.coordinator.data.get("rooms", {}).get(self._room_slug)
+        if room_state is None or room_state.time_to_target is None:
+            return None
+        if math.isinf(room_state.time_to_target):
+            return None
+        return round(room_state.time_to_target)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the learned thermal coefficients."""
+        room_state = self.coordinator.data.get("rooms", {}).get(self._room_slug)
+        if room_state is None:
+            return {}
+        return {
+            "target_reachable": (
+                None
+                if room_state.time_to_target is None
+                else not math.isinf(room_state.time_to_target)
+            ),
+            "heating_rate": room_state.heating_rate,
+            "cooling_rate": room_state.cooling_rate,
+            "loss_coefficient": room_state.loss_coefficient,
+        }
+
 
 # ===========================================================================
 # Whole-House Sensor Classes
@@ -603,10 +684,15 @@ class SmartClimateLastAnalysisSensor(SmartClimateEntity, SensorEntity):
 
 
 class SmartClimateSuggestionCountSensor(SmartClimateEntity, SensorEntity):
-    """Count of pending AI suggestions."""
+    """Count of pending AI suggestions.
+
+    Attributes carry only counts and ids; the full suggestions are served
+    by the ``smart_climate/suggestions`` websocket command.
+    """
 
     _attr_icon = "mdi:lightbulb-on-outline"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"pending_ids"})
 
     def __init__(self, coordinator) -> None:
         """Initialize the suggestion count sensor."""
@@ -632,11 +718,7 @@ class SmartClimateSuggestionCountSensor(SmartClimateEntity, SensorEntity):
         house_state = self.coordinator.data.get("house")
         if house_state is None:
             return 0
-        return sum(
-            1
-            for s in house_state.suggestions
-            if s.status == SUGGESTION_PENDING
-        )
+        return house_state.suggestions.count(SUGGESTION_PENDING)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -644,26 +726,125 @@ class SmartClimateSuggestionCountSensor(SmartClimateEntity, SensorEntity):
         house_state = self.coordinator.data.get("house")
         if house_state is None:
             return {}
-        pending = [
-            s for s in house_state.suggestions if s.status == SUGGESTION_PENDING
-        ]
+        suggestions = house_state.suggestions
         return {
-            "total_suggestions": len(house_state.suggestions),
-            "pending_titles": [s.title for s in pending],
-            "suggestions": [
+            "total_suggestions": len(suggestions),
+            "status_counts": {
+                status: suggestions.count(status) for status in SUGGESTION_STATUSES
+            },
+            "pending_ids": [s.id for s in suggestions.pending()],
+        }
+
+
+class SmartClimateAILatencySensor(SmartClimateEntity, SensorEntity):
+    """Total latency of the most recent AI provider call."""
+
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the AI latency sensor."""
+        super().__init__(
+            coordinator,
+            entity_key="ai_latency",
+            name="AI Latency",
+        )
+
+    @property
+    def entity_id(self) -> str:
+        """Return the entity_id."""
+        return f"sensor.{ENTITY_PREFIX}_ai_latency"
+
+    @entity_id.setter
+    def entity_id(self, value: str) -> None:
+        """Allow HA to set entity_id."""
+        self._attr_entity_id = value
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the latency of the last call in seconds."""
+        last = self.coordinator.ai_telemetry.last_call
+        if last is None:
+            return None
+        return round(last.latency, 2)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the last call's details and rolling statistics."""
+        telemetry = self.coordinator.ai_telemetry
+        last = telemetry.last_call
+        summary = telemetry.summary()
+        attrs: dict[str, Any] = {
+            "avg_latency": summary["avg_latency"],
+            "p95_latency": summary["p95_latency"],
+            "total_calls": summary["total_calls"],
+            "total_failures": summary["total_failures"],
+            "total_retries": summary["total_retries"],
+        }
+        if last is not None:
+            details = last.to_dict()
+            attrs.update(
                 {
-                    "id": s.id,
-                    "title": s.title,
-                    "description": s.description,
-                    "reasoning": s.reasoning,
-                    "confidence": s.confidence,
-                    "priority": s.priority,
-                    "status": s.status,
-                    "room": s.room,
-                    "action_type": s.action_type,
+                    key: details[key]
+                    for key in (
+                        "provider",
+                        "model",
+                        "success",
+                        "connect_time",
+                        "time_to_first_byte",
+                        "retries",
+                        "response_bytes",
+                        "model_warm",
+                    )
                 }
-                for s in house_state.suggestions
-            ],
+            )
+            attrs["last_call"] = details["timestamp"]
+        return attrs
+
+
+class SmartClimateAITokensSensor(SmartClimateEntity, SensorEntity):
+    """Cumulative prompt + completion tokens sent to AI providers."""
+
+    _attr_icon = "mdi:counter"
+    _attr_native_unit_of_measurement = "tokens"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the AI token usage sensor."""
+        super().__init__(
+            coordinator,
+            entity_key="ai_tokens",
+            name="AI Tokens Used",
+        )
+
+    @property
+    def entity_id(self) -> str:
+        """Return the entity_id."""
+        return f"sensor.{ENTITY_PREFIX}_ai_tokens"
+
+    @entity_id.setter
+    def entity_id(self, value: str) -> None:
+        """Allow HA to set entity_id."""
+        self._attr_entity_id = value
+
+    @property
+    def native_value(self) -> int:
+        """Return lifetime tokens used."""
+        return self.coordinator.ai_telemetry.total_tokens
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the prompt/completion split and last call usage."""
+        telemetry = self.coordinator.ai_telemetry
+        last = telemetry.last_call
+        return {
+            "prompt_tokens": telemetry.total_prompt_tokens,
+            "completion_tokens": telemetry.total_completion_tokens,
+            "avg_completion_tokens": telemetry.summary()["avg_completion_tokens"],
+            "last_prompt_tokens": last.prompt_tokens if last else None,
+            "last_completion_tokens": last.completion_tokens if last else None,
         }
 
 
@@ -671,6 +852,7 @@ class SmartClimateDailySummarySensor(SmartClimateEntity, SensorEntity):
     """AI-generated daily summary text."""
 
     _attr_icon = "mdi:text-box-outline"
+    _unrecorded_attributes = frozenset({"full_summary"})
 
     def __init__(self, coordinator) -> None:
         """Initialize the daily summary sensor."""
@@ -6,7 +6,7 @@ import logging
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
@@ -24,7 +24,6 @@ from .const import (
     SERVICE_SET_AUXILIARY_MODE,
     SERVICE_SET_ROOM_PRIORITY,
     SERVICE_TRIGGER_ANALYSIS,
-    SUGGESTION_PENDING,
 )
 from .models import Schedule, slugify
 
@@ -41,6 +40,7 @@ SCHEMA_TRIGGER_ANALYSIS = vol.Schema(
     {
         vol.Optional("scope", default="all"): vol.In(["all", "room"]),
         vol.Optional("room"): cv.string,
+        vol.Optional("cancel_running", default=False): cv.boolean,
     }
 )
 
@@ -134,18 +134,26 @@ def _get_coordinator(hass: HomeAssistant) -> SmartClimateCoordinator | None:
 # ---------------------------------------------------------------------------
 
 
-async def _handle_trigger_analysis(call: ServiceCall) -> None:
-    """Handle the trigger_analysis service call."""
+async def _handle_trigger_analysis(call: ServiceCall) -> ServiceResponse:
+    """Handle the trigger_analysis service call.
+
+    Returns once the analysis job is started or queued; the response
+    carries its job id for matching against progress events.
+    """
     coordinator = _get_coordinator(call.hass)
     if coordinator is None:
         _LOGGER.error("No Smart Climate coordinator found")
-        return
+        return None
 
     scope = call.data.get("scope", "all")
     room = call.data.get("room")
 
     _LOGGER.info("Service trigger_analysis called (scope=%s, room=%s)", scope, room)
-    await coordinator.async_trigger_analysis()
+    job_id = await coordinator.async_trigger_analysis(
+        trigger="service",
+        cancel_running=call.data.get("cancel_running", False),
+    )
+    return {"job_id": job_id}
 
 
 async def _handle_approve_suggestion(call: ServiceCall) -> None:
@@ -179,7 +187,7 @@ async def _handle_reject_suggestion(call: ServiceCall) -> None:
 
 async def _handle_approve_all_suggestions(call: ServiceCall) -> None:
     """Handle the approve_all_suggestions service call."""
-    from .ai.suggestions import approve_suggestion
+    from .ai.suggestions import approve_suggestions
 
     coordinator = _get_coordinator(call.hass)
     if coordinator is None:
@@ -195,11 +203,10 @@ async def _handle_approve_all_suggestions(call: ServiceCall) -> None:
         _LOGGER.warning("No house state available")
         return
 
-    pending = [s for s in house.suggestions if s.status == SUGGESTION_PENDING]
+    pending = house.suggestions.pending()
     _LOGGER.info("Service approve_all_suggestions called (%d pending)", len(pending))
 
-    for suggestion in pending:
-        await approve_suggestion(coordinator, suggestion.id)
+    await approve_suggestions(coordinator, [s.id for s in pending])
 
 
 async def _handle_reject_all_suggestions(call: ServiceCall) -> None:
@@ -220,7 +227,7 @@ async def _handle_reject_all_suggestions(call: ServiceCall) -> None:
         _LOGGER.warning("No house state available")
         return
 
-    pending = [s for s in house.suggestions if s.status == SUGGESTION_PENDING]
+    pending = house.suggestions.pending()
     _LOGGER.info("Service reject_all_suggestions called (%d pending)", len(pending))
 
     for suggestion in pending:
@@ -345,6 +352,7 @@ async def _handle_add_schedule(call: ServiceCall) -> None:
             break
 
     coordinator.schedules.append(schedule)
+    coordinator.replan_schedules()
     _LOGGER.info("Added schedule '%s' (slug=%s)", name, schedule.slug)
     await coordinator.async_request_refresh()
 
@@ -362,6 +370,7 @@ async def _handle_remove_schedule(call: ServiceCall) -> None:
     for schedule in coordinator.schedules:
         if schedule.slug == target_slug:
             coordinator.schedules.remove(schedule)
+            coordinator.replan_schedules()
             _LOGGER.info("Removed schedule '%s'", name)
             await coordinator.async_request_refresh()
             return
@@ -385,6 +394,7 @@ async def _handle_activate_schedule(call: ServiceCall) -> None:
             # Mark as a manual override so the schedule engine picks it up
             # regardless of its time window
             schedule._manual_override = True  # type: ignore[attr-defined]
+            coordinator.replan_schedules()
             _LOGGER.info("Manually activated schedule '%s'", name)
             await coordinator.async_request_refresh()
             return
@@ -408,6 +418,7 @@ async def _handle_deactivate_schedule(call: ServiceCall) -> None:
             if hasattr(schedule, "_manual_override"):
                 del schedule._manual_override  # type: ignore[attr-defined]
             schedule.enabled = False
+            coordinator.replan_schedules()
             _LOGGER.info("Deactivated schedule '%s'", name)
             await coordinator.async_request_refresh()
             return
@@ -468,6 +479,7 @@ async def async_setup_services(
         SERVICE_TRIGGER_ANALYSIS,
         _handle_trigger_analysis,
         schema=SCHEMA_TRIGGER_ANALYSIS,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
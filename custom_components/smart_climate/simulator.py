@@ -0,0 +1,539 @@
+"""RC thermal-model house simulator for benchmarking control policies.
+
+Each room is a first-order RC network coupled to the outdoor
+temperature::
+
+    dT/dt = (T_out - T) / tau + heat_input
+
+``heat_input`` (degrees per hour) comes from the room's share of its
+HVAC system, an auxiliary heater and occupant gains.  A system serves
+every room that shares its climate entity.  It is a bang-bang thermostat
+on the rooms' mean temperature, and its output is split between those
+rooms by their vent positions.  Heat input is held constant over a step,
+so each step is integrated exactly:
+``T' = T_eq + (T - T_eq) * exp(-dt / tau)``.
+
+The real ``SmartClimateCoordinator`` runs every step against the
+replay's in-memory state machine with a ``VirtualClock``.  Its vent,
+auxiliary and thermostat service calls feed back into the model, so
+follow-me, zone balancing and auxiliary logic can be compared over
+simulated months in seconds::
+
+    python -m custom_components.smart_climate.simulator --days 30 --rooms 6
+
+The physics is vectorised over rooms with NumPy when it is installed and
+falls back to plain Python otherwise; NumPy is not a requirement of the
+integration.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+from .clock import VirtualClock
+from .const import (
+    CONF_ENABLE_FOLLOW_ME,
+    CONF_ENABLE_ZONE_BALANCING,
+    CONF_OUTDOOR_TEMP_SENSOR,
+    CONF_RECORD_INPUTS,
+    CONF_ROOMS,
+    CONF_SCHEDULES,
+    CONF_TEMP_UNIT,
+    CONF_UPDATE_INTERVAL,
+    OPERATION_MODE_ACTIVE,
+)
+from .replay import ReplayResult, _NullStore, _ReplayHass
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+OUTDOOR_SENSOR = "sensor.sim_outdoor_temp"
+
+# Occupied rooms further than this from the setpoint count as discomfort.
+COMFORT_BAND = 1.0
+
+
+@dataclass
+class SimRoom:
+    """Thermal parameters and equipment of one simulated room.
+
+    Rates are in degrees per hour.
+    """
+
+    name: str
+    # Rooms with the same system share one climate entity.
+    system: str = "main"
+    # Envelope time constant R*C in hours.
+    tau_hours: float = 8.0
+    # Temperature change at full HVAC output with an average vent share.
+    hvac_rate: float = 4.0
+    aux_rate: float = 3.0
+    occupant_gain: float = 0.3
+    # Daily occupied periods as (start hour, end hour).
+    occupied_hours: Sequence[tuple[float, float]] = ((17.0, 23.0),)
+    priority: int = 5
+    has_vent: bool = True
+    has_auxiliary: bool = True
+    initial_temp: float = 66.0
+
+    @property
+    def slug(self) -> str:
+        """Return the room slug."""
+        return self.name.lower().replace(" ", "_")
+
+    def is_occupied(self, hour: float) -> bool:
+        """Return True if the room is occupied at ``hour`` of the day."""
+        for start, end in self.occupied_hours:
+            if start <= end and start <= hour < end:
+                return True
+            if start > end and (hour >= start or hour < end):
+                return True
+        return False
+
+
+@dataclass
+class SimHouse:
+    """A simulated house and its weather."""
+
+    rooms: list[SimRoom]
+    setpoint: float = 68.0
+    # "heat" or "cool"; auxiliary devices condition in the same direction.
+    hvac_mode: str = "heat"
+    # Thermostat deadband either side of the setpoint.
+    hysteresis: float = 0.5
+    outdoor_mean: float = 35.0
+    outdoor_swing: float = 10.0
+    # Standard deviation of slow random outdoor drift.
+    outdoor_noise: float = 2.0
+    seed: int = 0
+
+
+def default_house(room_count: int = 4, seed: int = 0) -> SimHouse:
+    """Build a varied house with two rooms per HVAC system."""
+    rng = random.Random(seed)
+    patterns = (((6.5, 8.5), (17.0, 23.0)), ((9.0, 17.0),), ((21.0, 7.0),), ((12.0, 14.0), (18.0, 20.0)))
+    rooms = [
+        SimRoom(
+            name=f"Room {index + 1}",
+            system=f"system_{index // 2 + 1}",
+            tau_hours=rng.uniform(5.0, 12.0),
+            hvac_rate=rng.uniform(3.0, 6.0),
+            aux_rate=rng.uniform(2.0, 4.0),
+            occupied_hours=patterns[index % len(patterns)],
+            priority=rng.randint(3, 9),
+            has_vent=index % 3 != 2,
+            initial_temp=rng.uniform(64.0, 68.0),
+        )
+        for index in range(room_count)
+    ]
+    return SimHouse(rooms=rooms, seed=seed)
+
+
+def house_config(house: SimHouse, interval: int) -> dict[str, Any]:
+    """Return config entry data wiring the coordinator to the simulation."""
+    rooms = []
+    for room in house.rooms:
+        rooms.append(
+            {
+                "room_name": room.name,
+                "room_slug": room.slug,
+                "climate_entity": f"climate.{room.system}",
+                "temp_sensors": [f"sensor.sim_{room.slug}_temp"],
+                "humidity_sensors": [],
+                "presence_sensors": [f"binary_sensor.sim_{room.slug}_occupancy"],
+                "door_window_sensors": [],
+                "vent_entities": [f"cover.sim_{room.slug}_vent"] if room.has_vent else [],
+                "auxiliary_entities": (
+                    [f"switch.sim_{room.slug}_heater"] if room.has_auxiliary else []
+                ),
+                "room_priority": room.priority,
+            }
+        )
+    return {
+        CONF_TEMP_UNIT: "F",
+        CONF_UPDATE_INTERVAL: interval,
+        CONF_ENABLE_FOLLOW_ME: True,
+        CONF_ENABLE_ZONE_BALANCING: True,
+        CONF_OUTDOOR_TEMP_SENSOR: OUTDOOR_SENSOR,
+        CONF_ROOMS: rooms,
+        CONF_SCHEDULES: [],
+    }
+
+
+class ThermalModel:
+    """Room temperatures and equipment state, stepped in bulk."""
+
+    def __init__(self, house: SimHouse) -> None:
+        rooms = house.rooms
+        self.count = len(rooms)
+        self.systems = sorted({room.system for room in rooms})
+        self.system_of = [self.systems.index(room.system) for room in rooms]
+        self.sign = -1.0 if house.hvac_mode == "cool" else 1.0
+        self.hysteresis = house.hysteresis
+        self.setpoints = [house.setpoint] * len(self.systems)
+        self.system_on = [False] * len(self.systems)
+
+        self.tau = [room.tau_hours for room in rooms]
+        self.hvac_rate = [room.hvac_rate for room in rooms]
+        self.aux_rate = [room.aux_rate for room in rooms]
+        self.gain = [room.occupant_gain for room in rooms]
+        self.temps = [room.initial_temp for room in rooms]
+        self.vents = [1.0] * self.count
+        self.aux_on = [False] * self.count
+        self.occupied = [False] * self.count
+        if np is not None:
+            self.system_of = np.array(self.system_of)
+            self.tau = np.array(self.tau)
+            self.hvac_rate = np.array(self.hvac_rate)
+            self.aux_rate = np.array(self.aux_rate)
+            self.gain = np.array(self.gain)
+            self.temps = np.array(self.temps)
+            self.vents = np.ones(self.count)
+
+    def system_temperatures(self) -> list[float]:
+        """Return the mean temperature of each system's rooms."""
+        totals = [0.0] * len(self.systems)
+        counts = [0] * len(self.systems)
+        for index in range(self.count):
+            system = int(self.system_of[index])
+            totals[system] += float(self.temps[index])
+            counts[system] += 1
+        return [total / count for total, count in zip(totals, counts)]
+
+    def update_thermostats(self) -> None:
+        """Switch each system on or off around its setpoint."""
+        for system, temp in enumerate(self.system_temperatures()):
+            error = (self.setpoints[system] - temp) * self.sign
+            if error > self.hysteresis:
+                self.system_on[system] = True
+            elif error < -self.hysteresis:
+                self.system_on[system] = False
+
+    def step(self, dt_hours: float, outdoor: float) -> None:
+        """Advance every room by ``dt_hours`` at a fixed outdoor temperature."""
+        if np is not None:
+            self._step_numpy(dt_hours, outdoor)
+        else:
+            self._step_python(dt_hours, outdoor)
+
+    def _step_numpy(self, dt_hours: float, outdoor: float) -> None:
+        on = np.array(self.system_on, dtype=float)[self.system_of]
+        vents = self.vents
+        group_total = np.bincount(self.system_of, weights=vents, minlength=len(self.systems))
+        group_size = np.bincount(self.system_of, minlength=len(self.systems))
+        # Closing dampers pushes the same airflow to the open ones.
+        share = vents * group_size[self.system_of] / np.maximum(group_total[self.system_of], 1e-9)
+        heat = (
+            self.sign * (self.hvac_rate * share * on + self.aux_rate * np.array(self.aux_on))
+            + self.gain * np.array(self.occupied)
+        )
+        equilibrium = outdoor + self.tau * heat
+        self.temps = equilibrium + (self.temps - equilibrium) * np.exp(-dt_hours / self.tau)
+
+    def _step_python(self, dt_hours: float, outdoor: float) -> None:
+        group_total = [0.0] * len(self.systems)
+        group_size = [0] * len(self.systems)
+        for index in range(self.count):
+            group_total[self.system_of[index]] += self.vents[index]
+            group_size[self.system_of[index]] += 1
+        for index in range(self.count):
+            system = self.system_of[index]
+            share = self.vents[index] * group_size[system] / max(group_total[system], 1e-9)
+            heat = self.sign * (
+                self.hvac_rate[index] * share * self.system_on[system]
+                + self.aux_rate[index] * self.aux_on[index]
+            ) + self.gain[index] * self.occupied[index]
+            equilibrium = outdoor + self.tau[index] * heat
+            decay = math.exp(-dt_hours / self.tau[index])
+            self.temps[index] = equilibrium + (self.temps[index] - equilibrium) * decay
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of a simulation run."""
+
+    days: float = 0.0
+    cycles: int = 0
+    elapsed: float = 0.0
+    rooms: dict[str, dict[str, float]] = field(default_factory=dict)
+    systems: dict[str, dict[str, float]] = field(default_factory=dict)
+    service_calls: dict[str, int] = field(default_factory=dict)
+    events: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def cycles_per_second(self) -> float:
+        """Return simulation throughput."""
+        return self.cycles / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def discomfort_degree_hours(self) -> float:
+        """Return occupied degree-hours outside the comfort band, all rooms."""
+        return sum(room["discomfort_degree_hours"] for room in self.rooms.values())
+
+    @property
+    def hvac_hours(self) -> float:
+        """Return total HVAC runtime across systems."""
+        return sum(system["runtime_hours"] for system in self.systems.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "days": self.days,
+            "cycles": self.cycles,
+            "elapsed": round(self.elapsed, 3),
+            "discomfort_degree_hours": round(self.discomfort_degree_hours, 2),
+            "hvac_hours": round(self.hvac_hours, 2),
+            "rooms": self.rooms,
+            "systems": self.systems,
+            "service_calls": self.service_calls,
+            "events": self.events,
+        }
+
+
+class HouseSimulator:
+    """Run the coordinator against a simulated house."""
+
+    def __init__(
+        self,
+        house: SimHouse,
+        start: datetime | None = None,
+        interval: int = 60,
+        config: dict[str, Any] | None = None,
+        operation_mode: str = OPERATION_MODE_ACTIVE,
+    ) -> None:
+        from .coordinator import SmartClimateCoordinator
+
+        self.house = house
+        self.interval = interval
+        self.model = ThermalModel(house)
+        self._rng = random.Random(house.seed)
+        self._drift = 0.0
+        self._capture = ReplayResult()
+        self.hass = _ReplayHass(self._capture)
+
+        data = house_config(house, interval)
+        data.update(config or {})
+        data[CONF_RECORD_INPUTS] = False
+        entry = SimpleNamespace(entry_id="simulation", data=data, options={}, title="Simulation")
+        self.coordinator = SmartClimateCoordinator(self.hass, entry)
+        self.coordinator.clock = self.clock = VirtualClock(
+            start or datetime(2024, 1, 1)
+        )
+        self.coordinator._store = _NullStore()
+        self.coordinator.operation_mode = operation_mode
+
+        self._index: dict[str, int] = {}
+        for index, room in enumerate(house.rooms):
+            self._index[f"cover.sim_{room.slug}_vent"] = index
+            self._index[f"switch.sim_{room.slug}_heater"] = index
+
+    def outdoor_temperature(self, now: datetime) -> float:
+        """Return the outdoor temperature: a daily cycle plus slow drift."""
+        hour = now.hour + now.minute / 60
+        # Coldest around 05:00, warmest around 17:00.
+        daily = -math.cos((hour - 5.0) / 24 * 2 * math.pi)
+        return self.house.outdoor_mean + self.house.outdoor_swing * daily + self._drift
+
+    async def async_run(self, days: float) -> SimulationResult:
+        """Simulate ``days`` of operation and return the outcome."""
+        model = self.model
+        rooms = self.house.rooms
+        dt_hours = self.interval / 3600
+        steps = int(days * 24 / dt_hours)
+        noise = self.house.outdoor_noise * math.sqrt(dt_hours / 24)
+
+        occupied_hours = [0.0] * model.count
+        deviation = [0.0] * model.count
+        discomfort = [0.0] * model.count
+        aux_hours = [0.0] * model.count
+        temp_sum = [0.0] * model.count
+        runtime = [0.0] * len(model.systems)
+        calls: Counter[str] = Counter()
+        events: Counter[str] = Counter()
+
+        started = time.perf_counter()
+        for _ in range(steps):
+            now = self.clock.now()
+            hour = now.hour + now.minute / 60
+            outdoor = self.outdoor_temperature(now)
+            model.occupied = [room.is_occupied(hour) for room in rooms]
+            model.update_thermostats()
+            self._publish(outdoor)
+
+            # Publish the refresh like DataUpdateCoordinator would.
+            self.coordinator.data = await self.coordinator._async_update_data()
+            self.coordinator.async_update_listeners()
+            await self.hass.async_drain()
+            for call in self._capture.service_calls:
+                calls[call["service"]] += 1
+                self._apply(call["service"], call["data"])
+            for event in self._capture.events:
+                events[event["event"]] += 1
+            self._capture.service_calls.clear()
+            self._capture.events.clear()
+
+            for index in range(model.count):
+                temp = float(model.temps[index])
+                temp_sum[index] += temp
+                if model.aux_on[index]:
+                    aux_hours[index] += dt_hours
+                if model.occupied[index]:
+                    off = abs(temp - model.setpoints[int(model.system_of[index])])
+                    occupied_hours[index] += dt_hours
+                    deviation[index] += off * dt_hours
+                    discomfort[index] += max(0.0, off - COMFORT_BAND) * dt_hours
+            for system, on in enumerate(model.system_on):
+                if on:
+                    runtime[system] += dt_hours
+
+            model.step(dt_hours, outdoor)
+            self._drift += self._rng.gauss(0.0, noise)
+            self.clock.advance(self.interval)
+
+        result = SimulationResult(
+            days=days,
+            cycles=steps,
+            elapsed=time.perf_counter() - started,
+            service_calls=dict(calls),
+            events=dict(events),
+        )
+        for index, room in enumerate(rooms):
+            result.rooms[room.slug] = {
+                "mean_temp": round(temp_sum[index] / max(steps, 1), 2),
+                "occupied_hours": round(occupied_hours[index], 2),
+                "mean_occupied_deviation": round(
+                    deviation[index] / occupied_hours[index], 2
+                )
+                if occupied_hours[index]
+                else 0.0,
+                "discomfort_degree_hours": round(discomfort[index], 2),
+                "aux_hours": round(aux_hours[index], 2),
+            }
+        for system, name in enumerate(model.systems):
+            result.systems[name] = {"runtime_hours": round(runtime[system], 2)}
+        return result
+
+    def _publish(self, outdoor: float) -> None:
+        """Write the model into the state machine the coordinator reads."""
+        model = self.model
+        changes: dict[str, Any] = {OUTDOOR_SENSOR: [f"{outdoor:.1f}", {}]}
+        action = "cooling" if model.sign < 0 else "heating"
+        for system, name in enumerate(model.systems):
+            changes[f"climate.{name}"] = [
+                self.house.hvac_mode,
+                {
+                    "temperature": model.setpoints[system],
+                    "hvac_action": action if model.system_on[system] else "idle",
+                },
+            ]
+        for index, room in enumerate(self.house.rooms):
+            slug = room.slug
+            changes[f"sensor.sim_{slug}_temp"] = [f"{float(model.temps[index]):.1f}", {}]
+            changes[f"binary_sensor.sim_{slug}_occupancy"] = [
+                "on" if model.occupied[index] else "off",
+                {},
+            ]
+            if room.has_vent:
+                position = round(float(model.vents[index]) * 100)
+                changes[f"cover.sim_{slug}_vent"] = ["open", {"current_position": position}]
+            if room.has_auxiliary:
+                changes[f"switch.sim_{slug}_heater"] = [
+                    "on" if model.aux_on[index] else "off",
+                    {},
+                ]
+        self.hass.states.apply(changes)
+
+    def _apply(self, service: str, data: dict[str, Any]) -> None:
+        """Feed a captured service call back into the model."""
+        entity_ids = data.get("entity_id", [])
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        model = self.model
+        for entity_id in entity_ids:
+            if service == "climate.set_temperature" and "temperature" in data:
+                name = entity_id.split(".", 1)[1]
+                if name in model.systems:
+                    model.setpoints[model.systems.index(name)] = float(data["temperature"])
+                continue
+            index = self._index.get(entity_id)
+            if index is None:
+                continue
+            if service == "cover.set_cover_position":
+                model.vents[index] = max(0.0, min(100.0, float(data["position"]))) / 100
+            elif service == "switch.turn_on":
+                model.aux_on[index] = True
+            elif service == "switch.turn_off":
+                model.aux_on[index] = False
+
+
+async def async_simulate(
+    house: SimHouse,
+    days: float,
+    interval: int = 60,
+    config: dict[str, Any] | None = None,
+    start: datetime | None = None,
+) -> SimulationResult:
+    """Simulate ``house`` for ``days`` with optional config overrides."""
+    simulator = HouseSimulator(house, start=start, interval=interval, config=config)
+    return await simulator.async_run(days)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=float, default=30.0)
+    parser.add_argument("--rooms", type=int, default=4)
+    parser.add_argument("--interval", type=int, default=60, help="Seconds per cycle")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="KEY=JSON",
+        help="Override a config entry option, e.g. enable_zone_balancing=false",
+    )
+    parser.add_argument("--output", help="Write the result as JSON")
+    args = parser.parse_args(argv)
+
+    overrides = {}
+    for item in args.set:
+        key, _, value = item.partition("=")
+        overrides[key] = json.loads(value)
+
+    house = default_house(args.rooms, seed=args.seed)
+    result = asyncio.run(
+        async_simulate(house, args.days, interval=args.interval, config=overrides)
+    )
+    print(
+        f"{result.days:g} days, {result.cycles} cycles in {result.elapsed:.2f}s "
+        f"({result.cycles_per_second:,.0f} cycles/s, "
+        f"{'NumPy' if np is not None else 'pure Python'} physics)"
+    )
+    print(
+        f"discomfort {result.discomfort_degree_hours:.1f} degree-hours, "
+        f"HVAC {result.hvac_hours:.1f} h"
+    )
+    for slug, room in result.rooms.items():
+        print(f"  {slug:<12} {room}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(result.to_dict(), handle, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
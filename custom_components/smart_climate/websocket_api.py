@@ -0,0 +1,174 @@
+"""Websocket commands for Smart Climate.
+
+Suggestion text is kept out of entity attributes so the recorder doesn't
+store it on every change; the card fetches it here a page at a time.  The
+card renders from the snapshot-and-delta subscription (see feed.py)
+rather than from entity states.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    DOMAIN,
+    SUGGESTION_STATUSES,
+    WS_SUGGESTIONS_DEFAULT_LIMIT,
+    WS_SUGGESTIONS_MAX_LIMIT,
+    WS_TYPE_SUBSCRIBE,
+    WS_TYPE_SUGGESTIONS,
+)
+from .models import Suggestion, SuggestionStore
+
+if TYPE_CHECKING:
+    from .coordinator import SmartClimateCoordinator
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, websocket_list_suggestions)
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+def _get_coordinator(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> SmartClimateCoordinator | None:
+    """Return the coordinator, or send an error and return None."""
+    coordinators = hass.data.get(DOMAIN)
+    if not coordinators:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Smart Climate is not set up"
+        )
+        return None
+    return next(iter(coordinators.values()))
+
+
+def filter_suggestions(
+    store: SuggestionStore,
+    status: str | None = None,
+    room: str | None = None,
+) -> list[Suggestion]:
+    """Return suggestions matching ``status`` and ``room``, oldest first."""
+    if status is not None:
+        suggestions = store.with_status(status)
+        if room is not None:
+            suggestions = [s for s in suggestions if s.room == room]
+        return suggestions
+    if room is not None:
+        return store.for_room(room)
+    return list(store)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUGGESTIONS,
+        vol.Optional("status"): vol.In(SUGGESTION_STATUSES),
+        vol.Optional("room"): cv.string,
+        vol.Optional("offset", default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional("limit", default=WS_SUGGESTIONS_DEFAULT_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=WS_SUGGESTIONS_MAX_LIMIT)
+        ),
+    }
+)
+@callback
+def websocket_list_suggestions(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return one page of stored suggestions with their full text."""
+    coordinator = _get_coordinator(hass, connection, msg)
+    if coordinator is None:
+        return
+
+    store = coordinator.data["house"].suggestions
+    matches = filter_suggestions(store, msg.get("status"), msg.get("room"))
+    offset, limit = msg["offset"], msg["limit"]
+    connection.send_result(
+        msg["id"],
+        {
+            "suggestions": [s.to_dict() for s in matches[offset : offset + limit]],
+            "total": len(matches),
+            "offset": offset,
+            "limit": limit,
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUBSCRIBE,
+        vol.Optional("feed_id"): cv.string,
+        vol.Optional("since_version"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to the state feed: a snapshot, then deltas as it changes.
+
+    Events are ``{"type": "snapshot", "feed_id", "version", "data"}`` and
+    ``{"type": "delta", "version", "changes"}``, each delta one version on
+    from the last.  A client that sees a gap resubscribes with the
+    ``feed_id`` and ``since_version`` it last applied and is replayed the
+    missed deltas, or sent a fresh snapshot if they are no longer held.
+    When the config entry unloads (e.g. reloads after an options change)
+    the subscription ends with a ``{"type": "closed"}`` event and the
+    client should subscribe again.
+    """
+    coordinator = _get_coordinator(hass, connection, msg)
+    if coordinator is None:
+        return
+    feed = coordinator.feed
+
+    @callback
+    def send_delta(version: int, changes: dict[str, Any]) -> None:
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"], {"type": "delta", "version": version, "changes": changes}
+            )
+        )
+
+    @callback
+    def send_closed() -> None:
+        connection.subscriptions.pop(msg["id"], None)
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"type": "closed"})
+        )
+
+    connection.subscriptions[msg["id"]] = feed.async_subscribe(
+        send_delta, send_closed
+    )
+    connection.send_result(msg["id"])
+
+    missed = None
+    if msg.get("feed_id") == feed.feed_id and "since_version" in msg:
+        missed = feed.deltas_since(msg["since_version"])
+    if missed is None:
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"],
+                {
+                    "type": "snapshot",
+                    "feed_id": feed.feed_id,
+                    "version": feed.version,
+                    "data": feed.snapshot,
+                },
+            )
+        )
+        return
+    for version, changes in missed:
+        send_delta(version, changes)
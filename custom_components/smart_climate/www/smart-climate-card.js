@@ -1,90 +1,11 @@
-var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=arguments.length,o=r<3?e:null===a?a=Object.getOwnPropertyDescriptor(e,s):a;if("object"==typeof Reflect&&"function"==typeof Reflect.decorate)o=Reflect.decorate(t,e,s,a);else for(var n=t.length-1;n>=0;n--)(i=t[n])&&(o=(r<3?i(o):r>3?i(e,s,o):i(e,s))||o);return r>3&&o&&Object.defineProperty(e,s,o),o}"function"==typeof SuppressedError&&SuppressedError;const s=globalThis,a=s.ShadowRoot&&(void 0===s.ShadyCSS||s.ShadyCSS.nativeShadow)&&"adoptedStyleSheets"in Document.prototype&&"replace"in CSSStyleSheet.prototype,i=Symbol(),r=new WeakMap;let o=class{constructor(t,e,s){if(this._$cssResult$=!0,s!==i)throw Error("CSSResult is not constructable. Use `unsafeCSS` or `css` instead.");this.cssText=t,this.t=e}get styleSheet(){let t=this.o;const e=this.t;if(a&&void 0===t){const s=void 0!==e&&1===e.length;s&&(t=r.get(e)),void 0===t&&((this.o=t=new CSSStyleSheet).replaceSync(this.cssText),s&&r.set(e,t))}return t}toString(){return this.cssText}};const n=(t,...e)=>{const s=1===t.length?t[0]:e.reduce((e,s,a)=>e+(t=>{if(!0===t._$cssResult$)return t.cssText;if("number"==typeof t)return t;throw Error("Value passed to 'css' function must be a 'css' function result: "+t+". Use 'unsafeCSS' to pass non-literal values, but take care to ensure page security.")})(s)+t[a+1],t[0]);return new o(s,t,i)},c=a?t=>t:t=>t instanceof CSSStyleSheet?(t=>{let e="";for(const s of t.cssRules)e+=s.cssText;return(t=>new o("string"==typeof t?t:t+"",void 0,i))(e)})(t):t,{is:l,defineProperty:d,getOwnPropertyDescriptor:p,getOwnPropertyNames:h,getOwnPropertySymbols:u,getPrototypeOf:v}=Object,m=globalThis,g=m.trustedTypes,f=g?g.emptyScript:"",b=m.reactiveElementPolyfillSupport,y=(t,e)=>t,x={toAttribute(t,e){switch(e){case Boolean:t=t?f:null;break;case Object:case Array:t=null==t?t:JSON.stringify(t)}return t},fromAttribute(t,e){let s=t;switch(e){case Boolean:s=null!==t;break;case Number:s=null===t?null:Number(t);break;case Object:case Array:try{s=JSON.parse(t)}catch(t){s=null}}return s}},_=(t,e)=>!l(t,e),$={attribute:!0,type:String,converter:x,reflect:!1,useDefault:!1,hasChanged:_};Symbol.metadata??=Symbol("metadata"),m.litPropertyMetadata??=new WeakMap;let w=class extends HTMLElement{static addInitializer(t){this._$Ei(),(this.l??=[]).push(t)}static get observedAttributes(){return this.finalize(),this._$Eh&&[...this._$Eh.keys()]}static createProperty(t,e=$){if(e.state&&(e.attribute=!1),this._$Ei(),this.prototype.hasOwnProperty(t)&&((e=Object.create(e)).wrapped=!0),this.elementProperties.set(t,e),!e.noAccessor){const s=Symbol(),a=this.getPropertyDescriptor(t,s,e);void 0!==a&&d(this.prototype,t,a)}}static getPropertyDescriptor(t,e,s){const{get:a,set:i}=p(this.prototype,t)??{get(){return this[e]},set(t){this[e]=t}};return{get:a,set(e){const r=a?.call(this);i?.call(this,e),this.requestUpdate(t,r,s)},configurable:!0,enumerable:!0}}static getPropertyOptions(t){return this.elementProperties.get(t)??$}static _$Ei(){if(this.hasOwnProperty(y("elementProperties")))return;const t=v(this);t.finalize(),void 0!==t.l&&(this.l=[...t.l]),this.elementProperties=new Map(t.elementProperties)}static finalize(){if(this.hasOwnProperty(y("finalized")))return;if(this.finalized=!0,this._$Ei(),this.hasOwnProperty(y("properties"))){const t=this.properties,e=[...h(t),...u(t)];for(const s of e)this.createProperty(s,t[s])}const t=this[Symbol.metadata];if(null!==t){const e=litPropertyMetadata.get(t);if(void 0!==e)for(const[t,s]of e)this.elementProperties.set(t,s)}this._$Eh=new Map;for(const[t,e]of this.elementProperties){const s=this._$Eu(t,e);void 0!==s&&this._$Eh.set(s,t)}this.elementStyles=this.finalizeStyles(this.styles)}static finalizeStyles(t){const e=[];if(Array.isArray(t)){const s=new Set(t.flat(1/0).reverse());for(const t of s)e.unshift(c(t))}else void 0!==t&&e.push(c(t));return e}static _$Eu(t,e){const s=e.attribute;return!1===s?void 0:"string"==typeof s?s:"string"==typeof t?t.toLowerCase():void 0}constructor(){super(),this._$Ep=void 0,this.isUpdatePending=!1,this.hasUpdated=!1,this._$Em=null,this._$Ev()}_$Ev(){this._$ES=new Promise(t=>this.enableUpdating=t),this._$AL=new Map,this._$E_(),this.requestUpdate(),this.constructor.l?.forEach(t=>t(this))}addController(t){(this._$EO??=new Set).add(t),void 0!==this.renderRoot&&this.isConnected&&t.hostConnected?.()}removeController(t){this._$EO?.delete(t)}_$E_(){const t=new Map,e=this.constructor.elementProperties;for(const s of e.keys())this.hasOwnProperty(s)&&(t.set(s,this[s]),delete this[s]);t.size>0&&(this._$Ep=t)}createRenderRoot(){const t=this.shadowRoot??this.attachShadow(this.constructor.shadowRootOptions);return((t,e)=>{if(a)t.adoptedStyleSheets=e.map(t=>t instanceof CSSStyleSheet?t:t.styleSheet);else for(const a of e){const e=document.createElement("style"),i=s.litNonce;void 0!==i&&e.setAttribute("nonce",i),e.textContent=a.cssText,t.appendChild(e)}})(t,this.constructor.elementStyles),t}connectedCallback(){this.renderRoot??=this.createRenderRoot(),this.enableUpdating(!0),this._$EO?.forEach(t=>t.hostConnected?.())}enableUpdating(t){}disconnectedCallback(){this._$EO?.forEach(t=>t.hostDisconnected?.())}attributeChangedCallback(t,e,s){this._$AK(t,s)}_$ET(t,e){const s=this.constructor.elementProperties.get(t),a=this.constructor._$Eu(t,s);if(void 0!==a&&!0===s.reflect){const i=(void 0!==s.converter?.toAttribute?s.converter:x).toAttribute(e,s.type);this._$Em=t,null==i?this.removeAttribute(a):this.setAttribute(a,i),this._$Em=null}}_$AK(t,e){const s=this.constructor,a=s._$Eh.get(t);if(void 0!==a&&this._$Em!==a){const t=s.getPropertyOptions(a),i="function"==typeof t.converter?{fromAttribute:t.converter}:void 0!==t.converter?.fromAttribute?t.converter:x;this._$Em=a;const r=i.fromAttribute(e,t.type);this[a]=r??this._$Ej?.get(a)??r,this._$Em=null}}requestUpdate(t,e,s,a=!1,i){if(void 0!==t){const r=this.constructor;if(!1===a&&(i=this[t]),s??=r.getPropertyOptions(t),!((s.hasChanged??_)(i,e)||s.useDefault&&s.reflect&&i===this._$Ej?.get(t)&&!this.hasAttribute(r._$Eu(t,s))))return;this.C(t,e,s)}!1===this.isUpdatePending&&(this._$ES=this._$EP())}C(t,e,{useDefault:s,reflect:a,wrapped:i},r){s&&!(this._$Ej??=new Map).has(t)&&(this._$Ej.set(t,r??e??this[t]),!0!==i||void 0!==r)||(this._$AL.has(t)||(this.hasUpdated||s||(e=void 0),this._$AL.set(t,e)),!0===a&&this._$Em!==t&&(this._$Eq??=new Set).add(t))}async _$EP(){this.isUpdatePending=!0;try{await this._$ES}catch(t){Promise.reject(t)}const t=this.scheduleUpdate();return null!=t&&await t,!this.isUpdatePending}scheduleUpdate(){return this.performUpdate()}performUpdate(){if(!this.isUpdatePending)return;if(!this.hasUpdated){if(this.renderRoot??=this.createRenderRoot(),this._$Ep){for(const[t,e]of this._$Ep)this[t]=e;this._$Ep=void 0}const t=this.constructor.elementProperties;if(t.size>0)for(const[e,s]of t){const{wrapped:t}=s,a=this[e];!0!==t||this._$AL.has(e)||void 0===a||this.C(e,void 0,s,a)}}let t=!1;const e=this._$AL;try{t=this.shouldUpdate(e),t?(this.willUpdate(e),this._$EO?.forEach(t=>t.hostUpdate?.()),this.update(e)):this._$EM()}catch(e){throw t=!1,this._$EM(),e}t&&this._$AE(e)}willUpdate(t){}_$AE(t){this._$EO?.forEach(t=>t.hostUpdated?.()),this.hasUpdated||(this.hasUpdated=!0,this.firstUpdated(t)),this.updated(t)}_$EM(){this._$AL=new Map,this.isUpdatePending=!1}get updateComplete(){return this.getUpdateComplete()}getUpdateComplete(){return this._$ES}shouldUpdate(t){return!0}update(t){this._$Eq&&=this._$Eq.forEach(t=>this._$ET(t,this[t])),this._$EM()}updated(t){}firstUpdated(t){}};w.elementStyles=[],w.shadowRootOptions={mode:"open"},w[y("elementProperties")]=new Map,w[y("finalized")]=new Map,b?.({ReactiveElement:w}),(m.reactiveElementVersions??=[]).push("2.1.2");const k=globalThis,S=t=>t,A=k.trustedTypes,C=A?A.createPolicy("lit-html",{createHTML:t=>t}):void 0,E="$lit$",z=`lit$${Math.random().toFixed(9).slice(2)}$`,N="?"+z,M=`<${N}>`,P=document,T=()=>P.createComment(""),O=t=>null===t||"object"!=typeof t&&"function"!=typeof t,H=Array.isArray,U="[ \t\n\f\r]",R=/<(?:(!--|\/[^a-zA-Z])|(\/?[a-zA-Z][^>\s]*)|(\/?$))/g,j=/-->/g,D=/>/g,B=RegExp(`>|${U}(?:([^\\s"'>=/]+)(${U}*=${U}*(?:[^ \t\n\f\r"'\`<>=]|("|')|))|$)`,"g"),F=/'/g,L=/"/g,V=/^(?:script|style|textarea|title)$/i,I=t=>(e,...s)=>({_$litType$:t,strings:e,values:s}),q=I(1),W=I(2),G=Symbol.for("lit-noChange"),Y=Symbol.for("lit-nothing"),J=new WeakMap,K=P.createTreeWalker(P,129);function Z(t,e){if(!H(t)||!t.hasOwnProperty("raw"))throw Error("invalid template strings array");return void 0!==C?C.createHTML(e):e}const Q=(t,e)=>{const s=t.length-1,a=[];let i,r=2===e?"<svg>":3===e?"<math>":"",o=R;for(let e=0;e<s;e++){const s=t[e];let n,c,l=-1,d=0;for(;d<s.length&&(o.lastIndex=d,c=o.exec(s),null!==c);)d=o.lastIndex,o===R?"!--"===c[1]?o=j:void 0!==c[1]?o=D:void 0!==c[2]?(V.test(c[2])&&(i=RegExp("</"+c[2],"g")),o=B):void 0!==c[3]&&(o=B):o===B?">"===c[0]?(o=i??R,l=-1):void 0===c[1]?l=-2:(l=o.lastIndex-c[2].length,n=c[1],o=void 0===c[3]?B:'"'===c[3]?L:F):o===L||o===F?o=B:o===j||o===D?o=R:(o=B,i=void 0);const p=o===B&&t[e+1].startsWith("/>")?" ":"";r+=o===R?s+M:l>=0?(a.push(n),s.slice(0,l)+E+s.slice(l)+z+p):s+z+(-2===l?e:p)}return[Z(t,r+(t[s]||"<?>")+(2===e?"</svg>":3===e?"</math>":"")),a]};class X{constructor({strings:t,_$litType$:e},s){let a;this.parts=[];let i=0,r=0;const o=t.length-1,n=this.parts,[c,l]=Q(t,e);if(this.el=X.createElement(c,s),K.currentNode=this.el.content,2===e||3===e){const t=this.el.content.firstChild;t.replaceWith(...t.childNodes)}for(;null!==(a=K.nextNode())&&n.length<o;){if(1===a.nodeType){if(a.hasAttributes())for(const t of a.getAttributeNames())if(t.endsWith(E)){const e=l[r++],s=a.getAttribute(t).split(z),o=/([.?@])?(.*)/.exec(e);n.push({type:1,index:i,name:o[2],strings:s,ctor:"."===o[1]?it:"?"===o[1]?rt:"@"===o[1]?ot:at}),a.removeAttribute(t)}else t.startsWith(z)&&(n.push({type:6,index:i}),a.removeAttribute(t));if(V.test(a.tagName)){const t=a.textContent.split(z),e=t.length-1;if(e>0){a.textContent=A?A.emptyScript:"";for(let s=0;s<e;s++)a.append(t[s],T()),K.nextNode(),n.push({type:2,index:++i});a.append(t[e],T())}}}else if(8===a.nodeType)if(a.data===N)n.push({type:2,index:i});else{let t=-1;for(;-1!==(t=a.data.indexOf(z,t+1));)n.push({type:7,index:i}),t+=z.length-1}i++}}static createElement(t,e){const s=P.createElement("template");return s.innerHTML=t,s}}function tt(t,e,s=t,a){if(e===G)return e;let i=void 0!==a?s._$Co?.[a]:s._$Cl;const r=O(e)?void 0:e._$litDirective$;return i?.constructor!==r&&(i?._$AO?.(!1),void 0===r?i=void 0:(i=new r(t),i._$AT(t,s,a)),void 0!==a?(s._$Co??=[])[a]=i:s._$Cl=i),void 0!==i&&(e=tt(t,i._$AS(t,e.values),i,a)),e}class et{constructor(t,e){this._$AV=[],this._$AN=void 0,this._$AD=t,this._$AM=e}get parentNode(){return this._$AM.parentNode}get _$AU(){return this._$AM._$AU}u(t){const{el:{content:e},parts:s}=this._$AD,a=(t?.creationScope??P).importNode(e,!0);K.currentNode=a;let i=K.nextNode(),r=0,o=0,n=s[0];for(;void 0!==n;){if(r===n.index){let e;2===n.type?e=new st(i,i.nextSibling,this,t):1===n.type?e=new n.ctor(i,n.name,n.strings,this,t):6===n.type&&(e=new nt(i,this,t)),this._$AV.push(e),n=s[++o]}r!==n?.index&&(i=K.nextNode(),r++)}return K.currentNode=P,a}p(t){let e=0;for(const s of this._$AV)void 0!==s&&(void 0!==s.strings?(s._$AI(t,s,e),e+=s.strings.length-2):s._$AI(t[e])),e++}}class st{get _$AU(){return this._$AM?._$AU??this._$Cv}constructor(t,e,s,a){this.type=2,this._$AH=Y,this._$AN=void 0,this._$AA=t,this._$AB=e,this._$AM=s,this.options=a,this._$Cv=a?.isConnected??!0}get parentNode(){let t=this._$AA.parentNode;const e=this._$AM;return void 0!==e&&11===t?.nodeType&&(t=e.parentNode),t}get startNode(){return this._$AA}get endNode(){return this._$AB}_$AI(t,e=this){t=tt(this,t,e),O(t)?t===Y||null==t||""===t?(this._$AH!==Y&&this._$AR(),this._$AH=Y):t!==this._$AH&&t!==G&&this._(t):void 0!==t._$litType$?this.$(t):void 0!==t.nodeType?this.T(t):(t=>H(t)||"function"==typeof t?.[Symbol.iterator])(t)?this.k(t):this._(t)}O(t){return this._$AA.parentNode.insertBefore(t,this._$AB)}T(t){this._$AH!==t&&(this._$AR(),this._$AH=this.O(t))}_(t){this._$AH!==Y&&O(this._$AH)?this._$AA.nextSibling.data=t:this.T(P.createTextNode(t)),this._$AH=t}$(t){const{values:e,_$litType$:s}=t,a="number"==typeof s?this._$AC(t):(void 0===s.el&&(s.el=X.createElement(Z(s.h,s.h[0]),this.options)),s);if(this._$AH?._$AD===a)this._$AH.p(e);else{const t=new et(a,this),s=t.u(this.options);t.p(e),this.T(s),this._$AH=t}}_$AC(t){let e=J.get(t.strings);return void 0===e&&J.set(t.strings,e=new X(t)),e}k(t){H(this._$AH)||(this._$AH=[],this._$AR());const e=this._$AH;let s,a=0;for(const i of t)a===e.length?e.push(s=new st(this.O(T()),this.O(T()),this,this.options)):s=e[a],s._$AI(i),a++;a<e.length&&(this._$AR(s&&s._$AB.nextSibling,a),e.length=a)}_$AR(t=this._$AA.nextSibling,e){for(this._$AP?.(!1,!0,e);t!==this._$AB;){const e=S(t).nextSibling;S(t).remove(),t=e}}setConnected(t){void 0===this._$AM&&(this._$Cv=t,this._$AP?.(t))}}class at{get tagName(){return this.element.tagName}get _$AU(){return this._$AM._$AU}constructor(t,e,s,a,i){this.type=1,this._$AH=Y,this._$AN=void 0,this.element=t,this.name=e,this._$AM=a,this.options=i,s.length>2||""!==s[0]||""!==s[1]?(this._$AH=Array(s.length-1).fill(new String),this.strings=s):this._$AH=Y}_$AI(t,e=this,s,a){const i=this.strings;let r=!1;if(void 0===i)t=tt(this,t,e,0),r=!O(t)||t!==this._$AH&&t!==G,r&&(this._$AH=t);else{const a=t;let o,n;for(t=i[0],o=0;o<i.length-1;o++)n=tt(this,a[s+o],e,o),n===G&&(n=this._$AH[o]),r||=!O(n)||n!==this._$AH[o],n===Y?t=Y:t!==Y&&(t+=(n??"")+i[o+1]),this._$AH[o]=n}r&&!a&&this.j(t)}j(t){t===Y?this.element.removeAttribute(this.name):this.element.setAttribute(this.name,t??"")}}class it extends at{constructor(){super(...arguments),this.type=3}j(t){this.element[this.name]=t===Y?void 0:t}}class rt extends at{constructor(){super(...arguments),this.type=4}j(t){this.element.toggleAttribute(this.name,!!t&&t!==Y)}}class ot extends at{constructor(t,e,s,a,i){super(t,e,s,a,i),this.type=5}_$AI(t,e=this){if((t=tt(this,t,e,0)??Y)===G)return;const s=this._$AH,a=t===Y&&s!==Y||t.capture!==s.capture||t.once!==s.once||t.passive!==s.passive,i=t!==Y&&(s===Y||a);a&&this.element.removeEventListener(this.name,this,s),i&&this.element.addEventListener(this.name,this,t),this._$AH=t}handleEvent(t){"function"==typeof this._$AH?this._$AH.call(this.options?.host??this.element,t):this._$AH.handleEvent(t)}}class nt{constructor(t,e,s){this.element=t,this.type=6,this._$AN=void 0,this._$AM=e,this.options=s}get _$AU(){return this._$AM._$AU}_$AI(t){tt(this,t)}}const ct=k.litHtmlPolyfillSupport;ct?.(X,st),(k.litHtmlVersions??=[]).push("3.3.2");const lt=globalThis;class dt extends w{constructor(){super(...arguments),this.renderOptions={host:this},this._$Do=void 0}createRenderRoot(){const t=super.createRenderRoot();return this.renderOptions.renderBefore??=t.firstChild,t}update(t){const e=this.render();this.hasUpdated||(this.renderOptions.isConnected=this.isConnected),super.update(t),this._$Do=((t,e,s)=>{const a=s?.renderBefore??e;let i=a._$litPart$;if(void 0===i){const t=s?.renderBefore??null;a._$litPart$=i=new st(e.insertBefore(T(),t),t,void 0,s??{})}return i._$AI(t),i})(e,this.renderRoot,this.renderOptions)}connectedCallback(){super.connectedCallback(),this._$Do?.setConnected(!0)}disconnectedCallback(){super.disconnectedCallback(),this._$Do?.setConnected(!1)}render(){return G}}dt._$litElement$=!0,dt.finalized=!0,lt.litElementHydrateSupport?.({LitElement:dt});const pt=lt.litElementPolyfillSupport;pt?.({LitElement:dt}),(lt.litElementVersions??=[]).push("4.2.2");const ht=t=>(e,s)=>{void 0!==s?s.addInitializer(()=>{customElements.define(t,e)}):customElements.define(t,e)},ut={attribute:!0,type:String,converter:x,reflect:!1,hasChanged:_},vt=(t=ut,e,s)=>{const{kind:a,metadata:i}=s;let r=globalThis.litPropertyMetadata.get(i);if(void 0===r&&globalThis.litPropertyMetadata.set(i,r=new Map),"setter"===a&&((t=Object.create(t)).wrapped=!0),r.set(s.name,t),"accessor"===a){const{name:a}=s;return{set(s){const i=e.get.call(this);e.set.call(this,s),this.requestUpdate(a,i,t,!0,s)},init(e){return void 0!==e&&this.C(a,void 0,t,e),e}}}if("setter"===a){const{name:a}=s;return function(s){const i=this[a];e.call(this,s),this.requestUpdate(a,i,t,!0,s)}}throw Error("Unsupported decorator location: "+a)};function mt(t){return(e,s)=>"object"==typeof s?vt(t,e,s):((t,e,s)=>{const a=e.hasOwnProperty(s);return e.constructor.createProperty(s,t),a?Object.getOwnPropertyDescriptor(e,s):void 0})(t,e,s)}function gt(t){return mt({...t,state:!0,attribute:!1})}const ft=n`
-  :host {
-    /* Comfort score colors */
-    --sc-comfort-excellent: #4caf50;
-    --sc-comfort-good: #2196f3;
-    --sc-comfort-fair: #ffc107;
-    --sc-comfort-poor: #ff9800;
-    --sc-comfort-bad: #f44336;
-    --sc-comfort-unknown: #9e9e9e;
-
-    /* HVAC action colors */
-    --sc-hvac-heating: #ff5722;
-    --sc-hvac-cooling: #2196f3;
-    --sc-hvac-fan: #00bcd4;
-    --sc-hvac-drying: #ff9800;
-    --sc-hvac-idle: #9e9e9e;
-
-    /* Card background - glassmorphism */
-    --sc-card-bg: rgba(255, 255, 255, 0.08);
-    --sc-card-bg-solid: rgba(32, 33, 36, 0.95);
-    --sc-card-border: rgba(255, 255, 255, 0.12);
-    --sc-card-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-    --sc-backdrop-blur: blur(16px);
-
-    /* Tile backgrounds */
-    --sc-tile-bg: rgba(255, 255, 255, 0.05);
-    --sc-tile-bg-hover: rgba(255, 255, 255, 0.1);
-    --sc-tile-border: rgba(255, 255, 255, 0.08);
-    --sc-tile-radius: 16px;
-
-    /* Text colors */
-    --sc-text-primary: rgba(255, 255, 255, 0.95);
-    --sc-text-secondary: rgba(255, 255, 255, 0.6);
-    --sc-text-muted: rgba(255, 255, 255, 0.35);
-
-    /* Font sizes */
-    --sc-font-xs: 0.65rem;
-    --sc-font-sm: 0.75rem;
-    --sc-font-md: 0.875rem;
-    --sc-font-lg: 1.1rem;
-    --sc-font-xl: 1.5rem;
-    --sc-font-xxl: 2rem;
-
-    /* Spacing */
-    --sc-space-xs: 4px;
-    --sc-space-sm: 8px;
-    --sc-space-md: 12px;
-    --sc-space-lg: 16px;
-    --sc-space-xl: 24px;
-
-    /* Border radius */
-    --sc-radius-sm: 8px;
-    --sc-radius-md: 12px;
-    --sc-radius-lg: 16px;
-    --sc-radius-xl: 24px;
-
-    /* Occupied / follow-me glow */
-    --sc-glow-occupied: 0 0 12px rgba(255, 193, 7, 0.4);
-    --sc-glow-followme: 0 0 16px rgba(33, 150, 243, 0.5);
-
-    /* Priority badge colors */
-    --sc-priority-high: #f44336;
-    --sc-priority-medium: #ff9800;
-    --sc-priority-low: #4caf50;
-
-    /* Section header */
-    --sc-section-border: rgba(255, 255, 255, 0.06);
-  }
-
-  /* Light mode overrides - triggered by HA theme */
-  :host([data-theme='light']) {
-    --sc-card-bg: rgba(255, 255, 255, 0.75);
-    --sc-card-bg-solid: rgba(248, 249, 250, 0.95);
-    --sc-card-border: rgba(0, 0, 0, 0.08);
-    --sc-card-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-
-    --sc-tile-bg: rgba(255, 255, 255, 0.6);
-    --sc-tile-bg-hover: rgba(255, 255, 255, 0.8);
-    --sc-tile-border: rgba(0, 0, 0, 0.06);
-
-    --sc-text-primary: rgba(0, 0, 0, 0.87);
-    --sc-text-secondary: rgba(0, 0, 0, 0.54);
-    --sc-text-muted: rgba(0, 0, 0, 0.3);
-
-    --sc-section-border: rgba(0, 0, 0, 0.06);
-  }
-`,bt=n`
+var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=arguments.length,o=r<3?e:null===a?a=Object.getOwnPropertyDescriptor(e,s):a;if("object"==typeof Reflect&&"function"==typeof Reflect.decorate)o=Reflect.decorate(t,e,s,a);else for(var n=t.length-1;n>=0;n--)(i=t[n])&&(o=(r<3?i(o):r>3?i(e,s,o):i(e,s))||o);return r>3&&o&&Object.defineProperty(e,s,o),o}"function"==typeof SuppressedError&&SuppressedError;const s=globalThis,a=s.ShadowRoot&&(void 0===s.ShadyCSS||s.ShadyCSS.nativeShadow)&&"adoptedStyleSheets"in Document.prototype&&"replace"in CSSStyleSheet.prototype,i=Symbol(),r=new WeakMap;let o=class{constructor(t,e,s){if(this._$cssResult$=!0,s!==i)throw Error("CSSResult is not constructable. Use `unsafeCSS` or `css` instead.");this.cssText=t,this.t=e}get styleSheet(){let t=this.o;const e=this.t;if(a&&void 0===t){const s=void 0!==e&&1===e.length;s&&(t=r.get(e)),void 0===t&&((this.o=t=new CSSStyleSheet).replaceSync(this.cssText),s&&r.set(e,t))}return t}toString(){return this.cssText}};const n=(t,...e)=>{const s=1===t.length?t[0]:e.reduce((e,s,a)=>e+(t=>{if(!0===t._$cssResult$)return t.cssText;if("number"==typeof t)return t;throw Error("Value passed to 'css' function must be a 'css' function result: "+t+". Use 'unsafeCSS' to pass non-literal values, but take care to ensure page security.")})(s)+t[a+1],t[0]);return new o(s,t,i)},c=a?t=>t:t=>t instanceof CSSStyleSheet?(t=>{let e="";for(const s of t.cssRules)e+=s.cssText;return(t=>new o("string"==typeof t?t:t+"",void 0,i))(e)})(t):t,{is:l,defineProperty:d,getOwnPropertyDescriptor:p,getOwnPropertyNames:h,getOwnPropertySymbols:u,getPrototypeOf:v}=Object,m=globalThis,g=m.trustedTypes,f=g?g.emptyScript:"",b=m.reactiveElementPolyfillSupport,y=(t,e)=>t,x={toAttribute(t,e){switch(e){case Boolean:t=t?f:null;break;case Object:case Array:t=null==t?t:JSON.stringify(t)}return t},fromAttribute(t,e){let s=t;switch(e){case Boolean:s=null!==t;break;case Number:s=null===t?null:Number(t);break;case Object:case Array:try{s=JSON.parse(t)}catch(t){s=null}}return s}},_=(t,e)=>!l(t,e),$={attribute:!0,type:String,converter:x,reflect:!1,useDefault:!1,hasChanged:_};Symbol.metadata??=Symbol("metadata"),m.litPropertyMetadata??=new WeakMap;let w=class extends HTMLElement{static addInitializer(t){this._$Ei(),(this.l??=[]).push(t)}static get observedAttributes(){return this.finalize(),this._$Eh&&[...this._$Eh.keys()]}static createProperty(t,e=$){if(e.state&&(e.attribute=!1),this._$Ei(),this.prototype.hasOwnProperty(t)&&((e=Object.create(e)).wrapped=!0),this.elementProperties.set(t,e),!e.noAccessor){const s=Symbol(),a=this.getPropertyDescriptor(t,s,e);void 0!==a&&d(this.prototype,t,a)}}static getPropertyDescriptor(t,e,s){const{get:a,set:i}=p(this.prototype,t)??{get(){return this[e]},set(t){this[e]=t}};return{get:a,set(e){const r=a?.call(this);i?.call(this,e),this.requestUpdate(t,r,s)},configurable:!0,enumerable:!0}}static getPropertyOptions(t){return this.elementProperties.get(t)??$}static _$Ei(){if(this.hasOwnProperty(y("elementProperties")))return;const t=v(this);t.finalize(),void 0!==t.l&&(this.l=[...t.l]),this.elementProperties=new Map(t.elementProperties)}static finalize(){if(this.hasOwnProperty(y("finalized")))return;if(this.finalized=!0,this._$Ei(),this.hasOwnProperty(y("properties"))){const t=this.properties,e=[...h(t),...u(t)];for(const s of e)this.createProperty(s,t[s])}const t=this[Symbol.metadata];if(null!==t){const e=litPropertyMetadata.get(t);if(void 0!==e)for(const[t,s]of e)this.elementProperties.set(t,s)}this._$Eh=new Map;for(const[t,e]of this.elementProperties){const s=this._$Eu(t,e);void 0!==s&&this._$Eh.set(s,t)}this.elementStyles=this.finalizeStyles(this.styles)}static finalizeStyles(t){const e=[];if(Array.isArray(t)){const s=new Set(t.flat(1/0).reverse());for(const t of s)e.unshift(c(t))}else void 0!==t&&e.push(c(t));return e}static _$Eu(t,e){const s=e.attribute;return!1===s?void 0:"string"==typeof s?s:"string"==typeof t?t.toLowerCase():void 0}constructor(){super(),this._$Ep=void 0,this.isUpdatePending=!1,this.hasUpdated=!1,this._$Em=null,this._$Ev()}_$Ev(){this._$ES=new Promise(t=>this.enableUpdating=t),this._$AL=new Map,this._$E_(),this.requestUpdate(),this.constructor.l?.forEach(t=>t(this))}addController(t){(this._$EO??=new Set).add(t),void 0!==this.renderRoot&&this.isConnected&&t.hostConnected?.()}removeController(t){this._$EO?.delete(t)}_$E_(){const t=new Map,e=this.constructor.elementProperties;for(const s of e.keys())this.hasOwnProperty(s)&&(t.set(s,this[s]),delete this[s]);t.size>0&&(this._$Ep=t)}createRenderRoot(){const t=this.shadowRoot??this.attachShadow(this.constructor.shadowRootOptions);return((t,e)=>{if(a)t.adoptedStyleSheets=e.map(t=>t instanceof CSSStyleSheet?t:t.styleSheet);else for(const a of e){const e=document.createElement("style"),i=s.litNonce;void 0!==i&&e.setAttribute("nonce",i),e.textContent=a.cssText,t.appendChild(e)}})(t,this.constructor.elementStyles),t}connectedCallback(){this.renderRoot??=this.createRenderRoot(),this.enableUpdating(!0),this._$EO?.forEach(t=>t.hostConnected?.())}enableUpdating(t){}disconnectedCallback(){this._$EO?.forEach(t=>t.hostDisconnected?.())}attributeChangedCallback(t,e,s){this._$AK(t,s)}_$ET(t,e){const s=this.constructor.elementProperties.get(t),a=this.constructor._$Eu(t,s);if(void 0!==a&&!0===s.reflect){const i=(void 0!==s.converter?.toAttribute?s.converter:x).toAttribute(e,s.type);this._$Em=t,null==i?this.removeAttribute(a):this.setAttribute(a,i),this._$Em=null}}_$AK(t,e){const s=this.constructor,a=s._$Eh.get(t);if(void 0!==a&&this._$Em!==a){const t=s.getPropertyOptions(a),i="function"==typeof t.converter?{fromAttribute:t.converter}:void 0!==t.converter?.fromAttribute?t.converter:x;this._$Em=a;const r=i.fromAttribute(e,t.type);this[a]=r??this._$Ej?.get(a)??r,this._$Em=null}}requestUpdate(t,e,s,a=!1,i){if(void 0!==t){const r=this.constructor;if(!1===a&&(i=this[t]),s??=r.getPropertyOptions(t),!((s.hasChanged??_)(i,e)||s.useDefault&&s.reflect&&i===this._$Ej?.get(t)&&!this.hasAttribute(r._$Eu(t,s))))return;this.C(t,e,s)}!1===this.isUpdatePending&&(this._$ES=this._$EP())}C(t,e,{useDefault:s,reflect:a,wrapped:i},r){s&&!(this._$Ej??=new Map).has(t)&&(this._$Ej.set(t,r??e??this[t]),!0!==i||void 0!==r)||(this._$AL.has(t)||(this.hasUpdated||s||(e=void 0),this._$AL.set(t,e)),!0===a&&this._$Em!==t&&(this._$Eq??=new Set).add(t))}async _$EP(){this.isUpdatePending=!0;try{await this._$ES}catch(t){Promise.reject(t)}const t=this.scheduleUpdate();return null!=t&&await t,!this.isUpdatePending}scheduleUpdate(){return this.performUpdate()}performUpdate(){if(!this.isUpdatePending)return;if(!this.hasUpdated){if(this.renderRoot??=this.createRenderRoot(),this._$Ep){for(const[t,e]of this._$Ep)this[t]=e;this._$Ep=void 0}const t=this.constructor.elementProperties;if(t.size>0)for(const[e,s]of t){const{wrapped:t}=s,a=this[e];!0!==t||this._$AL.has(e)||void 0===a||this.C(e,void 0,s,a)}}let t=!1;const e=this._$AL;try{t=this.shouldUpdate(e),t?(this.willUpdate(e),this._$EO?.forEach(t=>t.hostUpdate?.()),this.update(e)):this._$EM()}catch(e){throw t=!1,this._$EM(),e}t&&this._$AE(e)}willUpdate(t){}_$AE(t){this._$EO?.forEach(t=>t.hostUpdated?.()),this.hasUpdated||(this.hasUpdated=!0,this.firstUpdated(t)),this.updated(t)}_$EM(){this._$AL=new Map,this.isUpdatePending=!1}get updateComplete(){return this.getUpdateComplete()}getUpdateComplete(){return this._$ES}shouldUpdate(t){return!0}update(t){this._$Eq&&=this._$Eq.forEach(t=>this._$ET(t,this[t])),this._$EM()}updated(t){}firstUpdated(t){}};w.elementStyles=[],w.shadowRootOptions={mode:"open"},w[y("elementProperties")]=new Map,w[y("finalized")]=new Map,b?.({ReactiveElement:w}),(m.reactiveElementVersions??=[]).push("2.1.2");const k=globalThis,S=t=>t,A=k.trustedTypes,C=A?A.createPolicy("lit-html",{createHTML:t=>t}):void 0,E="$lit$",z=`lit$${Math.random().toFixed(9).slice(2)}$`,N="?"+z,M=`<${N}>`,P=document,T=()=>P.createComment(""),O=t=>null===t||"object"!=typeof t&&"function"!=typeof t,H=Array.isArray,U="[ \t\n\f\r]",R=/<(?:(!--|\/[^a-zA-Z])|(\/?[a-zA-Z][^>\s]*)|(\/?$))/g,j=/-->/g,D=/>/g,B=RegExp(`>|${U}(?:([^\\s"'>=/]+)(${U}*=${U}*(?:[^ \t\n\f\r"'\`<>=]|("|')|))|$)`,"g"),F=/'/g,L=/"/g,V=/^(?:script|style|textarea|title)$/i,I=t=>(e,...s)=>({_$litType$:t,strings:e,values:s}),q=I(1),W=I(2),G=Symbol.for("lit-noChange"),Y=Symbol.for("lit-nothing"),J=new WeakMap,K=P.createTreeWalker(P,129);function Z(t,e){if(!H(t)||!t.hasOwnProperty("raw"))throw Error("invalid template strings array");return void 0!==C?C.createHTML(e):e}const Q=(t,e)=>{const s=t.length-1,a=[];let i,r=2===e?"<svg>":3===e?"<math>":"",o=R;for(let e=0;e<s;e++){const s=t[e];let n,c,l=-1,d=0;for(;d<s.length&&(o.lastIndex=d,c=o.exec(s),null!==c);)d=o.lastIndex,o===R?"!--"===c[1]?o=j:void 0!==c[1]?o=D:void 0!==c[2]?(V.test(c[2])&&(i=RegExp("</"+c[2],"g")),o=B):void 0!==c[3]&&(o=B):o===B?">"===c[0]?(o=i??R,l=-1):void 0===c[1]?l=-2:(l=o.lastIndex-c[2].length,n=c[1],o=void 0===c[3]?B:'"'===c[3]?L:F):o===L||o===F?o=B:o===j||o===D?o=R:(o=B,i=void 0);const p=o===B&&t[e+1].startsWith("/>")?" ":"";r+=o===R?s+M:l>=0?(a.push(n),s.slice(0,l)+E+s.slice(l)+z+p):s+z+(-2===l?e:p)}return[Z(t,r+(t[s]||"<?>")+(2===e?"</svg>":3===e?"</math>":"")),a]};class X{constructor({strings:t,_$litType$:e},s){let a;this.parts=[];let i=0,r=0;const o=t.length-1,n=this.parts,[c,l]=Q(t,e);if(this.el=X.createElement(c,s),K.currentNode=this.el.content,2===e||3===e){const t=this.el.content.firstChild;t.replaceWith(...t.childNodes)}for(;null!==(a=K.nextNode())&&n.length<o;){if(1===a.nodeType){if(a.hasAttributes())for(const t of a.getAttributeNames())if(t.endsWith(E)){const e=l[r++],s=a.getAttribute(t).split(z),o=/([.?@])?(.*)/.exec(e);n.push({type:1,index:i,name:o[2],strings:s,ctor:"."===o[1]?it:"?"===o[1]?rt:"@"===o[1]?ot:at}),a.removeAttribute(t)}else t.startsWith(z)&&(n.push({type:6,index:i}),a.removeAttribute(t));if(V.test(a.tagName)){const t=a.textContent.split(z),e=t.length-1;if(e>0){a.textContent=A?A.emptyScript:"";for(let s=0;s<e;s++)a.append(t[s],T()),K.nextNode(),n.push({type:2,index:++i});a.append(t[e],T())}}}else if(8===a.nodeType)if(a.data===N)n.push({type:2,index:i});else{let t=-1;for(;-1!==(t=a.data.indexOf(z,t+1));)n.push({type:7,index:i}),t+=z.length-1}i++}}static createElement(t,e){const s=P.createElement("template");return s.innerHTML=t,s}}function tt(t,e,s=t,a){if(e===G)return e;let i=void 0!==a?s._$Co?.[a]:s._$Cl;const r=O(e)?void 0:e._$litDirective$;return i?.constructor!==r&&(i?._$AO?.(!1),void 0===r?i=void 0:(i=new r(t),i._$AT(t,s,a)),void 0!==a?(s._$Co??=[])[a]=i:s._$Cl=i),void 0!==i&&(e=tt(t,i._$AS(t,e.values),i,a)),e}class et{constructor(t,e){this._$AV=[],this._$AN=void 0,this._$AD=t,this._$AM=e}get parentNode(){return this._$AM.parentNode}get _$AU(){return this._$AM._$AU}u(t){const{el:{content:e},parts:s}=this._$AD,a=(t?.creationScope??P).importNode(e,!0);K.currentNode=a;let i=K.nextNode(),r=0,o=0,n=s[0];for(;void 0!==n;){if(r===n.index){let e;2===n.type?e=new st(i,i.nextSibling,this,t):1===n.type?e=new n.ctor(i,n.name,n.strings,this,t):6===n.type&&(e=new nt(i,this,t)),this._$AV.push(e),n=s[++o]}r!==n?.index&&(i=K.nextNode(),r++)}return K.currentNode=P,a}p(t){let e=0;for(const s of this._$AV)void 0!==s&&(void 0!==s.strings?(s._$AI(t,s,e),e+=s.strings.length-2):s._$AI(t[e])),e++}}class st{get _$AU(){return this._$AM?._$AU??this._$Cv}constructor(t,e,s,a){this.type=2,this._$AH=Y,this._$AN=void 0,this._$AA=t,this._$AB=e,this._$AM=s,this.options=a,this._$Cv=a?.isConnected??!0}get parentNode(){let t=this._$AA.parentNode;const e=this._$AM;return void 0!==e&&11===t?.nodeType&&(t=e.parentNode),t}get startNode(){return this._$AA}get endNode(){return this._$AB}_$AI(t,e=this){t=tt(this,t,e),O(t)?t===Y||null==t||""===t?(this._$AH!==Y&&this._$AR(),this._$AH=Y):t!==this._$AH&&t!==G&&this._(t):void 0!==t._$litType$?this.$(t):void 0!==t.nodeType?this.T(t):(t=>H(t)||"function"==typeof t?.[Symbol.iterator])(t)?this.k(t):this._(t)}O(t){return this._$AA.parentNode.insertBefore(t,this._$AB)}T(t){this._$AH!==t&&(this._$AR(),this._$AH=this.O(t))}_(t){this._$AH!==Y&&O(this._$AH)?this._$AA.nextSibling.data=t:this.T(P.createTextNode(t)),this._$AH=t}$(t){const{values:e,_$litType$:s}=t,a="number"==typeof s?this._$AC(t):(void 0===s.el&&(s.el=X.createElement(Z(s.h,s.h[0]),this.options)),s);if(this._$AH?._$AD===a)this._$AH.p(e);else{const t=new et(a,this),s=t.u(this.options);t.p(e),this.T(s),this._$AH=t}}_$AC(t){let e=J.get(t.strings);return void 0===e&&J.set(t.strings,e=new X(t)),e}k(t){H(this._$AH)||(this._$AH=[],this._$AR());const e=this._$AH;let s,a=0;for(const i of t)a===e.length?e.push(s=new st(this.O(T()),this.O(T()),this,this.options)):s=e[a],s._$AI(i),a++;a<e.length&&(this._$AR(s&&s._$AB.nextSibling,a),e.length=a)}_$AR(t=this._$AA.nextSibling,e){for(this._$AP?.(!1,!0,e);t!==this._$AB;){const e=S(t).nextSibling;S(t).remove(),t=e}}setConnected(t){void 0===this._$AM&&(this._$Cv=t,this._$AP?.(t))}}class at{get tagName(){return this.element.tagName}get _$AU(){return this._$AM._$AU}constructor(t,e,s,a,i){this.type=1,this._$AH=Y,this._$AN=void 0,this.element=t,this.name=e,this._$AM=a,this.options=i,s.length>2||""!==s[0]||""!==s[1]?(this._$AH=Array(s.length-1).fill(new String),this.strings=s):this._$AH=Y}_$AI(t,e=this,s,a){const i=this.strings;let r=!1;if(void 0===i)t=tt(this,t,e,0),r=!O(t)||t!==this._$AH&&t!==G,r&&(this._$AH=t);else{const a=t;let o,n;for(t=i[0],o=0;o<i.length-1;o++)n=tt(this,a[s+o],e,o),n===G&&(n=this._$AH[o]),r||=!O(n)||n!==this._$AH[o],n===Y?t=Y:t!==Y&&(t+=(n??"")+i[o+1]),this._$AH[o]=n}r&&!a&&this.j(t)}j(t){t===Y?this.element.removeAttribute(this.name):this.element.setAttribute(this.name,t??"")}}class it extends at{constructor(){super(...arguments),this.type=3}j(t){this.element[this.name]=t===Y?void 0:t}}class rt extends at{constructor(){super(...arguments),this.type=4}j(t){this.element.toggleAttribute(this.name,!!t&&t!==Y)}}class ot extends at{constructor(t,e,s,a,i){super(t,e,s,a,i),this.type=5}_$AI(t,e=this){if((t=tt(this,t,e,0)??Y)===G)return;const s=this._$AH,a=t===Y&&s!==Y||t.capture!==s.capture||t.once!==s.once||t.passive!==s.passive,i=t!==Y&&(s===Y||a);a&&this.element.removeEventListener(this.name,this,s),i&&this.element.addEventListener(this.name,this,t),this._$AH=t}handleEvent(t){"function"==typeof this._$AH?this._$AH.call(this.options?.host??this.element,t):this._$AH.handleEvent(t)}}class nt{constructor(t,e,s){this.element=t,this.type=6,this._$AN=void 0,this._$AM=e,this.options=s}get _$AU(){return this._$AM._$AU}_$AI(t){tt(this,t)}}const ct=k.litHtmlPolyfillSupport;ct?.(X,st),(k.litHtmlVersions??=[]).push("3.3.2");const lt=globalThis;class dt extends w{constructor(){super(...arguments),this.renderOptions={host:this},this._$Do=void 0}createRenderRoot(){const t=super.createRenderRoot();return this.renderOptions.renderBefore??=t.firstChild,t}update(t){const e=this.render();this.hasUpdated||(this.renderOptions.isConnected=this.isConnected),super.update(t),this._$Do=((t,e,s)=>{const a=s?.renderBefore??e;let i=a._$litPart$;if(void 0===i){const t=s?.renderBefore??null;a._$litPart$=i=new st(e.insertBefore(T(),t),t,void 0,s??{})}return i._$AI(t),i})(e,this.renderRoot,this.renderOptions)}connectedCallback(){super.connectedCallback(),this._$Do?.setConnected(!0)}disconnectedCallback(){super.disconnectedCallback(),this._$Do?.setConnected(!1)}render(){return G}}dt._$litElement$=!0,dt.finalized=!0,lt.litElementHydrateSupport?.({LitElement:dt});const pt=lt.litElementPolyfillSupport;pt?.({LitElement:dt}),(lt.litElementVersions??=[]).push("4.2.2");const ht=t=>(e,s)=>{void 0!==s?s.addInitializer(()=>{customElements.define(t,e)}):customElements.define(t,e)},ut={attribute:!0,type:String,converter:x,reflect:!1,hasChanged:_},vt=(t=ut,e,s)=>{const{kind:a,metadata:i}=s;let r=globalThis.litPropertyMetadata.get(i);if(void 0===r&&globalThis.litPropertyMetadata.set(i,r=new Map),"setter"===a&&((t=Object.create(t)).wrapped=!0),r.set(s.name,t),"accessor"===a){const{name:a}=s;return{set(s){const i=e.get.call(this);e.set.call(this,s),this.requestUpdate(a,i,t,!0,s)},init(e){return void 0!==e&&this.C(a,void 0,t,e),e}}}if("setter"===a){const{name:a}=s;return function(s){const i=this[a];e.call(this,s),this.requestUpdate(a,i,t,!0,s)}}throw Error("Unsupported decorator location: "+a)};function mt(t){return(e,s)=>"object"==typeof s?vt(t,e,s):((t,e,s)=>{const a=e.hasOwnProperty(s);return e.constructor.createProperty(s,t),a?Object.getOwnPropertyDescriptor(e,s):void 0})(t,e,s)}function gt(t){return mt({...t,state:!0,attribute:!1})}
+const __lit = { LitElement: dt, html: q, svg: W, css: n, nothing: Y, noChange: G, customElement: ht, property: mt, state: gt };
+const __mod = {};
+__mod["styles/animations"] = (() => {
+const { css } = __lit;
+/**
+ * Animation styles for the Smart Climate card.
+ */ const animationStyles = css`
   /* Heating pulse - warm glow */
   @keyframes sc-pulse-heating {
     0%, 100% {
@@ -229,132 +150,852 @@ var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=argume
   .sc-press:active {
     transform: scale(0.95);
   }
-`;function yt(t,e,s,a={}){return t.callService(e,s,a)}function xt(t,e){if(t&&t.states)return t.states[e]}function _t(t){return t.split("_").map(t=>t.charAt(0).toUpperCase()+t.slice(1)).join(" ")}function $t(t,e="°F"){if(null==t||"unknown"===t||"unavailable"===t)return"--"+e;const s="string"==typeof t?parseFloat(t):t;return isNaN(s)?"--"+e:`${Math.round(10*s)/10}${e}`}function wt(t){if(null==t||"unknown"===t||"unavailable"===t)return"--";const e="string"==typeof t?parseFloat(t):t;return isNaN(e)?"--":`${Math.round(e)}`}function kt(t){if(null==t||"unknown"===t||"unavailable"===t)return"var(--sc-comfort-unknown, #9e9e9e)";const e="string"==typeof t?parseFloat(t):t;return isNaN(e)?"var(--sc-comfort-unknown, #9e9e9e)":e>=90?"var(--sc-comfort-excellent, #4caf50)":e>=70?"var(--sc-comfort-good, #2196f3)":e>=50?"var(--sc-comfort-fair, #ffc107)":e>=30?"var(--sc-comfort-poor, #ff9800)":"var(--sc-comfort-bad, #f44336)"}function St(t){if(null==t||"unknown"===t||"unavailable"===t)return"Unknown";const e="string"==typeof t?parseFloat(t):t;return isNaN(e)?"Unknown":e>=90?"Excellent":e>=70?"Good":e>=50?"Fair":e>=30?"Poor":"Bad"}function At(t){if(null==t||"unknown"===t||"unavailable"===t)return"";const e="string"==typeof t?parseFloat(t):t;return isNaN(e)?"":e>.5?"↑":e>.1?"↗":e<-.5?"↓":e<-.1?"↘":"→"}function Ct(t){if(!t)return"";switch(t.toLowerCase()){case"heating":return"🔥";case"cooling":return"❄️";case"idle":return"⏸";case"fan":return"🌀";case"drying":return"💧";case"off":return"⏻";default:return""}}function Et(t){if(!t)return"var(--sc-hvac-idle, #9e9e9e)";switch(t.toLowerCase()){case"heating":return"var(--sc-hvac-heating, #ff5722)";case"cooling":return"var(--sc-hvac-cooling, #2196f3)";case"fan":return"var(--sc-hvac-fan, #00bcd4)";case"drying":return"var(--sc-hvac-drying, #ff9800)";default:return"var(--sc-hvac-idle, #9e9e9e)"}}function zt(t){if(null==t||"unknown"===t||"unavailable"===t)return"--";const e="string"==typeof t?parseFloat(t):t;if(isNaN(e))return"--";if(e<60)return`${Math.round(e)}m`;const s=Math.floor(e/60),a=Math.round(e%60);return a>0?`${s}h ${a}m`:`${s}h`}let Nt=class extends dt{constructor(){super(...arguments),this.roomSlug="",this.compact=!1}_entity(t){return xt(this.hass,`sensor.sc_${this.roomSlug}_${t}`)}_binaryEntity(t){return xt(this.hass,`binary_sensor.sc_${this.roomSlug}_${t}`)}_handleClick(){this.dispatchEvent(new CustomEvent("room-detail-open",{detail:{roomSlug:this.roomSlug},bubbles:!0,composed:!0}))}render(){const t=this._entity("comfort_score"),e=this._entity("temperature"),s=this._entity("humidity"),a=this._entity("target_temperature"),i=this._entity("temperature_trend"),r=this._entity("hvac_action"),o=this._entity("hvac_runtime"),n=this._entity("active_schedule"),c=this._binaryEntity("occupancy"),l=this._binaryEntity("follow_me_target"),d=t?parseFloat(t.state):NaN,p=e?.state,h=s?.state,u=a?.state,v=i?.state,m=r?.state||"idle",g=o?.state,f=n?.state||"",b="on"===c?.state,y="on"===l?.state,x=kt(d),_=isNaN(d)?0:Math.max(0,Math.min(100,d)),$=e?.attributes?.unit_of_measurement||"°F",w=["tile",b?"occupied":"",y?"follow-me":""].filter(Boolean).join(" ");return q`
-      <div class="${w}" @click=${this._handleClick}>
-        <!-- Comfort gradient overlay -->
-        <div
-          class="tile-gradient"
-          style="background: radial-gradient(circle at top left, ${x}, transparent 70%)"
-        ></div>
-
-        <!-- Header: name + occupancy -->
-        <div class="tile-header">
-          <span class="tile-name">${_t(this.roomSlug)}</span>
-          <span
-            class="tile-occupancy ${b?"":"vacant"}"
-            title="${b?"Occupied":"Vacant"}"
-          ></span>
-        </div>
+`;
+return { animationStyles };
+})();
+__mod["styles/card-styles"] = (() => {
+const { css } = __lit;
+/**
+ * Main card layout styles for the Smart Climate card.
+ */ const cardStyles = css`
+  :host {
+    display: block;
+    font-family: var(--ha-card-font-family, 'Roboto', 'Noto', sans-serif);
+    color: var(--sc-text-primary);
+  }
 
-        <!-- Temperature -->
-        <div class="tile-temp-row">
-          <span class="tile-temp">${$t(p,"")}</span>
-          <span class="tile-unit">${$}</span>
-          <span class="tile-trend">${At(v)}</span>
-        </div>
+  /* Main card container - glassmorphism */
+  .sc-card {
+    background: var(--sc-card-bg);
+    backdrop-filter: var(--sc-backdrop-blur);
+    -webkit-backdrop-filter: var(--sc-backdrop-blur);
+    border: 1px solid var(--sc-card-border);
+    border-radius: var(--sc-radius-xl);
+    box-shadow: var(--sc-card-shadow);
+    padding: var(--sc-space-lg);
+    overflow: hidden;
+  }
 
-        <!-- Secondary stats: humidity, target -->
-        <div class="tile-stats">
-          <span class="tile-stat">
-            <span class="tile-stat-icon">💧</span>
-            ${void 0!==h&&"unknown"!==h?`${Math.round(parseFloat(h))}%`:"--"}
-          </span>
-          <span class="tile-stat">
-            <span class="tile-stat-icon">🎯</span>
-            ${$t(u,$)}
-          </span>
-        </div>
+  /* Room grid layout - responsive columns */
+  .sc-room-grid {
+    display: grid;
+    grid-template-columns: repeat(2, 1fr);
+    gap: var(--sc-space-md);
+    padding: var(--sc-space-sm) 0;
+  }
 
-        <!-- Comfort bar -->
-        <div class="tile-comfort">
-          <div class="tile-comfort-label">
-            <span>Comfort</span>
-            <span style="color: ${x}">
-              ${wt(d)} - ${St(d)}
-            </span>
-          </div>
-          <div class="tile-comfort-bar">
-            <div
-              class="tile-comfort-fill"
-              style="width: ${_}%; background: ${x}"
-            ></div>
-          </div>
-        </div>
+  @media (min-width: 800px) {
+    .sc-room-grid {
+      grid-template-columns: repeat(3, 1fr);
+    }
+  }
 
-        <!-- HVAC action -->
-        <div class="tile-hvac">
-          <div
-            class="tile-hvac-dot ${"idle"!==m&&"off"!==m?"sc-dot-pulse":""}"
-            style="background: ${Et(m)}"
-          ></div>
-          <span class="tile-hvac-text">
-            ${Ct(m)}
-            ${m.charAt(0).toUpperCase()+m.slice(1)}
-          </span>
-          <span class="tile-hvac-runtime">${zt(g)}</span>
-        </div>
+  @media (max-width: 500px) {
+    .sc-room-grid {
+      grid-template-columns: 1fr;
+    }
+  }
 
-        <!-- Schedule -->
-        ${f&&"unknown"!==f&&"unavailable"!==f?q`<div class="tile-schedule">📅 ${f}</div>`:Y}
+  /* Compact mode: smaller tiles */
+  .sc-room-grid.compact {
+    gap: var(--sc-space-sm);
+  }
 
-        <!-- Auxiliary devices slot -->
-        <div class="tile-auxiliary">
-          <auxiliary-status
-            .hass=${this.hass}
-            .roomSlug=${this.roomSlug}
-          ></auxiliary-status>
-        </div>
-      </div>
-    `}};Nt.styles=[ft,bt,n`
-      :host {
-        display: block;
-      }
+  /* Section headers */
+  .sc-section {
+    margin-top: var(--sc-space-lg);
+    border-top: 1px solid var(--sc-section-border);
+    padding-top: var(--sc-space-md);
+  }
 
-      .tile {
-        position: relative;
-        background: var(--sc-tile-bg);
-        border: 1px solid var(--sc-tile-border);
-        border-radius: var(--sc-tile-radius);
-        padding: var(--sc-space-md);
-        cursor: pointer;
-        transition: background 0.2s ease, box-shadow 0.3s ease,
-          transform 0.15s ease;
-        overflow: hidden;
-      }
+  .sc-section-header {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    cursor: pointer;
+    padding: var(--sc-space-sm) 0;
+    user-select: none;
+    -webkit-user-select: none;
+  }
 
-      .tile:hover {
-        background: var(--sc-tile-bg-hover);
-        transform: translateY(-1px);
-      }
+  .sc-section-header:hover {
+    opacity: 0.8;
+  }
 
-      .tile:active {
-        transform: scale(0.98);
-      }
+  .sc-section-title {
+    font-size: var(--sc-font-md);
+    font-weight: 600;
+    color: var(--sc-text-primary);
+    display: flex;
+    align-items: center;
+    gap: var(--sc-space-sm);
+  }
 
-      /* Gradient overlay based on comfort score */
-      .tile-gradient {
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        opacity: 0.06;
-        pointer-events: none;
-        border-radius: var(--sc-tile-radius);
-        transition: opacity 0.3s ease;
-      }
+  .sc-section-badge {
+    background: var(--sc-tile-bg);
+    border-radius: var(--sc-radius-sm);
+    padding: 2px 8px;
+    font-size: var(--sc-font-xs);
+    font-weight: 500;
+    color: var(--sc-text-secondary);
+  }
 
-      .tile:hover .tile-gradient {
-        opacity: 0.1;
-      }
+  .sc-section-chevron {
+    font-size: var(--sc-font-md);
+    color: var(--sc-text-muted);
+    transition: transform 0.3s ease;
+  }
 
-      /* Occupied glow */
-      .tile.occupied {
-        box-shadow: var(--sc-glow-occupied);
-      }
+  .sc-section-chevron.open {
+    transform: rotate(180deg);
+  }
 
-      /* Follow-me glow */
-      .tile.follow-me {
+  .sc-section-content {
+    overflow: hidden;
+    max-height: 0;
+    opacity: 0;
+    transition: max-height 0.4s ease, opacity 0.3s ease;
+  }
+
+  .sc-section-content.open {
+    max-height: 2000px;
+    opacity: 1;
+  }
+
+  /* Buttons */
+  .sc-btn {
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    gap: var(--sc-space-xs);
+    padding: var(--sc-space-sm) var(--sc-space-md);
+    border: 1px solid var(--sc-tile-border);
+    border-radius: var(--sc-radius-sm);
+    background: var(--sc-tile-bg);
+    color: var(--sc-text-primary);
+    font-size: var(--sc-font-sm);
+    font-weight: 500;
+    cursor: pointer;
+    transition: background 0.2s ease, border-color 0.2s ease;
+    user-select: none;
+    -webkit-user-select: none;
+    outline: none;
+  }
+
+  .sc-btn:hover {
+    background: var(--sc-tile-bg-hover);
+  }
+
+  .sc-btn:active {
+    transform: scale(0.97);
+  }
+
+  .sc-btn.primary {
+    background: rgba(33, 150, 243, 0.2);
+    border-color: rgba(33, 150, 243, 0.4);
+    color: #64b5f6;
+  }
+
+  .sc-btn.primary:hover {
+    background: rgba(33, 150, 243, 0.3);
+  }
+
+  .sc-btn.success {
+    background: rgba(76, 175, 80, 0.2);
+    border-color: rgba(76, 175, 80, 0.4);
+    color: #81c784;
+  }
+
+  .sc-btn.success:hover {
+    background: rgba(76, 175, 80, 0.3);
+  }
+
+  .sc-btn.danger {
+    background: rgba(244, 67, 54, 0.2);
+    border-color: rgba(244, 67, 54, 0.4);
+    color: #e57373;
+  }
+
+  .sc-btn.danger:hover {
+    background: rgba(244, 67, 54, 0.3);
+  }
+
+  .sc-btn.small {
+    padding: var(--sc-space-xs) var(--sc-space-sm);
+    font-size: var(--sc-font-xs);
+  }
+
+  /* Progress bar base */
+  .sc-progress {
+    width: 100%;
+    height: 6px;
+    background: rgba(255, 255, 255, 0.08);
+    border-radius: 3px;
+    overflow: hidden;
+  }
+
+  .sc-progress-fill {
+    height: 100%;
+    border-radius: 3px;
+    transition: width 0.6s ease, background-color 0.3s ease;
+  }
+
+  /* No data / empty state */
+  .sc-empty {
+    text-align: center;
+    padding: var(--sc-space-xl);
+    color: var(--sc-text-muted);
+    font-size: var(--sc-font-md);
+  }
+
+  /* Overlay / drawer backdrop */
+  .sc-overlay {
+    position: fixed;
+    top: 0;
+    left: 0;
+    right: 0;
+    bottom: 0;
+    background: rgba(0, 0, 0, 0.6);
+    backdrop-filter: blur(4px);
+    -webkit-backdrop-filter: blur(4px);
+    z-index: 999;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+  }
+
+  /* Loading dots */
+  .sc-loading {
+    display: flex;
+    gap: var(--sc-space-xs);
+    justify-content: center;
+    padding: var(--sc-space-lg);
+  }
+
+  .sc-loading-dot {
+    width: 8px;
+    height: 8px;
+    border-radius: 50%;
+    background: var(--sc-text-muted);
+    animation: sc-loading-bounce 1.4s infinite ease-in-out both;
+  }
+
+  .sc-loading-dot:nth-child(1) { animation-delay: -0.32s; }
+  .sc-loading-dot:nth-child(2) { animation-delay: -0.16s; }
+
+  @keyframes sc-loading-bounce {
+    0%, 80%, 100% { transform: scale(0); }
+    40% { transform: scale(1); }
+  }
+`;
+return { cardStyles };
+})();
+__mod["styles/theme"] = (() => {
+const { css } = __lit;
+/**
+ * Theme CSS custom properties for the Smart Climate card.
+ * These can be overridden by the user's HA theme.
+ */ const themeStyles = css`
+  :host {
+    /* Comfort score colors */
+    --sc-comfort-excellent: #4caf50;
+    --sc-comfort-good: #2196f3;
+    --sc-comfort-fair: #ffc107;
+    --sc-comfort-poor: #ff9800;
+    --sc-comfort-bad: #f44336;
+    --sc-comfort-unknown: #9e9e9e;
+
+    /* HVAC action colors */
+    --sc-hvac-heating: #ff5722;
+    --sc-hvac-cooling: #2196f3;
+    --sc-hvac-fan: #00bcd4;
+    --sc-hvac-drying: #ff9800;
+    --sc-hvac-idle: #9e9e9e;
+
+    /* Card background - glassmorphism */
+    --sc-card-bg: rgba(255, 255, 255, 0.08);
+    --sc-card-bg-solid: rgba(32, 33, 36, 0.95);
+    --sc-card-border: rgba(255, 255, 255, 0.12);
+    --sc-card-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
+    --sc-backdrop-blur: blur(16px);
+
+    /* Tile backgrounds */
+    --sc-tile-bg: rgba(255, 255, 255, 0.05);
+    --sc-tile-bg-hover: rgba(255, 255, 255, 0.1);
+    --sc-tile-border: rgba(255, 255, 255, 0.08);
+    --sc-tile-radius: 16px;
+
+    /* Text colors */
+    --sc-text-primary: rgba(255, 255, 255, 0.95);
+    --sc-text-secondary: rgba(255, 255, 255, 0.6);
+    --sc-text-muted: rgba(255, 255, 255, 0.35);
+
+    /* Font sizes */
+    --sc-font-xs: 0.65rem;
+    --sc-font-sm: 0.75rem;
+    --sc-font-md: 0.875rem;
+    --sc-font-lg: 1.1rem;
+    --sc-font-xl: 1.5rem;
+    --sc-font-xxl: 2rem;
+
+    /* Spacing */
+    --sc-space-xs: 4px;
+    --sc-space-sm: 8px;
+    --sc-space-md: 12px;
+    --sc-space-lg: 16px;
+    --sc-space-xl: 24px;
+
+    /* Border radius */
+    --sc-radius-sm: 8px;
+    --sc-radius-md: 12px;
+    --sc-radius-lg: 16px;
+    --sc-radius-xl: 24px;
+
+    /* Occupied / follow-me glow */
+    --sc-glow-occupied: 0 0 12px rgba(255, 193, 7, 0.4);
+    --sc-glow-followme: 0 0 16px rgba(33, 150, 243, 0.5);
+
+    /* Priority badge colors */
+    --sc-priority-high: #f44336;
+    --sc-priority-medium: #ff9800;
+    --sc-priority-low: #4caf50;
+
+    /* Section header */
+    --sc-section-border: rgba(255, 255, 255, 0.06);
+  }
+
+  /* Light mode overrides - triggered by HA theme */
+  :host([data-theme='light']) {
+    --sc-card-bg: rgba(255, 255, 255, 0.75);
+    --sc-card-bg-solid: rgba(248, 249, 250, 0.95);
+    --sc-card-border: rgba(0, 0, 0, 0.08);
+    --sc-card-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
+
+    --sc-tile-bg: rgba(255, 255, 255, 0.6);
+    --sc-tile-bg-hover: rgba(255, 255, 255, 0.8);
+    --sc-tile-border: rgba(0, 0, 0, 0.06);
+
+    --sc-text-primary: rgba(0, 0, 0, 0.87);
+    --sc-text-secondary: rgba(0, 0, 0, 0.54);
+    --sc-text-muted: rgba(0, 0, 0, 0.3);
+
+    --sc-section-border: rgba(0, 0, 0, 0.06);
+  }
+`;
+return { themeStyles };
+})();
+__mod["utils/ha-api"] = (() => {
+/**
+ * Home Assistant WebSocket API helpers for the Smart Climate card.
+ */ /**
+ * Call a Home Assistant service.
+ */ function callService(hass, domain, service, data = {}) {
+  return hass.callService(domain, service, data);
+}
+/**
+ * Get the state object for an entity, or undefined if it doesn't exist.
+ */ function getEntityState(hass, entityId) {
+  if (!hass || !hass.states) return undefined;
+  return hass.states[entityId];
+}
+/**
+ * Fetch one page of suggestions with their full text.  Entity attributes
+ * only carry counts and ids so the recorder doesn't store the text.
+ */ function fetchSuggestions(hass, query = {}) {
+  return hass.callWS({
+    type: 'smart_climate/suggestions',
+    ...query
+  });
+}
+const KEYED_SECTIONS = [
+  'rooms',
+  'systems',
+  'schedules'
+];
+/**
+ * Apply a feed delta.  Changed records are replaced rather than mutated so
+ * components can tell what changed by identity.
+ */ function applyFeedDelta(snapshot, changes) {
+  const next = {
+    ...snapshot
+  };
+  for (const section of KEYED_SECTIONS){
+    const sectionChanges = changes[section];
+    if (!sectionChanges) continue;
+    const records = {
+      ...snapshot[section]
+    };
+    for (const [key, fields] of Object.entries(sectionChanges)){
+      if (fields === null) {
+        delete records[key];
+      } else {
+        records[key] = {
+          ...records[key],
+          ...fields
+        };
+      }
+    }
+    next[section] = records;
+  }
+  if (changes.house) {
+    next.house = {
+      ...snapshot.house,
+      ...changes.house
+    };
+  }
+  return next;
+}
+// Retry delays while resubscribing to the feed
+const FEED_RETRY_BASE_DELAY = 1000;
+const FEED_RETRY_MAX_DELAY = 30000;
+/**
+ * Subscribe to the smart_climate/subscribe snapshot-and-delta feed.
+ *
+ * Calls back with the full snapshot first and after every applied delta.
+ * If a delta arrives out of sequence the feed is resubscribed from the
+ * last applied version, which replays the missed deltas or sends a fresh
+ * snapshot.  When the integration reloads it closes the subscription, and
+ * the feed is resubscribed, retrying with backoff until the integration is
+ * back.  Rejects if the first subscription fails.
+ */ async function subscribeClimateFeed(hass, callback) {
+  let snapshot;
+  let feedId;
+  let version = -1;
+  let unsub;
+  let closed = false;
+  let resyncing = false;
+  let retryDelay = FEED_RETRY_BASE_DELAY;
+  let retryTimer;
+  // Drop the current subscription; ignore the error if the server
+  // already ended it.
+  const drop = ()=>{
+    if (unsub) Promise.resolve(unsub()).catch(()=>{});
+    unsub = undefined;
+  };
+  const subscribe = async ()=>{
+    const resync = feedId !== undefined ? {
+      feed_id: feedId,
+      since_version: version
+    } : {};
+    unsub = await hass.connection.subscribeMessage((event)=>{
+      if (event.type === 'closed') {
+        resubscribe();
+        return;
+      }
+      if (event.type === 'snapshot') {
+        snapshot = event.data;
+        feedId = event.feed_id;
+        version = event.version;
+      } else if (snapshot && event.version === version + 1) {
+        snapshot = applyFeedDelta(snapshot, event.changes);
+        version = event.version;
+      } else {
+        if (event.version > version) resubscribe();
+        return;
+      }
+      callback(snapshot);
+    }, {
+      type: 'smart_climate/subscribe',
+      ...resync
+    });
+    if (closed) drop();
+  };
+  const resubscribe = ()=>{
+    if (resyncing || closed) return;
+    resyncing = true;
+    drop();
+    const attempt = ()=>{
+      retryTimer = undefined;
+      if (closed) {
+        resyncing = false;
+        return;
+      }
+      subscribe().then(()=>{
+        resyncing = false;
+        retryDelay = FEED_RETRY_BASE_DELAY;
+      }).catch(()=>{
+        retryTimer = setTimeout(attempt, retryDelay);
+        retryDelay = Math.min(retryDelay * 2, FEED_RETRY_MAX_DELAY);
+      });
+    };
+    attempt();
+  };
+  await subscribe();
+  return ()=>{
+    closed = true;
+    if (retryTimer !== undefined) clearTimeout(retryTimer);
+    drop();
+  };
+}
+const INTEGRATION = 'smart_climate';
+const ENTITY_PATTERN = /^[a-z_]+\.sc_/;
+const ROOM_PATTERN = /^sensor\.sc_(.+)_comfort_score$/;
+let entityIndex;
+/**
+ * Index the integration's entity ids and rooms, rebuilt only when the set
+ * of entities changes.  Lovelace hands over a new states object on every
+ * state change anywhere in HA, so the entity registry is used as the key
+ * when available (it is only replaced when entities are added or removed)
+ * and the entity count otherwise.
+ */ function getEntityIndex(hass) {
+  const key = hass.entities ?? Object.keys(hass.states).length;
+  if (entityIndex && entityIndex.key === key) return entityIndex;
+  const entityIds = hass.entities ? Object.values(hass.entities).filter((entry)=>entry.platform === INTEGRATION).map((entry)=>entry.entity_id) : Object.keys(hass.states).filter((entityId)=>ENTITY_PATTERN.test(entityId));
+  const rooms = [];
+  for (const entityId of entityIds){
+    const match = entityId.match(ROOM_PATTERN);
+    if (match && match[1] && match[1] !== 'house') {
+      rooms.push(match[1]);
+    }
+  }
+  entityIndex = {
+    key,
+    entityIds: entityIds.sort(),
+    rooms: rooms.sort()
+  };
+  return entityIndex;
+}
+/**
+ * Entity ids belonging to Smart Climate.  The same array is returned until
+ * the entity set changes.
+ */ function smartClimateEntityIds(hass) {
+  if (!hass || !hass.states) return [];
+  return getEntityIndex(hass).entityIds;
+}
+/**
+ * Whether any of ``entityIds`` has a different state object in ``newHass``.
+ * HA keeps the state object of an unchanged entity, so identity suffices.
+ */ function statesChanged(oldHass, newHass, entityIds) {
+  if (!oldHass) return true;
+  if (oldHass.states === newHass.states) return false;
+  return entityIds.some((id)=>oldHass.states[id] !== newHass.states[id]);
+}
+function toIsoTime(seconds) {
+  return new Date(seconds * 1000).toISOString();
+}
+/**
+ * Apply a subscribe_entities update to a copy of the states it changes.
+ */ function applyStatesUpdate(states, update) {
+  const next = {
+    ...states
+  };
+  for (const [entityId, added] of Object.entries(update.a ?? {})){
+    const lastChanged = toIsoTime(added.lc);
+    next[entityId] = {
+      entity_id: entityId,
+      state: added.s,
+      attributes: added.a,
+      last_changed: lastChanged,
+      last_updated: added.lu ? toIsoTime(added.lu) : lastChanged
+    };
+  }
+  for (const entityId of update.r ?? []){
+    delete next[entityId];
+  }
+  for (const [entityId, { '+': toAdd, '-': toRemove }] of Object.entries(update.c ?? {})){
+    const current = next[entityId];
+    if (!current) continue;
+    const entity = {
+      ...current
+    };
+    if (toAdd?.a || toRemove?.a) {
+      entity.attributes = {
+        ...current.attributes,
+        ...toAdd?.a
+      };
+      for (const key of toRemove?.a ?? [])delete entity.attributes[key];
+    }
+    if (toAdd?.s !== undefined) entity.state = toAdd.s;
+    if (toAdd?.lc) {
+      entity.last_changed = entity.last_updated = toIsoTime(toAdd.lc);
+    } else if (toAdd?.lu) {
+      entity.last_updated = toIsoTime(toAdd.lu);
+    }
+    next[entityId] = entity;
+  }
+  return next;
+}
+/**
+ * Subscribe to state changes of Smart Climate's entities only.  The
+ * server sends just those entities, as compressed diffs that are applied
+ * here; the callback receives their full states.  Resubscribe when
+ * smartClimateEntityIds() returns a new list.
+ * Returns an unsubscribe function.
+ */ function subscribeEntities(hass, callback) {
+  if (!hass || !hass.connection) {
+    return ()=>{};
+  }
+  let states = {};
+  let unsub;
+  let closed = false;
+  hass.connection.subscribeMessage((update)=>{
+    states = applyStatesUpdate(states, update);
+    callback(states);
+  }, {
+    type: 'subscribe_entities',
+    entity_ids: smartClimateEntityIds(hass)
+  }).then((unsubFn)=>{
+    if (closed) unsubFn();
+    else unsub = unsubFn;
+  });
+  return ()=>{
+    closed = true;
+    if (unsub) unsub();
+  };
+}
+/**
+ * Discover all rooms managed by Smart Climate by finding entities
+ * matching the pattern sensor.sc_*_comfort_score.  The same array is
+ * returned until the entity set changes.
+ */ function discoverRooms(hass) {
+  if (!hass || !hass.states) return [];
+  return getEntityIndex(hass).rooms;
+}
+/**
+ * Get the friendly name for a room slug.
+ */ function getRoomName(roomSlug) {
+  return roomSlug.split('_').map((word)=>word.charAt(0).toUpperCase() + word.slice(1)).join(' ');
+}
+return { callService, getEntityState, fetchSuggestions, applyFeedDelta, FEED_RETRY_BASE_DELAY, FEED_RETRY_MAX_DELAY, subscribeClimateFeed, smartClimateEntityIds, statesChanged, subscribeEntities, discoverRooms, getRoomName };
+})();
+__mod["utils/formatters"] = (() => {
+/**
+ * Formatting utilities for the Smart Climate card.
+ */ /**
+ * Format a temperature value with its unit.
+ */ function formatTemp(value, unit = '°F') {
+  if (value === undefined || value === null || value === 'unknown' || value === 'unavailable') {
+    return '--' + unit;
+  }
+  const num = typeof value === 'string' ? parseFloat(value) : value;
+  if (isNaN(num)) return '--' + unit;
+  return `${Math.round(num * 10) / 10}${unit}`;
+}
+/**
+ * Format a Date to a time string (HH:MM AM/PM).
+ */ function formatTime(date) {
+  return date.toLocaleTimeString('en-US', {
+    hour: 'numeric',
+    minute: '2-digit',
+    hour12: true
+  });
+}
+/**
+ * Format a score value (0-100) as a display string.
+ */ function formatScore(score) {
+  if (score === undefined || score === null || score === 'unknown' || score === 'unavailable') {
+    return '--';
+  }
+  const num = typeof score === 'string' ? parseFloat(score) : score;
+  if (isNaN(num)) return '--';
+  return `${Math.round(num)}`;
+}
+/**
+ * Get the comfort color for a score (0-100).
+ * 90+  -> green
+ * 70+  -> blue
+ * 50+  -> amber
+ * 30+  -> orange
+ * 0+   -> red
+ */ function getComfortColor(score) {
+  if (score === undefined || score === null || score === 'unknown' || score === 'unavailable') {
+    return 'var(--sc-comfort-unknown, #9e9e9e)';
+  }
+  const num = typeof score === 'string' ? parseFloat(score) : score;
+  if (isNaN(num)) return 'var(--sc-comfort-unknown, #9e9e9e)';
+  if (num >= 90) return 'var(--sc-comfort-excellent, #4caf50)';
+  if (num >= 70) return 'var(--sc-comfort-good, #2196f3)';
+  if (num >= 50) return 'var(--sc-comfort-fair, #ffc107)';
+  if (num >= 30) return 'var(--sc-comfort-poor, #ff9800)';
+  return 'var(--sc-comfort-bad, #f44336)';
+}
+/**
+ * Get a human-readable label for a comfort score.
+ */ function getComfortLabel(score) {
+  if (score === undefined || score === null || score === 'unknown' || score === 'unavailable') {
+    return 'Unknown';
+  }
+  const num = typeof score === 'string' ? parseFloat(score) : score;
+  if (isNaN(num)) return 'Unknown';
+  if (num >= 90) return 'Excellent';
+  if (num >= 70) return 'Good';
+  if (num >= 50) return 'Fair';
+  if (num >= 30) return 'Poor';
+  return 'Bad';
+}
+/**
+ * Get a trend arrow character for a numeric trend value.
+ * Positive = rising, negative = falling, near-zero = stable.
+ */ function getTrendArrow(trend) {
+  if (trend === undefined || trend === null || trend === 'unknown' || trend === 'unavailable') {
+    return '';
+  }
+  const num = typeof trend === 'string' ? parseFloat(trend) : trend;
+  if (isNaN(num)) return '';
+  if (num > 0.5) return '↑';
+  if (num > 0.1) return '↗';
+  if (num < -0.5) return '↓';
+  if (num < -0.1) return '↘';
+  return '→';
+}
+/**
+ * Get an icon/emoji for an HVAC action.
+ */ function getHvacIcon(action) {
+  if (!action) return '';
+  switch(action.toLowerCase()){
+    case 'heating':
+      return '🔥';
+    case 'cooling':
+      return '❄️';
+    case 'idle':
+      return '⏸';
+    case 'fan':
+      return '🌀';
+    case 'drying':
+      return '💧';
+    case 'off':
+      return '⏻';
+    default:
+      return '';
+  }
+}
+/**
+ * Get the HVAC action color.
+ */ function getHvacColor(action) {
+  if (!action) return 'var(--sc-hvac-idle, #9e9e9e)';
+  switch(action.toLowerCase()){
+    case 'heating':
+      return 'var(--sc-hvac-heating, #ff5722)';
+    case 'cooling':
+      return 'var(--sc-hvac-cooling, #2196f3)';
+    case 'fan':
+      return 'var(--sc-hvac-fan, #00bcd4)';
+    case 'drying':
+      return 'var(--sc-hvac-drying, #ff9800)';
+    case 'idle':
+    case 'off':
+    default:
+      return 'var(--sc-hvac-idle, #9e9e9e)';
+  }
+}
+/**
+ * Format a duration in minutes to a readable string.
+ */ function formatDuration(minutes) {
+  if (minutes === undefined || minutes === null || minutes === 'unknown' || minutes === 'unavailable') {
+    return '--';
+  }
+  const num = typeof minutes === 'string' ? parseFloat(minutes) : minutes;
+  if (isNaN(num)) return '--';
+  if (num < 60) return `${Math.round(num)}m`;
+  const hours = Math.floor(num / 60);
+  const mins = Math.round(num % 60);
+  return mins > 0 ? `${hours}h ${mins}m` : `${hours}h`;
+}
+/**
+ * Generate confidence dots for a 0-5 rating.
+ */ function confidenceDots(level) {
+  const filled = Math.min(Math.max(Math.round(level), 0), 5);
+  const empty = 5 - filled;
+  return '●'.repeat(filled) + '○'.repeat(empty);
+}
+return { formatTemp, formatTime, formatScore, getComfortColor, getComfortLabel, getTrendArrow, getHvacIcon, getHvacColor, formatDuration, confidenceDots };
+})();
+__mod["components/room-tile"] = (() => {
+function _ts_decorate(decorators, target, key, desc) {
+  var c = arguments.length, r = c < 3 ? target : desc === null ? desc = Object.getOwnPropertyDescriptor(target, key) : desc, d;
+  if (typeof Reflect === "object" && typeof Reflect.decorate === "function") r = Reflect.decorate(decorators, target, key, desc);
+  else for(var i = decorators.length - 1; i >= 0; i--)if (d = decorators[i]) r = (c < 3 ? d(r) : c > 3 ? d(target, key, r) : d(target, key)) || r;
+  return c > 3 && r && Object.defineProperty(target, key, r), r;
+}
+const { LitElement, html, css, nothing } = __lit;
+const { customElement, property } = __lit;
+const { themeStyles } = __mod["styles/theme"];
+const { animationStyles } = __mod["styles/animations"];
+const { getEntityState, getRoomName, statesChanged } = __mod["utils/ha-api"];
+const { formatTemp, formatScore, getComfortColor, getComfortLabel, getTrendArrow, getHvacIcon, getHvacColor, formatDuration } = __mod["utils/formatters"];
+// Entities a tile reads when it has no feed snapshot
+const TILE_SENSORS = [
+  'comfort_score',
+  'temperature',
+  'humidity',
+  'target_temperature',
+  'temperature_trend',
+  'hvac_action',
+  'hvac_runtime',
+  'active_schedule',
+  'auxiliary'
+];
+const TILE_BINARY_SENSORS = [
+  'occupancy',
+  'follow_me_target'
+];
+// With a snapshot, only the temperature unit and the auxiliary slot
+// still come from entity states
+const FEED_TILE_SENSORS = [
+  'temperature',
+  'auxiliary'
+];
+class RoomTile extends LitElement {
+  constructor(){
+    super(...arguments);
+    this.roomSlug = '';
+    this.compact = false;
+    this._watchedKey = '';
+    this._watched = [];
+  }
+  static styles = [
+    themeStyles,
+    animationStyles,
+    css`
+      :host {
+        display: block;
+      }
+
+      .tile {
+        position: relative;
+        background: var(--sc-tile-bg);
+        border: 1px solid var(--sc-tile-border);
+        border-radius: var(--sc-tile-radius);
+        padding: var(--sc-space-md);
+        cursor: pointer;
+        transition: background 0.2s ease, box-shadow 0.3s ease,
+          transform 0.15s ease;
+        overflow: hidden;
+      }
+
+      .tile:hover {
+        background: var(--sc-tile-bg-hover);
+        transform: translateY(-1px);
+      }
+
+      .tile:active {
+        transform: scale(0.98);
+      }
+
+      /* Gradient overlay based on comfort score */
+      .tile-gradient {
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        opacity: 0.06;
+        pointer-events: none;
+        border-radius: var(--sc-tile-radius);
+        transition: opacity 0.3s ease;
+      }
+
+      .tile:hover .tile-gradient {
+        opacity: 0.1;
+      }
+
+      /* Occupied glow */
+      .tile.occupied {
+        box-shadow: var(--sc-glow-occupied);
+      }
+
+      /* Follow-me glow */
+      .tile.follow-me {
         box-shadow: var(--sc-glow-followme);
         border-color: rgba(33, 150, 243, 0.3);
       }
@@ -453,592 +1094,791 @@ var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=argume
         height: 4px;
         background: rgba(255, 255, 255, 0.06);
         border-radius: 2px;
-        overflow: hidden;
-      }
-
-      .tile-comfort-fill {
-        height: 100%;
-        border-radius: 2px;
-        transition: width 0.6s ease, background-color 0.3s ease;
-      }
-
-      /* HVAC action row */
-      .tile-hvac {
-        display: flex;
-        align-items: center;
-        gap: var(--sc-space-xs);
-        font-size: var(--sc-font-xs);
-        color: var(--sc-text-secondary);
-        margin-bottom: var(--sc-space-xs);
-      }
-
-      .tile-hvac-dot {
-        width: 6px;
-        height: 6px;
-        border-radius: 50%;
-        flex-shrink: 0;
-      }
-
-      .tile-hvac-text {
-        flex: 1;
-      }
-
-      .tile-hvac-runtime {
-        color: var(--sc-text-muted);
-      }
-
-      /* Schedule label */
-      .tile-schedule {
-        font-size: var(--sc-font-xs);
-        color: var(--sc-text-muted);
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-        margin-bottom: var(--sc-space-xs);
-      }
-
-      /* Auxiliary slot */
-      .tile-auxiliary {
-        margin-top: var(--sc-space-xs);
-      }
-
-      /* Compact mode */
-      :host([compact]) .tile {
-        padding: var(--sc-space-sm);
-      }
-
-      :host([compact]) .tile-temp {
-        font-size: var(--sc-font-xl);
-      }
-
-      :host([compact]) .tile-stats {
-        display: none;
-      }
-
-      :host([compact]) .tile-schedule {
-        display: none;
-      }
-    `],e([mt({attribute:!1})],Nt.prototype,"hass",void 0),e([mt({type:String})],Nt.prototype,"roomSlug",void 0),e([mt({type:Boolean})],Nt.prototype,"compact",void 0),Nt=e([ht("room-tile")],Nt);let Mt=class extends dt{_getComfort(){return xt(this.hass,"sensor.sc_house_comfort")}_getEfficiency(){return xt(this.hass,"sensor.sc_house_efficiency")}_getSchedule(){return xt(this.hass,"sensor.sc_active_schedule")}_getHvacStatus(){return xt(this.hass,"sensor.sc_hvac_status")}_getFollowMe(){return xt(this.hass,"binary_sensor.sc_follow_me_active")}_renderSegmentedBar(t){const e=Math.round(t/100*10),s=kt(t);return q`
-      <div class="progress-segmented">
-        ${Array.from({length:10}).map((t,a)=>q`
-            <div
-              class="progress-segment"
-              style="background: ${a<e?s:"rgba(255,255,255,0.06)"}"
-            ></div>
-          `)}
-      </div>
-    `}render(){const t=this._getComfort(),e=this._getEfficiency(),s=this._getSchedule(),a=this._getHvacStatus(),i=this._getFollowMe(),r=t?parseFloat(t.state):NaN,o=e?parseFloat(e.state):NaN,n=a?.state||"idle",c="on"===i?.state,l=i?.attributes?.target_room||"",d=s?.state||"None";return q`
-      <div class="overview">
-        <!-- Title -->
-        <div class="overview-header">
-          <div>
-            <div class="overview-title">Smart Climate</div>
-            <div class="overview-subtitle">Whole-house overview</div>
-          </div>
-        </div>
-
-        <!-- Score blocks -->
-        <div class="overview-scores">
-          <div class="score-block">
-            <div class="score-label">Comfort</div>
-            <div
-              class="score-value"
-              style="color: ${kt(r)}"
-            >
-              ${wt(r)}
-            </div>
-            <div class="score-sublabel">${St(r)}</div>
-            ${isNaN(r)?Y:this._renderSegmentedBar(r)}
-          </div>
-
-          <div class="score-block">
-            <div class="score-label">Efficiency</div>
-            <div
-              class="score-value"
-              style="color: ${kt(o)}"
-            >
-              ${wt(o)}
-            </div>
-            <div class="score-sublabel">
-              ${isNaN(o)?"--":`${Math.round(o)}%`}
-            </div>
-            ${isNaN(o)?Y:this._renderSegmentedBar(o)}
-          </div>
-        </div>
-
-        <!-- Status chips -->
-        <div class="overview-status">
-          <!-- HVAC Status -->
-          <div class="status-chip">
-            <div
-              class="status-dot ${"idle"!==n&&"off"!==n?"sc-dot-pulse":""}"
-              style="background: ${Et(n)}"
-            ></div>
-            <span>${Ct(n)}</span>
-            <span class="status-label"
-              >HVAC: ${n.charAt(0).toUpperCase()+n.slice(1)}</span
-            >
-          </div>
-
-          <!-- Follow-Me -->
-          ${c?q`
-                <div class="status-chip">
-                  <div
-                    class="status-dot sc-dot-pulse"
-                    style="background: var(--sc-comfort-good)"
-                  ></div>
-                  <span class="status-label">Follow-Me: ${l}</span>
-                </div>
-              `:Y}
-
-          <!-- Active Schedule -->
-          <div class="status-chip">
-            <span class="status-label">Schedule: ${d}</span>
-          </div>
-        </div>
-      </div>
-    `}};Mt.styles=[ft,bt,n`
-      :host {
-        display: block;
-      }
-
-      .overview {
-        display: flex;
-        flex-direction: column;
-        gap: var(--sc-space-md);
-        padding-bottom: var(--sc-space-md);
-      }
-
-      /* Title row */
-      .overview-header {
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-      }
-
-      .overview-title {
-        font-size: var(--sc-font-lg);
-        font-weight: 700;
-        color: var(--sc-text-primary);
-        letter-spacing: -0.3px;
-      }
-
-      .overview-subtitle {
-        font-size: var(--sc-font-xs);
-        color: var(--sc-text-muted);
-        margin-top: 2px;
-      }
-
-      /* Scores row */
-      .overview-scores {
-        display: flex;
-        gap: var(--sc-space-md);
-        flex-wrap: wrap;
-      }
-
-      .score-block {
-        flex: 1;
-        min-width: 100px;
-        background: var(--sc-tile-bg);
-        border: 1px solid var(--sc-tile-border);
-        border-radius: var(--sc-radius-md);
-        padding: var(--sc-space-sm) var(--sc-space-md);
-      }
-
-      .score-label {
-        font-size: var(--sc-font-xs);
-        color: var(--sc-text-muted);
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        margin-bottom: var(--sc-space-xs);
-      }
-
-      .score-value {
-        font-size: var(--sc-font-xl);
-        font-weight: 700;
-        line-height: 1;
-      }
-
-      .score-sublabel {
-        font-size: var(--sc-font-xs);
-        color: var(--sc-text-secondary);
-        margin-top: 2px;
-      }
-
-      /* Segmented progress bar */
-      .progress-segmented {
-        display: flex;
-        gap: 2px;
-        height: 4px;
-        margin-top: var(--sc-space-sm);
+        overflow: hidden;
       }
 
-      .progress-segment {
-        flex: 1;
+      .tile-comfort-fill {
+        height: 100%;
         border-radius: 2px;
-        transition: background-color 0.3s ease;
+        transition: width 0.6s ease, background-color 0.3s ease;
       }
 
-      /* Status row */
-      .overview-status {
+      /* HVAC action row */
+      .tile-hvac {
         display: flex;
-        flex-wrap: wrap;
-        gap: var(--sc-space-sm);
-      }
-
-      .status-chip {
-        display: inline-flex;
         align-items: center;
         gap: var(--sc-space-xs);
-        padding: var(--sc-space-xs) var(--sc-space-sm);
-        background: var(--sc-tile-bg);
-        border: 1px solid var(--sc-tile-border);
-        border-radius: var(--sc-radius-xl);
         font-size: var(--sc-font-xs);
         color: var(--sc-text-secondary);
-        white-space: nowrap;
+        margin-bottom: var(--sc-space-xs);
       }
 
-      .status-dot {
+      .tile-hvac-dot {
         width: 6px;
         height: 6px;
         border-radius: 50%;
         flex-shrink: 0;
       }
 
-      .status-label {
-        font-weight: 500;
+      .tile-hvac-text {
+        flex: 1;
       }
-    `],e([mt({attribute:!1})],Mt.prototype,"hass",void 0),Mt=e([ht("house-overview")],Mt);const Pt=n`
-  :host {
-    display: block;
-    font-family: var(--ha-card-font-family, 'Roboto', 'Noto', sans-serif);
-    color: var(--sc-text-primary);
-  }
 
-  /* Main card container - glassmorphism */
-  .sc-card {
-    background: var(--sc-card-bg);
-    backdrop-filter: var(--sc-backdrop-blur);
-    -webkit-backdrop-filter: var(--sc-backdrop-blur);
-    border: 1px solid var(--sc-card-border);
-    border-radius: var(--sc-radius-xl);
-    box-shadow: var(--sc-card-shadow);
-    padding: var(--sc-space-lg);
-    overflow: hidden;
-  }
+      .tile-hvac-runtime {
+        color: var(--sc-text-muted);
+      }
 
-  /* Room grid layout - responsive columns */
-  .sc-room-grid {
-    display: grid;
-    grid-template-columns: repeat(2, 1fr);
-    gap: var(--sc-space-md);
-    padding: var(--sc-space-sm) 0;
-  }
+      /* Schedule label */
+      .tile-schedule {
+        font-size: var(--sc-font-xs);
+        color: var(--sc-text-muted);
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+        margin-bottom: var(--sc-space-xs);
+      }
 
-  @media (min-width: 800px) {
-    .sc-room-grid {
-      grid-template-columns: repeat(3, 1fr);
+      /* Auxiliary slot */
+      .tile-auxiliary {
+        margin-top: var(--sc-space-xs);
+      }
+
+      /* Compact mode */
+      :host([compact]) .tile {
+        padding: var(--sc-space-sm);
+      }
+
+      :host([compact]) .tile-temp {
+        font-size: var(--sc-font-xl);
+      }
+
+      :host([compact]) .tile-stats {
+        display: none;
+      }
+
+      :host([compact]) .tile-schedule {
+        display: none;
+      }
+    `
+  ];
+  // Entity ids watched for hass updates, per slug and source
+  _watchedIds() {
+    const key = `${this.roomSlug}:${this.room ? 'feed' : 'states'}`;
+    if (key !== this._watchedKey) {
+      const sensors = this.room ? FEED_TILE_SENSORS : TILE_SENSORS;
+      const binarySensors = this.room ? [] : TILE_BINARY_SENSORS;
+      this._watchedKey = key;
+      this._watched = [
+        ...sensors.map((suffix)=>`sensor.sc_${this.roomSlug}_${suffix}`),
+        ...binarySensors.map((suffix)=>`binary_sensor.sc_${this.roomSlug}_${suffix}`)
+      ];
     }
+    return this._watched;
   }
-
-  @media (max-width: 500px) {
-    .sc-room-grid {
-      grid-template-columns: 1fr;
+  shouldUpdate(changedProps) {
+    if (changedProps.size !== 1 || !changedProps.has('hass')) return true;
+    const oldHass = changedProps.get('hass');
+    return statesChanged(oldHass, this.hass, this._watchedIds());
+  }
+  _entity(suffix) {
+    return getEntityState(this.hass, `sensor.sc_${this.roomSlug}_${suffix}`);
+  }
+  _binaryEntity(suffix) {
+    return getEntityState(this.hass, `binary_sensor.sc_${this.roomSlug}_${suffix}`);
+  }
+  _handleClick() {
+    this.dispatchEvent(new CustomEvent('room-detail-open', {
+      detail: {
+        roomSlug: this.roomSlug
+      },
+      bubbles: true,
+      composed: true
+    }));
+  }
+  _values() {
+    const room = this.room;
+    if (room) {
+      return {
+        comfortScore: room.comfort_score ?? NaN,
+        temp: room.temperature ?? undefined,
+        humidity: room.humidity ?? undefined,
+        target: room.target ?? undefined,
+        trend: room.temp_trend ?? undefined,
+        hvacAction: room.hvac_action || 'idle',
+        runtime: room.hvac_runtime_today ?? undefined,
+        schedule: room.active_schedule || '',
+        occupied: room.occupied,
+        isFollowMe: room.follow_me_active
+      };
     }
+    const comfortEntity = this._entity('comfort_score');
+    const followMeEntity = this._binaryEntity('follow_me_target');
+    return {
+      comfortScore: comfortEntity ? parseFloat(comfortEntity.state) : NaN,
+      temp: this._entity('temperature')?.state,
+      humidity: this._entity('humidity')?.state,
+      target: this._entity('target_temperature')?.state,
+      trend: this._entity('temperature_trend')?.state,
+      hvacAction: this._entity('hvac_action')?.state || 'idle',
+      runtime: this._entity('hvac_runtime')?.state,
+      schedule: this._entity('active_schedule')?.state || '',
+      occupied: this._binaryEntity('occupancy')?.state === 'on',
+      isFollowMe: followMeEntity?.state === 'on'
+    };
   }
+  render() {
+    const { comfortScore, temp, humidity, target, trend, hvacAction, runtime, schedule, occupied, isFollowMe } = this._values();
+    const comfortColor = getComfortColor(comfortScore);
+    const comfortPct = !isNaN(comfortScore) ? Math.max(0, Math.min(100, comfortScore)) : 0;
+    const tempUnit = this._entity('temperature')?.attributes?.unit_of_measurement || '°F';
+    const tileClasses = [
+      'tile',
+      occupied ? 'occupied' : '',
+      isFollowMe ? 'follow-me' : ''
+    ].filter(Boolean).join(' ');
+    return html`
+      <div class="${tileClasses}" @click=${this._handleClick}>
+        <!-- Comfort gradient overlay -->
+        <div
+          class="tile-gradient"
+          style="background: radial-gradient(circle at top left, ${comfortColor}, transparent 70%)"
+        ></div>
 
-  /* Compact mode: smaller tiles */
-  .sc-room-grid.compact {
-    gap: var(--sc-space-sm);
-  }
+        <!-- Header: name + occupancy -->
+        <div class="tile-header">
+          <span class="tile-name">${getRoomName(this.roomSlug)}</span>
+          <span
+            class="tile-occupancy ${occupied ? '' : 'vacant'}"
+            title="${occupied ? 'Occupied' : 'Vacant'}"
+          ></span>
+        </div>
 
-  /* Section headers */
-  .sc-section {
-    margin-top: var(--sc-space-lg);
-    border-top: 1px solid var(--sc-section-border);
-    padding-top: var(--sc-space-md);
-  }
+        <!-- Temperature -->
+        <div class="tile-temp-row">
+          <span class="tile-temp">${formatTemp(temp, '')}</span>
+          <span class="tile-unit">${tempUnit}</span>
+          <span class="tile-trend">${getTrendArrow(trend)}</span>
+        </div>
 
-  .sc-section-header {
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    cursor: pointer;
-    padding: var(--sc-space-sm) 0;
-    user-select: none;
-    -webkit-user-select: none;
-  }
+        <!-- Secondary stats: humidity, target -->
+        <div class="tile-stats">
+          <span class="tile-stat">
+            <span class="tile-stat-icon">💧</span>
+            ${humidity !== undefined && humidity !== 'unknown' ? `${Math.round(parseFloat(String(humidity)))}%` : '--'}
+          </span>
+          <span class="tile-stat">
+            <span class="tile-stat-icon">🎯</span>
+            ${formatTemp(target, tempUnit)}
+          </span>
+        </div>
 
-  .sc-section-header:hover {
-    opacity: 0.8;
-  }
+        <!-- Comfort bar -->
+        <div class="tile-comfort">
+          <div class="tile-comfort-label">
+            <span>Comfort</span>
+            <span style="color: ${comfortColor}">
+              ${formatScore(comfortScore)} - ${getComfortLabel(comfortScore)}
+            </span>
+          </div>
+          <div class="tile-comfort-bar">
+            <div
+              class="tile-comfort-fill"
+              style="width: ${comfortPct}%; background: ${comfortColor}"
+            ></div>
+          </div>
+        </div>
 
-  .sc-section-title {
-    font-size: var(--sc-font-md);
-    font-weight: 600;
-    color: var(--sc-text-primary);
-    display: flex;
-    align-items: center;
-    gap: var(--sc-space-sm);
-  }
+        <!-- HVAC action -->
+        <div class="tile-hvac">
+          <div
+            class="tile-hvac-dot ${hvacAction !== 'idle' && hvacAction !== 'off' ? 'sc-dot-pulse' : ''}"
+            style="background: ${getHvacColor(hvacAction)}"
+          ></div>
+          <span class="tile-hvac-text">
+            ${getHvacIcon(hvacAction)}
+            ${hvacAction.charAt(0).toUpperCase() + hvacAction.slice(1)}
+          </span>
+          <span class="tile-hvac-runtime">${formatDuration(runtime)}</span>
+        </div>
 
-  .sc-section-badge {
-    background: var(--sc-tile-bg);
-    border-radius: var(--sc-radius-sm);
-    padding: 2px 8px;
-    font-size: var(--sc-font-xs);
-    font-weight: 500;
-    color: var(--sc-text-secondary);
-  }
+        <!-- Schedule -->
+        ${schedule && schedule !== 'unknown' && schedule !== 'unavailable' ? html`<div class="tile-schedule">📅 ${schedule}</div>` : nothing}
 
-  .sc-section-chevron {
-    font-size: var(--sc-font-md);
-    color: var(--sc-text-muted);
-    transition: transform 0.3s ease;
+        <!-- Auxiliary devices slot -->
+        <div class="tile-auxiliary">
+          <auxiliary-status
+            .hass=${this.hass}
+            .roomSlug=${this.roomSlug}
+          ></auxiliary-status>
+        </div>
+      </div>
+    `;
   }
-
-  .sc-section-chevron.open {
-    transform: rotate(180deg);
+}
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], RoomTile.prototype, "hass", void 0);
+_ts_decorate([
+  property({
+    type: String
+  })
+], RoomTile.prototype, "roomSlug", void 0);
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], RoomTile.prototype, "room", void 0);
+_ts_decorate([
+  property({
+    type: Boolean
+  })
+], RoomTile.prototype, "compact", void 0);
+RoomTile = _ts_decorate([
+  customElement('room-tile')
+], RoomTile);
+return { RoomTile };
+})();
+__mod["components/room-grid"] = (() => {
+function _ts_decorate(decorators, target, key, desc) {
+  var c = arguments.length, r = c < 3 ? target : desc === null ? desc = Object.getOwnPropertyDescriptor(target, key) : desc, d;
+  if (typeof Reflect === "object" && typeof Reflect.decorate === "function") r = Reflect.decorate(decorators, target, key, desc);
+  else for(var i = decorators.length - 1; i >= 0; i--)if (d = decorators[i]) r = (c < 3 ? d(r) : c > 3 ? d(target, key, r) : d(target, key)) || r;
+  return c > 3 && r && Object.defineProperty(target, key, r), r;
+}
+const { LitElement, html, css } = __lit;
+const { customElement, property, state } = __lit;
+const { animationStyles } = __mod["styles/animations"];
+const { cardStyles } = __mod["styles/card-styles"];
+
+// Above this many rooms only the tiles near the viewport are rendered
+const VIRTUALIZE_THRESHOLD = 24;
+// Rows rendered above and below the viewport
+const OVERSCAN_ROWS = 2;
+// Row height (tile plus gap) assumed until a rendered row is measured
+const ESTIMATED_ROW_HEIGHT = 190;
+const ESTIMATED_COMPACT_ROW_HEIGHT = 110;
+class RoomGrid extends LitElement {
+  constructor(){
+    super(...arguments);
+    this.rooms = [];
+    this.compact = false;
+    this._startRow = 0;
+    this._endRow = 0;
+    this._columnCount = 1;
+    this._rowHeight = 0;
+    this._frame = 0;
   }
+  // Rendered rows [start, end) while windowed
+  static styles = [
+    animationStyles,
+    cardStyles,
+    css`
+      :host {
+        display: block;
+      }
 
-  .sc-section-content {
-    overflow: hidden;
-    max-height: 0;
-    opacity: 0;
-    transition: max-height 0.4s ease, opacity 0.3s ease;
-  }
+      /* Grid column overrides */
+      .sc-room-grid.cols-1 {
+        grid-template-columns: 1fr;
+      }
 
-  .sc-section-content.open {
-    max-height: 2000px;
-    opacity: 1;
-  }
+      .sc-room-grid.cols-2 {
+        grid-template-columns: repeat(2, 1fr);
+      }
 
-  /* Buttons */
-  .sc-btn {
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    gap: var(--sc-space-xs);
-    padding: var(--sc-space-sm) var(--sc-space-md);
-    border: 1px solid var(--sc-tile-border);
-    border-radius: var(--sc-radius-sm);
-    background: var(--sc-tile-bg);
-    color: var(--sc-text-primary);
-    font-size: var(--sc-font-sm);
-    font-weight: 500;
-    cursor: pointer;
-    transition: background 0.2s ease, border-color 0.2s ease;
-    user-select: none;
-    -webkit-user-select: none;
-    outline: none;
+      .sc-room-grid.cols-3 {
+        grid-template-columns: repeat(3, 1fr);
+      }
+
+      @media (max-width: 500px) {
+        .sc-room-grid.cols-2,
+        .sc-room-grid.cols-3 {
+          grid-template-columns: 1fr;
+        }
+      }
+
+      @media (min-width: 501px) and (max-width: 800px) {
+        .sc-room-grid.cols-3 {
+          grid-template-columns: repeat(2, 1fr);
+        }
+      }
+    `
+  ];
+  get _virtualized() {
+    return this.rooms.length > VIRTUALIZE_THRESHOLD;
+  }
+  connectedCallback() {
+    super.connectedCallback();
+    window.addEventListener('scroll', this._onViewportChange, {
+      capture: true,
+      passive: true
+    });
+    window.addEventListener('resize', this._onViewportChange, {
+      passive: true
+    });
+    this._resizeObserver = new ResizeObserver(this._onViewportChange);
+    this._resizeObserver.observe(this);
+  }
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    window.removeEventListener('scroll', this._onViewportChange, {
+      capture: true
+    });
+    window.removeEventListener('resize', this._onViewportChange);
+    this._resizeObserver?.disconnect();
+    cancelAnimationFrame(this._frame);
+    this._frame = 0;
+  }
+  updated(changedProps) {
+    super.updated(changedProps);
+    if (!this._virtualized) return;
+    const layoutChanged = changedProps.has('rooms') || changedProps.has('compact') || changedProps.has('columns');
+    // Measuring forces a layout, so skip it for state-only updates.
+    if (layoutChanged || changedProps.has('_startRow') || changedProps.has('_endRow')) {
+      this._measure();
+    }
+    if (layoutChanged) {
+      this._onViewportChange();
+    }
+  }
+  /**
+   * Recompute the visible rows at most once per animation frame.
+   */ _onViewportChange = ()=>{
+    if (this._frame || !this._virtualized) return;
+    this._frame = requestAnimationFrame(()=>{
+      this._frame = 0;
+      this._updateWindow();
+    });
+  };
+  /**
+   * Read the column count from the laid-out grid and the row height from
+   * the rendered tiles, so media queries and tile content stay the source
+   * of truth.
+   */ _measure() {
+    const grid = this.renderRoot.querySelector('.sc-room-grid');
+    if (!grid) return;
+    const style = getComputedStyle(grid);
+    this._columnCount = Math.max(1, style.gridTemplateColumns.split(' ').filter(Boolean).length);
+    const tiles = grid.querySelectorAll('room-tile');
+    const renderedRows = Math.ceil(tiles.length / this._columnCount);
+    if (renderedRows === 0) return;
+    const gap = parseFloat(style.rowGap) || 0;
+    const top = tiles[0].getBoundingClientRect().top;
+    const bottom = tiles[tiles.length - 1].getBoundingClientRect().bottom;
+    const rowHeight = (bottom - top + gap) / renderedRows;
+    if (rowHeight > 0 && Math.abs(rowHeight - this._rowHeight) >= 1) {
+      this._rowHeight = rowHeight;
+      this._onViewportChange();
+    }
+  }
+  _updateWindow() {
+    const rowHeight = this._rowHeight || (this.compact ? ESTIMATED_COMPACT_ROW_HEIGHT : ESTIMATED_ROW_HEIGHT);
+    const totalRows = Math.ceil(this.rooms.length / this._columnCount);
+    const rect = this.getBoundingClientRect();
+    const visibleTop = Math.max(0, -rect.top);
+    const visibleBottom = Math.max(0, window.innerHeight - rect.top);
+    const startRow = Math.max(0, Math.floor(visibleTop / rowHeight) - OVERSCAN_ROWS);
+    const endRow = Math.min(totalRows, Math.ceil(visibleBottom / rowHeight) + OVERSCAN_ROWS);
+    if (startRow !== this._startRow || endRow !== this._endRow) {
+      this._startRow = startRow;
+      this._endRow = Math.max(startRow, endRow);
+    }
+  }
+  _gridClasses() {
+    const classes = [
+      'sc-room-grid'
+    ];
+    if (this.compact) {
+      classes.push('compact');
+    }
+    if (this.columns) {
+      classes.push(`cols-${Math.min(3, Math.max(1, this.columns))}`);
+    }
+    return classes.join(' ');
   }
-
-  .sc-btn:hover {
-    background: var(--sc-tile-bg-hover);
+  _renderTile(room, className, style) {
+    return html`
+      <room-tile
+        .hass=${this.hass}
+        .roomSlug=${room}
+        .room=${this.feedRooms?.[room]}
+        ?compact=${this.compact}
+        class=${className}
+        style=${style}
+      ></room-tile>
+    `;
   }
-
-  .sc-btn:active {
-    transform: scale(0.97);
+  render() {
+    if (!this._virtualized) {
+      return html`
+        <div class="${this._gridClasses()}">
+          ${this.rooms.map((room, idx)=>this._renderTile(room, 'sc-fade-in', `animation-delay: ${idx * 50}ms`))}
+        </div>
+      `;
+    }
+    // Until the first measurement, render one screenful from the top.
+    const rowHeight = this._rowHeight || (this.compact ? ESTIMATED_COMPACT_ROW_HEIGHT : ESTIMATED_ROW_HEIGHT);
+    const columns = this._columnCount;
+    const totalRows = Math.ceil(this.rooms.length / columns);
+    const endRow = this._endRow > 0 ? Math.min(this._endRow, totalRows) : Math.min(totalRows, Math.ceil(window.innerHeight / rowHeight) + OVERSCAN_ROWS);
+    const startRow = Math.min(this._startRow, endRow);
+    const visible = this.rooms.slice(startRow * columns, endRow * columns);
+    // Not keyed: tiles are reused by position as the window moves.
+    return html`
+      <div
+        class="${this._gridClasses()}"
+        style="padding-top: calc(var(--sc-space-sm) + ${startRow * rowHeight}px);
+          padding-bottom: calc(var(--sc-space-sm) + ${(totalRows - endRow) * rowHeight}px)"
+      >
+        ${visible.map((room)=>this._renderTile(room, '', ''))}
+      </div>
+    `;
   }
+}
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], RoomGrid.prototype, "hass", void 0);
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], RoomGrid.prototype, "rooms", void 0);
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], RoomGrid.prototype, "feedRooms", void 0);
+_ts_decorate([
+  property({
+    type: Boolean
+  })
+], RoomGrid.prototype, "compact", void 0);
+_ts_decorate([
+  property({
+    type: Number
+  })
+], RoomGrid.prototype, "columns", void 0);
+_ts_decorate([
+  state()
+], RoomGrid.prototype, "_startRow", void 0);
+_ts_decorate([
+  state()
+], RoomGrid.prototype, "_endRow", void 0);
+RoomGrid = _ts_decorate([
+  customElement('room-grid')
+], RoomGrid);
+return { RoomGrid };
+})();
+__mod["components/house-overview"] = (() => {
+function _ts_decorate(decorators, target, key, desc) {
+  var c = arguments.length, r = c < 3 ? target : desc === null ? desc = Object.getOwnPropertyDescriptor(target, key) : desc, d;
+  if (typeof Reflect === "object" && typeof Reflect.decorate === "function") r = Reflect.decorate(decorators, target, key, desc);
+  else for(var i = decorators.length - 1; i >= 0; i--)if (d = decorators[i]) r = (c < 3 ? d(r) : c > 3 ? d(target, key, r) : d(target, key)) || r;
+  return c > 3 && r && Object.defineProperty(target, key, r), r;
+}
+const { LitElement, html, css, nothing } = __lit;
+const { customElement, property } = __lit;
+const { themeStyles } = __mod["styles/theme"];
+const { animationStyles } = __mod["styles/animations"];
+const { getEntityState, getRoomName } = __mod["utils/ha-api"];
+const { formatScore, getComfortColor, getComfortLabel, getHvacIcon, getHvacColor } = __mod["utils/formatters"];
+class HouseOverview extends LitElement {
+  static styles = [
+    themeStyles,
+    animationStyles,
+    css`
+      :host {
+        display: block;
+      }
 
-  .sc-btn.primary {
-    background: rgba(33, 150, 243, 0.2);
-    border-color: rgba(33, 150, 243, 0.4);
-    color: #64b5f6;
-  }
+      .overview {
+        display: flex;
+        flex-direction: column;
+        gap: var(--sc-space-md);
+        padding-bottom: var(--sc-space-md);
+      }
 
-  .sc-btn.primary:hover {
-    background: rgba(33, 150, 243, 0.3);
-  }
+      /* Title row */
+      .overview-header {
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+      }
 
-  .sc-btn.success {
-    background: rgba(76, 175, 80, 0.2);
-    border-color: rgba(76, 175, 80, 0.4);
-    color: #81c784;
-  }
+      .overview-title {
+        font-size: var(--sc-font-lg);
+        font-weight: 700;
+        color: var(--sc-text-primary);
+        letter-spacing: -0.3px;
+      }
 
-  .sc-btn.success:hover {
-    background: rgba(76, 175, 80, 0.3);
-  }
+      .overview-subtitle {
+        font-size: var(--sc-font-xs);
+        color: var(--sc-text-muted);
+        margin-top: 2px;
+      }
 
-  .sc-btn.danger {
-    background: rgba(244, 67, 54, 0.2);
-    border-color: rgba(244, 67, 54, 0.4);
-    color: #e57373;
-  }
+      /* Scores row */
+      .overview-scores {
+        display: flex;
+        gap: var(--sc-space-md);
+        flex-wrap: wrap;
+      }
 
-  .sc-btn.danger:hover {
-    background: rgba(244, 67, 54, 0.3);
-  }
+      .score-block {
+        flex: 1;
+        min-width: 100px;
+        background: var(--sc-tile-bg);
+        border: 1px solid var(--sc-tile-border);
+        border-radius: var(--sc-radius-md);
+        padding: var(--sc-space-sm) var(--sc-space-md);
+      }
 
-  .sc-btn.small {
-    padding: var(--sc-space-xs) var(--sc-space-sm);
-    font-size: var(--sc-font-xs);
-  }
+      .score-label {
+        font-size: var(--sc-font-xs);
+        color: var(--sc-text-muted);
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        margin-bottom: var(--sc-space-xs);
+      }
 
-  /* Progress bar base */
-  .sc-progress {
-    width: 100%;
-    height: 6px;
-    background: rgba(255, 255, 255, 0.08);
-    border-radius: 3px;
-    overflow: hidden;
-  }
+      .score-value {
+        font-size: var(--sc-font-xl);
+        font-weight: 700;
+        line-height: 1;
+      }
 
-  .sc-progress-fill {
-    height: 100%;
-    border-radius: 3px;
-    transition: width 0.6s ease, background-color 0.3s ease;
-  }
+      .score-sublabel {
+        font-size: var(--sc-font-xs);
+        color: var(--sc-text-secondary);
+        margin-top: 2px;
+      }
 
-  /* No data / empty state */
-  .sc-empty {
-    text-align: center;
-    padding: var(--sc-space-xl);
-    color: var(--sc-text-muted);
-    font-size: var(--sc-font-md);
-  }
+      /* Segmented progress bar */
+      .progress-segmented {
+        display: flex;
+        gap: 2px;
+        height: 4px;
+        margin-top: var(--sc-space-sm);
+      }
 
-  /* Overlay / drawer backdrop */
-  .sc-overlay {
-    position: fixed;
-    top: 0;
-    left: 0;
-    right: 0;
-    bottom: 0;
-    background: rgba(0, 0, 0, 0.6);
-    backdrop-filter: blur(4px);
-    -webkit-backdrop-filter: blur(4px);
-    z-index: 999;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-  }
+      .progress-segment {
+        flex: 1;
+        border-radius: 2px;
+        transition: background-color 0.3s ease;
+      }
 
-  /* Loading dots */
-  .sc-loading {
-    display: flex;
-    gap: var(--sc-space-xs);
-    justify-content: center;
-    padding: var(--sc-space-lg);
-  }
+      /* Status row */
+      .overview-status {
+        display: flex;
+        flex-wrap: wrap;
+        gap: var(--sc-space-sm);
+      }
 
-  .sc-loading-dot {
-    width: 8px;
-    height: 8px;
-    border-radius: 50%;
-    background: var(--sc-text-muted);
-    animation: sc-loading-bounce 1.4s infinite ease-in-out both;
-  }
+      .status-chip {
+        display: inline-flex;
+        align-items: center;
+        gap: var(--sc-space-xs);
+        padding: var(--sc-space-xs) var(--sc-space-sm);
+        background: var(--sc-tile-bg);
+        border: 1px solid var(--sc-tile-border);
+        border-radius: var(--sc-radius-xl);
+        font-size: var(--sc-font-xs);
+        color: var(--sc-text-secondary);
+        white-space: nowrap;
+      }
 
-  .sc-loading-dot:nth-child(1) { animation-delay: -0.32s; }
-  .sc-loading-dot:nth-child(2) { animation-delay: -0.16s; }
+      .status-dot {
+        width: 6px;
+        height: 6px;
+        border-radius: 50%;
+        flex-shrink: 0;
+      }
 
-  @keyframes sc-loading-bounce {
-    0%, 80%, 100% { transform: scale(0); }
-    40% { transform: scale(1); }
+      .status-label {
+        font-weight: 500;
+      }
+    `
+  ];
+  _getComfort() {
+    return getEntityState(this.hass, 'sensor.sc_house_comfort');
   }
-`;let Tt=class extends dt{constructor(){super(...arguments),this._expanded=!1,this._loading=new Set}_getSuggestionCount(){const t=xt(this.hass,"sensor.sc_ai_suggestion_count");if(!t)return 0;const e=parseInt(t.state,10);return isNaN(e)?0:e}_getSuggestions(){const t=xt(this.hass,"sensor.sc_ai_suggestion_count");if(!t)return[];const e=t.attributes?.pending_titles||[],s=t.attributes?.pending_ids||[],a=xt(this.hass,"sensor.sc_ai_daily_summary"),i=a?.attributes?.suggestions||[];return i.length>0?i:e.map((t,e)=>({id:s[e]||`suggestion_${e}`,title:t,description:"",confidence:3,priority:"medium",category:"general"}))}_getDailySummary(){const t=xt(this.hass,"sensor.sc_ai_daily_summary");return t?.state||""}_getLastAnalysis(){const t=xt(this.hass,"sensor.sc_ai_last_analysis");return t&&"unknown"!==t.state&&"unavailable"!==t.state?t.state:""}_toggleExpand(){this._expanded=!this._expanded}async _approve(t){this._loading=new Set([...this._loading,t]),this.requestUpdate();try{await yt(this.hass,"smart_climate","approve_suggestion",{suggestion_id:t})}catch(t){console.error("Failed to approve suggestion:",t)}this._loading.delete(t),this._loading=new Set(this._loading),this.requestUpdate()}async _reject(t){this._loading=new Set([...this._loading,t]),this.requestUpdate();try{await yt(this.hass,"smart_climate","reject_suggestion",{suggestion_id:t})}catch(t){console.error("Failed to reject suggestion:",t)}this._loading.delete(t),this._loading=new Set(this._loading),this.requestUpdate()}async _approveAll(){const t=this._getSuggestions();for(const e of t)await this._approve(e.id)}async _rejectAll(){const t=this._getSuggestions();for(const e of t)await this._reject(e.id)}render(){const t=this._getSuggestionCount(),e=this._getSuggestions(),s=this._getDailySummary(),a=this._getLastAnalysis();return q`
-      <div class="sc-section">
-        <!-- Collapsible header -->
-        <div class="sc-section-header" @click=${this._toggleExpand}>
-          <div class="sc-section-title">
-            AI Suggestions
-            ${t>0?q`<span class="sc-section-badge">${t}</span>`:Y}
+  _getEfficiency() {
+    return getEntityState(this.hass, 'sensor.sc_house_efficiency');
+  }
+  _getSchedule() {
+    return getEntityState(this.hass, 'sensor.sc_active_schedule');
+  }
+  _getHvacStatus() {
+    return getEntityState(this.hass, 'sensor.sc_hvac_status');
+  }
+  _getFollowMe() {
+    return getEntityState(this.hass, 'binary_sensor.sc_follow_me_active');
+  }
+  _renderSegmentedBar(score) {
+    const segments = 10;
+    const filledSegments = Math.round(score / 100 * segments);
+    const color = getComfortColor(score);
+    return html`
+      <div class="progress-segmented">
+        ${Array.from({
+      length: segments
+    }).map((_, i)=>html`
+            <div
+              class="progress-segment"
+              style="background: ${i < filledSegments ? color : 'rgba(255,255,255,0.06)'}"
+            ></div>
+          `)}
+      </div>
+    `;
+  }
+  _values() {
+    const house = this.house;
+    if (house) {
+      return {
+        comfortScore: house.comfort_score ?? NaN,
+        efficiencyScore: house.efficiency_score ?? NaN,
+        followMeActive: house.follow_me_target !== null,
+        followMeTarget: house.follow_me_target ? getRoomName(house.follow_me_target) : '',
+        scheduleName: house.active_schedule || 'None'
+      };
+    }
+    const comfort = this._getComfort();
+    const efficiency = this._getEfficiency();
+    const followMe = this._getFollowMe();
+    return {
+      comfortScore: comfort ? parseFloat(comfort.state) : NaN,
+      efficiencyScore: efficiency ? parseFloat(efficiency.state) : NaN,
+      followMeActive: followMe?.state === 'on',
+      followMeTarget: followMe?.attributes?.target_room || '',
+      scheduleName: this._getSchedule()?.state || 'None'
+    };
+  }
+  render() {
+    const { comfortScore, efficiencyScore, followMeActive, followMeTarget, scheduleName } = this._values();
+    const hvacAction = this._getHvacStatus()?.state || 'idle';
+    return html`
+      <div class="overview">
+        <!-- Title -->
+        <div class="overview-header">
+          <div>
+            <div class="overview-title">Smart Climate</div>
+            <div class="overview-subtitle">Whole-house overview</div>
           </div>
-          <span class="sc-section-chevron ${this._expanded?"open":""}"
-            >&#9662;</span
-          >
         </div>
 
-        <!-- Collapsible content -->
-        <div class="sc-section-content ${this._expanded?"open":""}">
-          <!-- Daily summary -->
-          ${s&&"unknown"!==s&&"unavailable"!==s?q`
-                <div class="daily-summary">
-                  <div class="daily-summary-label">Daily Summary</div>
-                  ${s}
-                </div>
-              `:Y}
-
-          <!-- Suggestion cards -->
-          ${e.length>0?q`
-                <div class="suggestion-list">
-                  ${e.map(t=>q`
-                      <div
-                        class="suggestion-card sc-fade-in ${this._loading.has(t.id)?"loading":""}"
-                      >
-                        <div class="suggestion-header">
-                          <span class="suggestion-title">${t.title}</span>
-                          <span
-                            class="suggestion-priority ${t.priority.toLowerCase()}"
-                            >${t.priority}</span
-                          >
-                        </div>
-
-                        ${t.description?q`<div class="suggestion-desc">
-                              ${t.description}
-                            </div>`:Y}
+        <!-- Score blocks -->
+        <div class="overview-scores">
+          <div class="score-block">
+            <div class="score-label">Comfort</div>
+            <div
+              class="score-value"
+              style="color: ${getComfortColor(comfortScore)}"
+            >
+              ${formatScore(comfortScore)}
+            </div>
+            <div class="score-sublabel">${getComfortLabel(comfortScore)}</div>
+            ${!isNaN(comfortScore) ? this._renderSegmentedBar(comfortScore) : nothing}
+          </div>
 
-                        <div class="suggestion-meta">
-                          <span class="suggestion-confidence">
-                            Confidence:
-                            <span class="confidence-dots"
-                              >${function(t){const e=Math.min(Math.max(Math.round(t),0),5),s=5-e;return"●".repeat(e)+"○".repeat(s)}(t.confidence)}</span
-                            >
-                          </span>
-                          ${t.category?q`<span class="suggestion-category"
-                                >${t.category}</span
-                              >`:Y}
-                        </div>
+          <div class="score-block">
+            <div class="score-label">Efficiency</div>
+            <div
+              class="score-value"
+              style="color: ${getComfortColor(efficiencyScore)}"
+            >
+              ${formatScore(efficiencyScore)}
+            </div>
+            <div class="score-sublabel">
+              ${!isNaN(efficiencyScore) ? `${Math.round(efficiencyScore)}%` : '--'}
+            </div>
+            ${!isNaN(efficiencyScore) ? this._renderSegmentedBar(efficiencyScore) : nothing}
+          </div>
+        </div>
 
-                        <div class="suggestion-actions">
-                          <button
-                            class="sc-btn danger small"
-                            @click=${e=>{e.stopPropagation(),this._reject(t.id)}}
-                          >
-                            Reject
-                          </button>
-                          <button
-                            class="sc-btn success small"
-                            @click=${e=>{e.stopPropagation(),this._approve(t.id)}}
-                          >
-                            Approve
-                          </button>
-                        </div>
-                      </div>
-                    `)}
-                </div>
+        <!-- Status chips -->
+        <div class="overview-status">
+          <!-- HVAC Status -->
+          <div class="status-chip">
+            <div
+              class="status-dot ${hvacAction !== 'idle' && hvacAction !== 'off' ? 'sc-dot-pulse' : ''}"
+              style="background: ${getHvacColor(hvacAction)}"
+            ></div>
+            <span>${getHvacIcon(hvacAction)}</span>
+            <span class="status-label"
+              >HVAC: ${hvacAction.charAt(0).toUpperCase() + hvacAction.slice(1)}</span
+            >
+          </div>
 
-                <!-- Bulk actions -->
-                ${e.length>1?q`
-                      <div class="bulk-actions">
-                        <button
-                          class="sc-btn danger small"
-                          @click=${this._rejectAll}
-                        >
-                          Reject All
-                        </button>
-                        <button
-                          class="sc-btn success small"
-                          @click=${this._approveAll}
-                        >
-                          Approve All
-                        </button>
-                      </div>
-                    `:Y}
-              `:q`
-                <div class="sc-empty">No pending suggestions</div>
-              `}
+          <!-- Follow-Me -->
+          ${followMeActive ? html`
+                <div class="status-chip">
+                  <div
+                    class="status-dot sc-dot-pulse"
+                    style="background: var(--sc-comfort-good)"
+                  ></div>
+                  <span class="status-label">Follow-Me: ${followMeTarget}</span>
+                </div>
+              ` : nothing}
 
-          <!-- Last analysis time -->
-          ${a?q`<div class="last-analysis">
-                Last analysis: ${a}
-              </div>`:Y}
+          <!-- Active Schedule -->
+          <div class="status-chip">
+            <span class="status-label">Schedule: ${scheduleName}</span>
+          </div>
         </div>
       </div>
-    `}};Tt.styles=[ft,bt,Pt,n`
+    `;
+  }
+}
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], HouseOverview.prototype, "hass", void 0);
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], HouseOverview.prototype, "house", void 0);
+HouseOverview = _ts_decorate([
+  customElement('house-overview')
+], HouseOverview);
+return { HouseOverview };
+})();
+__mod["components/suggestion-panel"] = (() => {
+function _ts_decorate(decorators, target, key, desc) {
+  var c = arguments.length, r = c < 3 ? target : desc === null ? desc = Object.getOwnPropertyDescriptor(target, key) : desc, d;
+  if (typeof Reflect === "object" && typeof Reflect.decorate === "function") r = Reflect.decorate(decorators, target, key, desc);
+  else for(var i = decorators.length - 1; i >= 0; i--)if (d = decorators[i]) r = (c < 3 ? d(r) : c > 3 ? d(target, key, r) : d(target, key)) || r;
+  return c > 3 && r && Object.defineProperty(target, key, r), r;
+}
+const { LitElement, html, css, nothing } = __lit;
+const { customElement, property, state } = __lit;
+const { themeStyles } = __mod["styles/theme"];
+const { animationStyles } = __mod["styles/animations"];
+const { cardStyles } = __mod["styles/card-styles"];
+const { getEntityState, callService, fetchSuggestions } = __mod["utils/ha-api"];
+const { confidenceDots } = __mod["utils/formatters"];
+// The most the smart_climate/suggestions command returns per page
+const SUGGESTION_PAGE_SIZE = 100;
+class SuggestionPanel extends LitElement {
+  constructor(){
+    super(...arguments);
+    this._expanded = false;
+    this._loading = new Set();
+    this._suggestions = [];
+    this._pendingKey = null;
+  }
+  // Pending ids the current list was fetched for
+  static styles = [
+    themeStyles,
+    animationStyles,
+    cardStyles,
+    css`
       :host {
         display: block;
       }
@@ -1191,126 +2031,280 @@ var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=argume
         text-align: right;
         margin-top: var(--sc-space-sm);
       }
-    `],e([mt({attribute:!1})],Tt.prototype,"hass",void 0),e([gt()],Tt.prototype,"_expanded",void 0),e([gt()],Tt.prototype,"_loading",void 0),Tt=e([ht("suggestion-panel")],Tt);let Ot=class extends dt{constructor(){super(...arguments),this._expanded=!1,this._colors=["#4caf50","#2196f3","#ff9800","#9c27b0","#00bcd4","#e91e63","#8bc34a","#ff5722"]}_getScheduleBlocks(){const t=xt(this.hass,"sensor.sc_active_schedule");if(!t)return[];const e=t.attributes?.today_blocks||[],s=new Map;let a=0;return e.map(t=>t.color?t:(s.has(t.name)||(s.set(t.name,this._colors[a%this._colors.length]),a++),{...t,color:s.get(t.name)||"#9e9e9e"}))}_toggleExpand(){this._expanded=!this._expanded}_timeToPercent(t,e){return(60*t+e)/1440*100}_renderTimeline(t){const e=new Date,s=this._timeToPercent(e.getHours(),e.getMinutes()),a=15;return W`
-      <svg
-        class="timeline-svg"
-        viewBox="0 0 ${100} ${55}"
-        preserveAspectRatio="none"
-      >
-        <!-- Background track -->
-        <rect
-          x="0" y="${a}"
-          width="${100}" height="${20}"
-          rx="4" ry="4"
-          fill="rgba(255,255,255,0.04)"
-        />
-
-        <!-- Hour markers -->
-        ${[6,12,18].map(t=>W`
-            <line
-              x1="${this._timeToPercent(t,0)}" y1="${a}"
-              x2="${this._timeToPercent(t,0)}" y2="${35}"
-              stroke="rgba(255,255,255,0.08)"
-              stroke-width="0.3"
-            />
-            <text
-              x="${this._timeToPercent(t,0)}"
-              y="${45}"
-              text-anchor="middle"
-              fill="rgba(255,255,255,0.3)"
-              font-size="3.5"
-              font-family="sans-serif"
-            >
-              ${12===t?"12p":t<12?`${t}a`:t-12+"p"}
-            </text>
-          `)}
-
-        <!-- Schedule blocks -->
-        ${t.map(t=>{const e=this._timeToPercent(t.start_hour,t.start_minute),s=this._timeToPercent(t.end_hour,t.end_minute),a=Math.max(.5,s-e);return W`
-            <rect
-              x="${e}" y="${16}"
-              width="${a}" height="${18}"
-              rx="2" ry="2"
-              fill="${t.color}"
-              opacity="0.7"
-            >
-              <title>${t.name}: ${t.start_hour}:${String(t.start_minute).padStart(2,"0")} - ${t.end_hour}:${String(t.end_minute).padStart(2,"0")}</title>
-            </rect>
-          `})}
-
-        <!-- NOW marker -->
-        <line
-          x1="${s}" y1="${11}"
-          x2="${s}" y2="${39}"
-          stroke="#ff5252"
-          stroke-width="0.6"
-        />
-        <circle
-          cx="${s}" cy="${11}"
-          r="2"
-          fill="#ff5252"
-        />
-        <text
-          x="${s}"
-          y="${8}"
-          text-anchor="middle"
-          fill="#ff5252"
-          font-size="3"
-          font-weight="bold"
-          font-family="sans-serif"
-        >
-          NOW
-        </text>
-      </svg>
-    `}render(){const t=this._getScheduleBlocks(),e=xt(this.hass,"sensor.sc_active_schedule"),s=e?.state||"None",a=new Date,i=new Map;return t.forEach(t=>i.set(t.name,t.color)),q`
+    `
+  ];
+  _getSuggestionCount() {
+    const entity = getEntityState(this.hass, 'sensor.sc_ai_suggestion_count');
+    if (!entity) return 0;
+    const num = parseInt(entity.state, 10);
+    return isNaN(num) ? 0 : num;
+  }
+  _getSuggestions() {
+    return this._suggestions;
+  }
+  updated(changed) {
+    if (changed.has('hass')) {
+      this._refreshSuggestions();
+    }
+  }
+  /**
+   * Re-fetch pending suggestions when the set of pending ids changes.
+   * The count sensor only carries ids; the text comes over websocket.
+   */ async _refreshSuggestions() {
+    const countEntity = getEntityState(this.hass, 'sensor.sc_ai_suggestion_count');
+    const pendingIds = countEntity?.attributes?.pending_ids || [];
+    const key = pendingIds.join(',');
+    if (key === this._pendingKey) return;
+    this._pendingKey = key;
+    if (pendingIds.length === 0) {
+      this._suggestions = [];
+      return;
+    }
+    try {
+      const page = await fetchSuggestions(this.hass, {
+        status: 'pending',
+        limit: SUGGESTION_PAGE_SIZE
+      });
+      // A newer change may have started another fetch meanwhile.
+      if (key !== this._pendingKey) return;
+      this._suggestions = page.suggestions.map((s)=>({
+          id: s.id,
+          title: s.title,
+          description: s.description,
+          // Stored as 0-1; the dots show 0-5.
+          confidence: s.confidence * 5,
+          priority: s.priority,
+          category: s.action_type
+        }));
+    } catch (err) {
+      console.error('Failed to fetch suggestions:', err);
+      this._pendingKey = null;
+    }
+  }
+  _getDailySummary() {
+    const entity = getEntityState(this.hass, 'sensor.sc_ai_daily_summary');
+    return entity?.state || '';
+  }
+  _getLastAnalysis() {
+    const entity = getEntityState(this.hass, 'sensor.sc_ai_last_analysis');
+    if (!entity || entity.state === 'unknown' || entity.state === 'unavailable') return '';
+    return entity.state;
+  }
+  _toggleExpand() {
+    this._expanded = !this._expanded;
+  }
+  async _approve(suggestionId) {
+    this._loading = new Set([
+      ...this._loading,
+      suggestionId
+    ]);
+    this.requestUpdate();
+    try {
+      await callService(this.hass, 'smart_climate', 'approve_suggestion', {
+        suggestion_id: suggestionId
+      });
+    } catch (err) {
+      console.error('Failed to approve suggestion:', err);
+    }
+    this._loading.delete(suggestionId);
+    this._loading = new Set(this._loading);
+    this.requestUpdate();
+  }
+  async _reject(suggestionId) {
+    this._loading = new Set([
+      ...this._loading,
+      suggestionId
+    ]);
+    this.requestUpdate();
+    try {
+      await callService(this.hass, 'smart_climate', 'reject_suggestion', {
+        suggestion_id: suggestionId
+      });
+    } catch (err) {
+      console.error('Failed to reject suggestion:', err);
+    }
+    this._loading.delete(suggestionId);
+    this._loading = new Set(this._loading);
+    this.requestUpdate();
+  }
+  async _approveAll() {
+    const suggestions = this._getSuggestions();
+    for (const s of suggestions){
+      await this._approve(s.id);
+    }
+  }
+  async _rejectAll() {
+    const suggestions = this._getSuggestions();
+    for (const s of suggestions){
+      await this._reject(s.id);
+    }
+  }
+  render() {
+    const count = this._getSuggestionCount();
+    const suggestions = this._getSuggestions();
+    const dailySummary = this._getDailySummary();
+    const lastAnalysis = this._getLastAnalysis();
+    return html`
       <div class="sc-section">
         <!-- Collapsible header -->
         <div class="sc-section-header" @click=${this._toggleExpand}>
           <div class="sc-section-title">
-            Schedule
-            <span class="sc-section-badge">${s}</span>
+            AI Suggestions
+            ${count > 0 ? html`<span class="sc-section-badge">${count}</span>` : nothing}
           </div>
-          <span class="sc-section-chevron ${this._expanded?"open":""}"
+          <span class="sc-section-chevron ${this._expanded ? 'open' : ''}"
             >&#9662;</span
           >
         </div>
 
         <!-- Collapsible content -->
-        <div class="sc-section-content ${this._expanded?"open":""}">
-          <div class="active-schedule-info">
-            Active:
-            <span class="active-schedule-name">${s}</span>
-            &middot; ${r=a,r.toLocaleTimeString("en-US",{hour:"numeric",minute:"2-digit",hour12:!0})}
-          </div>
-
-          ${t.length>0?q`
-                <div class="timeline-container">
-                  ${this._renderTimeline(t)}
-                  <div class="timeline-labels">
-                    <span>12 AM</span>
-                    <span>6 AM</span>
-                    <span>12 PM</span>
-                    <span>6 PM</span>
-                    <span>12 AM</span>
-                  </div>
+        <div class="sc-section-content ${this._expanded ? 'open' : ''}">
+          <!-- Daily summary -->
+          ${dailySummary && dailySummary !== 'unknown' && dailySummary !== 'unavailable' ? html`
+                <div class="daily-summary">
+                  <div class="daily-summary-label">Daily Summary</div>
+                  ${dailySummary}
                 </div>
+              ` : nothing}
 
-                <!-- Legend -->
-                <div class="schedule-legend">
-                  ${[...i.entries()].map(([t,e])=>q`
-                      <div class="legend-item">
-                        <span
-                          class="legend-dot"
-                          style="background: ${e}"
-                        ></span>
-                        ${t}
+          <!-- Suggestion cards -->
+          ${suggestions.length > 0 ? html`
+                <div class="suggestion-list">
+                  ${suggestions.map((s)=>html`
+                      <div
+                        class="suggestion-card sc-fade-in ${this._loading.has(s.id) ? 'loading' : ''}"
+                      >
+                        <div class="suggestion-header">
+                          <span class="suggestion-title">${s.title}</span>
+                          <span
+                            class="suggestion-priority ${s.priority.toLowerCase()}"
+                            >${s.priority}</span
+                          >
+                        </div>
+
+                        ${s.description ? html`<div class="suggestion-desc">
+                              ${s.description}
+                            </div>` : nothing}
+
+                        <div class="suggestion-meta">
+                          <span class="suggestion-confidence">
+                            Confidence:
+                            <span class="confidence-dots"
+                              >${confidenceDots(s.confidence)}</span
+                            >
+                          </span>
+                          ${s.category ? html`<span class="suggestion-category"
+                                >${s.category}</span
+                              >` : nothing}
+                        </div>
+
+                        <div class="suggestion-actions">
+                          <button
+                            class="sc-btn danger small"
+                            @click=${(e)=>{
+        e.stopPropagation();
+        this._reject(s.id);
+      }}
+                          >
+                            Reject
+                          </button>
+                          <button
+                            class="sc-btn success small"
+                            @click=${(e)=>{
+        e.stopPropagation();
+        this._approve(s.id);
+      }}
+                          >
+                            Approve
+                          </button>
+                        </div>
                       </div>
                     `)}
                 </div>
-              `:q`<div class="sc-empty">No schedules configured for today</div>`}
+
+                <!-- Bulk actions -->
+                ${suggestions.length > 1 ? html`
+                      <div class="bulk-actions">
+                        <button
+                          class="sc-btn danger small"
+                          @click=${this._rejectAll}
+                        >
+                          Reject All
+                        </button>
+                        <button
+                          class="sc-btn success small"
+                          @click=${this._approveAll}
+                        >
+                          Approve All
+                        </button>
+                      </div>
+                    ` : nothing}
+              ` : html`
+                <div class="sc-empty">No pending suggestions</div>
+              `}
+
+          <!-- Last analysis time -->
+          ${lastAnalysis ? html`<div class="last-analysis">
+                Last analysis: ${lastAnalysis}
+              </div>` : nothing}
         </div>
       </div>
-    `;var r}};Ot.styles=[ft,bt,Pt,n`
+    `;
+  }
+}
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], SuggestionPanel.prototype, "hass", void 0);
+_ts_decorate([
+  state()
+], SuggestionPanel.prototype, "_expanded", void 0);
+_ts_decorate([
+  state()
+], SuggestionPanel.prototype, "_loading", void 0);
+_ts_decorate([
+  state()
+], SuggestionPanel.prototype, "_suggestions", void 0);
+SuggestionPanel = _ts_decorate([
+  customElement('suggestion-panel')
+], SuggestionPanel);
+return { SuggestionPanel };
+})();
+__mod["components/schedule-view"] = (() => {
+function _ts_decorate(decorators, target, key, desc) {
+  var c = arguments.length, r = c < 3 ? target : desc === null ? desc = Object.getOwnPropertyDescriptor(target, key) : desc, d;
+  if (typeof Reflect === "object" && typeof Reflect.decorate === "function") r = Reflect.decorate(decorators, target, key, desc);
+  else for(var i = decorators.length - 1; i >= 0; i--)if (d = decorators[i]) r = (c < 3 ? d(r) : c > 3 ? d(target, key, r) : d(target, key)) || r;
+  return c > 3 && r && Object.defineProperty(target, key, r), r;
+}
+const { LitElement, html, css, svg } = __lit;
+const { customElement, property, state } = __lit;
+const { themeStyles } = __mod["styles/theme"];
+const { animationStyles } = __mod["styles/animations"];
+const { cardStyles } = __mod["styles/card-styles"];
+const { getEntityState } = __mod["utils/ha-api"];
+const { formatTime } = __mod["utils/formatters"];
+class ScheduleView extends LitElement {
+  constructor(){
+    super(...arguments);
+    this._expanded = false;
+    this._colors = [
+      '#4caf50',
+      '#2196f3',
+      '#ff9800',
+      '#9c27b0',
+      '#00bcd4',
+      '#e91e63',
+      '#8bc34a',
+      '#ff5722'
+    ];
+  }
+  static styles = [
+    themeStyles,
+    animationStyles,
+    cardStyles,
+    css`
       :host {
         display: block;
       }
@@ -1358,182 +2352,286 @@ var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=argume
       }
 
       .active-schedule-info {
-        font-size: var(--sc-font-sm);
-        color: var(--sc-text-secondary);
-        margin-bottom: var(--sc-space-sm);
-      }
-
-      .active-schedule-name {
-        color: var(--sc-text-primary);
-        font-weight: 600;
-      }
-    `],e([mt({attribute:!1})],Ot.prototype,"hass",void 0),e([gt()],Ot.prototype,"_expanded",void 0),Ot=e([ht("schedule-view")],Ot);let Ht=class extends dt{constructor(){super(...arguments),this.roomSlug="",this.open=!1,this._targetTemp=72,this._hvacMode="auto"}_entity(t){return xt(this.hass,`sensor.sc_${this.roomSlug}_${t}`)}_binaryEntity(t){return xt(this.hass,`binary_sensor.sc_${this.roomSlug}_${t}`)}_close(){this.dispatchEvent(new CustomEvent("room-detail-close",{bubbles:!0,composed:!0}))}_handleOverlayClick(t){t.target.classList.contains("detail-overlay")&&this._close()}_adjustTarget(t){this._targetTemp=Math.round(2*(this._targetTemp+t))/2,yt(this.hass,"smart_climate","set_target_temperature",{room:this.roomSlug,temperature:this._targetTemp}).catch(t=>console.error("Failed to set target temperature:",t))}_setMode(t){this._hvacMode=t,yt(this.hass,"smart_climate","set_hvac_mode",{room:this.roomSlug,mode:t}).catch(t=>console.error("Failed to set HVAC mode:",t))}updated(t){if(t.has("roomSlug")||t.has("open")){const t=this._entity("target_temperature");if(t){const e=parseFloat(t.state);isNaN(e)||(this._targetTemp=e)}const e=this._entity("hvac_mode");e&&"unknown"!==e.state&&(this._hvacMode=e.state)}}render(){if(!this.open||!this.roomSlug)return Y;const t=this._entity("comfort_score"),e=this._entity("efficiency"),s=this._entity("temperature"),a=this._entity("humidity"),i=this._entity("temperature_trend"),r=this._entity("hvac_action"),o=this._entity("hvac_runtime"),n=this._entity("active_schedule"),c=this._entity("vent_position"),l=this._entity("auxiliary"),d=t?parseFloat(t.state):NaN,p=e?parseFloat(e.state):NaN,h=s?.state,u=a?.state,v=i?.state,m=r?.state||"idle",g=o?.state,f=n?.state||"None",b=s?.attributes?.unit_of_measurement||"°F",y=c?.state,x=c?.attributes?.friendly_name||"Vent",_=l?.attributes?.devices||[],$=t?.attributes?.sensors||[];return q`
-      <div class="detail-overlay" @click=${this._handleOverlayClick}>
-        <div class="detail-drawer">
-          <!-- Handle -->
-          <div class="detail-handle"></div>
-
-          <!-- Header -->
-          <div class="detail-header">
-            <span class="detail-title">${_t(this.roomSlug)}</span>
-            <button class="detail-close" @click=${this._close}>&times;</button>
-          </div>
-
-          <!-- Temperature display -->
-          <div class="detail-section">
-            <div class="detail-temp-display">
-              <span class="detail-temp-value">${$t(h,"")}</span>
-              <span class="detail-temp-unit">${b}</span>
-              <span class="detail-temp-trend">${At(v)}</span>
-            </div>
-          </div>
-
-          <!-- Stats grid -->
-          <div class="detail-section">
-            <div class="detail-stats">
-              <div class="detail-stat">
-                <div class="detail-stat-label">Humidity</div>
-                <div class="detail-stat-value">
-                  ${u&&"unknown"!==u?`${Math.round(parseFloat(u))}%`:"--"}
-                </div>
-              </div>
-              <div class="detail-stat">
-                <div class="detail-stat-label">HVAC</div>
-                <div class="detail-stat-value" style="color: ${Et(m)}">
-                  ${Ct(m)}
-                  ${m.charAt(0).toUpperCase()+m.slice(1)}
-                </div>
-                <div class="detail-stat-sub">Runtime: ${zt(g)}</div>
-              </div>
-              <div class="detail-stat">
-                <div class="detail-stat-label">Schedule</div>
-                <div class="detail-stat-value">${f}</div>
-              </div>
-              <div class="detail-stat">
-                <div class="detail-stat-label">Target</div>
-                <div class="detail-stat-value">${$t(this._targetTemp,b)}</div>
-              </div>
-            </div>
-          </div>
-
-          <!-- Comfort / Efficiency bars -->
-          <div class="detail-section">
-            <div class="detail-section-title">Performance</div>
-
-            <div class="detail-bar-row">
-              <span class="detail-bar-label">Comfort</span>
-              <div class="detail-bar">
-                <div
-                  class="detail-bar-fill"
-                  style="width: ${isNaN(d)?0:d}%; background: ${kt(d)}"
-                ></div>
-              </div>
-              <span class="detail-bar-value" style="color: ${kt(d)}">
-                ${wt(d)}
-              </span>
-            </div>
+        font-size: var(--sc-font-sm);
+        color: var(--sc-text-secondary);
+        margin-bottom: var(--sc-space-sm);
+      }
 
-            <div class="detail-bar-row">
-              <span class="detail-bar-label">Efficiency</span>
-              <div class="detail-bar">
-                <div
-                  class="detail-bar-fill"
-                  style="width: ${isNaN(p)?0:p}%; background: ${kt(p)}"
-                ></div>
-              </div>
-              <span class="detail-bar-value" style="color: ${kt(p)}">
-                ${wt(p)}
-              </span>
-            </div>
+      .active-schedule-name {
+        color: var(--sc-text-primary);
+        font-weight: 600;
+      }
+    `
+  ];
+  // Schedule colors palette
+  /**
+   * Today's blocks from the feed's schedule definitions.  Days count from
+   * Monday = 0; a schedule ending at or before its start runs overnight.
+   */ _blocksFromFeed(schedules) {
+    const today = (new Date().getDay() + 6) % 7;
+    const yesterday = (today + 6) % 7;
+    const blocks = [];
+    for (const schedule of Object.values(schedules)){
+      if (!schedule.enabled) continue;
+      const [startHour, startMinute] = schedule.start_time.split(':').map(Number);
+      const [endHour, endMinute] = schedule.end_time.split(':').map(Number);
+      const overnight = endHour * 60 + endMinute <= startHour * 60 + startMinute;
+      const block = {
+        name: schedule.name,
+        color: ''
+      };
+      if (schedule.days.includes(today)) {
+        blocks.push({
+          ...block,
+          start_hour: startHour,
+          start_minute: startMinute,
+          end_hour: overnight ? 24 : endHour,
+          end_minute: overnight ? 0 : endMinute
+        });
+      }
+      if (overnight && schedule.days.includes(yesterday)) {
+        blocks.push({
+          ...block,
+          start_hour: 0,
+          start_minute: 0,
+          end_hour: endHour,
+          end_minute: endMinute
+        });
+      }
+    }
+    return blocks;
+  }
+  _getScheduleBlocks() {
+    let schedules;
+    if (this.schedules) {
+      schedules = this._blocksFromFeed(this.schedules);
+    } else {
+      const entity = getEntityState(this.hass, 'sensor.sc_active_schedule');
+      if (!entity) return [];
+      schedules = entity.attributes?.today_blocks || [];
+    }
+    // Assign colors if not present
+    const nameColorMap = new Map();
+    let colorIdx = 0;
+    return schedules.map((block)=>{
+      if (!block.color) {
+        if (!nameColorMap.has(block.name)) {
+          nameColorMap.set(block.name, this._colors[colorIdx % this._colors.length]);
+          colorIdx++;
+        }
+        return {
+          ...block,
+          color: nameColorMap.get(block.name) || '#9e9e9e'
+        };
+      }
+      return block;
+    });
+  }
+  _toggleExpand() {
+    this._expanded = !this._expanded;
+  }
+  _timeToPercent(hour, minute) {
+    return (hour * 60 + minute) / (24 * 60) * 100;
+  }
+  _renderTimeline(blocks) {
+    const now = new Date();
+    const nowPercent = this._timeToPercent(now.getHours(), now.getMinutes());
+    const svgWidth = 100; // viewBox percentage
+    const barY = 15;
+    const barHeight = 20;
+    const totalHeight = 55;
+    return svg`
+      <svg
+        class="timeline-svg"
+        viewBox="0 0 ${svgWidth} ${totalHeight}"
+        preserveAspectRatio="none"
+      >
+        <!-- Background track -->
+        <rect
+          x="0" y="${barY}"
+          width="${svgWidth}" height="${barHeight}"
+          rx="4" ry="4"
+          fill="rgba(255,255,255,0.04)"
+        />
 
-            <!-- Efficiency chart -->
-            <efficiency-chart
-              .hass=${this.hass}
-              .roomSlug=${this.roomSlug}
-            ></efficiency-chart>
-          </div>
+        <!-- Hour markers -->
+        ${[
+      6,
+      12,
+      18
+    ].map((hour)=>svg`
+            <line
+              x1="${this._timeToPercent(hour, 0)}" y1="${barY}"
+              x2="${this._timeToPercent(hour, 0)}" y2="${barY + barHeight}"
+              stroke="rgba(255,255,255,0.08)"
+              stroke-width="0.3"
+            />
+            <text
+              x="${this._timeToPercent(hour, 0)}"
+              y="${barY + barHeight + 10}"
+              text-anchor="middle"
+              fill="rgba(255,255,255,0.3)"
+              font-size="3.5"
+              font-family="sans-serif"
+            >
+              ${hour === 12 ? '12p' : hour < 12 ? `${hour}a` : `${hour - 12}p`}
+            </text>
+          `)}
 
-          <!-- Climate controls -->
-          <div class="detail-section">
-            <div class="detail-section-title">Climate Control</div>
-            <div class="detail-controls">
-              <!-- Target temperature -->
-              <div class="control-row">
-                <span class="control-label">Target</span>
-                <div class="temp-control">
-                  <button class="temp-btn" @click=${()=>this._adjustTarget(-.5)}>-</button>
-                  <span class="temp-display">${$t(this._targetTemp,b)}</span>
-                  <button class="temp-btn" @click=${()=>this._adjustTarget(.5)}>+</button>
-                </div>
-              </div>
+        <!-- Schedule blocks -->
+        ${blocks.map((block)=>{
+      const startPct = this._timeToPercent(block.start_hour, block.start_minute);
+      const endPct = this._timeToPercent(block.end_hour, block.end_minute);
+      const width = Math.max(0.5, endPct - startPct);
+      return svg`
+            <rect
+              x="${startPct}" y="${barY + 1}"
+              width="${width}" height="${barHeight - 2}"
+              rx="2" ry="2"
+              fill="${block.color}"
+              opacity="0.7"
+            >
+              <title>${block.name}: ${block.start_hour}:${String(block.start_minute).padStart(2, '0')} - ${block.end_hour}:${String(block.end_minute).padStart(2, '0')}</title>
+            </rect>
+          `;
+    })}
 
-              <!-- Mode select -->
-              <div class="control-row">
-                <span class="control-label">Mode</span>
-                <div class="mode-select">
-                  ${["auto","heat","cool","fan_only","off"].map(t=>q`
-                      <button
-                        class="mode-btn ${this._hvacMode===t?"active":""}"
-                        @click=${()=>this._setMode(t)}
-                      >
-                        ${t.replace("_"," ")}
-                      </button>
-                    `)}
-                </div>
-              </div>
-            </div>
+        <!-- NOW marker -->
+        <line
+          x1="${nowPercent}" y1="${barY - 4}"
+          x2="${nowPercent}" y2="${barY + barHeight + 4}"
+          stroke="#ff5252"
+          stroke-width="0.6"
+        />
+        <circle
+          cx="${nowPercent}" cy="${barY - 4}"
+          r="2"
+          fill="#ff5252"
+        />
+        <text
+          x="${nowPercent}"
+          y="${barY - 7}"
+          text-anchor="middle"
+          fill="#ff5252"
+          font-size="3"
+          font-weight="bold"
+          font-family="sans-serif"
+        >
+          NOW
+        </text>
+      </svg>
+    `;
+  }
+  render() {
+    const blocks = this._getScheduleBlocks();
+    const activeName = this.house ? this.house.active_schedule || 'None' : getEntityState(this.hass, 'sensor.sc_active_schedule')?.state || 'None';
+    const now = new Date();
+    // Build unique legend entries
+    const legendNames = new Map();
+    blocks.forEach((b)=>legendNames.set(b.name, b.color));
+    return html`
+      <div class="sc-section">
+        <!-- Collapsible header -->
+        <div class="sc-section-header" @click=${this._toggleExpand}>
+          <div class="sc-section-title">
+            Schedule
+            <span class="sc-section-badge">${activeName}</span>
           </div>
+          <span class="sc-section-chevron ${this._expanded ? 'open' : ''}"
+            >&#9662;</span
+          >
+        </div>
 
-          <!-- Vent status -->
-          ${y&&"unknown"!==y&&"unavailable"!==y?q`
-                <div class="detail-section">
-                  <div class="detail-section-title">Vent</div>
-                  <div class="vent-status">
-                    <span class="vent-icon">🔲</span>
-                    <div class="vent-info">
-                      <div class="vent-name">${x}</div>
-                      <div class="vent-position">Position: ${y}%</div>
-                    </div>
-                  </div>
-                </div>
-              `:Y}
+        <!-- Collapsible content -->
+        <div class="sc-section-content ${this._expanded ? 'open' : ''}">
+          <div class="active-schedule-info">
+            Active:
+            <span class="active-schedule-name">${activeName}</span>
+            &middot; ${formatTime(now)}
+          </div>
 
-          <!-- Auxiliary devices -->
-          ${_.length>0?q`
-                <div class="detail-section">
-                  <div class="detail-section-title">Auxiliary Devices</div>
-                  <div class="device-list">
-                    ${_.map(t=>q`
-                        <div class="device-item">
-                          <span class="device-icon">
-                            ${"on"===t.state||"active"===t.state?"🟢":"⚫"}
-                          </span>
-                          <span class="device-name">${t.name}</span>
-                          <span class="device-state">${t.state}</span>
-                        </div>
-                      `)}
+          ${blocks.length > 0 ? html`
+                <div class="timeline-container">
+                  ${this._renderTimeline(blocks)}
+                  <div class="timeline-labels">
+                    <span>12 AM</span>
+                    <span>6 AM</span>
+                    <span>12 PM</span>
+                    <span>6 PM</span>
+                    <span>12 AM</span>
                   </div>
                 </div>
-              `:Y}
 
-          <!-- Sensor list -->
-          ${$.length>0?q`
-                <div class="detail-section">
-                  <div class="detail-section-title">Sensors</div>
-                  <div class="device-list">
-                    ${$.map(t=>q`
-                        <div class="device-item">
-                          <span class="device-icon">📡</span>
-                          <span class="device-name">${t.name}</span>
-                          <span class="device-state">${t.state}</span>
-                        </div>
-                      `)}
-                  </div>
+                <!-- Legend -->
+                <div class="schedule-legend">
+                  ${[
+      ...legendNames.entries()
+    ].map(([name, color])=>html`
+                      <div class="legend-item">
+                        <span
+                          class="legend-dot"
+                          style="background: ${color}"
+                        ></span>
+                        ${name}
+                      </div>
+                    `)}
                 </div>
-              `:Y}
+              ` : html`<div class="sc-empty">No schedules configured for today</div>`}
         </div>
       </div>
-    `}};Ht.styles=[ft,bt,Pt,n`
+    `;
+  }
+}
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], ScheduleView.prototype, "hass", void 0);
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], ScheduleView.prototype, "schedules", void 0);
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], ScheduleView.prototype, "house", void 0);
+_ts_decorate([
+  state()
+], ScheduleView.prototype, "_expanded", void 0);
+ScheduleView = _ts_decorate([
+  customElement('schedule-view')
+], ScheduleView);
+return { ScheduleView };
+})();
+__mod["components/room-detail"] = (() => {
+function _ts_decorate(decorators, target, key, desc) {
+  var c = arguments.length, r = c < 3 ? target : desc === null ? desc = Object.getOwnPropertyDescriptor(target, key) : desc, d;
+  if (typeof Reflect === "object" && typeof Reflect.decorate === "function") r = Reflect.decorate(decorators, target, key, desc);
+  else for(var i = decorators.length - 1; i >= 0; i--)if (d = decorators[i]) r = (c < 3 ? d(r) : c > 3 ? d(target, key, r) : d(target, key)) || r;
+  return c > 3 && r && Object.defineProperty(target, key, r), r;
+}
+const { LitElement, html, css, nothing } = __lit;
+const { customElement, property, state } = __lit;
+const { themeStyles } = __mod["styles/theme"];
+const { animationStyles } = __mod["styles/animations"];
+const { cardStyles } = __mod["styles/card-styles"];
+const { getEntityState, callService, getRoomName } = __mod["utils/ha-api"];
+const { formatTemp, formatScore, getComfortColor, getTrendArrow, getHvacIcon, getHvacColor, formatDuration } = __mod["utils/formatters"];
+class RoomDetail extends LitElement {
+  constructor(){
+    super(...arguments);
+    this.roomSlug = '';
+    this.open = false;
+    this._targetTemp = 72;
+    this._hvacMode = 'auto';
+  }
+  static styles = [
+    themeStyles,
+    animationStyles,
+    cardStyles,
+    css`
       :host {
         display: block;
       }
@@ -1824,72 +2922,336 @@ var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=argume
         color: var(--sc-text-primary);
       }
 
-      .device-state {
-        font-size: var(--sc-font-xs);
-        color: var(--sc-text-muted);
-      }
+      .device-state {
+        font-size: var(--sc-font-xs);
+        color: var(--sc-text-muted);
+      }
+
+      /* Vent status */
+      .vent-status {
+        display: flex;
+        align-items: center;
+        gap: var(--sc-space-sm);
+        padding: var(--sc-space-sm);
+        background: var(--sc-tile-bg);
+        border-radius: var(--sc-radius-sm);
+      }
+
+      .vent-icon {
+        font-size: var(--sc-font-lg);
+      }
+
+      .vent-info {
+        flex: 1;
+      }
+
+      .vent-name {
+        font-size: var(--sc-font-sm);
+        color: var(--sc-text-primary);
+      }
+
+      .vent-position {
+        font-size: var(--sc-font-xs);
+        color: var(--sc-text-muted);
+      }
+    `
+  ];
+  _entity(suffix) {
+    return getEntityState(this.hass, `sensor.sc_${this.roomSlug}_${suffix}`);
+  }
+  _binaryEntity(suffix) {
+    return getEntityState(this.hass, `binary_sensor.sc_${this.roomSlug}_${suffix}`);
+  }
+  _close() {
+    this.dispatchEvent(new CustomEvent('room-detail-close', {
+      bubbles: true,
+      composed: true
+    }));
+  }
+  _handleOverlayClick(e) {
+    if (e.target.classList.contains('detail-overlay')) {
+      this._close();
+    }
+  }
+  _adjustTarget(delta) {
+    this._targetTemp = Math.round((this._targetTemp + delta) * 2) / 2;
+    callService(this.hass, 'smart_climate', 'set_target_temperature', {
+      room: this.roomSlug,
+      temperature: this._targetTemp
+    }).catch((err)=>console.error('Failed to set target temperature:', err));
+  }
+  _setMode(mode) {
+    this._hvacMode = mode;
+    callService(this.hass, 'smart_climate', 'set_hvac_mode', {
+      room: this.roomSlug,
+      mode
+    }).catch((err)=>console.error('Failed to set HVAC mode:', err));
+  }
+  updated(changedProps) {
+    if (changedProps.has('roomSlug') || changedProps.has('open')) {
+      // Sync target temp from entity when opening
+      const targetEntity = this._entity('target_temperature');
+      if (targetEntity) {
+        const val = parseFloat(targetEntity.state);
+        if (!isNaN(val)) this._targetTemp = val;
+      }
+      // Sync HVAC mode
+      const modeEntity = this._entity('hvac_mode');
+      if (modeEntity && modeEntity.state !== 'unknown') {
+        this._hvacMode = modeEntity.state;
+      }
+    }
+  }
+  render() {
+    if (!this.open || !this.roomSlug) return nothing;
+    const comfortEntity = this._entity('comfort_score');
+    const efficiencyEntity = this._entity('efficiency');
+    const tempEntity = this._entity('temperature');
+    const humidityEntity = this._entity('humidity');
+    const trendEntity = this._entity('temperature_trend');
+    const hvacEntity = this._entity('hvac_action');
+    const runtimeEntity = this._entity('hvac_runtime');
+    const scheduleEntity = this._entity('active_schedule');
+    const ventEntity = this._entity('vent_position');
+    const auxEntity = this._entity('auxiliary');
+    const comfortScore = comfortEntity ? parseFloat(comfortEntity.state) : NaN;
+    const efficiencyScore = efficiencyEntity ? parseFloat(efficiencyEntity.state) : NaN;
+    const temp = tempEntity?.state;
+    const humidity = humidityEntity?.state;
+    const trend = trendEntity?.state;
+    const hvacAction = hvacEntity?.state || 'idle';
+    const runtime = runtimeEntity?.state;
+    const schedule = scheduleEntity?.state || 'None';
+    const tempUnit = tempEntity?.attributes?.unit_of_measurement || '°F';
+    // Vent info
+    const ventPosition = ventEntity?.state;
+    const ventName = ventEntity?.attributes?.friendly_name || 'Vent';
+    // Auxiliary devices
+    const auxDevices = auxEntity?.attributes?.devices || [];
+    // Sensor list from attributes
+    const sensors = comfortEntity?.attributes?.sensors || [];
+    const hvacModes = [
+      'auto',
+      'heat',
+      'cool',
+      'fan_only',
+      'off'
+    ];
+    return html`
+      <div class="detail-overlay" @click=${this._handleOverlayClick}>
+        <div class="detail-drawer">
+          <!-- Handle -->
+          <div class="detail-handle"></div>
+
+          <!-- Header -->
+          <div class="detail-header">
+            <span class="detail-title">${getRoomName(this.roomSlug)}</span>
+            <button class="detail-close" @click=${this._close}>&times;</button>
+          </div>
+
+          <!-- Temperature display -->
+          <div class="detail-section">
+            <div class="detail-temp-display">
+              <span class="detail-temp-value">${formatTemp(temp, '')}</span>
+              <span class="detail-temp-unit">${tempUnit}</span>
+              <span class="detail-temp-trend">${getTrendArrow(trend)}</span>
+            </div>
+          </div>
+
+          <!-- Stats grid -->
+          <div class="detail-section">
+            <div class="detail-stats">
+              <div class="detail-stat">
+                <div class="detail-stat-label">Humidity</div>
+                <div class="detail-stat-value">
+                  ${humidity && humidity !== 'unknown' ? `${Math.round(parseFloat(humidity))}%` : '--'}
+                </div>
+              </div>
+              <div class="detail-stat">
+                <div class="detail-stat-label">HVAC</div>
+                <div class="detail-stat-value" style="color: ${getHvacColor(hvacAction)}">
+                  ${getHvacIcon(hvacAction)}
+                  ${hvacAction.charAt(0).toUpperCase() + hvacAction.slice(1)}
+                </div>
+                <div class="detail-stat-sub">Runtime: ${formatDuration(runtime)}</div>
+              </div>
+              <div class="detail-stat">
+                <div class="detail-stat-label">Schedule</div>
+                <div class="detail-stat-value">${schedule}</div>
+              </div>
+              <div class="detail-stat">
+                <div class="detail-stat-label">Target</div>
+                <div class="detail-stat-value">${formatTemp(this._targetTemp, tempUnit)}</div>
+              </div>
+            </div>
+          </div>
+
+          <!-- Comfort / Efficiency bars -->
+          <div class="detail-section">
+            <div class="detail-section-title">Performance</div>
+
+            <div class="detail-bar-row">
+              <span class="detail-bar-label">Comfort</span>
+              <div class="detail-bar">
+                <div
+                  class="detail-bar-fill"
+                  style="width: ${!isNaN(comfortScore) ? comfortScore : 0}%; background: ${getComfortColor(comfortScore)}"
+                ></div>
+              </div>
+              <span class="detail-bar-value" style="color: ${getComfortColor(comfortScore)}">
+                ${formatScore(comfortScore)}
+              </span>
+            </div>
+
+            <div class="detail-bar-row">
+              <span class="detail-bar-label">Efficiency</span>
+              <div class="detail-bar">
+                <div
+                  class="detail-bar-fill"
+                  style="width: ${!isNaN(efficiencyScore) ? efficiencyScore : 0}%; background: ${getComfortColor(efficiencyScore)}"
+                ></div>
+              </div>
+              <span class="detail-bar-value" style="color: ${getComfortColor(efficiencyScore)}">
+                ${formatScore(efficiencyScore)}
+              </span>
+            </div>
+
+            <!-- Efficiency chart -->
+            <efficiency-chart
+              .hass=${this.hass}
+              .roomSlug=${this.roomSlug}
+            ></efficiency-chart>
+          </div>
 
-      /* Vent status */
-      .vent-status {
-        display: flex;
-        align-items: center;
-        gap: var(--sc-space-sm);
-        padding: var(--sc-space-sm);
-        background: var(--sc-tile-bg);
-        border-radius: var(--sc-radius-sm);
-      }
+          <!-- Climate controls -->
+          <div class="detail-section">
+            <div class="detail-section-title">Climate Control</div>
+            <div class="detail-controls">
+              <!-- Target temperature -->
+              <div class="control-row">
+                <span class="control-label">Target</span>
+                <div class="temp-control">
+                  <button class="temp-btn" @click=${()=>this._adjustTarget(-0.5)}>-</button>
+                  <span class="temp-display">${formatTemp(this._targetTemp, tempUnit)}</span>
+                  <button class="temp-btn" @click=${()=>this._adjustTarget(0.5)}>+</button>
+                </div>
+              </div>
 
-      .vent-icon {
-        font-size: var(--sc-font-lg);
-      }
+              <!-- Mode select -->
+              <div class="control-row">
+                <span class="control-label">Mode</span>
+                <div class="mode-select">
+                  ${hvacModes.map((mode)=>html`
+                      <button
+                        class="mode-btn ${this._hvacMode === mode ? 'active' : ''}"
+                        @click=${()=>this._setMode(mode)}
+                      >
+                        ${mode.replace('_', ' ')}
+                      </button>
+                    `)}
+                </div>
+              </div>
+            </div>
+          </div>
 
-      .vent-info {
-        flex: 1;
-      }
+          <!-- Vent status -->
+          ${ventPosition && ventPosition !== 'unknown' && ventPosition !== 'unavailable' ? html`
+                <div class="detail-section">
+                  <div class="detail-section-title">Vent</div>
+                  <div class="vent-status">
+                    <span class="vent-icon">🔲</span>
+                    <div class="vent-info">
+                      <div class="vent-name">${ventName}</div>
+                      <div class="vent-position">Position: ${ventPosition}%</div>
+                    </div>
+                  </div>
+                </div>
+              ` : nothing}
 
-      .vent-name {
-        font-size: var(--sc-font-sm);
-        color: var(--sc-text-primary);
-      }
+          <!-- Auxiliary devices -->
+          ${auxDevices.length > 0 ? html`
+                <div class="detail-section">
+                  <div class="detail-section-title">Auxiliary Devices</div>
+                  <div class="device-list">
+                    ${auxDevices.map((device)=>html`
+                        <div class="device-item">
+                          <span class="device-icon">
+                            ${device.state === 'on' || device.state === 'active' ? '🟢' : '⚫'}
+                          </span>
+                          <span class="device-name">${device.name}</span>
+                          <span class="device-state">${device.state}</span>
+                        </div>
+                      `)}
+                  </div>
+                </div>
+              ` : nothing}
 
-      .vent-position {
-        font-size: var(--sc-font-xs);
-        color: var(--sc-text-muted);
-      }
-    `],e([mt({attribute:!1})],Ht.prototype,"hass",void 0),e([mt({type:String})],Ht.prototype,"roomSlug",void 0),e([mt({type:Boolean})],Ht.prototype,"open",void 0),e([gt()],Ht.prototype,"_targetTemp",void 0),e([gt()],Ht.prototype,"_hvacMode",void 0),Ht=e([ht("room-detail")],Ht);let Ut=class extends dt{constructor(){super(...arguments),this.roomSlug=""}_getEfficiencyData(){const t=xt(this.hass,this.roomSlug?`sensor.sc_${this.roomSlug}_efficiency`:"sensor.sc_house_efficiency");if(!t)return[];const e=t.attributes?.hourly_data||[];if(e.length>0)return e.slice(-12);const s=parseFloat(t.state);return isNaN(s)?[]:[s]}_renderBars(t){if(0===t.length)return Y;const e=40,s=t.map((t,s)=>{const a=Math.max(2,t/100*e),i=8.5*s,r=e-a,o=kt(t);return W`
-        <rect
-          x="${i}%"
-          y="${r}"
-          width="${6.5}%"
-          height="${a}"
-          rx="2"
-          ry="2"
-          fill="${o}"
-          opacity="0.8"
-        >
-          <title>${Math.round(t)}%</title>
-        </rect>
-      `});return W`
-      <svg viewBox="0 0 100 ${e}" preserveAspectRatio="none">
-        <!-- Grid lines -->
-        <line x1="0" y1="${10}" x2="100" y2="${10}"
-              stroke="rgba(255,255,255,0.05)" stroke-width="0.5" />
-        <line x1="0" y1="${20}" x2="100" y2="${20}"
-              stroke="rgba(255,255,255,0.05)" stroke-width="0.5" />
-        <line x1="0" y1="${30}" x2="100" y2="${30}"
-              stroke="rgba(255,255,255,0.05)" stroke-width="0.5" />
-        ${s}
-      </svg>
-    `}render(){const t=this._getEfficiencyData();return 0===t.length?Y:q`
-      <div class="chart-container">
-        <div class="chart-label">Efficiency</div>
-        ${this._renderBars(t)}
-        <div class="chart-legend">
-          <span>${t.length>1?`-${t.length}h`:"Now"}</span>
-          <span>Now</span>
+          <!-- Sensor list -->
+          ${sensors.length > 0 ? html`
+                <div class="detail-section">
+                  <div class="detail-section-title">Sensors</div>
+                  <div class="device-list">
+                    ${sensors.map((sensor)=>html`
+                        <div class="device-item">
+                          <span class="device-icon">📡</span>
+                          <span class="device-name">${sensor.name}</span>
+                          <span class="device-state">${sensor.state}</span>
+                        </div>
+                      `)}
+                  </div>
+                </div>
+              ` : nothing}
         </div>
       </div>
-    `}};Ut.styles=[ft,n`
+    `;
+  }
+}
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], RoomDetail.prototype, "hass", void 0);
+_ts_decorate([
+  property({
+    type: String
+  })
+], RoomDetail.prototype, "roomSlug", void 0);
+_ts_decorate([
+  property({
+    type: Boolean
+  })
+], RoomDetail.prototype, "open", void 0);
+_ts_decorate([
+  state()
+], RoomDetail.prototype, "_targetTemp", void 0);
+_ts_decorate([
+  state()
+], RoomDetail.prototype, "_hvacMode", void 0);
+RoomDetail = _ts_decorate([
+  customElement('room-detail')
+], RoomDetail);
+return { RoomDetail };
+})();
+__mod["components/efficiency-chart"] = (() => {
+function _ts_decorate(decorators, target, key, desc) {
+  var c = arguments.length, r = c < 3 ? target : desc === null ? desc = Object.getOwnPropertyDescriptor(target, key) : desc, d;
+  if (typeof Reflect === "object" && typeof Reflect.decorate === "function") r = Reflect.decorate(decorators, target, key, desc);
+  else for(var i = decorators.length - 1; i >= 0; i--)if (d = decorators[i]) r = (c < 3 ? d(r) : c > 3 ? d(target, key, r) : d(target, key)) || r;
+  return c > 3 && r && Object.defineProperty(target, key, r), r;
+}
+const { LitElement, html, css, nothing, svg } = __lit;
+const { customElement, property } = __lit;
+const { themeStyles } = __mod["styles/theme"];
+const { getEntityState } = __mod["utils/ha-api"];
+const { getComfortColor } = __mod["utils/formatters"];
+class EfficiencyChart extends LitElement {
+  constructor(){
+    super(...arguments);
+    this.roomSlug = '';
+  }
+  static styles = [
+    themeStyles,
+    css`
       :host {
         display: block;
       }
@@ -1919,21 +3281,117 @@ var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=argume
         color: var(--sc-text-muted);
         margin-top: 2px;
       }
-    `],e([mt({attribute:!1})],Ut.prototype,"hass",void 0),e([mt({type:String})],Ut.prototype,"roomSlug",void 0),Ut=e([ht("efficiency-chart")],Ut);let Rt=class extends dt{constructor(){super(...arguments),this.roomSlug=""}_getAuxEntity(){return xt(this.hass,`sensor.sc_${this.roomSlug}_auxiliary`)}_getDeviceIcon(t){switch(t?.toLowerCase()){case"fan":case"ceiling_fan":return"🌀";case"humidifier":return"💨";case"dehumidifier":return"🌊";case"heater":case"space_heater":return"🔥";case"air_purifier":return"🌿";case"window":return"🪟";default:return"⚡"}}render(){const t=this._getAuxEntity();if(!t)return Y;const e=(t.attributes?.devices||[]).filter(t=>"on"===t.state||"active"===t.state);return 0===e.length?Y:q`
-      <div class="aux-container">
-        ${e.map(t=>q`
-            <div class="aux-device sc-fade-in">
-              <span class="aux-icon">${this._getDeviceIcon(t.type)}</span>
-              <div class="aux-info">
-                <div class="aux-name">${t.name}</div>
-                ${t.reason?q`<div class="aux-reason">${t.reason}</div>`:Y}
-              </div>
-              <span class="aux-runtime">${zt(t.runtime)}</span>
-              <span class="aux-status-dot on sc-dot-pulse"></span>
-            </div>
-          `)}
+    `
+  ];
+  _getEfficiencyData() {
+    const entity = getEntityState(this.hass, this.roomSlug ? `sensor.sc_${this.roomSlug}_efficiency` : 'sensor.sc_house_efficiency');
+    if (!entity) return [];
+    // Try to get historical data from attributes
+    const history = entity.attributes?.hourly_data || [];
+    if (history.length > 0) {
+      return history.slice(-12); // Last 12 data points
+    }
+    // Fallback: just the current value as a single bar
+    const val = parseFloat(entity.state);
+    if (!isNaN(val)) {
+      return [
+        val
+      ];
+    }
+    return [];
+  }
+  _renderBars(data) {
+    if (data.length === 0) return nothing;
+    const maxBars = 12;
+    const chartWidth = 100; // percentage-based
+    const chartHeight = 40;
+    const barGap = 2;
+    const barWidth = (chartWidth - barGap * (maxBars - 1)) / maxBars;
+    const bars = data.map((value, index)=>{
+      const barHeight = Math.max(2, value / 100 * chartHeight);
+      const x = index * (barWidth + barGap);
+      const y = chartHeight - barHeight;
+      const color = getComfortColor(value);
+      return svg`
+        <rect
+          x="${x}%"
+          y="${y}"
+          width="${barWidth}%"
+          height="${barHeight}"
+          rx="2"
+          ry="2"
+          fill="${color}"
+          opacity="0.8"
+        >
+          <title>${Math.round(value)}%</title>
+        </rect>
+      `;
+    });
+    return svg`
+      <svg viewBox="0 0 100 ${chartHeight}" preserveAspectRatio="none">
+        <!-- Grid lines -->
+        <line x1="0" y1="${chartHeight * 0.25}" x2="100" y2="${chartHeight * 0.25}"
+              stroke="rgba(255,255,255,0.05)" stroke-width="0.5" />
+        <line x1="0" y1="${chartHeight * 0.5}" x2="100" y2="${chartHeight * 0.5}"
+              stroke="rgba(255,255,255,0.05)" stroke-width="0.5" />
+        <line x1="0" y1="${chartHeight * 0.75}" x2="100" y2="${chartHeight * 0.75}"
+              stroke="rgba(255,255,255,0.05)" stroke-width="0.5" />
+        ${bars}
+      </svg>
+    `;
+  }
+  render() {
+    const data = this._getEfficiencyData();
+    if (data.length === 0) return nothing;
+    return html`
+      <div class="chart-container">
+        <div class="chart-label">Efficiency</div>
+        ${this._renderBars(data)}
+        <div class="chart-legend">
+          <span>${data.length > 1 ? `-${data.length}h` : 'Now'}</span>
+          <span>Now</span>
+        </div>
       </div>
-    `}};return Rt.styles=[ft,bt,n`
+    `;
+  }
+}
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], EfficiencyChart.prototype, "hass", void 0);
+_ts_decorate([
+  property({
+    type: String
+  })
+], EfficiencyChart.prototype, "roomSlug", void 0);
+EfficiencyChart = _ts_decorate([
+  customElement('efficiency-chart')
+], EfficiencyChart);
+return { EfficiencyChart };
+})();
+__mod["components/auxiliary-status"] = (() => {
+function _ts_decorate(decorators, target, key, desc) {
+  var c = arguments.length, r = c < 3 ? target : desc === null ? desc = Object.getOwnPropertyDescriptor(target, key) : desc, d;
+  if (typeof Reflect === "object" && typeof Reflect.decorate === "function") r = Reflect.decorate(decorators, target, key, desc);
+  else for(var i = decorators.length - 1; i >= 0; i--)if (d = decorators[i]) r = (c < 3 ? d(r) : c > 3 ? d(target, key, r) : d(target, key)) || r;
+  return c > 3 && r && Object.defineProperty(target, key, r), r;
+}
+const { LitElement, html, css, nothing } = __lit;
+const { customElement, property } = __lit;
+const { themeStyles } = __mod["styles/theme"];
+const { animationStyles } = __mod["styles/animations"];
+const { getEntityState } = __mod["utils/ha-api"];
+const { formatDuration } = __mod["utils/formatters"];
+class AuxiliaryStatus extends LitElement {
+  constructor(){
+    super(...arguments);
+    this.roomSlug = '';
+  }
+  static styles = [
+    themeStyles,
+    animationStyles,
+    css`
       :host {
         display: block;
       }
@@ -2005,7 +3463,288 @@ var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=argume
         padding-left: var(--sc-space-sm);
         margin-top: 2px;
       }
-    `],e([mt({attribute:!1})],Rt.prototype,"hass",void 0),e([mt({type:String})],Rt.prototype,"roomSlug",void 0),Rt=e([ht("auxiliary-status")],Rt),t.SmartClimateCard=class extends dt{constructor(){super(...arguments),this._config={},this._rooms=[],this._detailRoom="",this._detailOpen=!1}setConfig(t){this._config={show_schedule:!0,show_suggestions:!0,show_efficiency:!0,compact:!1,...t}}getCardSize(){return 6}static getStubConfig(){return{show_schedule:!0,show_suggestions:!0,show_efficiency:!0,compact:!1}}updated(t){super.updated(t),t.has("hass")&&this.hass&&this._discoverRooms()}_discoverRooms(){const t=function(t){if(!t||!t.states)return[];const e=[],s=/^sensor\.sc_(.+)_comfort_score$/;for(const a of Object.keys(t.states)){const t=a.match(s);t&&t[1]&&"house"!==t[1]&&e.push(t[1])}return e.sort()}(this.hass);if(this._config.rooms_order&&this._config.rooms_order.length>0){const e=[];for(const s of this._config.rooms_order)t.includes(s)&&e.push(s);for(const s of t)e.includes(s)||e.push(s);this._rooms=e}else this._rooms=t}_handleRoomDetailOpen(t){this._detailRoom=t.detail.roomSlug,this._detailOpen=!0}_handleRoomDetailClose(){this._detailOpen=!1,this._detailRoom=""}_getGridClasses(){const t=["sc-room-grid"];return this._config.compact&&t.push("compact"),this._config.columns&&t.push(`cols-${Math.min(3,Math.max(1,this._config.columns))}`),t.join(" ")}render(){if(!this.hass)return q`
+    `
+  ];
+  _getAuxEntity() {
+    return getEntityState(this.hass, `sensor.sc_${this.roomSlug}_auxiliary`);
+  }
+  _getDeviceIcon(deviceType) {
+    switch(deviceType?.toLowerCase()){
+      case 'fan':
+      case 'ceiling_fan':
+        return '🌀';
+      case 'humidifier':
+        return '💨';
+      case 'dehumidifier':
+        return '🌊';
+      case 'heater':
+      case 'space_heater':
+        return '🔥';
+      case 'air_purifier':
+        return '🌿';
+      case 'window':
+        return '🪟';
+      default:
+        return '⚡';
+    }
+  }
+  render() {
+    const auxEntity = this._getAuxEntity();
+    if (!auxEntity) return nothing;
+    const devices = auxEntity.attributes?.devices || [];
+    const activeDevices = devices.filter((d)=>d.state === 'on' || d.state === 'active');
+    if (activeDevices.length === 0) return nothing;
+    return html`
+      <div class="aux-container">
+        ${activeDevices.map((device)=>html`
+            <div class="aux-device sc-fade-in">
+              <span class="aux-icon">${this._getDeviceIcon(device.type)}</span>
+              <div class="aux-info">
+                <div class="aux-name">${device.name}</div>
+                ${device.reason ? html`<div class="aux-reason">${device.reason}</div>` : nothing}
+              </div>
+              <span class="aux-runtime">${formatDuration(device.runtime)}</span>
+              <span class="aux-status-dot on sc-dot-pulse"></span>
+            </div>
+          `)}
+      </div>
+    `;
+  }
+}
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], AuxiliaryStatus.prototype, "hass", void 0);
+_ts_decorate([
+  property({
+    type: String
+  })
+], AuxiliaryStatus.prototype, "roomSlug", void 0);
+AuxiliaryStatus = _ts_decorate([
+  customElement('auxiliary-status')
+], AuxiliaryStatus);
+return { AuxiliaryStatus };
+})();
+__mod["smart-climate-card"] = (() => {
+function _ts_decorate(decorators, target, key, desc) {
+  var c = arguments.length, r = c < 3 ? target : desc === null ? desc = Object.getOwnPropertyDescriptor(target, key) : desc, d;
+  if (typeof Reflect === "object" && typeof Reflect.decorate === "function") r = Reflect.decorate(decorators, target, key, desc);
+  else for(var i = decorators.length - 1; i >= 0; i--)if (d = decorators[i]) r = (c < 3 ? d(r) : c > 3 ? d(target, key, r) : d(target, key)) || r;
+  return c > 3 && r && Object.defineProperty(target, key, r), r;
+}
+const { LitElement, html, css, nothing } = __lit;
+const { customElement, property, state } = __lit;
+// Sub-components
+
+
+
+
+
+
+
+// Styles
+const { themeStyles } = __mod["styles/theme"];
+const { cardStyles } = __mod["styles/card-styles"];
+const { animationStyles } = __mod["styles/animations"];
+const { FEED_RETRY_BASE_DELAY, FEED_RETRY_MAX_DELAY, discoverRooms, smartClimateEntityIds, statesChanged, subscribeClimateFeed } = __mod["utils/ha-api"];
+/**
+ * Whether two records have the same keys.
+ */ function sameKeys(a, b) {
+  const keys = Object.keys(a);
+  return keys.length === Object.keys(b).length && keys.every((key)=>key in b);
+}
+class SmartClimateCard extends LitElement {
+  constructor(){
+    super(...arguments);
+    this._config = {};
+    this._rooms = [];
+    this._feedSubscribing = false;
+    this._feedUnavailable = false;
+    this._feedRetryDelay = FEED_RETRY_BASE_DELAY;
+    this._detailRoom = '';
+    this._detailOpen = false;
+  }
+  // Home Assistant instance, set by Lovelace
+  // Card configuration
+  // Discovered rooms
+  // Latest snapshot from the smart_climate/subscribe feed
+  // Room list source last ordered, to skip re-ordering an unchanged list
+  // Room detail drawer state
+  static styles = [
+    themeStyles,
+    cardStyles,
+    animationStyles,
+    css`
+      :host {
+        display: block;
+      }
+
+      .sc-card {
+        background: var(--sc-card-bg);
+        backdrop-filter: var(--sc-backdrop-blur);
+        -webkit-backdrop-filter: var(--sc-backdrop-blur);
+        border: 1px solid var(--sc-card-border);
+        border-radius: var(--sc-radius-xl);
+        box-shadow: var(--sc-card-shadow);
+        padding: var(--sc-space-lg);
+        overflow: hidden;
+      }
+
+      /* Rooms section label */
+      .sc-rooms-label {
+        font-size: var(--sc-font-sm);
+        font-weight: 600;
+        color: var(--sc-text-muted);
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        margin-bottom: var(--sc-space-sm);
+        margin-top: var(--sc-space-md);
+      }
+    `
+  ];
+  /**
+   * Set card configuration from the Lovelace UI editor or YAML.
+   */ setConfig(config) {
+    this._config = {
+      show_schedule: true,
+      show_suggestions: true,
+      show_efficiency: true,
+      compact: false,
+      ...config
+    };
+    // Re-apply rooms_order to the rooms already found
+    const discovered = this._discovered;
+    this._discovered = undefined;
+    if (discovered) this._orderRooms(discovered);
+  }
+  /**
+   * Return the card size for Lovelace layout calculations.
+   */ getCardSize() {
+    return 6;
+  }
+  /**
+   * Static config stub for the card picker (editor).
+   */ static getStubConfig() {
+    return {
+      show_schedule: true,
+      show_suggestions: true,
+      show_efficiency: true,
+      compact: false
+    };
+  }
+  connectedCallback() {
+    super.connectedCallback();
+    if (this.hass) this._subscribeFeed();
+  }
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    if (this._feedRetryTimer !== undefined) {
+      clearTimeout(this._feedRetryTimer);
+      this._feedRetryTimer = undefined;
+    }
+    if (this._feedUnsub) {
+      this._feedUnsub();
+      this._feedUnsub = undefined;
+    }
+  }
+  /**
+   * Coalesce every change within an animation frame into one update.
+   */ async scheduleUpdate() {
+    await new Promise((resolve)=>requestAnimationFrame(resolve));
+    super.scheduleUpdate();
+  }
+  /**
+   * Skip renders for hass updates that only touched other integrations.
+   */ shouldUpdate(changedProps) {
+    if (changedProps.size !== 1 || !changedProps.has('hass')) return true;
+    const oldHass = changedProps.get('hass');
+    return statesChanged(oldHass, this.hass, smartClimateEntityIds(this.hass));
+  }
+  /**
+   * Subscribe to the feed once hass is available; until it is subscribed,
+   * discover rooms from entity states whenever hass updates.
+   */ updated(changedProps) {
+    super.updated(changedProps);
+    if (changedProps.has('hass') && this.hass) {
+      this._subscribeFeed();
+      if (!this._feedUnsub) this._discoverRooms();
+    }
+  }
+  /**
+   * Subscribe to the feed.  Falls back to entity states for good only when
+   * the integration predates the feed; other errors (the integration still
+   * starting or reloading, a dropped connection) are retried with backoff.
+   */ async _subscribeFeed() {
+    if (this._feedUnsub || this._feedSubscribing || this._feedUnavailable || this._feedRetryTimer !== undefined) {
+      return;
+    }
+    this._feedSubscribing = true;
+    try {
+      const unsub = await subscribeClimateFeed(this.hass, (snapshot)=>{
+        const rooms = this._feed?.rooms;
+        this._feed = snapshot;
+        if (!rooms || !sameKeys(rooms, snapshot.rooms)) {
+          this._orderRooms(Object.keys(snapshot.rooms).sort());
+        }
+      });
+      if (this.isConnected) {
+        this._feedUnsub = unsub;
+        this._feedRetryDelay = FEED_RETRY_BASE_DELAY;
+      } else {
+        unsub();
+      }
+    } catch (err) {
+      if (err?.code === 'unknown_command') {
+        this._feedUnavailable = true;
+      } else if (this.isConnected) {
+        this._feedRetryTimer = setTimeout(()=>{
+          this._feedRetryTimer = undefined;
+          if (this.hass) this._subscribeFeed();
+        }, this._feedRetryDelay);
+        this._feedRetryDelay = Math.min(this._feedRetryDelay * 2, FEED_RETRY_MAX_DELAY);
+      }
+      this._discoverRooms();
+    } finally{
+      this._feedSubscribing = false;
+    }
+  }
+  _discoverRooms() {
+    this._orderRooms(discoverRooms(this.hass));
+  }
+  _orderRooms(discovered) {
+    if (discovered === this._discovered) return;
+    this._discovered = discovered;
+    // Apply rooms_order from config if specified
+    if (this._config.rooms_order && this._config.rooms_order.length > 0) {
+      const ordered = [];
+      for (const slug of this._config.rooms_order){
+        if (discovered.includes(slug)) {
+          ordered.push(slug);
+        }
+      }
+      // Append any discovered rooms not in the order list
+      for (const slug of discovered){
+        if (!ordered.includes(slug)) {
+          ordered.push(slug);
+        }
+      }
+      this._rooms = ordered;
+    } else {
+      this._rooms = discovered;
+    }
+  }
+  _handleRoomDetailOpen(e) {
+    this._detailRoom = e.detail.roomSlug;
+    this._detailOpen = true;
+  }
+  _handleRoomDetailClose() {
+    this._detailOpen = false;
+    this._detailRoom = '';
+  }
+  render() {
+    if (!this.hass) {
+      return html`
         <ha-card>
           <div class="sc-card">
             <div class="sc-loading">
@@ -2015,32 +3754,34 @@ var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=argume
             </div>
           </div>
         </ha-card>
-      `;const t=!1!==this._config.show_schedule,e=!1!==this._config.show_suggestions,s=this._config.compact||!1;return q`
+      `;
+    }
+    const showSchedule = this._config.show_schedule !== false;
+    const showSuggestions = this._config.show_suggestions !== false;
+    const compact = this._config.compact || false;
+    return html`
       <ha-card>
         <div class="sc-card">
           <!-- 1. House Overview Header -->
-          <house-overview .hass=${this.hass}></house-overview>
+          <house-overview
+            .hass=${this.hass}
+            .house=${this._feed?.house}
+          ></house-overview>
 
           <!-- 2. Room Grid -->
-          ${this._rooms.length>0?q`
+          ${this._rooms.length > 0 ? html`
                 <div class="sc-rooms-label">
                   Rooms (${this._rooms.length})
                 </div>
-                <div
-                  class="${this._getGridClasses()}"
+                <room-grid
+                  .hass=${this.hass}
+                  .rooms=${this._rooms}
+                  .feedRooms=${this._feed?.rooms}
+                  .columns=${this._config.columns}
+                  ?compact=${compact}
                   @room-detail-open=${this._handleRoomDetailOpen}
-                >
-                  ${this._rooms.map((t,e)=>q`
-                      <room-tile
-                        .hass=${this.hass}
-                        .roomSlug=${t}
-                        ?compact=${s}
-                        class="sc-fade-in"
-                        style="animation-delay: ${50*e}ms"
-                      ></room-tile>
-                    `)}
-                </div>
-              `:q`
+                ></room-grid>
+              ` : html`
                 <div class="sc-empty">
                   No Smart Climate rooms found. Make sure the Smart Climate
                   integration is configured.
@@ -2048,70 +3789,60 @@ var SmartClimateCard=function(t){"use strict";function e(t,e,s,a){var i,r=argume
               `}
 
           <!-- 3. Schedule Timeline (collapsible) -->
-          ${t?q`<schedule-view .hass=${this.hass}></schedule-view>`:Y}
+          ${showSchedule ? html`<schedule-view
+                .hass=${this.hass}
+                .schedules=${this._feed?.schedules}
+                .house=${this._feed?.house}
+              ></schedule-view>` : nothing}
 
           <!-- 4. AI Suggestions (collapsible) -->
-          ${e?q`<suggestion-panel .hass=${this.hass}></suggestion-panel>`:Y}
+          ${showSuggestions ? html`<suggestion-panel .hass=${this.hass}></suggestion-panel>` : nothing}
         </div>
       </ha-card>
 
-      <!-- Room Detail Drawer (overlay) -->
-      <room-detail
-        .hass=${this.hass}
-        .roomSlug=${this._detailRoom}
-        ?open=${this._detailOpen}
-        @room-detail-close=${this._handleRoomDetailClose}
-      ></room-detail>
-    `}},t.SmartClimateCard.styles=[ft,Pt,bt,n`
-      :host {
-        display: block;
-      }
-
-      .sc-card {
-        background: var(--sc-card-bg);
-        backdrop-filter: var(--sc-backdrop-blur);
-        -webkit-backdrop-filter: var(--sc-backdrop-blur);
-        border: 1px solid var(--sc-card-border);
-        border-radius: var(--sc-radius-xl);
-        box-shadow: var(--sc-card-shadow);
-        padding: var(--sc-space-lg);
-        overflow: hidden;
-      }
-
-      /* Grid column overrides */
-      .sc-room-grid.cols-1 {
-        grid-template-columns: 1fr;
-      }
-
-      .sc-room-grid.cols-2 {
-        grid-template-columns: repeat(2, 1fr);
-      }
-
-      .sc-room-grid.cols-3 {
-        grid-template-columns: repeat(3, 1fr);
-      }
-
-      @media (max-width: 500px) {
-        .sc-room-grid.cols-2,
-        .sc-room-grid.cols-3 {
-          grid-template-columns: 1fr;
-        }
-      }
-
-      @media (min-width: 501px) and (max-width: 800px) {
-        .sc-room-grid.cols-3 {
-          grid-template-columns: repeat(2, 1fr);
-        }
-      }
-
-      /* Rooms section label */
-      .sc-rooms-label {
-        font-size: var(--sc-font-sm);
-        font-weight: 600;
-        color: var(--sc-text-muted);
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        margin-bottom: var(--sc-space-sm);
-        margin-top: var(--sc-space-md);
-      }
-    `],e([mt({attribute:!1})],t.SmartClimateCard.prototype,"hass",void 0),e([gt()],t.SmartClimateCard.prototype,"_config",void 0),e([gt()],t.SmartClimateCard.prototype,"_rooms",void 0),e([gt()],t.SmartClimateCard.prototype,"_detailRoom",void 0),e([gt()],t.SmartClimateCard.prototype,"_detailOpen",void 0),t.SmartClimateCard=e([ht("smart-climate-card")],t.SmartClimateCard),window.customCards=window.customCards||[],window.customCards.push({type:"smart-climate-card",name:"Smart Climate Card",description:"A comprehensive dashboard card for the Smart Climate HA integration. Shows room comfort, HVAC status, schedules, and AI suggestions.",preview:!0,documentationURL:"https://github.com/joshuaseidel/hass-climate-controll/tree/main/smart-climate-card"}),t}({});
+      <!-- Room Detail Drawer (overlay), only created while open -->
+      ${this._detailOpen ? html`<room-detail
+            .hass=${this.hass}
+            .roomSlug=${this._detailRoom}
+            open
+            @room-detail-close=${this._handleRoomDetailClose}
+          ></room-detail>` : nothing}
+    `;
+  }
+}
+_ts_decorate([
+  property({
+    attribute: false
+  })
+], SmartClimateCard.prototype, "hass", void 0);
+_ts_decorate([
+  state()
+], SmartClimateCard.prototype, "_config", void 0);
+_ts_decorate([
+  state()
+], SmartClimateCard.prototype, "_rooms", void 0);
+_ts_decorate([
+  state()
+], SmartClimateCard.prototype, "_feed", void 0);
+_ts_decorate([
+  state()
+], SmartClimateCard.prototype, "_detailRoom", void 0);
+_ts_decorate([
+  state()
+], SmartClimateCard.prototype, "_detailOpen", void 0);
+SmartClimateCard = _ts_decorate([
+  customElement('smart-climate-card')
+], SmartClimateCard);
+// Register card with Home Assistant's custom card registry
+window.customCards = window.customCards || [];
+window.customCards.push({
+  type: 'smart-climate-card',
+  name: 'Smart Climate Card',
+  description: 'A comprehensive dashboard card for the Smart Climate HA integration. Shows room comfort, HVAC status, schedules, and AI suggestions.',
+  preview: true,
+  documentationURL: 'https://github.com/joshuaseidel/hass-climate-controll/tree/main/smart-climate-card'
+});
+return { SmartClimateCard };
+})();
+t.SmartClimateCard = __mod["smart-climate-card"].SmartClimateCard;
+return t}({});
@@ -2,8 +2,8 @@ import { LitElement, html, css, nothing } from 'lit';
 import { customElement, property } from 'lit/decorators.js';
 import { themeStyles } from '../styles/theme';
 import { animationStyles } from '../styles/animations';
-import type { HomeAssistant } from '../utils/ha-api';
-import { getEntityState } from '../utils/ha-api';
+import type { HomeAssistant, HouseSnapshot } from '../utils/ha-api';
+import { getEntityState, getRoomName } from '../utils/ha-api';
 import {
   formatScore,
   getComfortColor,
@@ -15,10 +15,12 @@ import {
 /**
  * <house-overview> component
  * Header bar with house comfort/efficiency scores, HVAC status, follow-me status, active schedule.
+ * Scores, follow-me and schedule come from the feed's house snapshot when given one.
  */
 @customElement('house-overview')
 export class HouseOverview extends LitElement {
   @property({ attribute: false }) hass!: HomeAssistant;
+  @property({ attribute: false }) house?: HouseSnapshot;
 
   static styles = [
     themeStyles,
@@ -179,19 +181,41 @@ export class HouseOverview extends LitElement {
     `;
   }
 
-  render() {
+  private _values() {
+    const house = this.house;
+    if (house) {
+      return {
+        comfortScore: house.comfort_score ?? NaN,
+        efficiencyScore: house.efficiency_score ?? NaN,
+        followMeActive: house.follow_me_target !== null,
+        followMeTarget: house.follow_me_target
+          ? getRoomName(house.follow_me_target)
+          : '',
+        scheduleName: house.active_schedule || 'None',
+      };
+    }
+
     const comfort = this._getComfort();
     const efficiency = this._getEfficiency();
-    const schedule = this._getSchedule();
-    const hvac = this._getHvacStatus();
     const followMe = this._getFollowMe();
+    return {
+      comfortScore: comfort ? parseFloat(comfort.state) : NaN,
+      efficiencyScore: efficiency ? parseFloat(efficiency.state) : NaN,
+      followMeActive: followMe?.state === 'on',
+      followMeTarget: followMe?.attributes?.target_room || '',
+      scheduleName: this._getSchedule()?.state || 'None',
+    };
+  }
 
-    const comfortScore = comfort ? parseFloat(comfort.state) : NaN;
-    const efficiencyScore = efficiency ? parseFloat(efficiency.state) : NaN;
-    const hvacAction = hvac?.state || 'idle';
-    const followMeActive = followMe?.state === 'on';
-    const followMeTarget = followMe?.attributes?.target_room || '';
-    const scheduleName = schedule?.state || 'None';
+  render() {
+    const {
+      comfortScore,
+      efficiencyScore,
+      followMeActive,
+      followMeTarget,
+      scheduleName,
+    } = this._values();
+    const hvacAction = this._getHvacStatus()?.state || 'idle';
 
     return html`
       <div class="overview">
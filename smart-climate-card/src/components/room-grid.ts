@@ -0,0 +1,243 @@
+import { LitElement, html, css, PropertyValues } from 'lit';
+import { customElement, property, state } from 'lit/decorators.js';
+import { animationStyles } from '../styles/animations';
+import { cardStyles } from '../styles/card-styles';
+import type { HomeAssistant, RoomSnapshot } from '../utils/ha-api';
+import './room-tile';
+
+// Above this many rooms only the tiles near the viewport are rendered
+const VIRTUALIZE_THRESHOLD = 24;
+// Rows rendered above and below the viewport
+const OVERSCAN_ROWS = 2;
+// Row height (tile plus gap) assumed until a rendered row is measured
+const ESTIMATED_ROW_HEIGHT = 190;
+const ESTIMATED_COMPACT_ROW_HEIGHT = 110;
+
+/**
+ * <room-grid> component
+ * Responsive grid of room tiles.  Large houses are windowed: only rows
+ * near the viewport are rendered, with padding standing in for the rest,
+ * and tiles are rendered by position so scrolling reassigns the existing
+ * tile elements to other rooms instead of creating new ones.
+ */
+@customElement('room-grid')
+export class RoomGrid extends LitElement {
+  @property({ attribute: false }) hass!: HomeAssistant;
+  @property({ attribute: false }) rooms: string[] = [];
+  @property({ attribute: false }) feedRooms?: Record<string, RoomSnapshot>;
+  @property({ type: Boolean }) compact: boolean = false;
+  @property({ type: Number }) columns?: number;
+
+  // Rendered rows [start, end) while windowed
+  @state() private _startRow = 0;
+  @state() private _endRow = 0;
+
+  private _columnCount = 1;
+  private _rowHeight = 0;
+  private _frame = 0;
+  private _resizeObserver?: ResizeObserver;
+
+  static styles = [
+    animationStyles,
+    cardStyles,
+    css`
+      :host {
+        display: block;
+      }
+
+      /* Grid column overrides */
+      .sc-room-grid.cols-1 {
+        grid-template-columns: 1fr;
+      }
+
+      .sc-room-grid.cols-2 {
+        grid-template-columns: repeat(2, 1fr);
+      }
+
+      .sc-room-grid.cols-3 {
+        grid-template-columns: repeat(3, 1fr);
+      }
+
+      @media (max-width: 500px) {
+        .sc-room-grid.cols-2,
+        .sc-room-grid.cols-3 {
+          grid-template-columns: 1fr;
+        }
+      }
+
+      @media (min-width: 501px) and (max-width: 800px) {
+        .sc-room-grid.cols-3 {
+          grid-template-columns: repeat(2, 1fr);
+        }
+      }
+    `,
+  ];
+
+  private get _virtualized(): boolean {
+    return this.rooms.length > VIRTUALIZE_THRESHOLD;
+  }
+
+  connectedCallback() {
+    super.connectedCallback();
+    window.addEventListener('scroll', this._onViewportChange, {
+      capture: true,
+      passive: true,
+    });
+    window.addEventListener('resize', this._onViewportChange, { passive: true });
+    this._resizeObserver = new ResizeObserver(this._onViewportChange);
+    this._resizeObserver.observe(this);
+  }
+
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    window.removeEventListener('scroll', this._onViewportChange, { capture: true });
+    window.removeEventListener('resize', this._onViewportChange);
+    this._resizeObserver?.disconnect();
+    cancelAnimationFrame(this._frame);
+    this._frame = 0;
+  }
+
+  updated(changedProps: PropertyValues) {
+    super.updated(changedProps);
+    if (!this._virtualized) return;
+    const layoutChanged =
+      changedProps.has('rooms') ||
+      changedProps.has('compact') ||
+      changedProps.has('columns');
+    // Measuring forces a layout, so skip it for state-only updates.
+    if (
+      layoutChanged ||
+      changedProps.has('_startRow') ||
+      changedProps.has('_endRow')
+    ) {
+      this._measure();
+    }
+    if (layoutChanged) {
+      this._onViewportChange();
+    }
+  }
+
+  /**
+   * Recompute the visible rows at most once per animation frame.
+   */
+  private _onViewportChange = () => {
+    if (this._frame || !this._virtualized) return;
+    this._frame = requestAnimationFrame(() => {
+      this._frame = 0;
+      this._updateWindow();
+    });
+  };
+
+  /**
+   * Read the column count from the laid-out grid and the row height from
+   * the rendered tiles, so media queries and tile content stay the source
+   * of truth.
+   */
+  private _measure() {
+    const grid = this.renderRoot.querySelector<HTMLElement>('.sc-room-grid');
+    if (!grid) return;
+    const style = getComputedStyle(grid);
+    this._columnCount = Math.max(
+      1,
+      style.gridTemplateColumns.split(' ').filter(Boolean).length,
+    );
+
+    const tiles = grid.querySelectorAll<HTMLElement>('room-tile');
+    const renderedRows = Math.ceil(tiles.length / this._columnCount);
+    if (renderedRows === 0) return;
+    const gap = parseFloat(style.rowGap) || 0;
+    const top = tiles[0].getBoundingClientRect().top;
+    const bottom = tiles[tiles.length - 1].getBoundingClientRect().bottom;
+    const rowHeight = (bottom - top + gap) / renderedRows;
+    if (rowHeight > 0 && Math.abs(rowHeight - this._rowHeight) >= 1) {
+      this._rowHeight = rowHeight;
+      this._onViewportChange();
+    }
+  }
+
+  private _updateWindow() {
+    const rowHeight =
+      this._rowHeight ||
+      (this.compact ? ESTIMATED_COMPACT_ROW_HEIGHT : ESTIMATED_ROW_HEIGHT);
+    const totalRows = Math.ceil(this.rooms.length / this._columnCount);
+    const rect = this.getBoundingClientRect();
+    const visibleTop = Math.max(0, -rect.top);
+    const visibleBottom = Math.max(0, window.innerHeight - rect.top);
+
+    const startRow = Math.max(0, Math.floor(visibleTop / rowHeight) - OVERSCAN_ROWS);
+    const endRow = Math.min(
+      totalRows,
+      Math.ceil(visibleBottom / rowHeight) + OVERSCAN_ROWS,
+    );
+    if (startRow !== this._startRow || endRow !== this._endRow) {
+      this._startRow = startRow;
+      this._endRow = Math.max(startRow, endRow);
+    }
+  }
+
+  private _gridClasses(): string {
+    const classes = ['sc-room-grid'];
+    if (this.compact) {
+      classes.push('compact');
+    }
+    if (this.columns) {
+      classes.push(`cols-${Math.min(3, Math.max(1, this.columns))}`);
+    }
+    return classes.join(' ');
+  }
+
+  private _renderTile(room: string, className: string, style: string) {
+    return html`
+      <room-tile
+        .hass=${this.hass}
+        .roomSlug=${room}
+        .room=${this.feedRooms?.[room]}
+        ?compact=${this.compact}
+        class=${className}
+        style=${style}
+      ></room-tile>
+    `;
+  }
+
+  render() {
+    if (!this._virtualized) {
+      return html`
+        <div class="${this._gridClasses()}">
+          ${this.rooms.map((room, idx) =>
+            this._renderTile(room, 'sc-fade-in', `animation-delay: ${idx * 50}ms`),
+          )}
+        </div>
+      `;
+    }
+
+    // Until the first measurement, render one screenful from the top.
+    const rowHeight =
+      this._rowHeight ||
+      (this.compact ? ESTIMATED_COMPACT_ROW_HEIGHT : ESTIMATED_ROW_HEIGHT);
+    const columns = this._columnCount;
+    const totalRows = Math.ceil(this.rooms.length / columns);
+    const endRow =
+      this._endRow > 0
+        ? Math.min(this._endRow, totalRows)
+        : Math.min(totalRows, Math.ceil(window.innerHeight / rowHeight) + OVERSCAN_ROWS);
+    const startRow = Math.min(this._startRow, endRow);
+    const visible = this.rooms.slice(startRow * columns, endRow * columns);
+
+    // Not keyed: tiles are reused by position as the window moves.
+    return html`
+      <div
+        class="${this._gridClasses()}"
+        style="padding-top: calc(var(--sc-space-sm) + ${startRow * rowHeight}px);
+          padding-bottom: calc(var(--sc-space-sm) + ${(totalRows - endRow) * rowHeight}px)"
+      >
+        ${visible.map((room) => this._renderTile(room, '', ''))}
+      </div>
+    `;
+  }
+}
+
+declare global {
+  interface HTMLElementTagNameMap {
+    'room-grid': RoomGrid;
+  }
+}
@@ -1,9 +1,9 @@
-import { LitElement, html, css, nothing } from 'lit';
+import { LitElement, html, css, nothing, PropertyValues } from 'lit';
 import { customElement, property } from 'lit/decorators.js';
 import { themeStyles } from '../styles/theme';
 import { animationStyles } from '../styles/animations';
-import type { HomeAssistant, HassEntity } from '../utils/ha-api';
-import { getEntityState, getRoomName } from '../utils/ha-api';
+import type { HomeAssistant, HassEntity, RoomSnapshot } from '../utils/ha-api';
+import { getEntityState, getRoomName, statesChanged } from '../utils/ha-api';
 import {
   formatTemp,
   formatScore,
@@ -15,14 +15,35 @@ import {
   formatDuration,
 } from '../utils/formatters';
 
+// Entities a tile reads when it has no feed snapshot
+const TILE_SENSORS = [
+  'comfort_score',
+  'temperature',
+  'humidity',
+  'target_temperature',
+  'temperature_trend',
+  'hvac_action',
+  'hvac_runtime',
+  'active_schedule',
+  'auxiliary',
+];
+const TILE_BINARY_SENSORS = ['occupancy', 'follow_me_target'];
+// With a snapshot, only the temperature unit and the auxiliary slot
+// still come from entity states
+const FEED_TILE_SENSORS = ['temperature', 'auxiliary'];
+
 /**
  * <room-tile> component
  * Displays a single room's climate status as a compact tile in the grid.
+ * Renders from the feed's room snapshot when given one, otherwise from
+ * the room's entity states.  A hass update only re-renders the tile when
+ * one of the entities it reads changed.
  */
 @customElement('room-tile')
 export class RoomTile extends LitElement {
   @property({ attribute: false }) hass!: HomeAssistant;
   @property({ type: String }) roomSlug: string = '';
+  @property({ attribute: false }) room?: RoomSnapshot;
   @property({ type: Boolean }) compact: boolean = false;
 
   static styles = [
@@ -244,6 +265,32 @@ export class RoomTile extends LitElement {
     `,
   ];
 
+  // Entity ids watched for hass updates, per slug and source
+  private _watchedKey = '';
+  private _watched: string[] = [];
+
+  private _watchedIds(): string[] {
+    const key = `${this.roomSlug}:${this.room ? 'feed' : 'states'}`;
+    if (key !== this._watchedKey) {
+      const sensors = this.room ? FEED_TILE_SENSORS : TILE_SENSORS;
+      const binarySensors = this.room ? [] : TILE_BINARY_SENSORS;
+      this._watchedKey = key;
+      this._watched = [
+        ...sensors.map((suffix) => `sensor.sc_${this.roomSlug}_${suffix}`),
+        ...binarySensors.map(
+          (suffix) => `binary_sensor.sc_${this.roomSlug}_${suffix}`,
+        ),
+      ];
+    }
+    return this._watched;
+  }
+
+  protected shouldUpdate(changedProps: PropertyValues): boolean {
+    if (changedProps.size !== 1 || !changedProps.has('hass')) return true;
+    const oldHass = changedProps.get('hass') as HomeAssistant | undefined;
+    return statesChanged(oldHass, this.hass, this._watchedIds());
+  }
+
   private _entity(suffix: string): HassEntity | undefined {
     return getEntityState(this.hass, `sensor.sc_${this.roomSlug}_${suffix}`);
   }
@@ -265,33 +312,58 @@ export class RoomTile extends LitElement {
     );
   }
 
-  render() {
+  private _values() {
+    const room = this.room;
+    if (room) {
+      return {
+        comfortScore: room.comfort_score ?? NaN,
+        temp: room.temperature ?? undefined,
+        humidity: room.humidity ?? undefined,
+        target: room.target ?? undefined,
+        trend: room.temp_trend ?? undefined,
+        hvacAction: room.hvac_action || 'idle',
+        runtime: room.hvac_runtime_today ?? undefined,
+        schedule: room.active_schedule || '',
+        occupied: room.occupied,
+        isFollowMe: room.follow_me_active,
+      };
+    }
+
     const comfortEntity = this._entity('comfort_score');
-    const tempEntity = this._entity('temperature');
-    const humidityEntity = this._entity('humidity');
-    const targetEntity = this._entity('target_temperature');
-    const trendEntity = this._entity('temperature_trend');
-    const hvacEntity = this._entity('hvac_action');
-    const runtimeEntity = this._entity('hvac_runtime');
-    const scheduleEntity = this._entity('active_schedule');
-    const occupancyEntity = this._binaryEntity('occupancy');
     const followMeEntity = this._binaryEntity('follow_me_target');
+    return {
+      comfortScore: comfortEntity ? parseFloat(comfortEntity.state) : NaN,
+      temp: this._entity('temperature')?.state,
+      humidity: this._entity('humidity')?.state,
+      target: this._entity('target_temperature')?.state,
+      trend: this._entity('temperature_trend')?.state,
+      hvacAction: this._entity('hvac_action')?.state || 'idle',
+      runtime: this._entity('hvac_runtime')?.state,
+      schedule: this._entity('active_schedule')?.state || '',
+      occupied: this._binaryEntity('occupancy')?.state === 'on',
+      isFollowMe: followMeEntity?.state === 'on',
+    };
+  }
 
-    const comfortScore = comfortEntity ? parseFloat(comfortEntity.state) : NaN;
-    const temp = tempEntity?.state;
-    const humidity = humidityEntity?.state;
-    const target = targetEntity?.state;
-    const trend = trendEntity?.state;
-    const hvacAction = hvacEntity?.state || 'idle';
-    const runtime = runtimeEntity?.state;
-    const schedule = scheduleEntity?.state || '';
-    const occupied = occupancyEntity?.state === 'on';
-    const isFollowMe = followMeEntity?.state === 'on';
+  render() {
+    const {
+      comfortScore,
+      temp,
+      humidity,
+      target,
+      trend,
+      hvacAction,
+      runtime,
+      schedule,
+      occupied,
+      isFollowMe,
+    } = this._values();
 
     const comfortColor = getComfortColor(comfortScore);
     const comfortPct = !isNaN(comfortScore) ? Math.max(0, Math.min(100, comfortScore)) : 0;
 
-    const tempUnit = tempEntity?.attributes?.unit_of_measurement || '°F';
+    const tempUnit =
+      this._entity('temperature')?.attributes?.unit_of_measurement || '°F';
 
     const tileClasses = [
       'tile',
@@ -330,7 +402,7 @@ export class RoomTile extends LitElement {
           <span class="tile-stat">
             <span class="tile-stat-icon">💧</span>
             ${humidity !== undefined && humidity !== 'unknown'
-              ? `${Math.round(parseFloat(humidity as string))}%`
+              ? `${Math.round(parseFloat(String(humidity)))}%`
               : '--'}
           </span>
           <span class="tile-stat">
@@ -3,7 +3,11 @@ import { customElement, property, state } from 'lit/decorators.js';
 import { themeStyles } from '../styles/theme';
 import { animationStyles } from '../styles/animations';
 import { cardStyles } from '../styles/card-styles';
-import type { HomeAssistant } from '../utils/ha-api';
+import type {
+  HomeAssistant,
+  HouseSnapshot,
+  ScheduleSnapshot,
+} from '../utils/ha-api';
 import { getEntityState } from '../utils/ha-api';
 import { formatTime } from '../utils/formatters';
 
@@ -19,10 +23,13 @@ interface ScheduleBlock {
 /**
  * <schedule-view> component
  * Horizontal SVG timeline showing today's schedule blocks with a NOW marker.
+ * Blocks are built from the feed's schedules when given them.
  */
 @customElement('schedule-view')
 export class ScheduleView extends LitElement {
   @property({ attribute: false }) hass!: HomeAssistant;
+  @property({ attribute: false }) schedules?: Record<string, ScheduleSnapshot>;
+  @property({ attribute: false }) house?: HouseSnapshot;
   @state() private _expanded: boolean = false;
 
   static styles = [
@@ -101,12 +108,55 @@ export class ScheduleView extends LitElement {
     '#ff5722',
   ];
 
-  private _getScheduleBlocks(): ScheduleBlock[] {
-    const entity = getEntityState(this.hass, 'sensor.sc_active_schedule');
-    if (!entity) return [];
+  /**
+   * Today's blocks from the feed's schedule definitions.  Days count from
+   * Monday = 0; a schedule ending at or before its start runs overnight.
+   */
+  private _blocksFromFeed(
+    schedules: Record<string, ScheduleSnapshot>,
+  ): ScheduleBlock[] {
+    const today = (new Date().getDay() + 6) % 7;
+    const yesterday = (today + 6) % 7;
+    const blocks: ScheduleBlock[] = [];
+
+    for (const schedule of Object.values(schedules)) {
+      if (!schedule.enabled) continue;
+      const [startHour, startMinute] = schedule.start_time.split(':').map(Number);
+      const [endHour, endMinute] = schedule.end_time.split(':').map(Number);
+      const overnight = endHour * 60 + endMinute <= startHour * 60 + startMinute;
+      const block = { name: schedule.name, color: '' };
+
+      if (schedule.days.includes(today)) {
+        blocks.push({
+          ...block,
+          start_hour: startHour,
+          start_minute: startMinute,
+          end_hour: overnight ? 24 : endHour,
+          end_minute: overnight ? 0 : endMinute,
+        });
+      }
+      if (overnight && schedule.days.includes(yesterday)) {
+        blocks.push({
+          ...block,
+          start_hour: 0,
+          start_minute: 0,
+          end_hour: endHour,
+          end_minute: endMinute,
+        });
+      }
+    }
+    return blocks;
+  }
 
-    const schedules: ScheduleBlock[] =
-      entity.attributes?.today_blocks || [];
+  private _getScheduleBlocks(): ScheduleBlock[] {
+    let schedules: ScheduleBlock[];
+    if (this.schedules) {
+      schedules = this._blocksFromFeed(this.schedules);
+    } else {
+      const entity = getEntityState(this.hass, 'sensor.sc_active_schedule');
+      if (!entity) return [];
+      schedules = entity.attributes?.today_blocks || [];
+    }
 
     // Assign colors if not present
     const nameColorMap = new Map<string, string>();
@@ -231,8 +281,9 @@ export class ScheduleView extends LitElement {
 
   render() {
     const blocks = this._getScheduleBlocks();
-    const activeEntity = getEntityState(this.hass, 'sensor.sc_active_schedule');
-    const activeName = activeEntity?.state || 'None';
+    const activeName = this.house
+      ? this.house.active_schedule || 'None'
+      : getEntityState(this.hass, 'sensor.sc_active_schedule')?.state || 'None';
     const now = new Date();
 
     // Build unique legend entries
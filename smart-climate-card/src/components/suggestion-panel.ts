@@ -1,10 +1,10 @@
-import { LitElement, html, css, nothing } from 'lit';
+import { LitElement, html, css, nothing, PropertyValues } from 'lit';
 import { customElement, property, state } from 'lit/decorators.js';
 import { themeStyles } from '../styles/theme';
 import { animationStyles } from '../styles/animations';
 import { cardStyles } from '../styles/card-styles';
 import type { HomeAssistant } from '../utils/ha-api';
-import { getEntityState, callService } from '../utils/ha-api';
+import { getEntityState, callService, fetchSuggestions } from '../utils/ha-api';
 import { confidenceDots } from '../utils/formatters';
 
 interface Suggestion {
@@ -16,6 +16,9 @@ interface Suggestion {
   category: string;
 }
 
+// The most the smart_climate/suggestions command returns per page
+const SUGGESTION_PAGE_SIZE = 100;
+
 /**
  * <suggestion-panel> component
  * Collapsible panel showing AI suggestions with approve/reject buttons.
@@ -25,6 +28,9 @@ export class SuggestionPanel extends LitElement {
   @property({ attribute: false }) hass!: HomeAssistant;
   @state() private _expanded: boolean = false;
   @state() private _loading: Set<string> = new Set();
+  @state() private _suggestions: Suggestion[] = [];
+  // Pending ids the current list was fetched for
+  private _pendingKey: string | null = null;
 
   static styles = [
     themeStyles,
@@ -194,38 +200,53 @@ export class SuggestionPanel extends LitElement {
   }
 
   private _getSuggestions(): Suggestion[] {
-    const countEntity = getEntityState(
-      this.hass,
-      'sensor.sc_ai_suggestion_count',
-    );
-    if (!countEntity) return [];
+    return this._suggestions;
+  }
 
-    // Get suggestion list from the count sensor's attributes
-    const pendingTitles: string[] =
-      countEntity.attributes?.pending_titles || [];
-    const pendingIds: string[] = countEntity.attributes?.pending_ids || [];
+  protected updated(changed: PropertyValues) {
+    if (changed.has('hass')) {
+      this._refreshSuggestions();
+    }
+  }
 
-    // Try to get full details from the daily summary sensor attributes
-    const summaryEntity = getEntityState(
+  /**
+   * Re-fetch pending suggestions when the set of pending ids changes.
+   * The count sensor only carries ids; the text comes over websocket.
+   */
+  private async _refreshSuggestions() {
+    const countEntity = getEntityState(
       this.hass,
-      'sensor.sc_ai_daily_summary',
+      'sensor.sc_ai_suggestion_count',
     );
-    const fullSuggestions: Suggestion[] =
-      summaryEntity?.attributes?.suggestions || [];
-
-    if (fullSuggestions.length > 0) {
-      return fullSuggestions;
+    const pendingIds: string[] = countEntity?.attributes?.pending_ids || [];
+    const key = pendingIds.join(',');
+    if (key === this._pendingKey) return;
+    this._pendingKey = key;
+
+    if (pendingIds.length === 0) {
+      this._suggestions = [];
+      return;
+    }
+    try {
+      const page = await fetchSuggestions(this.hass, {
+        status: 'pending',
+        limit: SUGGESTION_PAGE_SIZE,
+      });
+      // A newer change may have started another fetch meanwhile.
+      if (key !== this._pendingKey) return;
+      this._suggestions = page.suggestions.map((s) => ({
+        id: s.id,
+        title: s.title,
+        description: s.description,
+        // Stored as 0-1; the dots show 0-5.
+        confidence: s.confidence * 5,
+        priority: s.priority,
+        category: s.action_type,
+      }));
+    } catch (err) {
+      console.error('Failed to fetch suggestions:', err);
+      this._pendingKey = null;
     }
-
-    // Fallback: build minimal suggestions from count sensor attributes
-    return pendingTitles.map((title, index) => ({
-      id: pendingIds[index] || `suggestion_${index}`,
-      title,
-      description: '',
-      confidence: 3,
-      priority: 'medium',
-      category: 'general',
-    }));
   }
 
   private _getDailySummary(): string {
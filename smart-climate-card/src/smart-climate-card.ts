@@ -2,7 +2,7 @@ import { LitElement, html, css, nothing, PropertyValues } from 'lit';
 import { customElement, property, state } from 'lit/decorators.js';
 
 // Sub-components
-import './components/room-tile';
+import './components/room-grid';
 import './components/house-overview';
 import './components/suggestion-panel';
 import './components/schedule-view';
@@ -16,8 +16,23 @@ import { cardStyles } from './styles/card-styles';
 import { animationStyles } from './styles/animations';
 
 // Utilities
-import type { HomeAssistant } from './utils/ha-api';
-import { discoverRooms } from './utils/ha-api';
+import type { ClimateSnapshot, HomeAssistant } from './utils/ha-api';
+import {
+  FEED_RETRY_BASE_DELAY,
+  FEED_RETRY_MAX_DELAY,
+  discoverRooms,
+  smartClimateEntityIds,
+  statesChanged,
+  subscribeClimateFeed,
+} from './utils/ha-api';
+
+/**
+ * Whether two records have the same keys.
+ */
+function sameKeys(a: Record<string, unknown>, b: Record<string, unknown>): boolean {
+  const keys = Object.keys(a);
+  return keys.length === Object.keys(b).length && keys.every((key) => key in b);
+}
 
 /**
  * Card configuration interface.
@@ -35,9 +50,14 @@ interface SmartClimateCardConfig {
 /**
  * Smart Climate Card - Main Lovelace card element.
  *
+ * Renders from the integration's smart_climate/subscribe feed, falling
+ * back to entity states when the integration predates it.  Updates are
+ * batched to one render per animation frame, and a hass update that
+ * touches none of the integration's entities doesn't render at all.
+ *
  * Provides a complete dashboard view of the Smart Climate integration:
  * - House overview with comfort/efficiency scores
- * - Responsive room grid with climate tiles
+ * - Responsive room grid with climate tiles, windowed for large houses
  * - Collapsible schedule timeline
  * - AI suggestion panel with approve/reject controls
  */
@@ -52,6 +72,17 @@ export class SmartClimateCard extends LitElement {
   // Discovered rooms
   @state() private _rooms: string[] = [];
 
+  // Latest snapshot from the smart_climate/subscribe feed
+  @state() private _feed?: ClimateSnapshot;
+  private _feedUnsub?: () => void;
+  private _feedSubscribing = false;
+  private _feedUnavailable = false;
+  private _feedRetryTimer?: ReturnType<typeof setTimeout>;
+  private _feedRetryDelay = FEED_RETRY_BASE_DELAY;
+
+  // Room list source last ordered, to skip re-ordering an unchanged list
+  private _discovered?: string[];
+
   // Room detail drawer state
   @state() private _detailRoom: string = '';
   @state() private _detailOpen: boolean = false;
@@ -76,32 +107,6 @@ export class SmartClimateCard extends LitElement {
         overflow: hidden;
       }
 
-      /* Grid column overrides */
-      .sc-room-grid.cols-1 {
-        grid-template-columns: 1fr;
-      }
-
-      .sc-room-grid.cols-2 {
-        grid-template-columns: repeat(2, 1fr);
-      }
-
-      .sc-room-grid.cols-3 {
-        grid-template-columns: repeat(3, 1fr);
-      }
-
-      @media (max-width: 500px) {
-        .sc-room-grid.cols-2,
-        .sc-room-grid.cols-3 {
-          grid-template-columns: 1fr;
-        }
-      }
-
-      @media (min-width: 501px) and (max-width: 800px) {
-        .sc-room-grid.cols-3 {
-          grid-template-columns: repeat(2, 1fr);
-        }
-      }
-
       /* Rooms section label */
       .sc-rooms-label {
         font-size: var(--sc-font-sm);
@@ -126,6 +131,11 @@ export class SmartClimateCard extends LitElement {
       compact: false,
       ...config,
     };
+
+    // Re-apply rooms_order to the rooms already found
+    const discovered = this._discovered;
+    this._discovered = undefined;
+    if (discovered) this._orderRooms(discovered);
   }
 
   /**
@@ -147,19 +157,105 @@ export class SmartClimateCard extends LitElement {
     };
   }
 
+  connectedCallback() {
+    super.connectedCallback();
+    if (this.hass) this._subscribeFeed();
+  }
+
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    if (this._feedRetryTimer !== undefined) {
+      clearTimeout(this._feedRetryTimer);
+      this._feedRetryTimer = undefined;
+    }
+    if (this._feedUnsub) {
+      this._feedUnsub();
+      this._feedUnsub = undefined;
+    }
+  }
+
   /**
-   * Discover rooms whenever hass updates.
+   * Coalesce every change within an animation frame into one update.
+   */
+  protected async scheduleUpdate(): Promise<void> {
+    await new Promise((resolve) => requestAnimationFrame(resolve));
+    super.scheduleUpdate();
+  }
+
+  /**
+   * Skip renders for hass updates that only touched other integrations.
+   */
+  protected shouldUpdate(changedProps: PropertyValues): boolean {
+    if (changedProps.size !== 1 || !changedProps.has('hass')) return true;
+    const oldHass = changedProps.get('hass') as HomeAssistant | undefined;
+    return statesChanged(oldHass, this.hass, smartClimateEntityIds(this.hass));
+  }
+
+  /**
+   * Subscribe to the feed once hass is available; until it is subscribed,
+   * discover rooms from entity states whenever hass updates.
    */
   updated(changedProps: PropertyValues) {
     super.updated(changedProps);
 
     if (changedProps.has('hass') && this.hass) {
+      this._subscribeFeed();
+      if (!this._feedUnsub) this._discoverRooms();
+    }
+  }
+
+  /**
+   * Subscribe to the feed.  Falls back to entity states for good only when
+   * the integration predates the feed; other errors (the integration still
+   * starting or reloading, a dropped connection) are retried with backoff.
+   */
+  private async _subscribeFeed() {
+    if (
+      this._feedUnsub ||
+      this._feedSubscribing ||
+      this._feedUnavailable ||
+      this._feedRetryTimer !== undefined
+    ) {
+      return;
+    }
+    this._feedSubscribing = true;
+    try {
+      const unsub = await subscribeClimateFeed(this.hass, (snapshot) => {
+        const rooms = this._feed?.rooms;
+        this._feed = snapshot;
+        if (!rooms || !sameKeys(rooms, snapshot.rooms)) {
+          this._orderRooms(Object.keys(snapshot.rooms).sort());
+        }
+      });
+      if (this.isConnected) {
+        this._feedUnsub = unsub;
+        this._feedRetryDelay = FEED_RETRY_BASE_DELAY;
+      } else {
+        unsub();
+      }
+    } catch (err: any) {
+      if (err?.code === 'unknown_command') {
+        this._feedUnavailable = true;
+      } else if (this.isConnected) {
+        this._feedRetryTimer = setTimeout(() => {
+          this._feedRetryTimer = undefined;
+          if (this.hass) this._subscribeFeed();
+        }, this._feedRetryDelay);
+        this._feedRetryDelay = Math.min(this._feedRetryDelay * 2, FEED_RETRY_MAX_DELAY);
+      }
       this._discoverRooms();
+    } finally {
+      this._feedSubscribing = false;
     }
   }
 
   private _discoverRooms() {
-    const discovered = discoverRooms(this.hass);
+    this._orderRooms(discoverRooms(this.hass));
+  }
+
+  private _orderRooms(discovered: string[]) {
+    if (discovered === this._discovered) return;
+    this._discovered = discovered;
 
     // Apply rooms_order from config if specified
     if (this._config.rooms_order && this._config.rooms_order.length > 0) {
@@ -191,20 +287,6 @@ export class SmartClimateCard extends LitElement {
     this._detailRoom = '';
   }
 
-  private _getGridClasses(): string {
-    const classes = ['sc-room-grid'];
-
-    if (this._config.compact) {
-      classes.push('compact');
-    }
-
-    if (this._config.columns) {
-      classes.push(`cols-${Math.min(3, Math.max(1, this._config.columns))}`);
-    }
-
-    return classes.join(' ');
-  }
-
   render() {
     if (!this.hass) {
       return html`
@@ -228,7 +310,10 @@ export class SmartClimateCard extends LitElement {
       <ha-card>
         <div class="sc-card">
           <!-- 1. House Overview Header -->
-          <house-overview .hass=${this.hass}></house-overview>
+          <house-overview
+            .hass=${this.hass}
+            .house=${this._feed?.house}
+          ></house-overview>
 
           <!-- 2. Room Grid -->
           ${this._rooms.length > 0
@@ -236,22 +321,14 @@ export class SmartClimateCard extends LitElement {
                 <div class="sc-rooms-label">
                   Rooms (${this._rooms.length})
                 </div>
-                <div
-                  class="${this._getGridClasses()}"
+                <room-grid
+                  .hass=${this.hass}
+                  .rooms=${this._rooms}
+                  .feedRooms=${this._feed?.rooms}
+                  .columns=${this._config.columns}
+                  ?compact=${compact}
                   @room-detail-open=${this._handleRoomDetailOpen}
-                >
-                  ${this._rooms.map(
-                    (room, idx) => html`
-                      <room-tile
-                        .hass=${this.hass}
-                        .roomSlug=${room}
-                        ?compact=${compact}
-                        class="sc-fade-in"
-                        style="animation-delay: ${idx * 50}ms"
-                      ></room-tile>
-                    `,
-                  )}
-                </div>
+                ></room-grid>
               `
             : html`
                 <div class="sc-empty">
@@ -262,7 +339,11 @@ export class SmartClimateCard extends LitElement {
 
           <!-- 3. Schedule Timeline (collapsible) -->
           ${showSchedule
-            ? html`<schedule-view .hass=${this.hass}></schedule-view>`
+            ? html`<schedule-view
+                .hass=${this.hass}
+                .schedules=${this._feed?.schedules}
+                .house=${this._feed?.house}
+              ></schedule-view>`
             : nothing}
 
           <!-- 4. AI Suggestions (collapsible) -->
@@ -272,13 +353,15 @@ export class SmartClimateCard extends LitElement {
         </div>
       </ha-card>
 
-      <!-- Room Detail Drawer (overlay) -->
-      <room-detail
-        .hass=${this.hass}
-        .roomSlug=${this._detailRoom}
-        ?open=${this._detailOpen}
-        @room-detail-close=${this._handleRoomDetailClose}
-      ></room-detail>
+      <!-- Room Detail Drawer (overlay), only created while open -->
+      ${this._detailOpen
+        ? html`<room-detail
+            .hass=${this.hass}
+            .roomSlug=${this._detailRoom}
+            open
+            @room-detail-close=${this._handleRoomDetailClose}
+          ></room-detail>`
+        : nothing}
     `;
   }
 }
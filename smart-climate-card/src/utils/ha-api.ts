@@ -4,6 +4,8 @@
 
 export interface HomeAssistant {
   states: Record<string, HassEntity>;
+  // Entity registry display entries; replaced only when the registry changes
+  entities?: Record<string, { entity_id: string; platform: string }>;
   callService(domain: string, service: string, data?: Record<string, any>): Promise<void>;
   callWS(msg: Record<string, any>): Promise<any>;
   connection: any;
@@ -41,7 +43,374 @@ export function getEntityState(
 }
 
 /**
- * Subscribe to entity state changes via the HA connection.
+ * A stored AI suggestion as returned by the smart_climate/suggestions command.
+ */
+export interface SuggestionRecord {
+  id: string;
+  title: string;
+  description: string;
+  reasoning: string;
+  room: string | null;
+  action_type: string;
+  action_data: Record<string, any>;
+  confidence: number;
+  priority: string;
+  status: string;
+  created_at: string;
+  expires_at: string;
+}
+
+export interface SuggestionPage {
+  suggestions: SuggestionRecord[];
+  total: number;
+  offset: number;
+  limit: number;
+}
+
+export interface SuggestionQuery {
+  status?: string;
+  room?: string;
+  offset?: number;
+  limit?: number;
+}
+
+/**
+ * Fetch one page of suggestions with their full text.  Entity attributes
+ * only carry counts and ids so the recorder doesn't store the text.
+ */
+export function fetchSuggestions(
+  hass: HomeAssistant,
+  query: SuggestionQuery = {},
+): Promise<SuggestionPage> {
+  return hass.callWS({ type: 'smart_climate/suggestions', ...query });
+}
+
+/**
+ * Compact per-room state published by the smart_climate/subscribe feed.
+ */
+export interface RoomSnapshot {
+  name: string;
+  system: string;
+  temperature: number | null;
+  humidity: number | null;
+  temp_trend: number | null;
+  target: number | null;
+  smart_target: number | null;
+  comfort_score: number | null;
+  efficiency_score: number | null;
+  hvac_action: string;
+  hvac_runtime_today: number | null;
+  occupied: boolean;
+  presence_confidence: number | null;
+  window_open: boolean;
+  follow_me_active: boolean;
+  user_override_active: boolean;
+  active_schedule: string | null;
+  next_schedule: string | null;
+  next_schedule_time: string | null;
+  preconditioning: boolean;
+  time_to_target: number | null;
+  auxiliary_active: boolean;
+  auxiliary_devices_on: string[];
+}
+
+/** Rooms served by one climate entity. */
+export interface SystemSnapshot {
+  rooms: string[];
+  hvac_action: string;
+  target: number | null;
+}
+
+export interface HouseSnapshot {
+  operation_mode: string;
+  comfort_score: number | null;
+  efficiency_score: number | null;
+  total_hvac_runtime: number | null;
+  follow_me_target: string | null;
+  active_schedule: string | null;
+  outdoor_temperature: number | null;
+  outdoor_humidity: number | null;
+  last_analysis_time: string | null;
+  pending_suggestions: number;
+}
+
+export interface ScheduleSnapshot {
+  name: string;
+  rooms: string[];
+  days: number[];
+  start_time: string;
+  end_time: string;
+  target_temperature: number;
+  hvac_mode: string | null;
+  enabled: boolean;
+  active: boolean;
+}
+
+export interface ClimateSnapshot {
+  rooms: Record<string, RoomSnapshot>;
+  systems: Record<string, SystemSnapshot>;
+  house: HouseSnapshot;
+  schedules: Record<string, ScheduleSnapshot>;
+}
+
+type FeedEvent =
+  | { type: 'snapshot'; feed_id: string; version: number; data: ClimateSnapshot }
+  | { type: 'delta'; version: number; changes: Record<string, any> }
+  | { type: 'closed' };
+
+const KEYED_SECTIONS = ['rooms', 'systems', 'schedules'] as const;
+
+/**
+ * Apply a feed delta.  Changed records are replaced rather than mutated so
+ * components can tell what changed by identity.
+ */
+export function applyFeedDelta(
+  snapshot: ClimateSnapshot,
+  changes: Record<string, any>,
+): ClimateSnapshot {
+  const next: ClimateSnapshot = { ...snapshot };
+  for (const section of KEYED_SECTIONS) {
+    const sectionChanges = changes[section];
+    if (!sectionChanges) continue;
+    const records: Record<string, any> = { ...snapshot[section] };
+    for (const [key, fields] of Object.entries(sectionChanges)) {
+      if (fields === null) {
+        delete records[key];
+      } else {
+        records[key] = { ...records[key], ...(fields as object) };
+      }
+    }
+    (next as any)[section] = records;
+  }
+  if (changes.house) {
+    next.house = { ...snapshot.house, ...changes.house };
+  }
+  return next;
+}
+
+// Retry delays while resubscribing to the feed
+export const FEED_RETRY_BASE_DELAY = 1000;
+export const FEED_RETRY_MAX_DELAY = 30000;
+
+/**
+ * Subscribe to the smart_climate/subscribe snapshot-and-delta feed.
+ *
+ * Calls back with the full snapshot first and after every applied delta.
+ * If a delta arrives out of sequence the feed is resubscribed from the
+ * last applied version, which replays the missed deltas or sends a fresh
+ * snapshot.  When the integration reloads it closes the subscription, and
+ * the feed is resubscribed, retrying with backoff until the integration is
+ * back.  Rejects if the first subscription fails.
+ */
+export async function subscribeClimateFeed(
+  hass: HomeAssistant,
+  callback: (snapshot: ClimateSnapshot) => void,
+): Promise<() => void> {
+  let snapshot: ClimateSnapshot | undefined;
+  let feedId: string | undefined;
+  let version = -1;
+  let unsub: (() => Promise<void> | void) | undefined;
+  let closed = false;
+  let resyncing = false;
+  let retryDelay = FEED_RETRY_BASE_DELAY;
+  let retryTimer: ReturnType<typeof setTimeout> | undefined;
+
+  // Drop the current subscription; ignore the error if the server
+  // already ended it.
+  const drop = () => {
+    if (unsub) Promise.resolve(unsub()).catch(() => {});
+    unsub = undefined;
+  };
+
+  const subscribe = async (): Promise<void> => {
+    const resync =
+      feedId !== undefined ? { feed_id: feedId, since_version: version } : {};
+    unsub = await hass.connection.subscribeMessage(
+      (event: FeedEvent) => {
+        if (event.type === 'closed') {
+          resubscribe();
+          return;
+        }
+        if (event.type === 'snapshot') {
+          snapshot = event.data;
+          feedId = event.feed_id;
+          version = event.version;
+        } else if (snapshot && event.version === version + 1) {
+          snapshot = applyFeedDelta(snapshot, event.changes);
+          version = event.version;
+        } else {
+          if (event.version > version) resubscribe();
+          return;
+        }
+        callback(snapshot);
+      },
+      { type: 'smart_climate/subscribe', ...resync },
+    );
+    if (closed) drop();
+  };
+
+  const resubscribe = () => {
+    if (resyncing || closed) return;
+    resyncing = true;
+    drop();
+    const attempt = () => {
+      retryTimer = undefined;
+      if (closed) {
+        resyncing = false;
+        return;
+      }
+      subscribe()
+        .then(() => {
+          resyncing = false;
+          retryDelay = FEED_RETRY_BASE_DELAY;
+        })
+        .catch(() => {
+          retryTimer = setTimeout(attempt, retryDelay);
+          retryDelay = Math.min(retryDelay * 2, FEED_RETRY_MAX_DELAY);
+        });
+    };
+    attempt();
+  };
+
+  await subscribe();
+  return () => {
+    closed = true;
+    if (retryTimer !== undefined) clearTimeout(retryTimer);
+    drop();
+  };
+}
+
+const INTEGRATION = 'smart_climate';
+const ENTITY_PATTERN = /^[a-z_]+\.sc_/;
+const ROOM_PATTERN = /^sensor\.sc_(.+)_comfort_score$/;
+
+interface EntityIndex {
+  key: unknown;
+  entityIds: string[];
+  rooms: string[];
+}
+
+let entityIndex: EntityIndex | undefined;
+
+/**
+ * Index the integration's entity ids and rooms, rebuilt only when the set
+ * of entities changes.  Lovelace hands over a new states object on every
+ * state change anywhere in HA, so the entity registry is used as the key
+ * when available (it is only replaced when entities are added or removed)
+ * and the entity count otherwise.
+ */
+function getEntityIndex(hass: HomeAssistant): EntityIndex {
+  const key = hass.entities ?? Object.keys(hass.states).length;
+  if (entityIndex && entityIndex.key === key) return entityIndex;
+
+  const entityIds = hass.entities
+    ? Object.values(hass.entities)
+        .filter((entry) => entry.platform === INTEGRATION)
+        .map((entry) => entry.entity_id)
+    : Object.keys(hass.states).filter((entityId) => ENTITY_PATTERN.test(entityId));
+
+  const rooms: string[] = [];
+  for (const entityId of entityIds) {
+    const match = entityId.match(ROOM_PATTERN);
+    if (match && match[1] && match[1] !== 'house') {
+      rooms.push(match[1]);
+    }
+  }
+
+  entityIndex = { key, entityIds: entityIds.sort(), rooms: rooms.sort() };
+  return entityIndex;
+}
+
+/**
+ * Entity ids belonging to Smart Climate.  The same array is returned until
+ * the entity set changes.
+ */
+export function smartClimateEntityIds(hass: HomeAssistant): string[] {
+  if (!hass || !hass.states) return [];
+  return getEntityIndex(hass).entityIds;
+}
+
+/**
+ * Whether any of ``entityIds`` has a different state object in ``newHass``.
+ * HA keeps the state object of an unchanged entity, so identity suffices.
+ */
+export function statesChanged(
+  oldHass: HomeAssistant | undefined,
+  newHass: HomeAssistant,
+  entityIds: readonly string[],
+): boolean {
+  if (!oldHass) return true;
+  if (oldHass.states === newHass.states) return false;
+  return entityIds.some((id) => oldHass.states[id] !== newHass.states[id]);
+}
+
+// Compressed entity state sent by subscribe_entities
+interface CompressedState {
+  s: string;
+  a: Record<string, any>;
+  lc: number;
+  lu?: number;
+}
+
+// One subscribe_entities message: added, changed and removed entities
+interface CompressedStatesUpdate {
+  a?: Record<string, CompressedState>;
+  c?: Record<
+    string,
+    { '+'?: Partial<CompressedState>; '-'?: { a?: string[] } }
+  >;
+  r?: string[];
+}
+
+function toIsoTime(seconds: number): string {
+  return new Date(seconds * 1000).toISOString();
+}
+
+/**
+ * Apply a subscribe_entities update to a copy of the states it changes.
+ */
+function applyStatesUpdate(
+  states: Record<string, HassEntity>,
+  update: CompressedStatesUpdate,
+): Record<string, HassEntity> {
+  const next = { ...states };
+  for (const [entityId, added] of Object.entries(update.a ?? {})) {
+    const lastChanged = toIsoTime(added.lc);
+    next[entityId] = {
+      entity_id: entityId,
+      state: added.s,
+      attributes: added.a,
+      last_changed: lastChanged,
+      last_updated: added.lu ? toIsoTime(added.lu) : lastChanged,
+    };
+  }
+  for (const entityId of update.r ?? []) {
+    delete next[entityId];
+  }
+  for (const [entityId, { '+': toAdd, '-': toRemove }] of Object.entries(update.c ?? {})) {
+    const current = next[entityId];
+    if (!current) continue;
+    const entity = { ...current };
+    if (toAdd?.a || toRemove?.a) {
+      entity.attributes = { ...current.attributes, ...toAdd?.a };
+      for (const key of toRemove?.a ?? []) delete entity.attributes[key];
+    }
+    if (toAdd?.s !== undefined) entity.state = toAdd.s;
+    if (toAdd?.lc) {
+      entity.last_changed = entity.last_updated = toIsoTime(toAdd.lc);
+    } else if (toAdd?.lu) {
+      entity.last_updated = toIsoTime(toAdd.lu);
+    }
+    next[entityId] = entity;
+  }
+  return next;
+}
+
+/**
+ * Subscribe to state changes of Smart Climate's entities only.  The
+ * server sends just those entities, as compressed diffs that are applied
+ * here; the callback receives their full states.  Resubscribe when
+ * smartClimateEntityIds() returns a new list.
  * Returns an unsubscribe function.
  */
 export function subscribeEntities(
@@ -52,41 +421,37 @@ export function subscribeEntities(
     return () => {};
   }
 
-  let unsub: (() => void) | null = null;
+  let states: Record<string, HassEntity> = {};
+  let unsub: (() => Promise<void> | void) | undefined;
+  let closed = false;
 
   hass.connection
-    .subscribeEvents((event: any) => {
-      if (event.event_type === 'state_changed') {
-        callback(hass.states);
-      }
-    }, 'state_changed')
-    .then((unsubFn: () => void) => {
-      unsub = unsubFn;
+    .subscribeMessage(
+      (update: CompressedStatesUpdate) => {
+        states = applyStatesUpdate(states, update);
+        callback(states);
+      },
+      { type: 'subscribe_entities', entity_ids: smartClimateEntityIds(hass) },
+    )
+    .then((unsubFn: () => Promise<void>) => {
+      if (closed) unsubFn();
+      else unsub = unsubFn;
     });
 
   return () => {
+    closed = true;
     if (unsub) unsub();
   };
 }
 
 /**
  * Discover all rooms managed by Smart Climate by finding entities
- * matching the pattern sensor.sc_*_comfort_score.
+ * matching the pattern sensor.sc_*_comfort_score.  The same array is
+ * returned until the entity set changes.
  */
 export function discoverRooms(hass: HomeAssistant): string[] {
   if (!hass || !hass.states) return [];
-
-  const rooms: string[] = [];
-  const pattern = /^sensor\.sc_(.+)_comfort_score$/;
-
-  for (const entityId of Object.keys(hass.states)) {
-    const match = entityId.match(pattern);
-    if (match && match[1] && match[1] !== 'house') {
-      rooms.push(match[1]);
-    }
-  }
-
-  return rooms.sort();
+  return getEntityIndex(hass).rooms;
 }
 
 /**
@@ -6,6 +6,7 @@ a full homeassistant installation.
 """
 
 import sys
+from enum import Enum, IntFlag
 from types import ModuleType
 from unittest.mock import MagicMock
 
@@ -55,6 +56,14 @@ def setup_mock_homeassistant():
     ha_core.ServiceCall = MagicMock
     ha_core.callback = lambda f: f
     ha_core.CALLBACK_TYPE = MagicMock
+    ha_core.Event = MagicMock
+    ha_core.State = MagicMock
+    ha_core.ServiceResponse = dict
+    ha_core.SupportsResponse = type("SupportsResponse", (), {
+        "NONE": "none",
+        "OPTIONAL": "optional",
+        "ONLY": "only",
+    })()
 
     # homeassistant.config_entries
     ha_config_entries = _create_module("homeassistant.config_entries")
@@ -113,7 +122,23 @@ def setup_mock_homeassistant():
 
     # homeassistant.helpers.entity
     ha_entity = _create_module("homeassistant.helpers.entity")
-    ha_entity.Entity = type("Entity", (), {})
+
+    class FakeEntity:
+        """Minimal Entity stub tracking removal callbacks and state writes."""
+
+        hass = None
+        available = True
+        state = None
+        state_attributes = None
+        extra_state_attributes = None
+
+        def async_on_remove(self, func):
+            self.__dict__.setdefault("_on_remove", []).append(func)
+
+        def async_write_ha_state(self):
+            self.__dict__["state_writes"] = self.__dict__.get("state_writes", 0) + 1
+
+    ha_entity.Entity = FakeEntity
 
     # homeassistant.helpers.update_coordinator
     ha_coordinator = _create_module("homeassistant.helpers.update_coordinator")
@@ -130,6 +155,7 @@ def setup_mock_homeassistant():
             self.config_entry = MagicMock()
             self.last_update_success_time = None
             self.logger = MagicMock()
+            self._listeners = []
 
         async def async_config_entry_first_refresh(self):
             pass
@@ -137,6 +163,14 @@ def setup_mock_homeassistant():
         def async_set_updated_data(self, data):
             self.data = data
 
+        def async_add_listener(self, update_callback, context=None):
+            self._listeners.append(update_callback)
+            return lambda: self._listeners.remove(update_callback)
+
+        def async_update_listeners(self):
+            for update_callback in list(self._listeners):
+                update_callback()
+
     ha_coordinator.DataUpdateCoordinator = FakeCoordinator
     class FakeCoordinatorEntityMeta(type):
         """Allow CoordinatorEntity[X] subscription on Python 3.9."""
@@ -147,6 +181,12 @@ def setup_mock_homeassistant():
         def __init__(self, coordinator):
             self.coordinator = coordinator
 
+        async def async_added_to_hass(self):
+            pass
+
+        def _handle_coordinator_update(self):
+            self.async_write_ha_state()
+
     ha_coordinator.CoordinatorEntity = FakeCoordinatorEntity
 
     # homeassistant.helpers.storage
@@ -168,6 +208,8 @@ def setup_mock_homeassistant():
     # homeassistant.helpers.event
     ha_event = _create_module("homeassistant.helpers.event")
     ha_event.async_track_time_change = MagicMock(return_value=lambda: None)
+    ha_event.async_call_later = MagicMock(return_value=lambda: None)
+    ha_event.async_track_state_change_event = MagicMock(return_value=lambda: None)
 
     # homeassistant.helpers.area_registry
     ha_area_reg = _create_module("homeassistant.helpers.area_registry")
@@ -266,13 +308,35 @@ def setup_mock_homeassistant():
     ha_http = _create_module("homeassistant.components.http")
     ha_http.StaticPathConfig = MagicMock
 
+    # homeassistant.components.websocket_api
+    ha_ws = _create_module("homeassistant.components.websocket_api")
+    ha_ws.ActiveConnection = MagicMock
+    ha_ws.ERR_NOT_FOUND = "not_found"
+    ha_ws.async_register_command = MagicMock()
+
+    def websocket_command(schema):
+        def decorate(func):
+            func._ws_schema = schema
+            func._ws_command = next(v for k, v in schema.items() if k == "type")
+            return func
+        return decorate
+
+    ha_ws.websocket_command = websocket_command
+    ha_ws.async_response = lambda func: func
+    ha_ws.event_message = lambda iden, event: {
+        "id": iden, "type": "event", "event": event,
+    }
+
     # homeassistant.components.sensor
     ha_sensor = _create_module("homeassistant.components.sensor")
-    ha_sensor.SensorEntity = type("SensorEntity", (), {})
+    ha_sensor.SensorEntity = type("SensorEntity", (FakeEntity,), {
+        "state": property(lambda self: self.native_value),
+    })
     ha_sensor.SensorDeviceClass = type("SensorDeviceClass", (), {
         "TEMPERATURE": "temperature",
         "HUMIDITY": "humidity",
         "TIMESTAMP": "timestamp",
+        "DURATION": "duration",
     })()
     ha_sensor.SensorStateClass = type("SensorStateClass", (), {
         "MEASUREMENT": "measurement",
@@ -281,7 +345,11 @@ def setup_mock_homeassistant():
 
     # homeassistant.components.binary_sensor
     ha_bsensor = _create_module("homeassistant.components.binary_sensor")
-    ha_bsensor.BinarySensorEntity = type("BinarySensorEntity", (), {})
+    ha_bsensor.BinarySensorEntity = type("BinarySensorEntity", (FakeEntity,), {
+        "state": property(
+            lambda self: None if self.is_on is None else ("on" if self.is_on else "off")
+        ),
+    })
     ha_bsensor.BinarySensorDeviceClass = type("BinarySensorDeviceClass", (), {
         "OCCUPANCY": "occupancy",
         "WINDOW": "window",
@@ -289,30 +357,41 @@ def setup_mock_homeassistant():
 
     # homeassistant.components.climate
     ha_climate = _create_module("homeassistant.components.climate")
-    ha_climate.ClimateEntity = type("ClimateEntity", (), {})
-    ha_climate.ClimateEntityFeature = type("ClimateEntityFeature", (), {
-        "TARGET_TEMPERATURE": 1,
-        "FAN_MODE": 8,
-        "PRESET_MODE": 16,
-        "SWING_MODE": 32,
-    })()
-    ha_climate.HVACMode = type("HVACMode", (), {
-        "OFF": "off",
-        "HEAT": "heat",
-        "COOL": "cool",
-        "AUTO": "auto",
-        "HEAT_COOL": "heat_cool",
-        "DRY": "dry",
-        "FAN_ONLY": "fan_only",
-    })()
-    ha_climate.HVACAction = type("HVACAction", (), {
-        "HEATING": "heating",
-        "COOLING": "cooling",
-        "IDLE": "idle",
-        "OFF": "off",
-        "DRYING": "drying",
-        "FAN": "fan",
-    })()
+    ha_climate.ClimateEntity = type("ClimateEntity", (FakeEntity,), {
+        "state": property(lambda self: self.hvac_mode),
+        "state_attributes": property(lambda self: {
+            "current_temperature": self.current_temperature,
+            "temperature": self.target_temperature,
+            "hvac_action": self.hvac_action,
+        }),
+    })
+    class ClimateEntityFeature(IntFlag):
+        TARGET_TEMPERATURE = 1
+        TARGET_TEMPERATURE_RANGE = 2
+        FAN_MODE = 8
+        PRESET_MODE = 16
+        SWING_MODE = 32
+
+    class HVACMode(str, Enum):
+        OFF = "off"
+        HEAT = "heat"
+        COOL = "cool"
+        AUTO = "auto"
+        HEAT_COOL = "heat_cool"
+        DRY = "dry"
+        FAN_ONLY = "fan_only"
+
+    class HVACAction(str, Enum):
+        HEATING = "heating"
+        COOLING = "cooling"
+        IDLE = "idle"
+        OFF = "off"
+        DRYING = "drying"
+        FAN = "fan"
+
+    ha_climate.ClimateEntityFeature = ClimateEntityFeature
+    ha_climate.HVACMode = HVACMode
+    ha_climate.HVACAction = HVACAction
 
     # homeassistant.components.select
     ha_select = _create_module("homeassistant.components.select")
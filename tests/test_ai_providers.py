@@ -1,15 +1,35 @@
 """Tests for AI provider abstractions and response parsing."""
+import asyncio
 import json
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from aiohttp import StreamReader
 
+from custom_components.smart_climate.ai import failover
+from custom_components.smart_climate.ai import provider as provider_module
 from custom_components.smart_climate.ai.analysis import (
     ALLOWED_ACTION_TYPES,
+    MAX_SUGGESTIONS,
     MAX_SAFE_TEMP,
     MIN_SAFE_TEMP,
+    _extract_json,
     parse_ai_response,
 )
+from custom_components.smart_climate.ai.failover import FailoverProvider
+from custom_components.smart_climate.ai.schema import (
+    ANALYSIS_SCHEMA,
+    ANALYSIS_SCHEMA_NAME,
+    compile_schema,
+    to_gemini_schema,
+    to_strict_schema,
+    validate_analysis,
+)
+from custom_components.smart_climate.ai.suggestions import approve_suggestions
+from custom_components.smart_climate.ai.telemetry import AICallRecord, AITelemetry
 from custom_components.smart_climate.ai.prompts import (
     build_system_prompt,
     build_user_prompt,
@@ -18,16 +38,30 @@ from custom_components.smart_climate.ai.provider import (
     AIConnectionError,
     AIProviderBase,
     AIProviderError,
+    AIRateLimitError,
     AIResponseError,
     NoOpProvider,
+    TokenBucket,
     create_ai_provider,
+    create_ai_provider_chain,
+    get_token_bucket,
+    next_backoff,
+    parse_retry_after,
+    read_limited_text,
 )
+from custom_components.smart_climate.clock import Clock
 from custom_components.smart_climate.const import (
     AI_PROVIDER_ANTHROPIC,
     AI_PROVIDER_GEMINI,
     AI_PROVIDER_GROK,
     AI_PROVIDER_OLLAMA,
     AI_PROVIDER_OPENAI,
+    CONF_AI_FALLBACK_API_KEY,
+    CONF_AI_FALLBACK_PROVIDER,
+    CONF_AI_PROVIDER,
+    DOMAIN,
+    EVENT_SUGGESTION_APPLIED,
+    EVENT_SUGGESTIONS_BULK_APPROVED,
     SUGGESTION_PENDING,
 )
 from custom_components.smart_climate.models import (
@@ -37,6 +71,7 @@ from custom_components.smart_climate.models import (
     RoomState,
     Suggestion,
     SuggestionPriority,
+    SuggestionStore,
 )
 
 # ---------------------------------------------------------------------------
@@ -699,3 +734,943 @@ class TestSuggestionLifecycle:
         suggestion = Suggestion(applied_at=now)
         data = suggestion.to_dict()
         assert data["applied_at"] == now.isoformat()
+
+
+# ---------------------------------------------------------------------------
+# Failover chain, hedging and circuit breaker tests
+# ---------------------------------------------------------------------------
+
+
+class _FakeProvider(AIProviderBase):
+    """Provider returning a canned response after an optional delay."""
+
+    def __init__(self, response="{}", delay=0.0, error=None):
+        super().__init__({})
+        self.response = response
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def analyze(self, system_prompt, user_prompt):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    async def test_connection(self):
+        return self.error is None
+
+
+class TestFailoverProvider:
+    """Tests for the ordered provider chain."""
+
+    @pytest.mark.asyncio
+    async def test_primary_response_used(self):
+        """A healthy primary should answer without touching the fallback."""
+        primary = _FakeProvider('{"summary": "primary"}')
+        fallback = _FakeProvider('{"summary": "fallback"}')
+        chain = FailoverProvider([("ollama", primary), ("openai", fallback)])
+
+        assert await chain.analyze("s", "u") == '{"summary": "primary"}'
+        assert fallback.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_fails_over_on_error(self):
+        """A failing primary should hand the request to the next provider."""
+        primary = _FakeProvider(error=AIConnectionError("down"))
+        fallback = _FakeProvider('{"summary": "fallback"}')
+        chain = FailoverProvider([("ollama", primary), ("openai", fallback)])
+
+        assert await chain.analyze("s", "u") == '{"summary": "fallback"}'
+
+    @pytest.mark.asyncio
+    async def test_invalid_response_fails_over(self):
+        """A non-JSON answer is not a valid response."""
+        primary = _FakeProvider("I cannot help with that")
+        fallback = _FakeProvider('{"summary": "ok"}')
+        chain = FailoverProvider([("ollama", primary), ("openai", fallback)])
+
+        assert await chain.analyze("s", "u") == '{"summary": "ok"}'
+
+    @pytest.mark.asyncio
+    async def test_all_fail_raises(self):
+        """An error should be raised when every provider fails."""
+        chain = FailoverProvider(
+            [
+                ("a", _FakeProvider(error=AIConnectionError("x"))),
+                ("b", _FakeProvider(error=AIResponseError("y"))),
+            ]
+        )
+        with pytest.raises(AIConnectionError, match="All AI providers failed"):
+            await chain.analyze("s", "u")
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins_and_loser_cancelled(self, monkeypatch):
+        """A slow primary should be hedged and cancelled once the hedge wins."""
+        monkeypatch.setattr(failover, "DEFAULT_HEDGE_DELAY", 0.01)
+        primary = _FakeProvider('{"summary": "slow"}', delay=5)
+        fallback = _FakeProvider('{"summary": "fast"}')
+        chain = FailoverProvider([("ollama", primary), ("openai", fallback)])
+
+        assert await chain.analyze("s", "u") == '{"summary": "fast"}'
+        assert primary.cancelled is True
+        # Losing a hedge race does not count against the provider
+        assert chain.health()["ollama"]["consecutive_failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_provider(self):
+        """A provider with an open breaker should not be called."""
+        primary = _FakeProvider(error=AIConnectionError("down"))
+        fallback = _FakeProvider('{"summary": "ok"}')
+        chain = FailoverProvider([("ollama", primary), ("openai", fallback)])
+
+        for _ in range(failover.BREAKER_FAILURE_THRESHOLD):
+            await chain.analyze("s", "u")
+        assert chain.health()["ollama"]["circuit"] == failover.BREAKER_OPEN
+
+        calls = primary.calls
+        await chain.analyze("s", "u")
+        assert primary.calls == calls
+
+    @pytest.mark.asyncio
+    async def test_test_connection_any_provider(self):
+        """Connection test passes if any provider in the chain is reachable."""
+        chain = FailoverProvider(
+            [
+                ("a", _FakeProvider(error=AIConnectionError("x"))),
+                ("b", _FakeProvider()),
+            ]
+        )
+        assert await chain.test_connection() is True
+
+
+class TestCircuitBreaker:
+    """Tests for the per-provider circuit breaker."""
+
+    def test_opens_after_threshold(self):
+        """Breaker opens after consecutive failures."""
+        breaker = failover.CircuitBreaker(failure_threshold=2, reset_seconds=60)
+        breaker.record_failure()
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.state == failover.BREAKER_OPEN
+        assert breaker.allow_request() is False
+
+    def test_half_open_allows_single_trial(self):
+        """After the reset period a single trial request is allowed."""
+        breaker = failover.CircuitBreaker(failure_threshold=1, reset_seconds=0)
+        breaker.record_failure()
+        assert breaker.state == failover.BREAKER_HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+        breaker.record_success()
+        assert breaker.state == failover.BREAKER_CLOSED
+
+    def test_latency_percentile(self):
+        """Nearest-rank percentile over the bounded window."""
+        tracker = failover.LatencyTracker(size=20)
+        for value in range(1, 41):
+            tracker.record(float(value))
+        # Only the last 20 samples (21..40) are kept
+        assert len(tracker) == 20
+        assert tracker.percentile(95) == 39.0
+        assert tracker.percentile(50) == 30.0
+        assert failover.LatencyTracker().percentile(95) is None
+
+
+class TestProviderChainFactory:
+    """Tests for create_ai_provider_chain."""
+
+    def test_single_provider_not_wrapped(self):
+        """Without a fallback the primary provider is returned as-is."""
+        from custom_components.smart_climate.ai.ollama_provider import OllamaProvider
+
+        provider = create_ai_provider_chain({CONF_AI_PROVIDER: AI_PROVIDER_OLLAMA})
+        assert isinstance(provider, OllamaProvider)
+
+    def test_fallback_builds_chain(self):
+        """A fallback provider produces an ordered FailoverProvider."""
+        provider = create_ai_provider_chain(
+            {
+                CONF_AI_PROVIDER: AI_PROVIDER_OLLAMA,
+                CONF_AI_FALLBACK_PROVIDER: AI_PROVIDER_OPENAI,
+                CONF_AI_FALLBACK_API_KEY: "sk-test",
+            }
+        )
+        assert isinstance(provider, FailoverProvider)
+        assert list(provider.health()) == ["ollama", "openai"]
+
+    def test_duplicate_provider_types_get_unique_names(self):
+        """Two providers of the same type are tracked separately."""
+        provider = create_ai_provider_chain(
+            {
+                CONF_AI_PROVIDER: AI_PROVIDER_OLLAMA,
+                CONF_AI_FALLBACK_PROVIDER: AI_PROVIDER_OLLAMA,
+            }
+        )
+        assert list(provider.health()) == ["ollama", "ollama_2"]
+
+    def test_none_returns_noop(self):
+        """No configured provider yields a NoOpProvider."""
+        assert isinstance(create_ai_provider_chain({}), NoOpProvider)
+
+
+# ---------------------------------------------------------------------------
+# Shared retry policy tests
+# ---------------------------------------------------------------------------
+
+
+class _FlakyProvider(AIProviderBase):
+    """Provider whose request raises the queued errors before succeeding."""
+
+    def __init__(self, errors):
+        super().__init__({})
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def analyze(self, system_prompt, user_prompt):
+        return await self._request_with_retry(self._send)
+
+    async def test_connection(self):
+        return True
+
+    def _rate_limit_key(self):
+        return f"test:{id(self)}"
+
+    async def _send(self, call):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        call.prompt_tokens = 120
+        call.completion_tokens = 30
+        call.response_bytes = 2
+        return "{}"
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    """Record retry sleeps instead of waiting on them."""
+    sleeps = []
+
+    async def _fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(provider_module.asyncio, "sleep", _fake_sleep)
+    monkeypatch.setattr(provider_module, "_TOKEN_BUCKETS", {})
+    monkeypatch.setattr(provider_module, "TOKEN_BUCKET_CAPACITY", 100)
+    return sleeps
+
+
+class TestRetryPolicy:
+    """Tests for AIProviderBase._request_with_retry."""
+
+    async def test_retries_connection_errors(self, fast_retries):
+        """Transient errors are retried until the request succeeds."""
+        provider = _FlakyProvider([AIConnectionError("a"), AIConnectionError("b")])
+        assert await provider.analyze("s", "u") == "{}"
+        assert provider.calls == 3
+        assert len(fast_retries) == 2
+
+    async def test_response_error_not_retried(self, fast_retries):
+        """A malformed response is propagated immediately."""
+        provider = _FlakyProvider([AIResponseError("bad")])
+        with pytest.raises(AIResponseError):
+            await provider.analyze("s", "u")
+        assert provider.calls == 1
+
+    async def test_retry_after_honoured(self, fast_retries):
+        """A Retry-After hint longer than the backoff wins."""
+        provider = _FlakyProvider([AIRateLimitError("429", retry_after=12.0)])
+        assert await provider.analyze("s", "u") == "{}"
+        assert fast_retries[0] >= 12.0
+
+    async def test_gives_up_after_max_attempts(self, fast_retries):
+        """Errors beyond RETRY_MAX_ATTEMPTS are raised with the same type."""
+        errors = [
+            AIRateLimitError("429") for _ in range(provider_module.RETRY_MAX_ATTEMPTS)
+        ]
+        provider = _FlakyProvider(errors)
+        with pytest.raises(AIRateLimitError, match="after 5 attempts"):
+            await provider.analyze("s", "u")
+        assert provider.calls == provider_module.RETRY_MAX_ATTEMPTS
+
+    async def test_stops_when_budget_exhausted(self, fast_retries):
+        """A Retry-After beyond the time budget is not waited out."""
+        provider = _FlakyProvider(
+            [AIRateLimitError("529", retry_after=provider_module.RETRY_TIME_BUDGET + 1)]
+        )
+        with pytest.raises(AIRateLimitError):
+            await provider.analyze("s", "u")
+        assert provider.calls == 1
+        assert fast_retries == []
+
+    def test_backoff_within_bounds(self):
+        """Decorrelated jitter stays between the base and the cap."""
+        delay = provider_module.RETRY_BASE_DELAY
+        for _ in range(50):
+            delay = next_backoff(delay)
+            assert provider_module.RETRY_BASE_DELAY <= delay
+            assert delay <= provider_module.RETRY_MAX_DELAY
+
+
+class TestParseRetryAfter:
+    """Tests for rate-limit header parsing."""
+
+    def test_seconds(self):
+        assert parse_retry_after({"Retry-After": "7"}) == 7.0
+
+    def test_milliseconds(self):
+        assert parse_retry_after({"retry-after-ms": "1500"}) == 1.5
+
+    def test_http_date(self):
+        when = datetime.now(tz=timezone.utc) + timedelta(seconds=30)
+        header = when.strftime("%a, %d %b %Y %H:%M:%S GMT")
+        assert 25 <= parse_retry_after({"Retry-After": header}) <= 31
+
+    def test_openai_reset_duration(self):
+        headers = {
+            "x-ratelimit-reset-requests": "1m30s",
+            "x-ratelimit-reset-tokens": "250ms",
+        }
+        assert parse_retry_after(headers) == 90.0
+
+    def test_anthropic_reset_timestamp(self):
+        when = datetime.now(tz=timezone.utc) + timedelta(seconds=20)
+        headers = {"anthropic-ratelimit-requests-reset": when.isoformat()}
+        assert 15 <= parse_retry_after(headers) <= 21
+
+    def test_missing_or_garbage(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"x-ratelimit-reset-requests": "soon"}) is None
+
+
+class TestTokenBucket:
+    """Tests for the shared per-provider token bucket."""
+
+    def test_bucket_shared_per_key(self, monkeypatch):
+        """Providers on the same endpoint share one bucket."""
+        monkeypatch.setattr(provider_module, "_TOKEN_BUCKETS", {})
+        from custom_components.smart_climate.ai.openai_provider import OpenAIProvider
+
+        first = OpenAIProvider({"api_key": "a"})
+        second = OpenAIProvider({"api_key": "b"})
+        assert get_token_bucket(first._rate_limit_key()) is get_token_bucket(
+            second._rate_limit_key()
+        )
+        other = OpenAIProvider({"base_url": "http://localhost:8080"})
+        assert get_token_bucket(other._rate_limit_key()) is not get_token_bucket(
+            first._rate_limit_key()
+        )
+
+    async def test_burst_then_wait(self, monkeypatch):
+        """Tokens beyond the capacity require waiting for a refill."""
+        sleeps = []
+
+        async def _fake_sleep(seconds):
+            sleeps.append(seconds)
+            bucket._updated -= seconds
+
+        monkeypatch.setattr(provider_module.asyncio, "sleep", _fake_sleep)
+        bucket = TokenBucket(capacity=2, rate=1.0)
+        await bucket.acquire()
+        await bucket.acquire()
+        assert sleeps == []
+        await bucket.acquire()
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= 1.0
+
+
+# ---------------------------------------------------------------------------
+# Call telemetry tests
+# ---------------------------------------------------------------------------
+
+
+class TestAITelemetry:
+    """Tests for per-call AI metrics."""
+
+    async def test_successful_call_recorded(self, fast_retries):
+        """Retries, tokens and size of a call end up in the telemetry."""
+        telemetry = AITelemetry()
+        provider = _FlakyProvider([AIConnectionError("a")])
+        provider.telemetry = telemetry
+
+        await provider.analyze("s", "u")
+
+        call = telemetry.last_call
+        assert call.success is True
+        assert call.retries == 1
+        assert call.prompt_tokens == 120
+        assert call.completion_tokens == 30
+        assert call.response_bytes == 2
+        assert telemetry.total_tokens == 150
+
+    async def test_failed_call_recorded(self, fast_retries):
+        """A failing call is recorded with its error."""
+        telemetry = AITelemetry()
+        provider = _FlakyProvider([AIResponseError("bad json")])
+        provider.telemetry = telemetry
+
+        with pytest.raises(AIResponseError):
+            await provider.analyze("s", "u")
+
+        assert telemetry.last_call.success is False
+        assert "bad json" in telemetry.last_call.error
+        assert telemetry.summary()["total_failures"] == 1
+
+    async def test_cancelled_call_not_recorded(self, fast_retries):
+        """A hedge loser cancelled mid-request is not counted as a failure."""
+        telemetry = AITelemetry()
+        provider = _FlakyProvider([])
+        provider.telemetry = telemetry
+        started = asyncio.Event()
+
+        async def hang(call):
+            started.set()
+            await asyncio.Event().wait()
+
+        provider._send = hang
+        task = asyncio.ensure_future(provider.analyze("s", "u"))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert telemetry.total_calls == 0
+        assert telemetry.total_failures == 0
+
+    def test_history_is_bounded(self):
+        """Only the most recent calls are kept; totals keep counting."""
+        telemetry = AITelemetry(size=3)
+        for _ in range(5):
+            telemetry.record(AICallRecord(success=True, latency=1.0, prompt_tokens=10))
+        assert len(telemetry) == 3
+        assert telemetry.total_calls == 5
+        assert telemetry.total_prompt_tokens == 50
+
+    def test_summary_latency(self):
+        """Average and p95 latency cover successful calls only."""
+        telemetry = AITelemetry()
+        for latency in (1.0, 2.0, 3.0):
+            telemetry.record(AICallRecord(success=True, latency=latency))
+        telemetry.record(AICallRecord(success=False, latency=99.0))
+        summary = telemetry.summary()
+        assert summary["avg_latency"] == 2.0
+        assert summary["p95_latency"] == 3.0
+
+    def test_round_trip(self):
+        """Telemetry survives serialization for the state store."""
+        telemetry = AITelemetry()
+        telemetry.record(
+            AICallRecord(
+                provider="OpenAI",
+                model="gpt-4o-mini",
+                success=True,
+                latency=4.2,
+                time_to_first_byte=3.9,
+                completion_tokens=80,
+            )
+        )
+        restored = AITelemetry()
+        restored.restore(telemetry.to_dict())
+        assert restored.as_list() == telemetry.as_list()
+        assert restored.total_completion_tokens == 80
+
+    def test_chain_attaches_telemetry(self):
+        """Every provider in a chain reports to the shared sink."""
+        telemetry = AITelemetry()
+        chain = create_ai_provider_chain(
+            {
+                CONF_AI_PROVIDER: AI_PROVIDER_OLLAMA,
+                CONF_AI_FALLBACK_PROVIDER: AI_PROVIDER_OPENAI,
+            },
+            telemetry=telemetry,
+        )
+        assert all(p.telemetry is telemetry for _, p in chain._providers)
+
+
+# ---------------------------------------------------------------------------
+# Structured output tests
+# ---------------------------------------------------------------------------
+
+_VALID_ANALYSIS = {
+    "summary": "All good.",
+    "suggestions": [
+        {
+            "title": "Lower bedroom",
+            "description": "Drop the setpoint overnight.",
+            "reasoning": "Room is unoccupied.",
+            "room": "bedroom",
+            "action_type": "set_temperature",
+            "action_data": {"temperature": 68},
+            "confidence": 0.8,
+            "priority": "medium",
+        }
+    ],
+}
+
+
+class TestAnalysisSchema:
+    """Tests for the analysis schema and its precompiled validator."""
+
+    def test_valid_document(self):
+        assert validate_analysis(_VALID_ANALYSIS) == []
+
+    def test_reports_type_enum_and_range_errors(self):
+        doc = json.loads(json.dumps(_VALID_ANALYSIS))
+        doc["suggestions"][0]["priority"] = "urgent"
+        doc["suggestions"][0]["confidence"] = 1.5
+        doc["suggestions"][0]["action_data"]["vent_position"] = "open"
+        del doc["summary"]
+        errors = validate_analysis(doc)
+        assert "$.summary: missing" in errors
+        assert any("priority" in e and "urgent" in e for e in errors)
+        assert any("confidence" in e for e in errors)
+        assert any("vent_position" in e for e in errors)
+
+    def test_rejects_unexpected_property(self):
+        validator = compile_schema(
+            {"type": "object", "properties": {}, "additionalProperties": False}
+        )
+        assert validator({"extra": 1}) == ["$.extra: unexpected property"]
+
+    def test_max_items(self):
+        doc = {"summary": "", "suggestions": _VALID_ANALYSIS["suggestions"] * 11}
+        assert any("more than 10" in e for e in validate_analysis(doc))
+
+    def test_strict_schema_requires_every_property(self):
+        strict = to_strict_schema(ANALYSIS_SCHEMA)
+        action_data = strict["properties"]["suggestions"]["items"]["properties"][
+            "action_data"
+        ]
+        assert set(action_data["required"]) == set(action_data["properties"])
+        # The source schema is left untouched.
+        assert ANALYSIS_SCHEMA["properties"]["suggestions"]["items"]["properties"][
+            "action_data"
+        ]["required"] == []
+
+    def test_gemini_schema_uses_nullable(self):
+        gemini = to_gemini_schema(ANALYSIS_SCHEMA)
+        room = gemini["properties"]["suggestions"]["items"]["properties"]["room"]
+        assert room == {"type": "string", "nullable": True}
+        assert "additionalProperties" not in json.dumps(gemini)
+
+    def test_parse_logs_schema_mismatch_but_salvages(self, caplog):
+        doc = json.loads(json.dumps(_VALID_ANALYSIS))
+        doc["suggestions"][0]["priority"] = "urgent"
+        suggestions, _ = parse_ai_response(json.dumps(doc))
+        assert len(suggestions) == 1
+        assert suggestions[0].priority == SuggestionPriority.MEDIUM
+        assert "does not match the analysis schema" in caplog.text
+
+
+class TestStructuredOutputPayloads:
+    """Each provider sends the analysis schema through its native feature."""
+
+    @staticmethod
+    async def _capture(provider, monkeypatch):
+        captured = {}
+
+        async def _fake_request(*args):
+            captured["payload"] = args[-2]
+            return "{}"
+
+        monkeypatch.setattr(provider, "_make_request", _fake_request)
+        await provider.analyze("system", "user")
+        return captured["payload"]
+
+    async def test_openai_json_schema(self, fast_retries, monkeypatch):
+        provider = create_ai_provider(AI_PROVIDER_OPENAI, {"api_key": "k"})
+        payload = await self._capture(provider, monkeypatch)
+        fmt = payload["response_format"]
+        assert fmt["type"] == "json_schema"
+        assert fmt["json_schema"]["strict"] is True
+        assert fmt["json_schema"]["name"] == ANALYSIS_SCHEMA_NAME
+
+    async def test_grok_inherits_json_schema(self, fast_retries, monkeypatch):
+        provider = create_ai_provider(AI_PROVIDER_GROK, {"api_key": "k"})
+        payload = await self._capture(provider, monkeypatch)
+        assert payload["response_format"]["type"] == "json_schema"
+
+    async def test_gemini_response_schema(self, fast_retries, monkeypatch):
+        provider = create_ai_provider(AI_PROVIDER_GEMINI, {"api_key": "k"})
+        payload = await self._capture(provider, monkeypatch)
+        assert payload["generationConfig"]["responseSchema"] == to_gemini_schema(
+            ANALYSIS_SCHEMA
+        )
+
+    async def test_ollama_format_schema(self, fast_retries, monkeypatch):
+        provider = create_ai_provider(AI_PROVIDER_OLLAMA, {})
+        payload = await self._capture(provider, monkeypatch)
+        assert payload["format"] == ANALYSIS_SCHEMA
+
+    async def test_anthropic_forced_tool(self, fast_retries, monkeypatch):
+        provider = create_ai_provider(AI_PROVIDER_ANTHROPIC, {"api_key": "k"})
+        payload = await self._capture(provider, monkeypatch)
+        assert payload["tool_choice"] == {"type": "tool", "name": ANALYSIS_SCHEMA_NAME}
+        assert payload["tools"][0]["input_schema"] == ANALYSIS_SCHEMA
+
+    def test_anthropic_tool_input_extracted(self):
+        from custom_components.smart_climate.ai.anthropic_provider import (
+            _extract_content,
+        )
+
+        blocks = [
+            {"type": "text", "text": "Here you go"},
+            {"type": "tool_use", "name": ANALYSIS_SCHEMA_NAME, "input": _VALID_ANALYSIS},
+        ]
+        assert json.loads(_extract_content(blocks)) == _VALID_ANALYSIS
+        assert _extract_content([{"type": "text", "text": "{}"}]) == "{}"
+
+
+# ---------------------------------------------------------------------------
+# JSON extraction tests
+# ---------------------------------------------------------------------------
+
+
+class TestExtractJson:
+    """Tests for the single-pass JSON scanner."""
+
+    def test_surrounding_prose(self):
+        text = 'Sure! Here is the analysis:\n{"summary": "ok"}\nLet me know.'
+        assert _extract_json(text) == {"summary": "ok"}
+
+    def test_markdown_fence(self):
+        assert _extract_json('```json\n{"a": [1, {"b": 2}]}\n```') == {"a": [1, {"b": 2}]}
+
+    def test_braces_and_escapes_inside_strings(self):
+        text = '{"summary": "use } and { and \\" quotes", "n": 1} trailing }'
+        assert _extract_json(text) == {"summary": 'use } and { and " quotes', "n": 1}
+
+    def test_stray_brace_in_prose(self):
+        text = 'Set {temperature} as needed. {"summary": "ok"}'
+        assert _extract_json(text) == {"summary": "ok"}
+
+    def test_unbalanced_brace_before_fence(self):
+        text = 'Set temps to {68-70.\n```json\n{"summary": "ok"}\n```'
+        assert _extract_json(text) == {"summary": "ok"}
+
+    def test_unbalanced_brace_before_object(self):
+        text = 'Set temps to {68-70. {"summary": "ok"}'
+        assert _extract_json(text) == {"summary": "ok"}
+
+    def test_no_object(self):
+        with pytest.raises(ValueError):
+            _extract_json("no json here")
+        with pytest.raises(ValueError):
+            _extract_json('{"unterminated": [1, 2')
+
+    def test_size_limit(self):
+        with pytest.raises(ValueError, match="limit"):
+            _extract_json('{"summary": "' + "x" * 100 + '"}', max_chars=50)
+
+    def test_suggestions_capped_while_scanning(self):
+        item = {"title": "t", "action_data": {"nested": [1, {"x": "]"}]}}
+        doc = {"summary": "s", "suggestions": [item] * 40, "after": True}
+        data = _extract_json(json.dumps(doc))
+        assert len(data["suggestions"]) == MAX_SUGGESTIONS
+        assert data["after"] is True
+
+    def test_top_level_array_returned_as_is(self):
+        assert _extract_json("[1, 2]") == [1, 2]
+
+    def test_pathological_input_is_linear(self):
+        """Multi-megabyte unbalanced input is rejected quickly."""
+        import time
+
+        text = "```json\n" + "{[" * 500_000 + "``" * 250_000
+        start = time.perf_counter()
+        with pytest.raises(ValueError):
+            _extract_json(text, max_chars=len(text))
+        assert time.perf_counter() - start < 5.0
+
+
+class _FakeContent:
+    def __init__(self, data):
+        self._data = data
+
+    async def iter_chunked(self, n):
+        for start in range(0, len(self._data), n):
+            yield self._data[start : start + n]
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self.content = _FakeContent(data)
+        self.charset = None
+
+
+class TestReadLimitedText:
+    """Tests for the bounded HTTP body reader."""
+
+    async def test_within_limit(self):
+        assert await read_limited_text(_FakeResponse(b'{"a": 1}'), limit=100) == '{"a": 1}'
+
+    async def test_over_limit(self):
+        with pytest.raises(AIResponseError):
+            await read_limited_text(_FakeResponse(b"x" * 101), limit=100)
+
+    async def test_streamed_body_is_read_to_eof(self):
+        # Chunks arrive one at a time, so a single read() would only see
+        # the first of them.
+        body = json.dumps({"text": "y" * 200_000}).encode()
+        content = StreamReader(
+            MagicMock(), 2**16, loop=asyncio.get_running_loop()
+        )
+
+        async def stream():
+            for start in range(0, len(body), 16_384):
+                content.feed_data(body[start : start + 16_384])
+                await asyncio.sleep(0)
+            content.feed_eof()
+
+        resp = SimpleNamespace(content=content, charset=None)
+        feeder = asyncio.create_task(stream())
+        text = await read_limited_text(resp)
+        await feeder
+        assert json.loads(text) == {"text": "y" * 200_000}
+
+        content = StreamReader(
+            MagicMock(), 2**16, loop=asyncio.get_running_loop()
+        )
+        feeder = asyncio.create_task(stream())
+        with pytest.raises(AIResponseError):
+            await read_limited_text(
+                SimpleNamespace(content=content, charset=None), limit=50_000
+            )
+        feeder.cancel()
+
+
+class _FakeWarmSession:
+    """Stand-in for aiohttp.ClientSession recording warm-up posts."""
+
+    posts: list = []
+    status = 200
+
+    def __init__(self, **_kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def post(self, url, json=None):
+        self.posts.append((url, json))
+        return _FakeWarmResponse(self.status)
+
+
+class _FakeWarmResponse:
+    def __init__(self, status):
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return b"{}"
+
+
+class TestModelWarmUp:
+    """Tests for preloading local models before analysis."""
+
+    @pytest.fixture
+    def fake_session(self, monkeypatch):
+        from custom_components.smart_climate.ai import ollama_provider
+
+        _FakeWarmSession.posts = []
+        _FakeWarmSession.status = 200
+        monkeypatch.setattr(ollama_provider.aiohttp, "ClientSession", _FakeWarmSession)
+        return _FakeWarmSession
+
+    async def test_base_provider_has_nothing_to_warm(self):
+        assert await _FakeProvider().warm_up(10) is False
+
+    async def test_ollama_preload_sets_keep_alive(self, fake_session):
+        provider = create_ai_provider(AI_PROVIDER_OLLAMA, {"model": "llama3"})
+        assert await provider.warm_up(15) is True
+        url, payload = fake_session.posts[0]
+        assert url.endswith("/api/generate")
+        assert payload == {"model": "llama3", "keep_alive": "15m"}
+
+    async def test_ollama_skips_while_warm(self, fake_session):
+        provider = create_ai_provider(AI_PROVIDER_OLLAMA, {})
+        assert await provider.warm_up(15) is True
+        assert await provider.warm_up(15) is True
+        assert len(fake_session.posts) == 1
+
+    async def test_ollama_failed_preload(self, fake_session):
+        fake_session.status = 404
+        provider = create_ai_provider(AI_PROVIDER_OLLAMA, {})
+        assert await provider.warm_up(15) is False
+        # Not marked warm, so the next attempt retries.
+        assert await provider.warm_up(15) is False
+        assert len(fake_session.posts) == 2
+
+    async def test_failover_warms_every_provider(self, fake_session):
+        ollama = create_ai_provider(AI_PROVIDER_OLLAMA, {})
+        chain = FailoverProvider([("fake", _FakeProvider()), ("ollama", ollama)])
+        assert await chain.warm_up(15) is True
+        assert len(fake_session.posts) == 1
+
+    def test_telemetry_counts_cold_starts(self):
+        telemetry = AITelemetry()
+        telemetry.record(AICallRecord(provider="Ollama", success=True, model_warm=False))
+        telemetry.record(AICallRecord(provider="Ollama", success=True, model_warm=True))
+        telemetry.record(AICallRecord(provider="OpenAI", success=True))
+        assert telemetry.summary()["recent_cold_starts"] == 1
+
+        restored = AITelemetry()
+        restored.restore(telemetry.to_dict())
+        assert [c.model_warm for c in restored._calls] == [False, True, None]
+
+
+# ---------------------------------------------------------------------------
+# Bulk approval
+# ---------------------------------------------------------------------------
+
+
+class TestBulkApproval:
+    """Tests for approve_suggestions."""
+
+    @pytest.fixture
+    def setup(self, sample_room_state, sample_room_state_2):
+        # The nursery shares the living room thermostat.
+        shared = replace(
+            sample_room_state_2,
+            config=replace(
+                sample_room_state_2.config, climate_entity="climate.living_room"
+            ),
+        )
+        rooms = {"living_room": sample_room_state, "nursery": shared}
+        house = HouseState(suggestions=SuggestionStore())
+        hass = MagicMock()
+        hass.services.async_call = AsyncMock()
+        coordinator = SimpleNamespace(
+            hass=hass, clock=Clock(), data={"house": house, "rooms": rooms}
+        )
+        hass.data = {DOMAIN: {"entry": coordinator}}
+        return coordinator, house
+
+    def _add(self, house, **kwargs):
+        suggestion = Suggestion(**kwargs)
+        house.suggestions.add(suggestion)
+        return suggestion
+
+    async def test_conflicting_setpoints_coalesce(self, setup):
+        coordinator, house = setup
+        low = self._add(
+            house, room="living_room", action_type="set_temperature",
+            action_data={"temperature": 70}, priority=SuggestionPriority.LOW,
+        )
+        high = self._add(
+            house, room="nursery", action_type="set_temperature",
+            action_data={"temperature": 68}, priority=SuggestionPriority.HIGH,
+        )
+
+        outcomes = await approve_suggestions(coordinator, [low.id, high.id])
+
+        assert outcomes == {low.id: "superseded", high.id: "applied"}
+        coordinator.hass.services.async_call.assert_awaited_once_with(
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.living_room", "temperature": 68},
+            blocking=True,
+        )
+        assert low.status == "rejected"
+        assert high.id in low.rejected_reason
+        assert high.status == "applied"
+        assert self._applied_events(coordinator) == [high.id]
+
+    def _applied_events(self, coordinator):
+        return [
+            c.args[1]["suggestion_id"]
+            for c in coordinator.hass.bus.async_fire.call_args_list
+            if c.args[0] == EVENT_SUGGESTION_APPLIED
+        ]
+
+    async def test_events_report_all_outcomes(self, setup):
+        coordinator, house = setup
+        mode = self._add(
+            house, room="living_room", action_type="set_mode",
+            action_data={"mode": "cool"},
+        )
+        vent = self._add(
+            house, room="living_room", action_type="vent_adjustment",
+            action_data={"vent_position": 40},
+        )
+        info = self._add(house, action_type="general")
+        done = self._add(house, action_type="general", status="applied")
+
+        outcomes = await approve_suggestions(
+            coordinator, [mode.id, vent.id, info.id, done.id, "missing"]
+        )
+
+        assert outcomes == {
+            mode.id: "applied",
+            vent.id: "applied",
+            info.id: "applied",
+            done.id: "not_pending",
+            "missing": "not_found",
+        }
+        assert coordinator.hass.services.async_call.await_count == 2
+        assert self._applied_events(coordinator) == [mode.id, vent.id, info.id]
+        fired = coordinator.hass.bus.async_fire.call_args_list
+        assert len(fired) == 4
+        event, payload = fired[-1].args
+        assert event == EVENT_SUGGESTIONS_BULK_APPROVED
+        assert payload["outcomes"] == outcomes
+        assert payload["service_calls"] == 2
+
+    async def test_failed_call_marks_only_its_suggestions(self, setup):
+        coordinator, house = setup
+
+        async def call(domain, service, data, blocking):
+            if domain == "cover":
+                raise RuntimeError("vent offline")
+
+        coordinator.hass.services.async_call.side_effect = call
+        temp = self._add(
+            house, room="living_room", action_type="set_temperature",
+            action_data={"temperature": 71},
+        )
+        vent = self._add(
+            house, room="living_room", action_type="vent_adjustment",
+            action_data={"vent_position": 40},
+        )
+
+        outcomes = await approve_suggestions(coordinator, [temp.id, vent.id])
+
+        assert outcomes == {temp.id: "applied", vent.id: "failed"}
+        assert vent.status == SUGGESTION_PENDING
+        assert self._applied_events(coordinator) == [temp.id]
+
+    async def test_winner_failure_leaves_superseded_pending(self, setup):
+        coordinator, house = setup
+        coordinator.hass.services.async_call.side_effect = RuntimeError("offline")
+        low = self._add(
+            house, room="living_room", action_type="set_temperature",
+            action_data={"temperature": 70}, priority=SuggestionPriority.LOW,
+        )
+        high = self._add(
+            house, room="nursery", action_type="set_temperature",
+            action_data={"temperature": 68}, priority=SuggestionPriority.HIGH,
+        )
+
+        outcomes = await approve_suggestions(coordinator, [low.id, high.id])
+
+        assert outcomes == {low.id: "failed", high.id: "failed"}
+        assert low.status == SUGGESTION_PENDING
+        assert not low.rejected_reason
+        assert high.status == SUGGESTION_PENDING
+        assert self._applied_events(coordinator) == []
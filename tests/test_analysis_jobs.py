@@ -0,0 +1,145 @@
+"""Tests for the single-flight AI analysis job manager."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.smart_climate.ai.jobs import (
+    JOB_CANCELLED,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_RUNNING,
+    AnalysisJobManager,
+)
+from custom_components.smart_climate.const import EVENT_ANALYSIS_PROGRESS
+
+
+class _Runner:
+    """Job runner that blocks until released."""
+
+    def __init__(self):
+        self.started = []
+        self.release = asyncio.Event()
+        self.error = None
+
+    async def __call__(self, job, progress):
+        self.started.append(job.job_id)
+        progress("provider")
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+
+
+@pytest.fixture
+async def hass():
+    loop = asyncio.get_running_loop()
+    return SimpleNamespace(
+        async_create_background_task=lambda coro, name: loop.create_task(coro),
+        bus=MagicMock(),
+    )
+
+
+def _events(hass):
+    return [
+        call.args[1]
+        for call in hass.bus.async_fire.call_args_list
+        if call.args[0] == EVENT_ANALYSIS_PROGRESS
+    ]
+
+
+class TestAnalysisJobManager:
+    """Tests for AnalysisJobManager."""
+
+    async def test_single_job_runs_to_completion(self, hass):
+        runner = _Runner()
+        manager = AnalysisJobManager(hass, runner)
+        job_id = manager.request("button")
+        assert manager.current.state == JOB_RUNNING
+
+        runner.release.set()
+        await manager.async_join()
+
+        job = manager.get(job_id)
+        assert job.state == JOB_COMPLETED
+        assert not manager.busy
+        states = [(e["state"], e["stage"]) for e in _events(hass)]
+        assert states == [
+            ("running", None),
+            ("running", "provider"),
+            ("completed", "provider"),
+        ]
+
+    async def test_concurrent_triggers_collapse(self, hass):
+        runner = _Runner()
+        manager = AnalysisJobManager(hass, runner)
+        first = manager.request("button")
+        second = manager.request("button")
+        third = manager.request("service")
+        await asyncio.sleep(0)
+
+        assert first != second
+        assert second == third
+        assert manager.pending.requests == 2
+        assert runner.started == [first]
+
+        runner.release.set()
+        await manager.async_join()
+        assert runner.started == [first, second]
+        assert manager.get(second).state == JOB_COMPLETED
+
+    async def test_cancel_running_starts_follow_up(self, hass):
+        runner = _Runner()
+        manager = AnalysisJobManager(hass, runner)
+        stale = manager.request("schedule")
+        await asyncio.sleep(0)
+        fresh = manager.request("service", cancel_running=True)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert manager.get(stale).state == JOB_CANCELLED
+        assert manager.current.job_id == fresh
+
+        runner.release.set()
+        await manager.async_join()
+        assert manager.get(fresh).state == JOB_COMPLETED
+
+    async def test_cancel_before_first_step(self, hass):
+        runner = _Runner()
+        manager = AnalysisJobManager(hass, runner)
+        stale = manager.request("schedule")
+        fresh = manager.request("service", cancel_running=True)
+        runner.release.set()
+        await manager.async_join()
+
+        assert manager.get(stale).state == JOB_CANCELLED
+        assert manager.get(fresh).state == JOB_COMPLETED
+        assert runner.started == [fresh]
+
+    async def test_failure_recorded_and_queue_continues(self, hass):
+        runner = _Runner()
+        runner.error = RuntimeError("boom")
+        manager = AnalysisJobManager(hass, runner)
+        failed = manager.request()
+        follow_up = manager.request()
+        runner.release.set()
+        await manager.async_join()
+
+        assert manager.get(failed).state == JOB_FAILED
+        assert manager.get(failed).error == "boom"
+        assert manager.get(follow_up).state == JOB_FAILED
+
+    async def test_shutdown_drops_queue(self, hass):
+        runner = _Runner()
+        manager = AnalysisJobManager(hass, runner)
+        running = manager.request()
+        queued = manager.request()
+        await asyncio.sleep(0)
+        await manager.async_shutdown()
+
+        assert manager.get(running).state == JOB_CANCELLED
+        assert manager.get(queued).state == JOB_CANCELLED
+        assert not manager.busy
+        assert runner.started == [running]
+        assert [j["job_id"] for j in manager.as_dict()["history"]] == [queued, running]
@@ -0,0 +1,170 @@
+"""Tests for the parameter-sweep backtester."""
+
+import sqlite3
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.smart_climate.backtest import (
+    ParameterSet,
+    build_frames,
+    history_from_recording,
+    load_recorder_history,
+    parameter_grid,
+    run_sweep,
+    tracked_entities,
+)
+from custom_components.smart_climate.const import CONF_ROOMS
+from custom_components.smart_climate.recorder import RecordingWriter
+
+START = datetime(2024, 1, 8, 6, 0)
+
+
+@pytest.fixture
+def config(sample_config_data):
+    sample_config_data[CONF_ROOMS][0]["auxiliary_entities"] = ["switch.lr_heater"]
+    sample_config_data[CONF_ROOMS][0]["vent_entities"] = ["cover.lr_vent"]
+    sample_config_data[CONF_ROOMS].append(
+        {
+            "room_name": "Office",
+            "room_slug": "office",
+            "climate_entity": "climate.living_room",
+            "temp_sensors": ["sensor.office_temp"],
+            "presence_sensors": ["binary_sensor.office_motion"],
+        }
+    )
+    return sample_config_data
+
+
+def _history():
+    """Two hours: heating runs from 06:10 while the living room stays cold."""
+    def at(minutes):
+        return START + timedelta(minutes=minutes)
+
+    return {
+        "climate.living_room": [
+            (at(0), "heat", {"temperature": 70, "hvac_action": "idle"}),
+            (at(10), "heat", {"temperature": 70, "hvac_action": "heating"}),
+        ],
+        "sensor.lr_temp": [(at(0), "66", {})],
+        "sensor.lr_humidity": [(at(0), "45", {})],
+        "binary_sensor.lr_motion": [(at(0), "on", {}), (at(60), "off", {})],
+        "sensor.office_temp": [(at(0), "69", {})],
+        "binary_sensor.office_motion": [(at(0), "off", {}), (at(30), "on", {})],
+        "weather.home": [(at(0), "cloudy", {"temperature": 30})],
+    }
+
+
+class TestFrames:
+    """Tests for loading and resampling history."""
+
+    def test_build_frames(self, config):
+        frames = build_frames(_history(), config, START, START + timedelta(hours=2))
+
+        assert len(frames) == 24
+        living, office = frames[6].rooms  # 06:30
+        assert frames[6].outdoor == 30
+        assert living.temperature == 66 and living.humidity == 45
+        assert living.hvac_action == "heating"
+        assert living.hvac_since == START + timedelta(minutes=10)
+        assert living.cycles_today == 1
+        assert living.runtime_today == 20
+        assert office.occupied and living.occupied
+        assert not frames[-1].rooms[0].occupied
+
+    def test_tracked_entities(self, config):
+        assert "sensor.office_temp" in tracked_entities(config)
+        assert "weather.home" in tracked_entities(config)
+
+    def test_history_from_recording(self, tmp_path, config):
+        path = str(tmp_path / "inputs.jsonl.gz")
+        writer = RecordingWriter(path, config)
+        state = SimpleNamespace(state="66", attributes={})
+        writer.write(writer.encode_cycle(START, {"sensor.lr_temp": state}))
+        writer.write(
+            writer.encode_cycle(START + timedelta(minutes=1), {"sensor.lr_temp": None})
+        )
+
+        loaded_config, history = history_from_recording(path)
+        assert loaded_config[CONF_ROOMS] == config[CONF_ROOMS]
+        assert history["sensor.lr_temp"] == [
+            (START, "66", {}),
+            (START + timedelta(minutes=1), "unavailable", {}),
+        ]
+
+    def test_load_recorder_history(self, tmp_path):
+        path = str(tmp_path / "home-assistant_v2.db")
+        db = sqlite3.connect(path)
+        db.executescript(
+            """
+            CREATE TABLE states_meta (metadata_id INTEGER PRIMARY KEY, entity_id TEXT);
+            CREATE TABLE state_attributes (attributes_id INTEGER PRIMARY KEY, shared_attrs TEXT);
+            CREATE TABLE states (state_id INTEGER PRIMARY KEY, metadata_id INTEGER,
+                state TEXT, attributes_id INTEGER, last_updated_ts REAL);
+            INSERT INTO states_meta VALUES (1, 'sensor.lr_temp'), (2, 'sensor.other');
+            INSERT INTO state_attributes VALUES (1, '{"unit": "F"}');
+            """
+        )
+        rows = [
+            (1, 1, "60", None, (START - timedelta(hours=2)).timestamp()),
+            (2, 1, "65", 1, (START - timedelta(hours=1)).timestamp()),
+            (3, 1, "66", None, (START + timedelta(minutes=5)).timestamp()),
+            (4, 2, "1", None, (START + timedelta(minutes=5)).timestamp()),
+            (5, 1, "67", None, (START + timedelta(hours=5)).timestamp()),
+        ]
+        db.executemany("INSERT INTO states VALUES (?, ?, ?, ?, ?)", rows)
+        db.commit()
+        db.close()
+
+        history = load_recorder_history(
+            path, ["sensor.lr_temp"], START, START + timedelta(hours=1)
+        )
+        assert history == {
+            "sensor.lr_temp": [
+                (START - timedelta(hours=1), "65", {"unit": "F"}),
+                (START + timedelta(minutes=5), "66", {}),
+            ]
+        }
+
+
+class TestSweep:
+    """Tests for parameter grids and evaluation."""
+
+    def test_parameter_grid(self):
+        base = ParameterSet.from_config({"away_temp_offset": 3.0, "other": 1})
+        grid = parameter_grid(base, {"auxiliary_threshold": [1, 2], "follow_me_cooldown": [5, 10]})
+
+        assert len(grid) == 4
+        assert {p.away_temp_offset for p in grid} == {3.0}
+        assert (grid[1].auxiliary_threshold, grid[1].follow_me_cooldown) == (1, 10)
+        with pytest.raises(ValueError):
+            parameter_grid(base, {"bogus": [1]})
+
+    def test_parameters_change_outcomes(self, config):
+        frames = build_frames(_history(), config, START, START + timedelta(hours=2))
+        grid = parameter_grid(
+            ParameterSet(), {"auxiliary_threshold": [2.0, 5.0], "away_temp_offset": [2.0, 6.0]}
+        )
+        results = run_sweep(frames, config, grid, workers=1)
+        by_params = {(r.params.auxiliary_threshold, r.params.away_temp_offset): r for r in results}
+
+        # 4 degrees below target for over the 15 min delay: only the
+        # lower threshold engages the heater.
+        assert by_params[(2.0, 2.0)].aux_starts == 1
+        assert by_params[(2.0, 2.0)].aux_hours > 1
+        assert by_params[(5.0, 2.0)].aux_hours == 0
+        # A bigger away offset sets the unoccupied rooms back further.
+        assert (
+            by_params[(2.0, 6.0)].setback_degree_hours
+            > by_params[(2.0, 2.0)].setback_degree_hours
+        )
+        assert 0 < results[0].mean_vent_position <= 100
+
+    def test_process_pool_matches_serial(self, config):
+        frames = build_frames(_history(), config, START, START + timedelta(hours=2))
+        grid = parameter_grid(ParameterSet(), {"away_temp_offset": [1.0, 2.0, 3.0, 4.0]})
+
+        serial = run_sweep(frames, config, grid, workers=1)
+        parallel = run_sweep(frames, config, grid, workers=2)
+        assert [r.to_dict() for r in parallel] == [r.to_dict() for r in serial]
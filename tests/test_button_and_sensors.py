@@ -7,7 +7,9 @@ from custom_components.smart_climate.const import (
     AI_PROVIDER_NONE,
     CONF_AI_PROVIDER,
     ENTITY_PREFIX,
+    SUGGESTION_PENDING,
 )
+from custom_components.smart_climate.models import SuggestionStore
 
 # ---------------------------------------------------------------------------
 # Button entity
@@ -96,6 +98,7 @@ class TestDailySummarySensorAttributes:
         assert attrs["provider"] == "openai"
         assert "analysis_time" in attrs
         assert attrs["analysis_time"] == "2026-02-10T06:00:00"
+        assert "full_summary" in sensor._unrecorded_attributes
 
     def test_summary_attributes_empty_when_no_house(self):
         """Summary attributes should be empty dict when house state is None."""
@@ -139,15 +142,15 @@ class TestDailySummarySensorAttributes:
 class TestSuggestionCountSensorAttributes:
     """Tests for SmartClimateSuggestionCountSensor enhanced attributes."""
 
-    def test_suggestion_attributes_contain_suggestions_list(
+    def test_suggestion_attributes_carry_only_counts_and_ids(
         self, sample_house_state, sample_suggestion
     ):
-        """Suggestion count sensor should include full suggestions list."""
+        """Suggestion text is served by websocket, not state attributes."""
         from custom_components.smart_climate.sensor import (
             SmartClimateSuggestionCountSensor,
         )
 
-        sample_house_state.suggestions = [sample_suggestion]
+        sample_house_state.suggestions = SuggestionStore([sample_suggestion])
 
         coordinator = MagicMock()
         coordinator.data = {"house": sample_house_state}
@@ -157,52 +160,22 @@ class TestSuggestionCountSensorAttributes:
         sensor = SmartClimateSuggestionCountSensor(coordinator)
         attrs = sensor.extra_state_attributes
 
-        assert "suggestions" in attrs
-        assert len(attrs["suggestions"]) == 1
-
-        s = attrs["suggestions"][0]
-        assert s["id"] == sample_suggestion.id
-        assert s["title"] == sample_suggestion.title
-        assert s["description"] == sample_suggestion.description
-        assert s["reasoning"] == sample_suggestion.reasoning
-        assert s["confidence"] == sample_suggestion.confidence
-        assert s["priority"] == sample_suggestion.priority
-        assert s["status"] == sample_suggestion.status
-        assert s["room"] == sample_suggestion.room
-        assert s["action_type"] == sample_suggestion.action_type
-
-    def test_suggestion_attributes_still_have_legacy_fields(
-        self, sample_house_state, sample_suggestion
-    ):
-        """Suggestion count sensor should still have total_suggestions and pending_titles."""
-        from custom_components.smart_climate.sensor import (
-            SmartClimateSuggestionCountSensor,
-        )
-
-        sample_house_state.suggestions = [sample_suggestion]
-
-        coordinator = MagicMock()
-        coordinator.data = {"house": sample_house_state}
-        coordinator.config_entry = MagicMock()
-        coordinator.config_entry.entry_id = "test_entry"
-
-        sensor = SmartClimateSuggestionCountSensor(coordinator)
-        attrs = sensor.extra_state_attributes
-
-        assert "total_suggestions" in attrs
+        assert set(attrs) == {"total_suggestions", "status_counts", "pending_ids"}
         assert attrs["total_suggestions"] == 1
-        assert "pending_titles" in attrs
-        assert sample_suggestion.title in attrs["pending_titles"]
+        assert attrs["status_counts"][SUGGESTION_PENDING] == 1
+        assert attrs["pending_ids"] == [sample_suggestion.id]
+        assert sample_suggestion.description not in str(attrs)
+        assert "pending_ids" in sensor._unrecorded_attributes
 
-    def test_suggestion_attributes_empty_list_when_no_suggestions(
+    def test_suggestion_attributes_empty_when_no_suggestions(
         self, sample_house_state
     ):
-        """Suggestions list should be empty when no suggestions exist."""
+        """Counts are zero and no ids are listed without suggestions."""
         from custom_components.smart_climate.sensor import (
             SmartClimateSuggestionCountSensor,
         )
 
-        sample_house_state.suggestions = []
+        sample_house_state.suggestions = SuggestionStore()
 
         coordinator = MagicMock()
         coordinator.data = {"house": sample_house_state}
@@ -212,9 +185,9 @@ class TestSuggestionCountSensorAttributes:
         sensor = SmartClimateSuggestionCountSensor(coordinator)
         attrs = sensor.extra_state_attributes
 
-        assert attrs["suggestions"] == []
         assert attrs["total_suggestions"] == 0
-        assert attrs["pending_titles"] == []
+        assert attrs["pending_ids"] == []
+        assert not any(attrs["status_counts"].values())
 
 
 # ---------------------------------------------------------------------------
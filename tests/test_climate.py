@@ -0,0 +1,85 @@
+"""Tests for the virtual zone climate entity."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from custom_components.smart_climate import climate as climate_module
+from custom_components.smart_climate.climate import SmartClimateVirtualClimate
+
+
+def _real_state(state="heat", **attributes):
+    attrs = {
+        "hvac_modes": ["off", "heat", "cool", "bogus"],
+        "hvac_action": "heating",
+        "current_temperature": "68.5",
+        "temperature": 70,
+        "min_temp": 45,
+        "max_temp": 90,
+        "fan_mode": "auto",
+        "supported_features": 9,
+    }
+    attrs.update(attributes)
+    return SimpleNamespace(state=state, attributes=attrs)
+
+
+def _entity(sample_room_state):
+    states = {"climate.living_room": _real_state()}
+    coordinator = MagicMock()
+    coordinator.data = {"rooms": {"living_room": sample_room_state}}
+    entity = SmartClimateVirtualClimate(coordinator, "living_room", "Living Room")
+    entity.hass = MagicMock()
+    entity.hass.states.get = MagicMock(side_effect=states.get)
+    return entity, states
+
+
+class TestVirtualClimateMirroring:
+    """The entity mirrors its real climate entity from state-change events."""
+
+    async def test_snapshot_on_add_and_on_change(self, sample_room_state):
+        entity, states = _entity(sample_room_state)
+        with patch.object(climate_module, "async_track_state_change_event") as track:
+            unsub = MagicMock()
+            track.return_value = unsub
+            await entity.async_added_to_hass()
+
+        _, entity_ids, handler = track.call_args.args
+        assert entity_ids == ["climate.living_room"]
+        assert entity._on_remove == [unsub]
+        assert entity.hvac_mode == "heat"
+        assert entity.hvac_modes == ["off", "heat", "cool"]
+        assert entity.hvac_action == "heating"
+        assert entity.current_temperature == 68.5
+        assert entity.target_temperature == 70.0
+        assert entity.min_temp == 45.0
+        assert entity.supported_features == 9
+
+        # A change is parsed once and published immediately.
+        lookups = entity.hass.states.get.call_count
+        new_state = _real_state("cool", temperature="74", hvac_action="cooling")
+        handler(SimpleNamespace(data={"new_state": new_state}))
+        assert entity.state_writes == 1
+        assert entity.hvac_mode == "cool"
+        assert entity.hvac_action == "cooling"
+        assert entity.target_temperature == 74.0
+        assert entity.hass.states.get.call_count == lookups
+
+    async def test_missing_or_malformed_state(self, sample_room_state):
+        entity, states = _entity(sample_room_state)
+        states["climate.living_room"] = _real_state(
+            "unavailable",
+            hvac_modes=[],
+            current_temperature="unknown",
+            supported_features="n/a",
+            unit_of_measurement="°C",
+        )
+        await entity.async_added_to_hass()
+        assert entity.hvac_mode is None
+        assert entity.hvac_modes == ["off"]
+        assert entity.current_temperature is None
+        assert entity.supported_features == 0
+        assert entity.temperature_unit == "°C"
+
+        entity._handle_real_state_change(SimpleNamespace(data={"new_state": None}))
+        assert entity.hvac_action is None
+        assert entity.target_temperature is None
+        assert entity.temperature_unit == "°F"
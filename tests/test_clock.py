@@ -0,0 +1,126 @@
+"""Tests for the shared clock and fast-forwarding the coordinator."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.smart_climate.clock import Clock, VirtualClock
+from custom_components.smart_climate.const import (
+    SUGGESTION_EXPIRED,
+    SUGGESTION_PENDING,
+)
+from custom_components.smart_climate.coordinator import SmartClimateCoordinator
+from custom_components.smart_climate.helpers.auxiliary import should_engage_auxiliary
+from custom_components.smart_climate.helpers.presence import (
+    determine_follow_me_target,
+)
+from custom_components.smart_climate.models import HVACAction, Suggestion
+
+START = datetime(2024, 1, 8, 12, 0)
+
+
+class TestVirtualClock:
+    """Tests for VirtualClock."""
+
+    def test_advance_and_set(self):
+        clock = VirtualClock(START)
+        assert clock.now() == START
+        assert clock.advance(timedelta(days=2)) == START + timedelta(days=2)
+        assert clock.advance(30) == START + timedelta(days=2, seconds=30)
+        clock.set(START + timedelta(days=3))
+        assert clock.now() == START + timedelta(days=3)
+
+    def test_never_runs_backwards(self):
+        clock = VirtualClock(START)
+        with pytest.raises(ValueError):
+            clock.set(START - timedelta(seconds=1))
+
+    def test_utcnow_is_the_same_instant(self):
+        clock = VirtualClock(START)
+        assert clock.utcnow().tzinfo is not None
+        assert clock.utcnow().timestamp() == START.timestamp()
+
+    def test_system_clock(self):
+        clock = Clock()
+        assert abs((clock.now() - datetime.now()).total_seconds()) < 1
+        assert clock.utcnow().tzinfo is not None
+
+
+class TestHelpersUseInjectedTime:
+    """Helpers decide relative to the ``now`` they are given."""
+
+    def test_suggestion_expiry(self):
+        s = Suggestion(created_at=START, expires_at=START + timedelta(hours=24))
+        assert not s.is_expired(START + timedelta(hours=23))
+        assert s.is_expired(START + timedelta(hours=25))
+
+    def test_follow_me_cooldown(self, sample_room_state, sample_room_state_2):
+        sample_room_state.occupied = True
+        sample_room_state.last_presence_time = START
+        sample_room_state_2.occupied = True
+        sample_room_state_2.last_presence_time = START + timedelta(minutes=1)
+        rooms = {"living_room": sample_room_state, "nursery": sample_room_state_2}
+
+        held = determine_follow_me_target(
+            rooms, "living_room", cooldown_minutes=5, now=START + timedelta(minutes=2)
+        )
+        switched = determine_follow_me_target(
+            rooms, "living_room", cooldown_minutes=5, now=START + timedelta(minutes=10)
+        )
+        assert held == "living_room"
+        assert switched == "nursery"
+
+    def test_auxiliary_delay(self, sample_room_state):
+        sample_room_state.temperature = 60.0
+        sample_room_state.hvac_action = HVACAction.HEATING
+        sample_room_state.hvac_state_change_time = START
+        sample_room_state.temp_trend = 0.0
+
+        assert not should_engage_auxiliary(
+            sample_room_state, 70.0, delay_minutes=15, now=START + timedelta(minutes=5)
+        )
+        assert should_engage_auxiliary(
+            sample_room_state, 70.0, delay_minutes=15, now=START + timedelta(minutes=20)
+        )
+
+
+class TestCoordinatorFastForward:
+    """Drive the coordinator through days of virtual time."""
+
+    @staticmethod
+    def _coordinator(sample_config_data):
+        states = {
+            "climate.living_room": SimpleNamespace(
+                state="heat", attributes={"temperature": 68, "hvac_action": "idle"}
+            ),
+            "sensor.lr_temp": SimpleNamespace(state="67", attributes={}),
+            "binary_sensor.lr_motion": SimpleNamespace(state="on", attributes={}),
+        }
+        hass = MagicMock()
+        hass.states.get = states.get
+        hass.services.async_call = AsyncMock()
+        hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+        entry = SimpleNamespace(entry_id="test", data=sample_config_data, options={})
+        coordinator = SmartClimateCoordinator(hass, entry)
+        coordinator.clock = VirtualClock(START)
+        return coordinator
+
+    async def test_days_of_cycles_share_the_virtual_clock(self, sample_config_data):
+        coordinator = self._coordinator(sample_config_data)
+        house = coordinator._house_state
+        suggestion = Suggestion(created_at=START, expires_at=START + timedelta(hours=24))
+        house.suggestions.add(suggestion)
+
+        for _ in range(48 * 3):
+            coordinator.clock.advance(timedelta(minutes=30))
+            data = await coordinator._async_update_data()
+            if coordinator.clock.now() <= suggestion.expires_at:
+                assert suggestion.status == SUGGESTION_PENDING
+
+        room = data["rooms"]["living_room"]
+        assert coordinator.clock.now() == START + timedelta(days=3)
+        assert room.last_presence_time == START + timedelta(days=3)
+        assert room.temp_history[-1][0] == coordinator.clock.now()
+        assert suggestion.status == SUGGESTION_EXPIRED
@@ -1,14 +1,20 @@
 """Tests for the Smart Climate config flow."""
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 
 from custom_components.smart_climate.const import (
     CONF_ENABLE_FOLLOW_ME,
     CONF_ENABLE_ZONE_BALANCING,
     CONF_INTEGRATION_NAME,
+    CONF_PRESENCE_DECAY,
+    CONF_PRESENCE_HOLD_OFF,
     CONF_ROOMS,
     CONF_SCHEDULES,
     CONF_TEMP_UNIT,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_PRESENCE_DECAY,
+    DEFAULT_PRESENCE_HOLD_OFF,
 )
 
 # ---------------------------------------------------------------------------
@@ -959,3 +965,21 @@ class TestOptionsFlowMenu:
 
         assert flow._rooms[1]["room_name"] == "Bedroom"
         assert flow._rooms[1]["climate_entity"] == "climate.br"
+
+    @pytest.mark.asyncio
+    async def test_general_settings_include_presence_timing(self):
+        """General settings should expose presence hold-off and decay."""
+        flow = self._make_options_flow()
+        result = await flow.async_step_general_settings()
+        defaults = {str(k): k.default() for k in result["data_schema"].schema}
+        assert defaults[CONF_PRESENCE_HOLD_OFF] == DEFAULT_PRESENCE_HOLD_OFF
+        assert defaults[CONF_PRESENCE_DECAY] == DEFAULT_PRESENCE_DECAY
+
+        flow.async_step_init = AsyncMock()
+        await flow.async_step_general_settings(
+            {CONF_PRESENCE_HOLD_OFF: 5, CONF_PRESENCE_DECAY: 30}
+        )
+        result = await flow.async_step_general_settings()
+        defaults = {str(k): k.default() for k in result["data_schema"].schema}
+        assert flow._data[CONF_PRESENCE_HOLD_OFF] == 5
+        assert defaults[CONF_PRESENCE_DECAY] == 30
@@ -235,7 +235,7 @@ class TestDataStructureShape:
         assert state.outdoor_humidity is None
         assert state.last_analysis_time is None
         assert state.ai_daily_summary == ""
-        assert state.suggestions == []
+        assert len(state.suggestions) == 0
 
     def test_room_config_from_dict_basic(self, sample_config_data):
         """RoomConfig.from_dict should parse config data correctly."""
@@ -0,0 +1,51 @@
+"""Tests for change-detected state writes in the base entity."""
+
+from unittest.mock import MagicMock
+
+from custom_components.smart_climate.binary_sensor import (
+    SmartClimateAuxiliaryActiveSensor,
+)
+from custom_components.smart_climate.models import StateWriteStats
+from custom_components.smart_climate.sensor import SmartClimateTemperatureSensor
+
+
+def _coordinator(room_state):
+    coordinator = MagicMock()
+    coordinator.data = {"rooms": {"living_room": room_state}}
+    coordinator.state_write_stats = StateWriteStats()
+    return coordinator
+
+
+class TestChangeDetectedWrites:
+    """Coordinator refreshes only write state that changed."""
+
+    def test_unchanged_refresh_is_skipped(self, sample_room_state):
+        coordinator = _coordinator(sample_room_state)
+        entity = SmartClimateTemperatureSensor(coordinator, "living_room", "°F")
+
+        entity._handle_coordinator_update()
+        entity._handle_coordinator_update()
+        assert entity.state_writes == 1
+
+        sample_room_state.temperature += 0.5
+        entity._handle_coordinator_update()
+        assert entity.state_writes == 2
+
+        # An attribute change alone is published too.
+        sample_room_state.smart_target = 68.0
+        entity._handle_coordinator_update()
+        assert entity.state_writes == 3
+        assert coordinator.state_write_stats == StateWriteStats(written=3, skipped=1)
+
+    def test_in_place_attribute_change_is_written(self, sample_room_state):
+        coordinator = _coordinator(sample_room_state)
+        entity = SmartClimateAuxiliaryActiveSensor(coordinator, "living_room")
+        sample_room_state.auxiliary_active = True
+        sample_room_state.auxiliary_devices_on.append("switch.heater")
+        assert entity.async_write_ha_state_if_changed()
+
+        # The attribute shares the room's list; mutating it is a change.
+        sample_room_state.auxiliary_devices_on.append("fan.box_fan")
+        assert entity.async_write_ha_state_if_changed()
+        assert not entity.async_write_ha_state_if_changed()
+        assert entity.state_writes == 2
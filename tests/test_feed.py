@@ -0,0 +1,131 @@
+"""Tests for the snapshot-and-delta feed."""
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.smart_climate.const import OPERATION_MODE_TRAINING
+from custom_components.smart_climate.feed import (
+    SnapshotFeed,
+    build_snapshot,
+    diff_snapshot,
+)
+
+
+def _coordinator(rooms, house, schedules):
+    coordinator = DataUpdateCoordinator(None)
+    coordinator.data = {"rooms": rooms, "house": house}
+    coordinator.schedules = schedules
+    coordinator.operation_mode = OPERATION_MODE_TRAINING
+    return coordinator
+
+
+class TestSnapshot:
+    """The snapshot and its deltas."""
+
+    def test_snapshot_sections(
+        self,
+        sample_room_state,
+        sample_room_state_2,
+        sample_house_state,
+        sample_schedule,
+    ):
+        sample_room_state_2.config.climate_entity = "climate.living_room"
+        rooms = {"living_room": sample_room_state, "nursery": sample_room_state_2}
+        snapshot = build_snapshot(
+            _coordinator(rooms, sample_house_state, [sample_schedule])
+        )
+
+        room = snapshot["rooms"]["living_room"]
+        assert room["name"] == "Living Room"
+        assert room["temperature"] == 72.1
+        assert room["hvac_action"] == "cooling"
+        assert snapshot["systems"] == {
+            "climate.living_room": {
+                "rooms": ["living_room", "nursery"],
+                "hvac_action": "cooling",
+                "target": 72.0,
+            }
+        }
+        assert snapshot["house"]["operation_mode"] == OPERATION_MODE_TRAINING
+        assert snapshot["house"]["follow_me_target"] == "living_room"
+        assert snapshot["schedules"]["baby_nap"]["active"]
+
+    def test_diff_carries_only_changes(self, sample_room_state, sample_house_state):
+        rooms = {"living_room": sample_room_state}
+        coordinator = _coordinator(rooms, sample_house_state, [])
+        before = build_snapshot(coordinator)
+        assert diff_snapshot(before, build_snapshot(coordinator)) == {}
+
+        sample_room_state.temperature = 72.6
+        sample_house_state.comfort_score = 81.0
+        delta = diff_snapshot(before, build_snapshot(coordinator))
+        assert delta == {
+            "rooms": {"living_room": {"temperature": 72.6}},
+            "house": {"comfort_score": 81.0},
+        }
+
+        del rooms["living_room"]
+        delta = diff_snapshot(before, build_snapshot(coordinator))
+        assert delta["rooms"] == {"living_room": None}
+        assert delta["systems"] == {"climate.living_room": None}
+
+
+class TestSnapshotFeed:
+    """Versioning, subscription and replay."""
+
+    def test_publishes_versioned_deltas(self, sample_room_state, sample_house_state):
+        coordinator = _coordinator(
+            {"living_room": sample_room_state}, sample_house_state, []
+        )
+        feed = SnapshotFeed(coordinator, history=2)
+        received = []
+        unsubscribe = feed.async_subscribe(lambda *args: received.append(args))
+        assert feed.version == 0
+
+        coordinator.async_update_listeners()
+        assert received == []
+
+        for temperature in (72.5, 73.0, 73.5):
+            sample_room_state.temperature = temperature
+            coordinator.async_update_listeners()
+        assert [version for version, _ in received] == [1, 2, 3]
+        assert received[-1][1] == {"rooms": {"living_room": {"temperature": 73.5}}}
+        assert feed.snapshot["rooms"]["living_room"]["temperature"] == 73.5
+
+        # Only the last two deltas are held for replay.
+        assert [v for v, _ in feed.deltas_since(1)] == [2, 3]
+        assert feed.deltas_since(3) == []
+        assert feed.deltas_since(0) is None
+        assert feed.deltas_since(4) is None
+
+        unsubscribe()
+        assert coordinator._listeners == []
+
+        # Changes made with no subscribers arrive as one delta on resubscribe.
+        sample_room_state.temperature = 74.0
+        sample_room_state.occupied = False
+        coordinator.async_update_listeners()
+        feed.async_subscribe(lambda *args: received.append(args))
+        assert feed.version == 4
+        assert feed.deltas_since(3) == [
+            (4, {"rooms": {"living_room": {"temperature": 74.0, "occupied": False}}})
+        ]
+
+    def test_close_ends_subscriptions(self, sample_room_state, sample_house_state):
+        coordinator = _coordinator(
+            {"living_room": sample_room_state}, sample_house_state, []
+        )
+        feed = SnapshotFeed(coordinator)
+        received, closed = [], []
+        unsubscribe = feed.async_subscribe(
+            lambda *args: received.append(args), lambda: closed.append(True)
+        )
+
+        feed.async_close()
+        assert closed == [True]
+        assert coordinator._listeners == []
+
+        sample_room_state.temperature = 75.0
+        coordinator.async_update_listeners()
+        assert received == []
+        # Unsubscribing after the close is harmless.
+        unsubscribe()
@@ -0,0 +1,191 @@
+"""Tests for the incremental follow-me index and its coordinator wiring."""
+
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.smart_climate import coordinator as coordinator_module
+from custom_components.smart_climate.clock import VirtualClock
+from custom_components.smart_climate.const import (
+    CONF_ROOMS,
+    DEFAULT_AWAY_TEMP_OFFSET,
+    DEFAULT_PRESENCE_HOLD_OFF,
+    EVENT_FOLLOW_ME_CHANGED,
+    OPERATION_MODE_ACTIVE,
+)
+from custom_components.smart_climate.coordinator import SmartClimateCoordinator
+from custom_components.smart_climate.helpers.presence import (
+    FollowMeIndex,
+    determine_follow_me_target,
+)
+from custom_components.smart_climate.models import RoomConfig, RoomState
+
+START = datetime(2024, 1, 8, 8, 0)
+
+
+class TestFollowMeIndex:
+    """FollowMeIndex agrees with determine_follow_me_target."""
+
+    def test_matches_stateless_selection(self):
+        rng = random.Random(7)
+        rooms = {
+            f"room_{i}": RoomState(
+                config=RoomConfig(
+                    name=f"Room {i}",
+                    slug=f"room_{i}",
+                    climate_entity="climate.house",
+                    presence_sensors=[f"binary_sensor.room_{i}"] if i != 3 else [],
+                    priority=rng.randint(1, 3),
+                )
+            )
+            for i in range(8)
+        }
+        index = FollowMeIndex(list(rooms))
+        current = None
+        now = START
+        for _ in range(2000):
+            now += timedelta(minutes=rng.choice([0, 1, 2, 7]))
+            slug = rng.choice(list(rooms))
+            room = rooms[slug]
+            room.occupied = not room.occupied
+            room.presence_since = now if room.occupied else None
+            index.update(
+                slug,
+                room.occupied and bool(room.config.presence_sensors),
+                room.presence_since,
+                room.config.priority,
+            )
+            # As in the coordinator, every occupied room is seen each cycle.
+            for other in rooms.values():
+                if other.occupied:
+                    other.last_presence_time = now
+
+            expected = determine_follow_me_target(rooms, current, 5, now)
+            assert index.select(rooms, current, 5, now) == expected
+            current = expected
+
+        assert len(index._heap) <= 4 * len(rooms) + 16
+
+    def test_reentry_rekeys_room(self):
+        a = RoomConfig(name="A", slug="a", climate_entity="climate.a", priority=1)
+        b = RoomConfig(name="B", slug="b", climate_entity="climate.b", priority=9)
+        index = FollowMeIndex(["a", "b"])
+        index.update("b", True, START, b.priority)
+        index.update("a", True, START + timedelta(minutes=1), a.priority)
+        assert index.best() == "a"
+        index.update("a", False, None, a.priority)
+        assert index.best() == "b"
+        assert "a" not in index and len(index) == 1
+        index.update("b", False, None, b.priority)
+        assert index.best() is None
+
+
+class TestCoordinatorFollowMe:
+    """The coordinator recomputes follow-me targets only on changes."""
+
+    @staticmethod
+    def _coordinator(sample_config_data):
+        nursery = dict(sample_config_data[CONF_ROOMS][0])
+        nursery.update(
+            room_name="Nursery",
+            room_slug="nursery",
+            climate_entity="climate.nursery",
+            temp_sensors=["sensor.n_temp"],
+            presence_sensors=["binary_sensor.n_motion"],
+            door_window_sensors=[],
+        )
+        sample_config_data[CONF_ROOMS].append(nursery)
+        states = {
+            "climate.living_room": SimpleNamespace(
+                state="heat", attributes={"temperature": 70, "hvac_action": "idle"}
+            ),
+            "climate.nursery": SimpleNamespace(
+                state="heat", attributes={"temperature": 70, "hvac_action": "idle"}
+            ),
+            "sensor.lr_temp": SimpleNamespace(state="69", attributes={}),
+            "sensor.n_temp": SimpleNamespace(state="69", attributes={}),
+            "binary_sensor.lr_motion": SimpleNamespace(state="on", attributes={}),
+            "binary_sensor.n_motion": SimpleNamespace(state="off", attributes={}),
+        }
+        hass = MagicMock()
+        hass.states.get = states.get
+        hass.services.async_call = AsyncMock()
+        hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+        entry = SimpleNamespace(entry_id="test", data=sample_config_data, options={})
+        coordinator = SmartClimateCoordinator(hass, entry)
+        coordinator.clock = VirtualClock(START)
+        coordinator.operation_mode = OPERATION_MODE_ACTIVE
+        return coordinator, states
+
+    async def test_targets_follow_transitions_only(self, sample_config_data):
+        coordinator, states = self._coordinator(sample_config_data)
+        with patch.object(
+            coordinator_module,
+            "calculate_follow_me_targets",
+            wraps=coordinator_module.calculate_follow_me_targets,
+        ) as calculate:
+            data = await coordinator._async_update_data()
+            for _ in range(10):
+                coordinator.clock.advance(60)
+                data = await coordinator._async_update_data()
+            assert calculate.call_count == 1
+            rooms = data["rooms"]
+            assert data["house"].follow_me_target == "living_room"
+            assert rooms["nursery"].smart_target == 70 - DEFAULT_AWAY_TEMP_OFFSET
+
+            # Someone walks into the nursery: only it is recomputed.
+            states["binary_sensor.n_motion"].state = "on"
+            coordinator.clock.advance(60)
+            data = await coordinator._async_update_data()
+            assert calculate.call_count == 2
+            assert set(calculate.call_args.args[0]) == {"nursery"}
+            assert rooms["nursery"].smart_target == 70
+
+            # Living room empties: after the hold-off the primary moves and
+            # both are refreshed.
+            states["binary_sensor.lr_motion"].state = "off"
+            coordinator.clock.advance(60)
+            data = await coordinator._async_update_data()
+            assert data["house"].follow_me_target == "living_room"
+            coordinator.clock.advance(timedelta(minutes=DEFAULT_PRESENCE_HOLD_OFF))
+            data = await coordinator._async_update_data()
+            assert data["house"].follow_me_target == "nursery"
+            assert set(calculate.call_args.args[0]) == {"living_room", "nursery"}
+            assert rooms["living_room"].smart_target == 70 - DEFAULT_AWAY_TEMP_OFFSET
+            assert rooms["nursery"].follow_me_active
+
+            # A thermostat change refreshes just that room.
+            states["climate.nursery"].attributes["temperature"] = 72
+            coordinator.clock.advance(60)
+            await coordinator._async_update_data()
+            assert set(calculate.call_args.args[0]) == {"nursery"}
+            assert rooms["nursery"].smart_target == 72
+
+    async def test_change_event_fires_once_per_change(self, sample_config_data):
+        coordinator, states = self._coordinator(sample_config_data)
+
+        def changes():
+            return [
+                call.args[1]
+                for call in coordinator.hass.bus.async_fire.call_args_list
+                if call.args[0] == EVENT_FOLLOW_ME_CHANGED
+            ]
+
+        await coordinator._async_update_data()
+        for _ in range(5):
+            coordinator.clock.advance(60)
+            await coordinator._async_update_data()
+        assert changes() == [{"previous_room": None, "new_room": "living_room"}]
+
+        states["binary_sensor.lr_motion"].state = "off"
+        states["binary_sensor.n_motion"].state = "on"
+        coordinator.clock.advance(timedelta(minutes=DEFAULT_PRESENCE_HOLD_OFF + 1))
+        await coordinator._async_update_data()
+        for _ in range(3):
+            coordinator.clock.advance(60)
+            await coordinator._async_update_data()
+        assert changes() == [
+            {"previous_room": None, "new_room": "living_room"},
+            {"previous_room": "living_room", "new_room": "nursery"},
+        ]
@@ -0,0 +1,225 @@
+"""Tests for the deterministic local rules engine."""
+
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.smart_climate.ai import async_run_analysis, suggestions
+from custom_components.smart_climate.ai.analysis import (
+    MAX_SUGGESTIONS,
+    parse_ai_response,
+)
+from custom_components.smart_climate.ai.prompts import build_user_prompt
+from custom_components.smart_climate.ai.provider import (
+    create_ai_provider,
+    create_ai_provider_chain,
+)
+from custom_components.smart_climate.ai.rules import (
+    LocalRulesProvider,
+    evaluate_rules,
+    findings_to_suggestions,
+)
+from custom_components.smart_climate.ai.schema import validate_analysis
+from custom_components.smart_climate.const import (
+    AI_PROVIDER_LOCAL,
+    AI_PROVIDER_OPENAI,
+    CONF_AI_PROVIDER,
+)
+from custom_components.smart_climate.models import HVACAction
+
+
+def _rules(room_state, **rooms):
+    data = {"rooms": rooms or {room_state.config.slug: room_state}}
+    return {f.rule: f for f in evaluate_rules(data)}
+
+
+class TestRules:
+    """Tests for the individual rules."""
+
+    def test_quiet_house_has_no_findings(self, sample_room_state, sample_room_state_2):
+        calm = replace(sample_room_state, hvac_cycles_today=2)
+        data = {"rooms": {"living_room": calm, "nursery": sample_room_state_2}}
+        assert evaluate_rules(data) == []
+
+    def test_window_open_while_cooling_closes_vents(self, sample_room_state):
+        room = replace(sample_room_state, window_open=True)
+        finding = _rules(room)["window_open_hvac"]
+        assert finding.room == "living_room"
+        assert finding.suggestion["action_type"] == "vent_adjustment"
+        assert finding.suggestion["action_data"] == {"vent_position": 0}
+        assert finding.suggestion["priority"] == "high"
+
+    def test_window_open_while_idle_ignored(self, sample_room_state):
+        room = replace(
+            sample_room_state, window_open=True, hvac_action=HVACAction.IDLE
+        )
+        assert "window_open_hvac" not in _rules(room)
+
+    def test_short_cycling(self, sample_room_state):
+        room = replace(sample_room_state, hvac_cycles_today=12, hvac_runtime_today=60)
+        finding = _rules(room)["short_cycling"]
+        assert "12 cycles" in finding.suggestion["reasoning"]
+
+    def test_long_cycles_are_fine(self, sample_room_state):
+        room = replace(sample_room_state, hvac_cycles_today=8, hvac_runtime_today=162)
+        assert "short_cycling" not in _rules(room)
+
+    def test_unoccupied_room_conditioned(self, sample_room_state_2):
+        room = replace(
+            sample_room_state_2,
+            hvac_action=HVACAction.HEATING,
+            last_presence_time=datetime.now() - timedelta(hours=2),
+        )
+        finding = _rules(room)["unoccupied_conditioned"]
+        assert finding.suggestion["action_type"] == "general"
+
+    def test_recent_presence_not_flagged(self, sample_room_state_2):
+        room = replace(
+            sample_room_state_2,
+            hvac_action=HVACAction.HEATING,
+            last_presence_time=datetime.now() - timedelta(minutes=5),
+        )
+        assert "unoccupied_conditioned" not in _rules(room)
+
+    def test_shared_setpoint_conflict(self, sample_room_state, sample_room_state_2):
+        shared = replace(
+            sample_room_state_2.config, climate_entity="climate.living_room"
+        )
+        warm = replace(sample_room_state, temperature=75.0, current_target=72.0)
+        cold = replace(
+            sample_room_state_2, config=shared, temperature=68.0, current_target=72.0
+        )
+        findings = _rules(None, living_room=warm, nursery=cold)
+        finding = findings["shared_setpoint_conflict"]
+        assert finding.room is None
+        assert "nursery" in finding.suggestion["description"]
+
+    def test_findings_match_analysis_schema(self, sample_room_state):
+        room = replace(
+            sample_room_state,
+            window_open=True,
+            hvac_cycles_today=12,
+            hvac_runtime_today=30,
+        )
+        findings = evaluate_rules({"rooms": {"living_room": room}})
+        suggestions = findings_to_suggestions(findings)
+        assert len(suggestions) == 2
+        for finding in findings:
+            assert validate_analysis(
+                {"summary": "", "suggestions": [finding.suggestion]}
+            ) == []
+
+
+class TestLocalRulesProvider:
+    """Tests for the local provider and the pre-pass prompt changes."""
+
+    async def test_provider_reads_data_source(self, sample_room_state):
+        room = replace(sample_room_state, window_open=True)
+        provider = LocalRulesProvider({}, data_source=lambda: {"rooms": {"lr": room}})
+        suggestions, summary = parse_ai_response(await provider.analyze("", ""))
+        assert len(suggestions) == 1
+        assert "1 issue" in summary
+
+    async def test_provider_uses_now_source(self, sample_room_state_2):
+        seen = datetime(2024, 1, 8, 8, 0)
+        room = replace(
+            sample_room_state_2,
+            hvac_action=HVACAction.HEATING,
+            last_presence_time=seen,
+        )
+        provider = LocalRulesProvider(
+            {},
+            data_source=lambda: {"rooms": {"nursery": room}},
+            now_source=lambda: seen + timedelta(minutes=5),
+        )
+        response = json.loads(await provider.analyze("", ""))
+        assert response["suggestions"] == []
+
+        provider.now_source = lambda: seen + timedelta(hours=2)
+        response = json.loads(await provider.analyze("", ""))
+        assert len(response["suggestions"]) == 1
+
+    async def test_provider_without_data(self):
+        response = json.loads(await LocalRulesProvider({}).analyze("", ""))
+        assert response["suggestions"] == []
+
+    def test_factory_and_chain_wiring(self):
+        assert isinstance(create_ai_provider(AI_PROVIDER_LOCAL, {}), LocalRulesProvider)
+        source, now = dict, datetime.now
+        provider = create_ai_provider_chain(
+            {CONF_AI_PROVIDER: AI_PROVIDER_LOCAL}, data_source=source, now_source=now
+        )
+        assert provider.data_source is source
+        assert provider.now_source is now
+
+    def test_prompt_omits_handled_facts(self, sample_room_state):
+        room = replace(sample_room_state, window_open=True)
+        data = {"rooms": {"living_room": room}}
+        findings = evaluate_rules(data)
+
+        plain = build_user_prompt(data)
+        filtered = build_user_prompt(data, findings=findings)
+
+        assert "Window/door open: yes" in plain
+        assert "Window/door open" not in filtered
+        assert "## Already Reported" in filtered
+        assert "Window open while cooling Living Room" in filtered
+
+
+class TestPrepassPipeline:
+    """Tests for how the pre-pass results reach the stored suggestions."""
+
+    @pytest.fixture
+    def run(self, sample_room_state, monkeypatch):
+        room = replace(sample_room_state, window_open=True)
+        stored = AsyncMock()
+        monkeypatch.setattr(suggestions, "store_suggestions", stored)
+        provider = SimpleNamespace(analyze=AsyncMock())
+        coordinator = SimpleNamespace(
+            config_entry=SimpleNamespace(data={CONF_AI_PROVIDER: AI_PROVIDER_OPENAI}),
+            data={"rooms": {"living_room": room}},
+            clock=SimpleNamespace(now=lambda: datetime(2024, 1, 8, 12, 0)),
+            get_ai_provider=lambda: provider,
+            async_warm_up_ai=AsyncMock(),
+        )
+
+        async def run():
+            await async_run_analysis(None, coordinator)
+            return stored.await_args.args[1:]
+
+        run.provider = provider
+        run.stored = stored
+        return run
+
+    async def test_provider_failure_keeps_rule_suggestions(self, run):
+        run.provider.analyze.side_effect = RuntimeError("timeout")
+        with pytest.raises(RuntimeError):
+            await run()
+        stored, summary = run.stored.await_args.args[1:]
+        assert [s.title for s in stored] == ["Window open while cooling Living Room"]
+        assert summary.startswith("Local rules found 1 issue")
+
+    async def test_merged_suggestions_are_capped(self, run):
+        item = {
+            "room": "living_room",
+            "description": "d",
+            "action_type": "general",
+            "action_data": {},
+            "reasoning": "r",
+            "confidence": 0.8,
+            "priority": "low",
+        }
+        run.provider.analyze.return_value = json.dumps({
+            "summary": "s",
+            "suggestions": [
+                {**item, "title": f"AI {i}"} for i in range(MAX_SUGGESTIONS)
+            ],
+        })
+        stored, _summary = await run()
+        assert len(stored) == MAX_SUGGESTIONS
+        assert stored[0].title == "Window open while cooling Living Room"
+        assert stored[-1].title == f"AI {MAX_SUGGESTIONS - 2}"
@@ -0,0 +1,156 @@
+"""Tests for schedule lookahead and pre-conditioning in the coordinator."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.smart_climate import coordinator as coordinator_module
+from custom_components.smart_climate.clock import VirtualClock
+from custom_components.smart_climate.const import (
+    CONF_ENABLE_PRECONDITIONING,
+    CONF_OUTDOOR_TEMP_SENSOR,
+    CONF_SCHEDULES,
+    EVENT_SCHEDULE_ACTIVATED,
+    OPERATION_MODE_ACTIVE,
+)
+from custom_components.smart_climate.coordinator import SmartClimateCoordinator
+
+START = datetime(2024, 1, 8, 0, 0)  # Monday
+MORNING = datetime(2024, 1, 8, 7, 0)
+
+
+def _coordinator(sample_config_data, **overrides):
+    sample_config_data[CONF_OUTDOOR_TEMP_SENSOR] = "sensor.outdoor"
+    sample_config_data[CONF_SCHEDULES] = [
+        {
+            "schedule_name": "Morning",
+            "schedule_rooms": ["living_room"],
+            "schedule_start_time": "07:00",
+            "schedule_end_time": "09:00",
+            "schedule_target_temp": 72.0,
+        }
+    ]
+    sample_config_data.update(overrides)
+    states = {
+        "climate.living_room": SimpleNamespace(
+            state="heat", attributes={"temperature": 66, "hvac_action": "idle"}
+        ),
+        "sensor.lr_temp": SimpleNamespace(state="66", attributes={}),
+        "sensor.outdoor": SimpleNamespace(state="30", attributes={}),
+    }
+    hass = MagicMock()
+    hass.states.get = states.get
+    hass.services.async_call = AsyncMock()
+    hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+    entry = SimpleNamespace(entry_id="test", data=sample_config_data, options={})
+    coordinator = SmartClimateCoordinator(hass, entry)
+    coordinator.clock = VirtualClock(START)
+    coordinator.operation_mode = OPERATION_MODE_ACTIVE
+    coordinator.async_update_listeners = MagicMock()
+
+    # A learned room: 6 degrees/h of heat, losing 10%/h of the gap outside.
+    thermal = coordinator._thermal["living_room"]
+    thermal.theta = [0.1, 6.0, 5.0, 0.0]
+    thermal.samples = thermal.heating_samples = 50
+    return coordinator
+
+
+async def _cycle_at(coordinator, when):
+    coordinator.clock.set(when)
+    data = await coordinator._async_update_data()
+    return data["rooms"]["living_room"]
+
+
+class TestPreconditioning:
+    """The coordinator starts schedules early from the thermal model."""
+
+    async def test_starts_early_then_hands_over(self, sample_config_data):
+        coordinator = _coordinator(sample_config_data)
+
+        room = await _cycle_at(coordinator, START)
+        # 66 -> 72 towards an equilibrium of 30 + 6 / 0.1 = 90: ~173 minutes.
+        lead = (MORNING - room.precondition_start).total_seconds() / 60
+        assert lead == pytest.approx(172.6, abs=0.5)
+        assert room.next_schedule == "Morning"
+        assert room.next_schedule_time == MORNING
+
+        room = await _cycle_at(coordinator, datetime(2024, 1, 8, 3, 0))
+        assert not room.preconditioning
+        assert room.smart_target != 72.0
+
+        room = await _cycle_at(coordinator, datetime(2024, 1, 8, 5, 0))
+        assert room.preconditioning
+        assert room.smart_target == 72.0
+        assert room.last_adjustment_reason == "Pre-conditioning: Morning"
+        assert room.active_schedule is None
+
+        room = await _cycle_at(coordinator, datetime(2024, 1, 8, 7, 30))
+        assert not room.preconditioning
+        assert room.active_schedule == "Morning"
+        assert room.smart_target == 72.0
+        assert room.next_schedule is None
+        assert room.next_schedule_time == datetime(2024, 1, 8, 9, 0, 1)
+        fired = [c.args[0] for c in coordinator.hass.bus.async_fire.call_args_list]
+        assert EVENT_SCHEDULE_ACTIVATED in fired
+
+    async def test_disabled_or_unlearned_starts_on_time(self, sample_config_data):
+        coordinator = _coordinator(
+            sample_config_data, **{CONF_ENABLE_PRECONDITIONING: False}
+        )
+        room = await _cycle_at(coordinator, START)
+        assert room.precondition_start is None
+
+        coordinator = _coordinator(sample_config_data)
+        coordinator._thermal["living_room"].heating_samples = 0
+        room = await _cycle_at(coordinator, START)
+        assert room.precondition_start is None
+        assert room.next_schedule_time == MORNING
+
+    async def test_steady_cycles_do_not_reevaluate(self, sample_config_data):
+        coordinator = _coordinator(sample_config_data)
+        with patch.object(
+            coordinator_module,
+            "get_winning_schedule",
+            wraps=coordinator_module.get_winning_schedule,
+        ) as winning:
+            for minute in range(0, 120, 1):
+                await _cycle_at(coordinator, START + timedelta(minutes=minute))
+        assert winning.call_count == 1
+
+
+class TestScheduleTimers:
+    """One timer per room, at the next pre-conditioning start or transition."""
+
+    async def test_timer_chain(self, sample_config_data):
+        coordinator = _coordinator(sample_config_data)
+        with patch.object(coordinator_module, "async_call_later") as call_later:
+            call_later.return_value = MagicMock()
+            coordinator.schedule_room_transitions()
+            room = await _cycle_at(coordinator, START)
+
+            assert call_later.call_count == 1
+            _, delay, fire = call_later.call_args.args
+            assert delay == (room.precondition_start - START).total_seconds()
+
+            # The pre-conditioning timer applies the early setpoint at once.
+            coordinator.clock.set(room.precondition_start)
+            fire(coordinator.clock.now())
+            assert room.preconditioning
+            assert room.smart_target == 72.0
+            coordinator.async_update_listeners.assert_called_once()
+            _, delay, fire = call_later.call_args.args
+            assert delay == (MORNING - room.precondition_start).total_seconds()
+
+            # The transition timer activates the schedule and plans the end.
+            coordinator.clock.set(MORNING)
+            fire(MORNING)
+            assert room.active_schedule == "Morning"
+            assert not room.preconditioning
+            _, delay, _ = call_later.call_args.args
+            assert delay == 2 * 3600 + 1
+
+            coordinator.cancel_scheduled_tasks()
+            assert call_later.return_value.call_count >= 1
+            assert not coordinator._schedule_unsubs
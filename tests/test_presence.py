@@ -0,0 +1,180 @@
+"""Tests for event-timestamped presence capture."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.smart_climate import coordinator as coordinator_module
+from custom_components.smart_climate.clock import VirtualClock
+from custom_components.smart_climate.const import (
+    CONF_FOLLOW_ME_COOLDOWN,
+    CONF_PRESENCE_DECAY,
+    CONF_PRESENCE_HOLD_OFF,
+    CONF_ROOMS,
+    OPERATION_MODE_ACTIVE,
+)
+from custom_components.smart_climate.coordinator import SmartClimateCoordinator
+from custom_components.smart_climate.helpers.presence import RoomPresence
+
+START = datetime(2024, 1, 8, 8, 0)
+
+
+class TestRoomPresence:
+    """Tests for the per-room presence record."""
+
+    def test_hold_off_then_decay(self):
+        presence = RoomPresence(
+            ["binary_sensor.a"], timedelta(minutes=2), timedelta(minutes=10)
+        )
+        assert not presence.is_occupied(START)
+        assert presence.last_seen(START) is None
+
+        assert presence.record("binary_sensor.a", True, START)
+        assert not presence.record("binary_sensor.a", True, START)
+        off = START + timedelta(seconds=20)
+        assert presence.record("binary_sensor.a", False, off)
+
+        assert presence.last_on == START
+        assert presence.last_seen(off + timedelta(minutes=1)) == off
+        assert presence.hold_off_ends() == off + timedelta(minutes=2)
+        assert presence.is_occupied(off + timedelta(minutes=1))
+        assert not presence.is_occupied(off + timedelta(minutes=2))
+        assert presence.confidence(off + timedelta(minutes=7)) == pytest.approx(0.5)
+        assert presence.confidence(off + timedelta(minutes=30)) == 0.0
+
+    def test_room_stays_sensing_until_last_sensor_clears(self):
+        presence = RoomPresence(["binary_sensor.a", "binary_sensor.b"])
+        presence.record("binary_sensor.a", True, START)
+        presence.record("binary_sensor.b", True, START + timedelta(minutes=1))
+        presence.record("binary_sensor.a", False, START + timedelta(minutes=2))
+        assert presence.sensing
+        assert presence.last_on == START
+        assert presence.last_off is None
+
+        presence.record("binary_sensor.b", False, START + timedelta(minutes=3))
+        assert not presence.sensing
+        assert presence.last_off == START + timedelta(minutes=3)
+        # Unknown sensors are ignored.
+        assert not presence.record("binary_sensor.c", True, START)
+
+
+class TestCoordinatorPresenceEvents:
+    """Presence is captured from state-change events between polls."""
+
+    @staticmethod
+    def _coordinator(sample_config_data):
+        nursery = dict(sample_config_data[CONF_ROOMS][0])
+        nursery.update(
+            room_name="Nursery",
+            room_slug="nursery",
+            climate_entity="climate.nursery",
+            temp_sensors=["sensor.n_temp"],
+            presence_sensors=["binary_sensor.n_motion"],
+            door_window_sensors=[],
+        )
+        sample_config_data[CONF_ROOMS].append(nursery)
+        sample_config_data[CONF_PRESENCE_HOLD_OFF] = 2
+        sample_config_data[CONF_PRESENCE_DECAY] = 10
+        sample_config_data[CONF_FOLLOW_ME_COOLDOWN] = 0
+        states = {
+            "climate.living_room": SimpleNamespace(
+                state="heat", attributes={"temperature": 70, "hvac_action": "idle"}
+            ),
+            "climate.nursery": SimpleNamespace(
+                state="heat", attributes={"temperature": 70, "hvac_action": "idle"}
+            ),
+            "sensor.lr_temp": SimpleNamespace(state="69", attributes={}),
+            "sensor.n_temp": SimpleNamespace(state="69", attributes={}),
+            "binary_sensor.lr_motion": SimpleNamespace(
+                state="on", attributes={}, last_changed=START - timedelta(hours=1)
+            ),
+            "binary_sensor.n_motion": SimpleNamespace(
+                state="off", attributes={}, last_changed=START - timedelta(hours=1)
+            ),
+        }
+        hass = MagicMock()
+        hass.states.get = states.get
+        hass.services.async_call = AsyncMock()
+        hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+        entry = SimpleNamespace(entry_id="test", data=sample_config_data, options={})
+        coordinator = SmartClimateCoordinator(hass, entry)
+        coordinator.clock = VirtualClock(START)
+        coordinator.operation_mode = OPERATION_MODE_ACTIVE
+        coordinator.async_update_listeners = MagicMock()
+        return coordinator, states
+
+    @staticmethod
+    def _event(entity_id, state, when):
+        return SimpleNamespace(
+            data={
+                "entity_id": entity_id,
+                "new_state": SimpleNamespace(
+                    state=state, attributes={}, last_changed=when.astimezone()
+                ),
+            }
+        )
+
+    async def test_pulse_between_polls_is_captured(self, sample_config_data):
+        coordinator, states = self._coordinator(sample_config_data)
+        with patch.object(coordinator_module, "async_call_later") as call_later:
+            call_later.return_value = MagicMock()
+            coordinator.start_presence_tracking()
+            data = await coordinator._async_update_data()
+            assert data["house"].follow_me_target == "living_room"
+            # Seeded from last_changed, not from the first poll.
+            assert coordinator._presence["living_room"].last_on == START - timedelta(
+                hours=1
+            )
+
+            # A 10-second pulse in the nursery that no poll ever sees.
+            pulse = START + timedelta(seconds=20)
+            coordinator.clock.set(pulse + timedelta(seconds=10))
+            coordinator._handle_presence_event(
+                self._event("binary_sensor.n_motion", "on", pulse)
+            )
+            nursery = coordinator._room_states["nursery"]
+            assert nursery.occupied
+            # Follow-me reacted without waiting for the next poll.
+            assert coordinator._house_state.follow_me_target == "nursery"
+            coordinator.async_update_listeners.assert_called_once()
+
+            coordinator._handle_presence_event(
+                self._event(
+                    "binary_sensor.n_motion", "off", pulse + timedelta(seconds=10)
+                )
+            )
+            _, delay, expire = call_later.call_args.args
+            assert delay == 120
+
+            coordinator.clock.advance(60)
+            data = await coordinator._async_update_data()
+            assert nursery.occupied
+            assert nursery.last_presence_time == pulse + timedelta(seconds=10)
+            assert nursery.presence_confidence == 1.0
+
+            # The hold-off timer clears occupancy right on time.
+            coordinator.clock.set(pulse + timedelta(seconds=130))
+            expire(coordinator.clock.now())
+            assert not nursery.occupied
+            assert coordinator._house_state.follow_me_target == "living_room"
+
+            coordinator.cancel_scheduled_tasks()
+            assert not coordinator._hold_off_unsubs
+            assert coordinator._presence_unsub is None
+
+    async def test_polls_only_sample_until_tracking_starts(self, sample_config_data):
+        coordinator, states = self._coordinator(sample_config_data)
+        await coordinator._async_update_data()
+        states["binary_sensor.n_motion"].state = "on"
+        coordinator.clock.advance(60)
+        data = await coordinator._async_update_data()
+        assert data["rooms"]["nursery"].occupied
+
+        coordinator.start_presence_tracking()
+        states["binary_sensor.n_motion"].state = "off"
+        coordinator.clock.advance(600)
+        data = await coordinator._async_update_data()
+        # Events own the sensors now; a poll doesn't resample them.
+        assert data["rooms"]["nursery"].occupied
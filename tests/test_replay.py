@@ -0,0 +1,228 @@
+"""Tests for the input recorder and offline replay harness."""
+
+import gzip
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.smart_climate.clock import VirtualClock
+from custom_components.smart_climate.const import CONF_SCHEDULES
+from custom_components.smart_climate.recorder import (
+    InputRecorder,
+    RecordedEvent,
+    RecordingWriter,
+    read_recording,
+)
+from custom_components.smart_climate.replay import async_replay, diff_results
+
+START = datetime(2024, 1, 8, 5, 58)
+
+
+def _state(state, **attributes):
+    return SimpleNamespace(state=state, attributes=attributes)
+
+
+def _inputs(temp, hvac_action="idle", target=68):
+    return {
+        "climate.living_room": _state(
+            "heat", temperature=target, hvac_action=hvac_action
+        ),
+        "sensor.lr_temp": _state(str(temp)),
+        "sensor.lr_humidity": _state("45"),
+        "binary_sensor.lr_motion": _state("on"),
+        "binary_sensor.lr_window": _state("off"),
+    }
+
+
+def _write(path, config, cycles):
+    writer = RecordingWriter(str(path), config)
+    for offset, states in cycles:
+        writer.write(writer.encode_cycle(START + timedelta(minutes=offset), states))
+    return writer
+
+
+class TestRecording:
+    """Tests for RecordingWriter / read_recording."""
+
+    def test_round_trip_stores_only_deltas(self, tmp_path):
+        path = tmp_path / "inputs.jsonl.gz"
+        _write(path, {"a": 1}, [(0, _inputs(66)), (1, _inputs(66)), (2, _inputs(67))])
+
+        cycles = list(read_recording(str(path)))
+        assert [c.time for c in cycles] == [
+            START,
+            START + timedelta(minutes=1),
+            START + timedelta(minutes=2),
+        ]
+        assert cycles[0].keyframe and not cycles[1].keyframe
+        assert len(cycles[0].changes) == 5
+        assert cycles[1].changes == {}
+        assert cycles[2].changes == {"sensor.lr_temp": ["67", {}]}
+        assert cycles[2].config == {"a": 1}
+
+    def test_removed_entity_and_new_session(self, tmp_path):
+        path = tmp_path / "inputs.jsonl.gz"
+        writer = _write(path, {}, [(0, {"sensor.x": _state("1")}), (1, {"sensor.x": None})])
+        writer.restart()
+        writer.write(
+            writer.encode_cycle(START + timedelta(hours=1), {"sensor.x": _state("2")})
+        )
+
+        cycles = list(read_recording(str(path)))
+        assert cycles[1].changes == {"sensor.x": None}
+        assert cycles[2].keyframe
+        assert cycles[2].time == START + timedelta(hours=1)
+
+    def test_truncated_tail_is_tolerated(self, tmp_path):
+        path = tmp_path / "inputs.jsonl.gz"
+        _write(path, {}, [(0, _inputs(66)), (1, _inputs(67))])
+        whole = path.read_bytes()
+        with gzip.open(path, "ab") as handle:
+            handle.write(b'{"t": 120, "s": {}}\n' * 50)
+        path.write_bytes(path.read_bytes()[: len(whole) + 12])
+
+        assert len(list(read_recording(str(path)))) == 2
+
+    async def test_input_recorder_flushes_and_rotates(self, tmp_path):
+        hass = MagicMock()
+        hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+
+        async def executor(func, *args):
+            return func(*args)
+
+        hass.async_add_executor_job = executor
+        path = tmp_path / "inputs.jsonl.gz"
+        recorder = InputRecorder(hass, str(path), {}, flush_cycles=2, max_bytes=1)
+
+        recorder.record_cycle(START, _inputs(66))
+        recorder.record_cycle(START + timedelta(minutes=1), _inputs(67))
+        assert hass.async_create_task.call_count == 1
+        await recorder.async_flush()
+        assert len(list(read_recording(str(path)))) == 2
+
+        recorder.record_cycle(START + timedelta(minutes=2), _inputs(68))
+        await recorder.async_flush()
+        rotated = list(read_recording(f"{path}.1"))
+        current = list(read_recording(str(path)))
+        assert len(rotated) == 2
+        assert len(current) == 1
+        assert current[0].keyframe
+        assert len(current[0].changes) == 5
+
+
+    def test_events_attach_to_the_next_cycle(self, tmp_path):
+        path = tmp_path / "inputs.jsonl.gz"
+        writer = RecordingWriter(str(path), {})
+        # Before the first cycle the keyframe carries the state instead.
+        assert writer.encode_event(START, "binary_sensor.lr_motion", _state("off")) == []
+        lines = writer.encode_cycle(START, _inputs(66))
+        lines += writer.encode_event(
+            START + timedelta(seconds=20), "binary_sensor.lr_motion", _state("off")
+        )
+        lines += writer.encode_cycle(START + timedelta(minutes=1), _inputs(66))
+        writer.write(lines)
+
+        first, second = read_recording(str(path))
+        assert first.events == [] and first.version == 2
+        assert second.events == [
+            RecordedEvent(
+                START + timedelta(seconds=20), "binary_sensor.lr_motion", ["off", {}]
+            )
+        ]
+        # The cycle only carries what the event did not already change.
+        assert second.changes == {"binary_sensor.lr_motion": ["on", {}]}
+
+
+class TestReplay:
+    """Tests for async_replay."""
+
+    async def test_replay_captures_decisions_and_events(
+        self, tmp_path, sample_config_data
+    ):
+        sample_config_data[CONF_SCHEDULES] = [
+            {
+                "schedule_name": "Morning",
+                "schedule_start_time": "06:00",
+                "schedule_end_time": "08:00",
+                "schedule_target_temp": 70,
+            }
+        ]
+        path = tmp_path / "inputs.jsonl.gz"
+        _write(
+            path,
+            sample_config_data,
+            [(0, _inputs(66)), (1, _inputs(66)), (2, _inputs(66, "heating"))],
+        )
+
+        result = await async_replay(read_recording(str(path)))
+
+        assert result.cycles == 3
+        assert [d["time"] for d in result.decisions] == [
+            START.isoformat(),
+            (START + timedelta(minutes=2)).isoformat(),
+        ]
+        room = result.decisions[-1]["rooms"]["living_room"]
+        assert room["active_schedule"] == "Morning"
+        assert room["smart_target"] == 70
+        assert room["hvac_action"] == "heating"
+        assert any(
+            e["event"] == "smart_climate_schedule_activated" for e in result.events
+        )
+
+    async def test_diff_results(self, tmp_path, sample_config_data):
+        path = tmp_path / "inputs.jsonl.gz"
+        _write(path, sample_config_data, [(0, _inputs(66)), (5, _inputs(69))])
+
+        baseline = (await async_replay(read_recording(str(path)))).to_dict()
+        same = (await async_replay(read_recording(str(path)))).to_dict()
+        assert diff_results(baseline, same) == []
+
+        changed = dict(sample_config_data, target_temp_offset=1)
+        changed[CONF_SCHEDULES] = [
+            {
+                "schedule_name": "All day",
+                "schedule_start_time": "00:00",
+                "schedule_end_time": "23:59",
+                "schedule_target_temp": 72,
+            }
+        ]
+        candidate = (
+            await async_replay(read_recording(str(path)), config=changed)
+        ).to_dict()
+        assert diff_results(baseline, candidate)
+
+    async def test_events_replay_at_their_time(self, tmp_path, sample_config_data):
+        path = tmp_path / "inputs.jsonl.gz"
+        writer = RecordingWriter(str(path), sample_config_data)
+        absent = dict(_inputs(66), **{"binary_sensor.lr_motion": _state("off")})
+        entered = START + timedelta(seconds=20)
+        lines = writer.encode_cycle(START, absent)
+        lines += writer.encode_event(entered, "binary_sensor.lr_motion", _state("on"))
+        lines += writer.encode_cycle(START + timedelta(minutes=1), _inputs(66))
+        writer.write(lines)
+
+        result = await async_replay(read_recording(str(path)))
+
+        assert result.cycles == 2
+        assert result.decisions[0]["house"]["follow_me_target"] is None
+        assert result.decisions[1]["time"] == entered.isoformat()
+        assert result.decisions[1]["house"]["follow_me_target"] == "living_room"
+
+    async def test_coordinator_records_events(self, sample_config_data):
+        from custom_components.smart_climate.coordinator import (
+            SmartClimateCoordinator,
+        )
+
+        entry = SimpleNamespace(entry_id="test", data=sample_config_data, options={})
+        coordinator = SmartClimateCoordinator(MagicMock(), entry)
+        coordinator.clock = VirtualClock(START)
+        coordinator.recorder = MagicMock()
+        new_state = _state("on")
+        coordinator._handle_presence_event(
+            SimpleNamespace(
+                data={"entity_id": "binary_sensor.lr_motion", "new_state": new_state}
+            )
+        )
+        coordinator.recorder.record_event.assert_called_once_with(
+            START, "binary_sensor.lr_motion", new_state
+        )
@@ -0,0 +1,131 @@
+"""Tests for the schedule services re-planning the coordinator."""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.smart_climate import services
+from custom_components.smart_climate.clock import VirtualClock
+from custom_components.smart_climate.const import (
+    CONF_ENABLE_PRECONDITIONING,
+    CONF_SCHEDULES,
+    DOMAIN,
+    OPERATION_MODE_ACTIVE,
+)
+from custom_components.smart_climate.coordinator import SmartClimateCoordinator
+
+DURING_MORNING = datetime(2024, 1, 8, 7, 30)  # Monday
+LATE_MORNING = datetime(2024, 1, 8, 10, 0)
+
+
+def _coordinator(sample_config_data):
+    sample_config_data[CONF_ENABLE_PRECONDITIONING] = False
+    sample_config_data[CONF_SCHEDULES] = [
+        {
+            "schedule_name": "Morning",
+            "schedule_rooms": ["living_room"],
+            "schedule_start_time": "07:00",
+            "schedule_end_time": "09:00",
+            "schedule_target_temp": 72.0,
+        },
+        {
+            "schedule_name": "Evening",
+            "schedule_rooms": ["living_room"],
+            "schedule_start_time": "18:00",
+            "schedule_end_time": "20:00",
+            "schedule_target_temp": 70.0,
+            "schedule_enabled": False,
+        },
+    ]
+    states = {
+        "climate.living_room": SimpleNamespace(
+            state="heat", attributes={"temperature": 68, "hvac_action": "idle"}
+        ),
+        "sensor.lr_temp": SimpleNamespace(state="68", attributes={}),
+    }
+    hass = MagicMock()
+    hass.states.get = states.get
+    hass.services.async_call = AsyncMock()
+    hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+    entry = SimpleNamespace(entry_id="test", data=sample_config_data, options={})
+    coordinator = SmartClimateCoordinator(hass, entry)
+    coordinator.clock = VirtualClock(DURING_MORNING)
+    coordinator.operation_mode = OPERATION_MODE_ACTIVE
+    coordinator.async_update_listeners = MagicMock()
+    coordinator.async_request_refresh = AsyncMock()
+    hass.data = {DOMAIN: {"test": coordinator}}
+    return coordinator
+
+
+def _call(coordinator, **data):
+    return SimpleNamespace(hass=coordinator.hass, data=data)
+
+
+def _plan(coordinator):
+    return coordinator._schedule_plans["living_room"]
+
+
+class TestScheduleServicesReplan:
+    """Schedule changes take effect at once, not at the next transition."""
+
+    async def test_remove_and_deactivate_drop_the_running_schedule(
+        self, sample_config_data
+    ):
+        for handler in (
+            services._handle_remove_schedule,
+            services._handle_deactivate_schedule,
+        ):
+            coordinator = _coordinator(dict(sample_config_data))
+            await coordinator._async_update_data()
+            room = coordinator._room_states["living_room"]
+            assert room.active_schedule == "Morning"
+            assert room.smart_target == 72.0
+
+            await handler(_call(coordinator, name="Morning"))
+            assert _plan(coordinator).active is None
+            assert room.active_schedule is None
+            coordinator.async_update_listeners.assert_called()
+
+            # The next cycle no longer applies the old plan's target.
+            await coordinator._async_update_data()
+            assert room.smart_target != 72.0
+
+    async def test_add_applies_immediately(self, sample_config_data):
+        coordinator = _coordinator(sample_config_data)
+        coordinator.clock.set(LATE_MORNING)
+        await coordinator._async_update_data()
+        room = coordinator._room_states["living_room"]
+        assert room.active_schedule is None
+
+        await services._handle_add_schedule(
+            _call(
+                coordinator,
+                name="Brunch",
+                rooms="living_room",
+                start_time="09:30",
+                end_time="11:00",
+                target_temp=71.0,
+            )
+        )
+        assert room.active_schedule == "Brunch"
+        assert room.smart_target == 71.0
+        assert _plan(coordinator).next_at == datetime(2024, 1, 8, 11, 0, 1)
+
+    async def test_activate_overrides_time_window(self, sample_config_data):
+        coordinator = _coordinator(sample_config_data)
+        coordinator.clock.set(LATE_MORNING)
+        await coordinator._async_update_data()
+        room = coordinator._room_states["living_room"]
+
+        await services._handle_activate_schedule(_call(coordinator, name="Evening"))
+        assert room.active_schedule == "Evening"
+        assert room.smart_target == 70.0
+
+    async def test_outside_active_mode_plans_on_next_cycle(self, sample_config_data):
+        coordinator = _coordinator(sample_config_data)
+        await coordinator._async_update_data()
+        coordinator.operation_mode = "training"
+
+        await services._handle_remove_schedule(_call(coordinator, name="Morning"))
+        assert coordinator._schedule_plans == {}
+        assert coordinator._schedule_unsubs == {}
@@ -3,6 +3,10 @@ from datetime import datetime, time, timedelta
 
 from custom_components.smart_climate.const import (
     DEFAULT_AWAY_TEMP_OFFSET,
+    SUGGESTION_APPLIED,
+    SUGGESTION_EXPIRED,
+    SUGGESTION_PENDING,
+    SUGGESTION_REJECTED,
 )
 from custom_components.smart_climate.helpers.auxiliary import (
     FAN_SPEED_PER_DEGREE,
@@ -20,6 +24,7 @@ from custom_components.smart_climate.helpers.scheduling import (
     get_todays_schedules,
     get_winning_schedule,
     is_schedule_active_now,
+    next_schedule_transition,
     parse_time,
 )
 from custom_components.smart_climate.helpers.vents import (
@@ -34,6 +39,7 @@ from custom_components.smart_climate.models import (
     RoomState,
     Schedule,
     Suggestion,
+    SuggestionStore,
     slugify,
 )
 
@@ -265,6 +271,77 @@ class TestSuggestionModel:
         assert s.is_expired() is True
 
 
+class TestSuggestionStore:
+    """Tests for the indexed suggestion store."""
+
+    def _store(self, now):
+        return SuggestionStore(
+            [
+                Suggestion(id="a", room="nursery", expires_at=now + timedelta(hours=3)),
+                Suggestion(id="b", room="nursery", expires_at=now + timedelta(hours=1)),
+                Suggestion(id="c", room=None, expires_at=now + timedelta(hours=2)),
+            ]
+        )
+
+    def test_indexes(self):
+        store = self._store(datetime.now())
+        assert len(store) == 3
+        assert "b" in store
+        assert store.get("c").room is None
+        assert [s.id for s in store.for_room("nursery")] == ["a", "b"]
+        assert store.count(SUGGESTION_PENDING) == 3
+
+    def test_set_status_reindexes(self):
+        store = self._store(datetime.now())
+        store.set_status(store.get("a"), SUGGESTION_REJECTED)
+        assert [s.id for s in store.pending()] == ["b", "c"]
+        assert [s.id for s in store.with_status(SUGGESTION_REJECTED)] == ["a"]
+        assert store.get("a").status == SUGGESTION_REJECTED
+
+    def test_next_expiry_skips_stale_heap_entries(self):
+        now = datetime.now()
+        store = self._store(now)
+        assert store.next_expiry() == now + timedelta(hours=1)
+        store.set_status(store.get("b"), SUGGESTION_APPLIED)
+        assert store.next_expiry() == now + timedelta(hours=2)
+        store.remove("c")
+        assert store.next_expiry() == now + timedelta(hours=3)
+
+    def test_expire_due(self):
+        now = datetime.now()
+        store = self._store(now)
+        expired = store.expire_due(now + timedelta(hours=2, minutes=30))
+        assert sorted(s.id for s in expired) == ["b", "c"]
+        assert store.get("b").status == SUGGESTION_EXPIRED
+        assert [s.id for s in store.pending()] == ["a"]
+
+    def test_remove_pending_keeps_history(self):
+        store = self._store(datetime.now())
+        store.set_status(store.get("a"), SUGGESTION_APPLIED)
+        assert store.remove_pending() == 2
+        assert [s.id for s in store] == ["a"]
+        assert store.for_room("nursery")[0].id == "a"
+
+    def test_compact_applies_retention(self):
+        now = datetime.now()
+        store = SuggestionStore()
+        for idx in range(5):
+            store.add(
+                Suggestion(
+                    id=f"old{idx}",
+                    status=SUGGESTION_APPLIED,
+                    created_at=now - timedelta(days=idx),
+                )
+            )
+        store.add(Suggestion(id="ancient", created_at=now - timedelta(days=90)))
+
+        dropped = store.compact(3, timedelta(days=3), now=now)
+
+        # Pending suggestions survive regardless of age.
+        assert dropped == 2
+        assert sorted(s.id for s in store) == ["ancient", "old0", "old1", "old2"]
+
+
 # ---------------------------------------------------------------------------
 # Scheduling: is_schedule_active_now
 # ---------------------------------------------------------------------------
@@ -446,6 +523,59 @@ class TestHouseActiveSchedule:
         assert result == "Night Mode"
 
 
+# ---------------------------------------------------------------------------
+# Scheduling: next_schedule_transition
+# ---------------------------------------------------------------------------
+
+
+class TestNextScheduleTransition:
+    """Tests for next_schedule_transition."""
+
+    def test_next_start(self, sample_schedule):
+        """Before the nap the next change is its start."""
+        now = datetime(2024, 1, 1, 9, 0)  # Monday
+        when, schedule = next_schedule_transition([sample_schedule], "nursery", now)
+        assert when == datetime(2024, 1, 1, 13, 0)
+        assert schedule is sample_schedule
+
+    def test_end_is_after_inclusive_end_time(self, sample_schedule):
+        """An active schedule ends just after its end minute."""
+        now = datetime(2024, 1, 1, 14, 0)
+        when, schedule = next_schedule_transition([sample_schedule], "nursery", now)
+        assert when == datetime(2024, 1, 1, 15, 0, 1)
+        assert schedule is None
+        assert get_winning_schedule([sample_schedule], "nursery", when) is None
+        assert get_winning_schedule(
+            [sample_schedule], "nursery", when - timedelta(seconds=1)
+        ) is sample_schedule
+
+    def test_skips_days_off(self, sample_schedule):
+        """Friday afternoon's next nap is on Monday."""
+        now = datetime(2024, 1, 5, 16, 0)  # Friday
+        when, _ = next_schedule_transition([sample_schedule], "nursery", now)
+        assert when == datetime(2024, 1, 8, 13, 0)
+
+    def test_higher_priority_takeover(self, sample_schedule, sample_schedule_night):
+        """Boundaries that don't change the winner are skipped."""
+        sample_schedule.start_time = "21:00"
+        sample_schedule.end_time = "23:00"
+        now = datetime(2024, 1, 1, 20, 0)
+        rooms = [sample_schedule, sample_schedule_night]
+        when, schedule = next_schedule_transition(rooms, "nursery", now)
+        assert (when, schedule) == (datetime(2024, 1, 1, 21, 0), sample_schedule)
+        # Night Mode starts at 22:00 but the nap still wins until it ends.
+        when, schedule = next_schedule_transition(rooms, "nursery", when)
+        assert (when, schedule) == (
+            datetime(2024, 1, 1, 23, 0, 1),
+            sample_schedule_night,
+        )
+
+    def test_no_schedules_for_room(self, sample_schedule):
+        """Rooms without schedules have no transitions."""
+        now = datetime(2024, 1, 1, 9, 0)
+        assert next_schedule_transition([sample_schedule], "living_room", now) is None
+
+
 # ---------------------------------------------------------------------------
 # Scheduling: get_todays_schedules
 # ---------------------------------------------------------------------------
@@ -828,15 +958,57 @@ class TestShouldEngageAuxiliary:
         )
         assert result is False
 
+    def test_no_engage_when_past_target_for_action(self, sample_room_state):
+        """A shared system heating elsewhere should not heat a warm room."""
+        sample_room_state.temperature = 76.0
+        sample_room_state.hvac_action = HVACAction.HEATING
+        sample_room_state.hvac_state_change_time = (
+            datetime.now() - timedelta(minutes=30)
+        )
+        sample_room_state.temp_trend = 0.0
+        result = should_engage_auxiliary(
+            sample_room_state, target_temp=72.0
+        )
+        assert result is False
+
 
 # ---------------------------------------------------------------------------
 # Auxiliary: should_disengage_auxiliary
 # ---------------------------------------------------------------------------
 
 
+    def test_no_engage_with_window_open(self, sample_room_state):
+        """Should not engage while a door or window is open."""
+        sample_room_state.temperature = 76.0
+        sample_room_state.hvac_action = HVACAction.COOLING
+        sample_room_state.hvac_state_change_time = (
+            datetime.now() - timedelta(minutes=20)
+        )
+        sample_room_state.temp_trend = 0.3
+        sample_room_state.window_open = True
+        result = should_engage_auxiliary(
+            sample_room_state, target_temp=72.0, threshold=2.0, delay_minutes=15
+        )
+        assert result is False
+
+
 class TestShouldDisengageAuxiliary:
     """Tests for auxiliary device disengagement logic."""
 
+    def test_disengage_with_window_open(self, sample_room_state):
+        """Should disengage as soon as a door or window opens."""
+        sample_room_state.temperature = 76.0
+        sample_room_state.window_open = True
+        aux_state = AuxiliaryDeviceState(
+            entity_id="switch.heater",
+            device_type=AuxiliaryDeviceType.SWITCH,
+            is_on=True,
+            runtime_minutes=10.0,
+        )
+        assert should_disengage_auxiliary(
+            sample_room_state, target_temp=72.0, aux_state=aux_state
+        )
+
     def test_disengage_within_threshold(self, sample_room_state):
         """Should disengage when temp is within DISENGAGE_THRESHOLD of target."""
         sample_room_state.temperature = 72.5  # within 1.0 of 72.0
@@ -894,6 +1066,21 @@ class TestShouldDisengageAuxiliary:
         )
         assert result is True
 
+    def test_disengage_heater_past_target(self, sample_room_state):
+        """Should disengage a heater once the room is above target."""
+        sample_room_state.temperature = 76.0
+        aux_state = AuxiliaryDeviceState(
+            entity_id="switch.heater",
+            device_type=AuxiliaryDeviceType.SWITCH,
+            is_on=True,
+            runtime_minutes=10.0,
+            heating=True,
+        )
+        result = should_disengage_auxiliary(
+            sample_room_state, target_temp=72.0, aux_state=aux_state
+        )
+        assert result is True
+
 
 # ---------------------------------------------------------------------------
 # Auxiliary: calculate_fan_speed
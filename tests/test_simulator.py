@@ -0,0 +1,80 @@
+"""Tests for the RC thermal-model house simulator."""
+
+import math
+
+from custom_components.smart_climate.const import CONF_ENABLE_ZONE_BALANCING
+from custom_components.smart_climate.simulator import (
+    HouseSimulator,
+    SimHouse,
+    SimRoom,
+    ThermalModel,
+    async_simulate,
+    default_house,
+)
+
+
+def _house(**kwargs):
+    rooms = [
+        SimRoom(name="Cold", tau_hours=4.0, initial_temp=60.0, occupied_hours=((0, 24),)),
+        SimRoom(name="Warm", tau_hours=8.0, initial_temp=70.0, occupied_hours=()),
+    ]
+    return SimHouse(rooms=rooms, outdoor_noise=0.0, **kwargs)
+
+
+class TestThermalModel:
+    """Tests for ThermalModel physics."""
+
+    def test_free_decay_matches_rc_solution(self):
+        model = ThermalModel(_house())
+        model.step(2.0, outdoor=30.0)
+        assert math.isclose(
+            float(model.temps[0]), 30.0 + 30.0 * math.exp(-2.0 / 4.0), rel_tol=1e-9
+        )
+        assert math.isclose(
+            float(model.temps[1]), 30.0 + 40.0 * math.exp(-2.0 / 8.0), rel_tol=1e-9
+        )
+
+    def test_vent_share_conserves_capacity(self):
+        model = ThermalModel(_house())
+        model.system_on = [True]
+        model.vents[0], model.vents[1] = 1.0, 0.1
+        before = [float(t) for t in model.temps]
+        model.step(0.01, outdoor=float(model.temps[0]))
+        # Nearly all of the airflow goes to the open vent.
+        assert float(model.temps[0]) - before[0] > 5 * (float(model.temps[1]) - before[1])
+
+    def test_thermostat_hysteresis(self):
+        model = ThermalModel(_house(setpoint=65.0, hysteresis=0.5))
+        model.update_thermostats()  # mean 65.0: inside the deadband
+        assert model.system_on == [False]
+        model.temps[0] = 58.0
+        model.update_thermostats()
+        assert model.system_on == [True]
+
+
+class TestHouseSimulator:
+    """Tests for running the coordinator against the model."""
+
+    async def test_service_calls_feed_back(self):
+        simulator = HouseSimulator(_house())
+        simulator._apply("switch.turn_on", {"entity_id": "switch.sim_cold_heater"})
+        simulator._apply(
+            "cover.set_cover_position", {"entity_id": "cover.sim_warm_vent", "position": 25}
+        )
+        simulator._apply("climate.set_temperature", {"entity_id": "climate.main", "temperature": 70})
+        assert simulator.model.aux_on == [True, False]
+        assert float(simulator.model.vents[1]) == 0.25
+        assert simulator.model.setpoints == [70.0]
+
+    async def test_zone_balancing_reduces_discomfort(self):
+        house = default_house(4)
+        balanced = await async_simulate(house, days=2, interval=300)
+        unbalanced = await async_simulate(
+            house, days=2, interval=300, config={CONF_ENABLE_ZONE_BALANCING: False}
+        )
+
+        assert balanced.cycles == 2 * 24 * 12
+        assert balanced.service_calls.get("cover.set_cover_position", 0) > 0
+        assert "cover.set_cover_position" not in unbalanced.service_calls
+        assert balanced.discomfort_degree_hours < unbalanced.discomfort_degree_hours
+        assert set(balanced.systems) == {"system_1", "system_2"}
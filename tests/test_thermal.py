@@ -0,0 +1,200 @@
+"""Tests for online thermal response learning."""
+
+import math
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.smart_climate.clock import VirtualClock
+from custom_components.smart_climate.const import (
+    AUXILIARY_RECOVERY_MINUTES,
+    THERMAL_MIN_SAMPLES,
+)
+from custom_components.smart_climate.coordinator import SmartClimateCoordinator
+from custom_components.smart_climate.helpers.auxiliary import should_engage_auxiliary
+from custom_components.smart_climate.helpers.thermal import ThermalEstimator
+from custom_components.smart_climate.models import HVACAction
+
+START = datetime(2024, 1, 8, 0, 0)
+
+LOSS, HEAT, COOL, GAIN = 0.2, 6.0, 5.0, 0.4
+
+
+def _simulate(estimator, hours, mode="heat", step_minutes=1, low=66.0, high=70.0):
+    """Drive a known first-order room under a hysteresis thermostat."""
+    temp, action = 68.0, HVACAction.IDLE
+    now = START
+    for minute in range(0, int(hours * 60), step_minutes):
+        outdoor = 35.0 + 15.0 * math.sin(2 * math.pi * minute / (60 * 24))
+        estimator.observe(now, temp, outdoor, action)
+        if mode == "heat":
+            if temp < low:
+                action = HVACAction.HEATING
+            elif temp > high:
+                action = HVACAction.IDLE
+        else:
+            if temp > high:
+                action = HVACAction.COOLING
+            elif temp < low:
+                action = HVACAction.IDLE
+        drive = HEAT if action == HVACAction.HEATING else 0.0
+        drive -= COOL if action == HVACAction.COOLING else 0.0
+        # Integrate the interval in small steps.
+        for _ in range(step_minutes * 6):
+            temp += (LOSS * (outdoor - temp) + drive + GAIN) / 360.0
+        now += timedelta(minutes=step_minutes)
+    return now
+
+
+class TestThermalEstimator:
+    """Tests for the RLS estimator."""
+
+    def test_learns_known_room(self):
+        estimator = ThermalEstimator()
+        _simulate(estimator, hours=72)
+
+        assert estimator.is_confident(HVACAction.HEATING)
+        assert estimator.heating_rate == pytest.approx(HEAT, rel=0.1)
+        assert estimator.loss_coefficient == pytest.approx(LOSS, rel=0.15)
+        assert not estimator.is_confident(HVACAction.COOLING)
+
+    def test_needs_samples_before_predicting(self):
+        estimator = ThermalEstimator()
+        assert estimator.time_to_target(60.0, 68.0, 30.0) is None
+        _simulate(estimator, hours=1)
+        assert estimator.samples < 2 * THERMAL_MIN_SAMPLES
+        assert estimator.time_to_target(60.0, 68.0, 30.0) is None
+
+    def test_open_window_and_unknown_outdoor_are_skipped(self):
+        estimator = ThermalEstimator()
+        now = START
+        for minute in range(120):
+            now = START + timedelta(minutes=minute)
+            estimator.observe(now, 68.0 - minute / 60, 30.0, HVACAction.IDLE, True)
+            estimator.observe(now, 68.0, None, HVACAction.IDLE)
+        assert estimator.samples == 0
+
+    def test_time_to_target_matches_closed_form(self):
+        estimator = ThermalEstimator()
+        _simulate(estimator, hours=72)
+        estimator.theta = [LOSS, HEAT, COOL, GAIN]
+
+        # Equilibrium with heat on at 30 outside: 30 + 6.4 / 0.2 = 62.
+        assert estimator.time_to_target(55.0, 65.0, 30.0) == math.inf
+        minutes = estimator.time_to_target(60.0, 61.0, 30.0)
+        expected = -math.log((61.0 - 62.0) / (60.0 - 62.0)) / LOSS * 60.0
+        assert minutes == pytest.approx(expected)
+        assert estimator.time_to_target(68.0, 68.0, 30.0) == 0.0
+
+    def test_round_trip(self):
+        estimator = ThermalEstimator()
+        _simulate(estimator, hours=24)
+        restored = ThermalEstimator.from_dict(estimator.to_dict())
+        assert restored.theta == estimator.theta
+        assert restored.samples == estimator.samples
+        assert restored.time_to_target(64.0, 68.0, 40.0) == estimator.time_to_target(
+            64.0, 68.0, 40.0
+        )
+        with pytest.raises(ValueError):
+            ThermalEstimator.from_dict({"theta": [1.0]})
+
+
+class TestPredictiveAuxiliary:
+    """Auxiliary engagement from a prediction."""
+
+    def test_engages_without_waiting_for_delay(self, sample_room_state):
+        now = START
+        sample_room_state.temperature = 60.0
+        sample_room_state.hvac_action = HVACAction.HEATING
+        sample_room_state.hvac_state_change_time = now
+        sample_room_state.temp_trend = 2.0
+
+        assert not should_engage_auxiliary(sample_room_state, 70.0, now=now)
+        assert should_engage_auxiliary(
+            sample_room_state,
+            70.0,
+            now=now,
+            time_to_target=AUXILIARY_RECOVERY_MINUTES + 1,
+        )
+        assert should_engage_auxiliary(
+            sample_room_state, 70.0, now=now, time_to_target=math.inf
+        )
+
+    def test_prediction_within_recovery_holds_off(self, sample_room_state):
+        sample_room_state.temperature = 60.0
+        sample_room_state.hvac_action = HVACAction.HEATING
+        sample_room_state.hvac_state_change_time = START - timedelta(hours=1)
+        sample_room_state.temp_trend = 0.0
+
+        assert not should_engage_auxiliary(
+            sample_room_state, 70.0, now=START, time_to_target=20.0
+        )
+
+
+class _MemoryStore:
+    def __init__(self):
+        self.data = None
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.data = data
+
+
+class TestCoordinatorThermal:
+    """Coordinator wiring of the estimator."""
+
+    @staticmethod
+    def _coordinator(sample_config_data, states, store):
+        hass = MagicMock()
+        hass.states.get = states.get
+        hass.services.async_call = AsyncMock()
+        hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+        entry = SimpleNamespace(entry_id="test", data=sample_config_data, options={})
+        coordinator = SmartClimateCoordinator(hass, entry)
+        coordinator.clock = VirtualClock(START)
+        coordinator._store = store
+        return coordinator
+
+    async def test_learns_and_persists(self, sample_config_data):
+        sample_config_data["outdoor_temp_sensor"] = "sensor.outdoor"
+        states = {
+            "climate.living_room": SimpleNamespace(
+                state="heat", attributes={"temperature": 70, "hvac_action": "heating"}
+            ),
+            "sensor.lr_temp": SimpleNamespace(state="60", attributes={}),
+            "sensor.outdoor": SimpleNamespace(state="30", attributes={}),
+        }
+        store = _MemoryStore()
+        coordinator = self._coordinator(sample_config_data, states, store)
+
+        temp = 60.0
+        for minute in range(12 * 60):
+            heating = minute % 60 < 40
+            states["climate.living_room"].attributes["hvac_action"] = (
+                "heating" if heating else "idle"
+            )
+            states["sensor.lr_temp"].state = str(round(temp, 3))
+            data = await coordinator._async_update_data()
+            drive = 6.0 if heating else 0.0
+            temp += (0.2 * (30.0 - temp) + drive) / 60.0
+            coordinator.clock.advance(timedelta(minutes=1))
+
+        room = data["rooms"]["living_room"]
+        assert room.heating_rate == pytest.approx(6.0, rel=0.2)
+        assert room.time_to_target is not None
+        # The action started at the last transition, not the last poll.
+        assert room.hvac_state_change_time < coordinator.clock.now() - timedelta(
+            minutes=5
+        )
+
+        await coordinator.async_save_state()
+        restored = self._coordinator(sample_config_data, states, store)
+        await restored.async_restore_state()
+        assert restored._room_states["living_room"].heating_rate == room.heating_rate
+        assert restored._thermal["living_room"].samples == (
+            coordinator._thermal["living_room"].samples
+        )
@@ -0,0 +1,204 @@
+"""Tests for the Smart Climate websocket commands."""
+
+from unittest.mock import MagicMock
+
+import pytest
+import voluptuous as vol
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from custom_components.smart_climate.const import (
+    DOMAIN,
+    SUGGESTION_APPLIED,
+    SUGGESTION_PENDING,
+    WS_SUGGESTIONS_MAX_LIMIT,
+    WS_TYPE_SUBSCRIBE,
+    WS_TYPE_SUGGESTIONS,
+)
+from custom_components.smart_climate.feed import SnapshotFeed
+from custom_components.smart_climate.models import (
+    HouseState,
+    Suggestion,
+    SuggestionStore,
+)
+from custom_components.smart_climate.websocket_api import (
+    filter_suggestions,
+    websocket_list_suggestions,
+    websocket_subscribe,
+)
+
+SCHEMA = vol.Schema(
+    {vol.Required("id"): int, **websocket_list_suggestions._ws_schema}
+)
+SUBSCRIBE_SCHEMA = vol.Schema(
+    {vol.Required("id"): int, **websocket_subscribe._ws_schema}
+)
+
+
+def _store():
+    suggestions = [
+        Suggestion(id=f"s{i}", title=f"Suggestion {i}", room=room, status=status)
+        for i, (room, status) in enumerate(
+            [
+                ("nursery", SUGGESTION_PENDING),
+                ("office", SUGGESTION_PENDING),
+                ("nursery", SUGGESTION_APPLIED),
+                (None, SUGGESTION_PENDING),
+                ("nursery", SUGGESTION_PENDING),
+            ]
+        )
+    ]
+    return SuggestionStore(suggestions)
+
+
+def _call(store, **msg):
+    hass = MagicMock()
+    coordinator = MagicMock(data={"house": HouseState(suggestions=store)})
+    hass.data = {DOMAIN: {"entry": coordinator}}
+    connection = MagicMock()
+    websocket_list_suggestions(
+        hass, connection, SCHEMA({"id": 1, "type": WS_TYPE_SUGGESTIONS, **msg})
+    )
+    return connection
+
+
+class TestFilterSuggestions:
+    """Filtering by status and room."""
+
+    def test_filters(self):
+        store = _store()
+        assert len(filter_suggestions(store)) == 5
+        assert [s.id for s in filter_suggestions(store, SUGGESTION_PENDING)] == [
+            "s0",
+            "s1",
+            "s3",
+            "s4",
+        ]
+        assert [s.id for s in filter_suggestions(store, room="nursery")] == [
+            "s0",
+            "s2",
+            "s4",
+        ]
+        assert [
+            s.id for s in filter_suggestions(store, SUGGESTION_PENDING, "nursery")
+        ] == ["s0", "s4"]
+
+
+class TestListSuggestionsCommand:
+    """The smart_climate/suggestions command."""
+
+    def test_pages_with_full_text(self):
+        store = _store()
+        connection = _call(store, status=SUGGESTION_PENDING, offset=1, limit=2)
+        msg_id, result = connection.send_result.call_args.args
+        assert msg_id == 1
+        assert result["total"] == 4
+        assert (result["offset"], result["limit"]) == (1, 2)
+        assert [s["id"] for s in result["suggestions"]] == ["s1", "s3"]
+        assert result["suggestions"][0]["title"] == "Suggestion 1"
+
+        result = _call(store, room="office").send_result.call_args.args[1]
+        assert [s["id"] for s in result["suggestions"]] == ["s1"]
+
+    def test_rejects_bad_arguments(self):
+        with pytest.raises(vol.Invalid):
+            SCHEMA({"id": 1, "type": WS_TYPE_SUGGESTIONS, "status": "bogus"})
+        with pytest.raises(vol.Invalid):
+            SCHEMA(
+                {
+                    "id": 1,
+                    "type": WS_TYPE_SUGGESTIONS,
+                    "limit": WS_SUGGESTIONS_MAX_LIMIT + 1,
+                }
+            )
+
+    def test_not_set_up(self):
+        hass = MagicMock()
+        hass.data = {}
+        connection = MagicMock()
+        websocket_list_suggestions(
+            hass, connection, SCHEMA({"id": 7, "type": WS_TYPE_SUGGESTIONS})
+        )
+        connection.send_error.assert_called_once()
+        connection.send_result.assert_not_called()
+
+
+class TestSubscribeCommand:
+    """The smart_climate/subscribe command."""
+
+    def _setup(self, sample_room_state):
+        coordinator = DataUpdateCoordinator(None)
+        coordinator.data = {"rooms": {"living_room": sample_room_state}}
+        coordinator.schedules = []
+        coordinator.operation_mode = "active"
+        coordinator.feed = SnapshotFeed(coordinator)
+        hass = MagicMock()
+        hass.data = {DOMAIN: {"entry": coordinator}}
+        return hass, coordinator
+
+    def _subscribe(self, hass, msg_id, **msg):
+        connection = MagicMock()
+        connection.subscriptions = {}
+        websocket_subscribe(
+            hass,
+            connection,
+            SUBSCRIBE_SCHEMA({"id": msg_id, "type": WS_TYPE_SUBSCRIBE, **msg}),
+        )
+        return connection
+
+    @staticmethod
+    def _events(connection):
+        return [c.args[0]["event"] for c in connection.send_message.call_args_list]
+
+    def test_snapshot_then_deltas(self, sample_room_state):
+        hass, coordinator = self._setup(sample_room_state)
+        connection = self._subscribe(hass, 3)
+        connection.send_result.assert_called_once_with(3)
+        (snapshot,) = self._events(connection)
+        assert snapshot["type"] == "snapshot"
+        assert snapshot["version"] == 0
+        assert snapshot["data"]["rooms"]["living_room"]["temperature"] == 72.1
+
+        sample_room_state.temperature = 73.0
+        coordinator.async_update_listeners()
+        assert self._events(connection)[-1] == {
+            "type": "delta",
+            "version": 1,
+            "changes": {"rooms": {"living_room": {"temperature": 73.0}}},
+        }
+
+        connection.subscriptions[3]()
+        sample_room_state.temperature = 74.0
+        coordinator.async_update_listeners()
+        assert len(self._events(connection)) == 2
+
+    def test_resync(self, sample_room_state):
+        hass, coordinator = self._setup(sample_room_state)
+        feed = coordinator.feed
+        first = self._subscribe(hass, 1)
+        for temperature in (73.0, 74.0):
+            sample_room_state.temperature = temperature
+            coordinator.async_update_listeners()
+
+        # A client that applied version 1 is replayed from there.
+        replay = self._subscribe(hass, 2, feed_id=feed.feed_id, since_version=1)
+        assert self._events(replay) == [
+            {
+                "type": "delta",
+                "version": 2,
+                "changes": {"rooms": {"living_room": {"temperature": 74.0}}},
+            }
+        ]
+
+        # A version from another feed (e.g. before a restart) gets a snapshot.
+        stale = self._subscribe(hass, 4, feed_id="old", since_version=1)
+        (event,) = self._events(stale)
+        assert (event["type"], event["version"]) == ("snapshot", 2)
+        assert len(self._events(first)) == 3
+
+    def test_entry_unload_closes_subscription(self, sample_room_state):
+        hass, coordinator = self._setup(sample_room_state)
+        connection = self._subscribe(hass, 5)
+        coordinator.feed.async_close()
+        assert self._events(connection)[-1] == {"type": "closed"}
+        assert connection.subscriptions == {}
+        assert coordinator._listeners == []
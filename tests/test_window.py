@@ -0,0 +1,136 @@
+"""Tests for the window-open fast path."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.smart_climate.clock import VirtualClock
+from custom_components.smart_climate.const import (
+    CONF_ROOMS,
+    EVENT_AUXILIARY_DEACTIVATED,
+    EVENT_WINDOW_OPEN_ADJUSTED,
+    OPERATION_MODE_ACTIVE,
+    OPERATION_MODE_TRAINING,
+)
+from custom_components.smart_climate.coordinator import SmartClimateCoordinator
+from custom_components.smart_climate.helpers.vents import MIN_VENT_POSITION
+
+START = datetime(2024, 1, 8, 8, 0)
+
+
+def _coordinator(sample_config_data):
+    living = sample_config_data[CONF_ROOMS][0]
+    living.update(
+        vent_entities=["cover.lr_vent"], auxiliary_entities=["switch.lr_heater"]
+    )
+    bedroom = dict(living)
+    bedroom.update(
+        room_name="Bedroom",
+        room_slug="bedroom",
+        climate_entity="climate.bedroom",
+        temp_sensors=["sensor.br_temp"],
+        presence_sensors=["binary_sensor.br_motion"],
+        door_window_sensors=["binary_sensor.br_window"],
+        vent_entities=["cover.br_vent"],
+        auxiliary_entities=[],
+    )
+    sample_config_data[CONF_ROOMS].append(bedroom)
+    states = {
+        "climate.living_room": SimpleNamespace(
+            state="heat", attributes={"temperature": 70, "hvac_action": "heating"}
+        ),
+        "climate.bedroom": SimpleNamespace(
+            state="heat", attributes={"temperature": 70, "hvac_action": "heating"}
+        ),
+        "sensor.lr_temp": SimpleNamespace(state="66", attributes={}),
+        "sensor.br_temp": SimpleNamespace(state="66", attributes={}),
+        "binary_sensor.lr_motion": SimpleNamespace(state="on", attributes={}),
+        "binary_sensor.br_motion": SimpleNamespace(state="on", attributes={}),
+        "binary_sensor.lr_window": SimpleNamespace(state="off", attributes={}),
+        "binary_sensor.br_window": SimpleNamespace(state="off", attributes={}),
+    }
+    tasks = []
+    hass = MagicMock()
+    hass.states.get = states.get
+    hass.services.async_call = AsyncMock()
+    hass.async_create_task = MagicMock(side_effect=tasks.append)
+    entry = SimpleNamespace(entry_id="test", data=sample_config_data, options={})
+    coordinator = SmartClimateCoordinator(hass, entry)
+    coordinator.clock = VirtualClock(START)
+    coordinator.operation_mode = OPERATION_MODE_ACTIVE
+    coordinator.async_update_listeners = MagicMock()
+    return coordinator, states, tasks
+
+
+def _window_event(entity_id):
+    return SimpleNamespace(data={"entity_id": entity_id})
+
+
+class TestWindowFastPath:
+    """A door/window change is handled for its room without a full cycle."""
+
+    async def test_open_window_reacts_for_that_room_only(self, sample_config_data):
+        coordinator, states, tasks = _coordinator(sample_config_data)
+        await coordinator._async_update_data()
+        for task in tasks:
+            task.close()
+        tasks.clear()
+        heater = coordinator._auxiliary_states["living_room"]["switch.lr_heater"]
+        heater.is_on, heater.started_at, heater.heating = True, START, True
+        coordinator.clock.advance(timedelta(seconds=15))
+        hass = coordinator.hass
+        hass.services.async_call.reset_mock()
+        hass.bus.async_fire.reset_mock()
+
+        states["binary_sensor.lr_window"].state = "on"
+        coordinator._handle_window_event(_window_event("binary_sensor.lr_window"))
+
+        # The room is updated synchronously and the event fires at once.
+        assert coordinator._room_states["living_room"].window_open
+        assert not coordinator._room_states["bedroom"].window_open
+        fired = [c.args[0] for c in hass.bus.async_fire.call_args_list]
+        assert fired == [EVENT_WINDOW_OPEN_ADJUSTED]
+        coordinator.async_update_listeners.assert_called_once()
+
+        assert len(tasks) == 1
+        await tasks.pop()
+        calls = [c.args[:3] for c in hass.services.async_call.call_args_list]
+        assert calls == [
+            (
+                "cover",
+                "set_cover_position",
+                {"entity_id": "cover.lr_vent", "position": MIN_VENT_POSITION},
+            ),
+            ("switch", "turn_off", {"entity_id": "switch.lr_heater"}),
+        ]
+        assert not heater.is_on
+        assert EVENT_AUXILIARY_DEACTIVATED in [
+            c.args[0] for c in hass.bus.async_fire.call_args_list
+        ]
+
+        # The next poll sees the window already open and doesn't fire again.
+        hass.bus.async_fire.reset_mock()
+        await coordinator._async_update_data()
+        assert EVENT_WINDOW_OPEN_ADJUSTED not in [
+            c.args[0] for c in hass.bus.async_fire.call_args_list
+        ]
+        for task in tasks:
+            task.close()
+
+    async def test_unchanged_or_training_does_not_dispatch(self, sample_config_data):
+        coordinator, states, tasks = _coordinator(sample_config_data)
+        await coordinator._async_update_data()
+        for task in tasks:
+            task.close()
+        tasks.clear()
+
+        coordinator._handle_window_event(_window_event("binary_sensor.lr_window"))
+        assert not tasks
+        coordinator.async_update_listeners.assert_not_called()
+
+        coordinator.operation_mode = OPERATION_MODE_TRAINING
+        states["binary_sensor.br_window"].state = "on"
+        coordinator._handle_window_event(_window_event("binary_sensor.br_window"))
+        assert coordinator._room_states["bedroom"].window_open
+        assert not tasks
+        coordinator.async_update_listeners.assert_called_once()